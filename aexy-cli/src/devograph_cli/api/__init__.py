@@ -1,5 +1,6 @@
 """API client for Aexy CLI."""
 
-from aexy_cli.api.client import AexyClient
+from aexy_cli.api.cache import ResponseCache
+from aexy_cli.api.client import AexyClient, get_client, run
 
-__all__ = ["AexyClient"]
+__all__ = ["AexyClient", "ResponseCache", "get_client", "run"]
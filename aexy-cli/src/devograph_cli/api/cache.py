@@ -0,0 +1,120 @@
+"""On-disk response cache for the Aexy API client."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "AEXY_CLI_CACHE_DIR"
+NO_CACHE_ENV = "AEXY_CLI_NO_CACHE"
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory, honouring AEXY_CLI_CACHE_DIR and XDG_CACHE_HOME."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aexy-cli" / "responses"
+
+
+def cache_disabled() -> bool:
+    """Check whether caching was turned off with AEXY_CLI_NO_CACHE."""
+    return os.environ.get(NO_CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.body = data.get("body")
+        self.etag: str | None = data.get("etag")
+        self.last_modified: str | None = data.get("last_modified")
+        self.stored_at: float = data.get("stored_at", 0)
+        self.ttl: float = data.get("ttl", 0)
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """JSON response cache stored as one file per request.
+
+    Entries are keyed by method, URL, request body and a hash of the API
+    token, so different accounts never share responses. Within its TTL an
+    entry is served without a request; after that it is revalidated with
+    its ETag or Last-Modified date and refreshed on 304 Not Modified.
+    """
+
+    def __init__(self, directory: Path | None = None):
+        self.directory = directory or default_cache_dir()
+
+    @staticmethod
+    def make_key(method: str, url: str, body: Any = None, token: str | None = None) -> str:
+        parts = [
+            method.upper(),
+            url,
+            json.dumps(body, sort_keys=True, default=str) if body is not None else "",
+            hashlib.sha256(token.encode()).hexdigest() if token else "",
+        ]
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the stored entry, fresh or stale, or None."""
+        try:
+            return CachedResponse(json.loads(self._path(key).read_text()))
+        except (OSError, ValueError):
+            return None
+
+    def set(
+        self,
+        key: str,
+        body: Any,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body. Write errors are ignored."""
+        path = self._path(key)
+        entry = {
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "ttl": ttl,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(entry))
+            tmp.replace(path)
+        except OSError:
+            pass
+
+    def touch(self, key: str, entry: CachedResponse) -> None:
+        """Restart the TTL of an entry the server confirmed is unchanged."""
+        self.set(key, entry.body, entry.ttl, entry.etag, entry.last_modified)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("*/*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -1,31 +1,133 @@
 """API client for communicating with Aexy backend."""
 
+import asyncio
 import os
-from typing import Any
+from collections.abc import Awaitable, Coroutine
+from typing import Any, TypeVar
 
+import click
 import httpx
 import keyring
 
+from aexy_cli.api.cache import ResponseCache, cache_disabled
+
 SERVICE_NAME = "aexy-cli"
 DEFAULT_BASE_URL = "http://localhost:8000/api"
 
+# How long cached responses are served without asking the server (seconds)
+LIST_TTL = 60
+LOOKUP_TTL = 5 * 60
+PROFILE_TTL = 10 * 60
+INSIGHTS_TTL = 15 * 60
+
+# Concurrent requests for multi-resource commands
+DEFAULT_FAN_OUT = 8
+
+T = TypeVar("T")
+
+# One connection pool per process, reused by every AexyClient
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+# Keyring lookups are slow; read the token once per process
+_stored_token: str | None = None
+_stored_token_loaded = False
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared connection pool."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command coroutine and close the shared connections afterwards."""
+
+    async def runner() -> T:
+        try:
+            return await coro
+        finally:
+            await close_http_client()
+
+    return asyncio.run(runner())
+
+
+def get_client() -> "AexyClient":
+    """Build a client with the options given to the ``aexy`` command group."""
+    ctx = click.get_current_context(silent=True)
+    options = (ctx.find_root().obj or {}) if ctx is not None else {}
+    return AexyClient(
+        base_url=options.get("api_url"),
+        use_cache=not options.get("no_cache", False),
+    )
+
 
 class AexyClient:
-    """HTTP client for Aexy API."""
+    """HTTP client for Aexy API.
+
+    Requests share one keep-alive connection pool (HTTP/2 when the ``h2``
+    package is installed). Read endpoints are cached on disk with a TTL
+    and revalidated with ETags; pass ``use_cache=False`` or set
+    ``AEXY_CLI_NO_CACHE=1`` to bypass the cache.
+    """
 
-    def __init__(self, base_url: str | None = None, token: str | None = None):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        token: str | None = None,
+        cache: ResponseCache | None = None,
+        use_cache: bool = True,
+    ):
         self.base_url = base_url or os.environ.get("DEVOGRAPH_API_URL", DEFAULT_BASE_URL)
         self._token = token or self._get_stored_token()
+        self._cache = None if not use_cache or cache_disabled() else cache or ResponseCache()
+
+    async def __aenter__(self) -> "AexyClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await close_http_client()
 
     def _get_stored_token(self) -> str | None:
         """Get token from keyring."""
-        try:
-            return keyring.get_password(SERVICE_NAME, "api_token")
-        except Exception:
-            return os.environ.get("DEVOGRAPH_API_TOKEN")
+        global _stored_token, _stored_token_loaded
+        if not _stored_token_loaded:
+            try:
+                _stored_token = keyring.get_password(SERVICE_NAME, "api_token")
+            except Exception:
+                _stored_token = os.environ.get("DEVOGRAPH_API_TOKEN")
+            _stored_token_loaded = True
+        return _stored_token
 
     def _save_token(self, token: str) -> None:
         """Save token to keyring."""
+        global _stored_token, _stored_token_loaded
+        _stored_token, _stored_token_loaded = token, True
         try:
             keyring.set_password(SERVICE_NAME, "api_token", token)
         except Exception:
@@ -33,6 +135,8 @@ class AexyClient:
 
     def _clear_token(self) -> None:
         """Clear stored token."""
+        global _stored_token, _stored_token_loaded
+        _stored_token, _stored_token_loaded = None, True
         try:
             keyring.delete_password(SERVICE_NAME, "api_token")
         except Exception:
@@ -54,22 +158,52 @@ class AexyClient:
         self,
         method: str,
         endpoint: str,
+        cache_ttl: float | None = None,
         **kwargs: Any,
     ) -> dict | list | None:
-        """Make an HTTP request."""
+        """Make an HTTP request.
+
+        With ``cache_ttl``, a cached response younger than the TTL is
+        returned without a request, and an older one is revalidated.
+        """
         url = f"{self.base_url}{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                url,
-                headers=self._headers(),
-                timeout=30.0,
-                **kwargs,
+        headers = self._headers()
+
+        cache_key = None
+        entry = None
+        if cache_ttl and self._cache is not None:
+            body = {"params": kwargs.get("params"), "json": kwargs.get("json")}
+            cache_key = self._cache.make_key(method, url, body, self._token)
+            entry = self._cache.get(cache_key)
+            if entry is not None:
+                if entry.is_fresh:
+                    return entry.body
+                headers.update(entry.conditional_headers())
+
+        response = await _get_http_client().request(
+            method,
+            url,
+            headers=headers,
+            **kwargs,
+        )
+        if response.status_code == 304 and entry is not None:
+            self._cache.touch(cache_key, entry)
+            return entry.body
+
+        response.raise_for_status()
+        if response.status_code == 204:
+            return None
+        data = response.json()
+
+        if cache_key is not None:
+            self._cache.set(
+                cache_key,
+                data,
+                cache_ttl,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
             )
-            response.raise_for_status()
-            if response.status_code == 204:
-                return None
-            return response.json()
+        return data
 
     async def get(self, endpoint: str, **kwargs: Any) -> dict | list | None:
         """Make a GET request."""
@@ -87,6 +221,20 @@ class AexyClient:
         """Make a DELETE request."""
         return await self._request("DELETE", endpoint, **kwargs)
 
+    async def gather(self, *requests: Awaitable[T], limit: int = DEFAULT_FAN_OUT) -> list[T]:
+        """Run requests concurrently, at most ``limit`` at a time, in order."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(request: Awaitable[T]) -> T:
+            async with semaphore:
+                return await request
+
+        return await asyncio.gather(*(bounded(r) for r in requests))
+
+    def clear_cache(self) -> None:
+        """Remove all cached responses, even if this client bypasses the cache."""
+        (self._cache or ResponseCache()).clear()
+
     # Authentication
     def set_token(self, token: str) -> None:
         """Set and store authentication token."""
@@ -97,53 +245,58 @@ class AexyClient:
         """Clear authentication token."""
         self._token = None
         self._clear_token()
+        self.clear_cache()
 
     # Developer endpoints
     async def list_developers(self) -> list[dict]:
         """List all developers."""
-        result = await self.get("/developers")
+        result = await self.get("/developers", cache_ttl=LIST_TTL)
         return result if isinstance(result, list) else []
 
     async def get_developer(self, developer_id: str) -> dict | None:
         """Get developer by ID."""
-        result = await self.get(f"/developers/{developer_id}")
+        result = await self.get(f"/developers/{developer_id}", cache_ttl=LOOKUP_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_developer_by_username(self, username: str) -> dict | None:
         """Get developer by GitHub username."""
-        result = await self.get(f"/developers/github/{username}")
+        result = await self.get(f"/developers/github/{username}", cache_ttl=LOOKUP_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_developer_profile(self, developer_id: str) -> dict | None:
         """Get developer's full profile with analysis."""
-        result = await self.get(f"/developers/{developer_id}/profile")
+        result = await self.get(f"/developers/{developer_id}/profile", cache_ttl=PROFILE_TTL)
         return result if isinstance(result, dict) else None
 
     # Team endpoints
     async def list_teams(self) -> list[dict]:
         """List all teams."""
-        result = await self.get("/teams")
+        result = await self.get("/teams", cache_ttl=LIST_TTL)
         return result if isinstance(result, list) else []
 
     async def get_team(self, team_id: str) -> dict | None:
         """Get team by ID."""
-        result = await self.get(f"/teams/{team_id}")
+        result = await self.get(f"/teams/{team_id}", cache_ttl=LOOKUP_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_team_skills(self, team_id: str) -> dict | None:
         """Get team skill analysis."""
-        result = await self.get(f"/teams/{team_id}/skills")
+        result = await self.get(f"/teams/{team_id}/skills", cache_ttl=PROFILE_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_team_gaps(self, team_id: str) -> dict | None:
         """Get team skill gaps."""
-        result = await self.get(f"/teams/{team_id}/gaps")
+        result = await self.get(f"/teams/{team_id}/gaps", cache_ttl=PROFILE_TTL)
         return result if isinstance(result, dict) else None
 
     # Analytics endpoints
     async def get_skill_heatmap(self, developer_ids: list[str]) -> dict | None:
         """Get skill heatmap for developers."""
-        result = await self.post("/analytics/heatmap/skills", json={"developer_ids": developer_ids})
+        result = await self.post(
+            "/analytics/heatmap/skills",
+            json={"developer_ids": developer_ids},
+            cache_ttl=PROFILE_TTL,
+        )
         return result if isinstance(result, dict) else None
 
     async def get_productivity_trends(
@@ -155,6 +308,7 @@ class AexyClient:
         result = await self.post(
             "/analytics/productivity",
             json={"developer_ids": developer_ids, "days": days},
+            cache_ttl=PROFILE_TTL,
         )
         return result if isinstance(result, dict) else None
 
@@ -163,23 +317,24 @@ class AexyClient:
         result = await self.post(
             "/analytics/workload",
             json={"developer_ids": developer_ids},
+            cache_ttl=PROFILE_TTL,
         )
         return result if isinstance(result, dict) else None
 
     # Prediction endpoints
     async def get_attrition_risk(self, developer_id: str) -> dict | None:
         """Get attrition risk for developer."""
-        result = await self.get(f"/predictions/attrition/{developer_id}")
+        result = await self.get(f"/predictions/attrition/{developer_id}", cache_ttl=INSIGHTS_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_burnout_risk(self, developer_id: str) -> dict | None:
         """Get burnout risk for developer."""
-        result = await self.get(f"/predictions/burnout/{developer_id}")
+        result = await self.get(f"/predictions/burnout/{developer_id}", cache_ttl=INSIGHTS_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_performance_trajectory(self, developer_id: str) -> dict | None:
         """Get performance trajectory for developer."""
-        result = await self.get(f"/predictions/trajectory/{developer_id}")
+        result = await self.get(f"/predictions/trajectory/{developer_id}", cache_ttl=INSIGHTS_TTL)
         return result if isinstance(result, dict) else None
 
     async def get_team_health(self, developer_ids: list[str]) -> dict | None:
@@ -187,6 +342,7 @@ class AexyClient:
         result = await self.post(
             "/predictions/team-health",
             json={"developer_ids": developer_ids},
+            cache_ttl=INSIGHTS_TTL,
         )
         return result if isinstance(result, dict) else None
 
@@ -1,9 +1,9 @@
 """CLI commands for Aexy."""
 
-from aexy_cli.commands.profile import profile
-from aexy_cli.commands.team import team
-from aexy_cli.commands.match import match
 from aexy_cli.commands.insights import insights
+from aexy_cli.commands.match import match
+from aexy_cli.commands.profile import profile
 from aexy_cli.commands.report import report
+from aexy_cli.commands.team import team
 
 __all__ = ["profile", "team", "match", "insights", "report"]
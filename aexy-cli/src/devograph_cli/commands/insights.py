@@ -1,13 +1,11 @@
 """Insights command - Predictive analytics and insights."""
 
-import asyncio
-
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from aexy_cli.api import AexyClient
+from aexy_cli.api import get_client, run
 
 console = Console()
 
@@ -23,12 +21,12 @@ def insights():
 @click.option("--all", "-a", "show_all", is_flag=True, help="Show all developers")
 def attrition_risk(username: str | None, show_all: bool):
     """View attrition risk analysis."""
-    asyncio.run(_attrition_risk(username, show_all))
+    run(_attrition_risk(username, show_all))
 
 
 async def _attrition_risk(username: str | None, show_all: bool):
     """Async implementation of attrition risk."""
-    client = AexyClient()
+    client = get_client()
 
     if username:
         with console.status(f"[bold green]Fetching developer @{username}..."):
@@ -62,10 +60,11 @@ async def _attrition_risk(username: str | None, show_all: bool):
         table.add_column("Score", style="yellow")
         table.add_column("Top Factor", style="white")
 
-        for dev in developers[:20]:
-            with console.status(f"[dim]Analyzing @{dev.get('github_username')}...[/dim]"):
-                risk = await client.get_attrition_risk(dev["id"])
+        shown = developers[:20]
+        with console.status(f"[bold green]Analyzing {len(shown)} developers..."):
+            risks = await client.gather(*(client.get_attrition_risk(dev["id"]) for dev in shown))
 
+        for dev, risk in zip(shown, risks):
             if risk:
                 score = risk.get("risk_score", 0)
                 level = risk.get("risk_level", "unknown")
@@ -149,12 +148,12 @@ def _get_risk_style(level: str) -> str:
 @click.argument("username")
 def burnout_risk(username: str):
     """View burnout risk analysis for a developer."""
-    asyncio.run(_burnout_risk(username))
+    run(_burnout_risk(username))
 
 
 async def _burnout_risk(username: str):
     """Async implementation of burnout risk."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status(f"[bold green]Fetching developer @{username}..."):
         developer = await client.get_developer_by_username(username)
@@ -204,12 +203,12 @@ async def _burnout_risk(username: str):
 @click.option("--months", "-m", default=6, help="Months to predict ahead")
 def trajectory(username: str, months: int):
     """View performance trajectory prediction."""
-    asyncio.run(_trajectory(username, months))
+    run(_trajectory(username, months))
 
 
 async def _trajectory(username: str, months: int):
     """Async implementation of trajectory."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status(f"[bold green]Fetching developer @{username}..."):
         developer = await client.get_developer_by_username(username)
@@ -282,12 +281,12 @@ async def _trajectory(username: str, months: int):
 @click.argument("team_name", required=False)
 def team_health(team_name: str | None):
     """View team health analysis."""
-    asyncio.run(_team_health(team_name))
+    run(_team_health(team_name))
 
 
 async def _team_health(team_name: str | None):
     """Async implementation of team health."""
-    client = AexyClient()
+    client = get_client()
 
     if team_name:
         with console.status(f"[bold green]Fetching team {team_name}..."):
@@ -1,13 +1,11 @@
 """Match command - Task matching to developers."""
 
-import asyncio
-
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from aexy_cli.api import AexyClient
+from aexy_cli.api import get_client, run
 
 console = Console()
 
@@ -21,12 +19,12 @@ def match(description: str, skills: tuple, top: int):
 
     Example: aexy match "Fix authentication bug in OAuth flow" -s python -s oauth
     """
-    asyncio.run(_match(description, list(skills), top))
+    run(_match(description, list(skills), top))
 
 
 async def _match(description: str, skills: list[str], top: int):
     """Async implementation of match."""
-    client = AexyClient()
+    client = get_client()
 
     console.print(Panel(f"[bold]Task:[/bold] {description}", border_style="blue"))
     if skills:
@@ -1,13 +1,11 @@
 """Profile command - View developer profiles."""
 
-import asyncio
-
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from aexy_cli.api import AexyClient
+from aexy_cli.api import get_client, run
 
 console = Console()
 
@@ -23,12 +21,12 @@ def profile():
 @click.option("--full", "-f", is_flag=True, help="Show full profile with analysis")
 def show_profile(username: str, full: bool):
     """Show developer profile by GitHub username."""
-    asyncio.run(_show_profile(username, full))
+    run(_show_profile(username, full))
 
 
 async def _show_profile(username: str, full: bool):
     """Async implementation of show profile."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status(f"[bold green]Fetching profile for @{username}..."):
         developer = await client.get_developer_by_username(username)
@@ -107,12 +105,12 @@ def _display_full_profile(profile_data: dict):
 @click.option("--limit", "-n", default=20, help="Number of developers to show")
 def list_profiles(limit: int):
     """List all developers."""
-    asyncio.run(_list_profiles(limit))
+    run(_list_profiles(limit))
 
 
 async def _list_profiles(limit: int):
     """Async implementation of list profiles."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status("[bold green]Fetching developers..."):
         developers = await client.list_developers()
@@ -145,12 +143,12 @@ async def _list_profiles(limit: int):
 @click.option("--output", "-o", help="Output file path")
 def export_profile(username: str, format: str, output: str | None):
     """Export developer profile."""
-    asyncio.run(_export_profile(username, format, output))
+    run(_export_profile(username, format, output))
 
 
 async def _export_profile(username: str, format: str, output: str | None):
     """Async implementation of export profile."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status(f"[bold green]Fetching profile for @{username}..."):
         developer = await client.get_developer_by_username(username)
@@ -1,15 +1,14 @@
 """Report command - Generate and export reports."""
 
 import asyncio
-import time
 
 import click
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
-from aexy_cli.api import AexyClient
+from aexy_cli.api import AexyClient, get_client, run
 
 console = Console()
 
@@ -23,12 +22,12 @@ def report():
 @report.command("list")
 def list_reports():
     """List all available reports."""
-    asyncio.run(_list_reports())
+    run(_list_reports())
 
 
 async def _list_reports():
     """Async implementation of list reports."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status("[bold green]Fetching reports..."):
         reports = await client.list_reports()
@@ -71,12 +70,12 @@ def generate_report(report_type: str, format: str, output: str | None, wait: boo
     - team: Team skills and health overview
     - developer: Individual developer profile report
     """
-    asyncio.run(_generate_report(report_type, format, output, wait))
+    run(_generate_report(report_type, format, output, wait))
 
 
 async def _generate_report(report_type: str, format: str, output: str | None, wait: bool):
     """Async implementation of generate report."""
-    client = AexyClient()
+    client = get_client()
 
     console.print(Panel(
         f"[bold]Generating {report_type.title()} Report[/bold]\n"
@@ -152,19 +151,25 @@ async def _wait_for_export(client: AexyClient, job_id: str, output: str | None):
 
 
 @report.command("status")
-@click.argument("job_id")
-def report_status(job_id: str):
-    """Check status of an export job."""
-    asyncio.run(_report_status(job_id))
+@click.argument("job_ids", nargs=-1, required=True)
+def report_status(job_ids: tuple[str, ...]):
+    """Check status of one or more export jobs."""
+    run(_report_status(list(job_ids)))
 
 
-async def _report_status(job_id: str):
+async def _report_status(job_ids: list[str]):
     """Async implementation of report status."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status("[bold green]Fetching job status..."):
-        status = await client.get_export_status(job_id)
+        statuses = await client.gather(*(client.get_export_status(job_id) for job_id in job_ids))
+
+    for job_id, status in zip(job_ids, statuses):
+        _print_job_status(job_id, status)
+
 
+def _print_job_status(job_id: str, status: dict | None):
+    """Print the status panel of one export job."""
     if not status:
         console.print(f"[red]Export job {job_id} not found[/red]")
         return
@@ -214,12 +219,12 @@ def export_data(data_type: str, format: str, output: str):
     - skills: Skill distribution data
     - analytics: Analytics summary
     """
-    asyncio.run(_export_data(data_type, format, output))
+    run(_export_data(data_type, format, output))
 
 
 async def _export_data(data_type: str, format: str, output: str):
     """Async implementation of export data."""
-    client = AexyClient()
+    client = get_client()
 
     console.print(f"[bold]Exporting {data_type} as {format.upper()}...[/bold]")
 
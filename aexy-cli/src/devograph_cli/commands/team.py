@@ -1,14 +1,11 @@
 """Team command - Team analytics and management."""
 
-import asyncio
-
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from aexy_cli.api import AexyClient
+from aexy_cli.api import get_client, run
 
 console = Console()
 
@@ -20,14 +17,15 @@ def team():
 
 
 @team.command("list")
-def list_teams():
+@click.option("--skills", is_flag=True, help="Show each team's top skills")
+def list_teams(skills: bool):
     """List all teams."""
-    asyncio.run(_list_teams())
+    run(_list_teams(skills))
 
 
-async def _list_teams():
+async def _list_teams(show_skills: bool = False):
     """Async implementation of list teams."""
-    client = AexyClient()
+    client = get_client()
 
     with console.status("[bold green]Fetching teams..."):
         teams = await client.list_teams()
@@ -36,18 +34,26 @@ async def _list_teams():
         console.print("[yellow]No teams found[/yellow]")
         return
 
+    team_skills = [None] * len(teams)
+    if show_skills:
+        with console.status(f"[bold green]Fetching skills for {len(teams)} teams..."):
+            team_skills = await client.gather(*(client.get_team_skills(t.get("id")) for t in teams))
+
     table = Table(title=f"Teams ({len(teams)} total)")
     table.add_column("Name", style="cyan")
     table.add_column("Members", style="green")
+    if show_skills:
+        table.add_column("Top Skills", style="magenta")
     table.add_column("Description", style="white")
 
-    for t in teams:
+    for t, skills in zip(teams, team_skills):
         member_count = len(t.get("developer_ids", []))
-        table.add_row(
-            t.get("name", "Unknown"),
-            str(member_count),
-            t.get("description") or "-",
-        )
+        row = [t.get("name", "Unknown"), str(member_count)]
+        if show_skills:
+            names = [s.get("name", "?") for s in (skills or {}).get("skills", [])[:3]]
+            row.append(", ".join(names) or "-")
+        row.append(t.get("description") or "-")
+        table.add_row(*row)
 
     console.print(table)
 
@@ -56,12 +62,12 @@ async def _list_teams():
 @click.argument("team_name", required=False)
 def team_skills(team_name: str | None):
     """Show team skill distribution."""
-    asyncio.run(_team_skills(team_name))
+    run(_team_skills(team_name))
 
 
 async def _team_skills(team_name: str | None):
     """Async implementation of team skills."""
-    client = AexyClient()
+    client = get_client()
 
     # If no team specified, show aggregate for all developers
     if not team_name:
@@ -127,12 +133,12 @@ async def _team_skills(team_name: str | None):
 @click.option("--target-skills", "-s", multiple=True, help="Target skills to check gaps for")
 def team_gaps(team_name: str | None, target_skills: tuple):
     """Identify skill gaps in team."""
-    asyncio.run(_team_gaps(team_name, list(target_skills)))
+    run(_team_gaps(team_name, list(target_skills)))
 
 
 async def _team_gaps(team_name: str | None, target_skills: list[str]):
     """Async implementation of team gaps."""
-    client = AexyClient()
+    client = get_client()
 
     if team_name:
         with console.status(f"[bold green]Fetching team {team_name}..."):
@@ -225,12 +231,12 @@ async def _team_gaps(team_name: str | None, target_skills: list[str]):
 @click.argument("team_name", required=False)
 def team_workload(team_name: str | None):
     """Show workload distribution."""
-    asyncio.run(_team_workload(team_name))
+    run(_team_workload(team_name))
 
 
 async def _team_workload(team_name: str | None):
     """Async implementation of team workload."""
-    client = AexyClient()
+    client = get_client()
 
     if team_name:
         with console.status(f"[bold green]Fetching team {team_name}..."):
@@ -4,8 +4,9 @@ import click
 from rich.console import Console
 
 from aexy_cli import __version__
-from aexy_cli.commands import profile, team, match, insights, report
-from aexy_cli.api import AexyClient
+from aexy_cli.api import ResponseCache, get_client
+from aexy_cli.api.cache import NO_CACHE_ENV, default_cache_dir
+from aexy_cli.commands import insights, match, profile, report, team
 
 console = Console()
 
@@ -13,8 +14,9 @@ console = Console()
 @click.group()
 @click.version_option(version=__version__, prog_name="aexy")
 @click.option("--api-url", envvar="DEVOGRAPH_API_URL", help="Aexy API URL")
+@click.option("--no-cache", is_flag=True, help="Bypass the local response cache")
 @click.pass_context
-def cli(ctx, api_url: str | None):
+def cli(ctx, api_url: str | None, no_cache: bool):
     """Aexy CLI - Developer Intelligence Platform.
 
     Analyze developer skills, team dynamics, and get AI-powered insights
@@ -31,6 +33,7 @@ def cli(ctx, api_url: str | None):
     ctx.ensure_object(dict)
     if api_url:
         ctx.obj["api_url"] = api_url
+    ctx.obj["no_cache"] = no_cache
 
 
 @cli.command()
@@ -40,7 +43,7 @@ def login(token: str):
 
     Get your API token from the Aexy web dashboard under Settings > API.
     """
-    client = AexyClient()
+    client = get_client()
     client.set_token(token)
     console.print("[green]Successfully logged in![/green]")
     console.print("[dim]Token stored securely in system keychain.[/dim]")
@@ -49,7 +52,7 @@ def login(token: str):
 @cli.command()
 def logout():
     """Log out and clear stored credentials."""
-    client = AexyClient()
+    client = get_client()
     client.logout()
     console.print("[green]Successfully logged out![/green]")
 
@@ -57,7 +60,7 @@ def logout():
 @cli.command()
 def status():
     """Check authentication and API status."""
-    client = AexyClient()
+    client = get_client()
 
     console.print(f"[bold]API URL:[/bold] {client.base_url}")
 
@@ -71,17 +74,24 @@ def status():
 @cli.command()
 def config():
     """Show current configuration."""
-    import os
+    client = get_client()
 
     console.print("[bold]Aexy CLI Configuration[/bold]")
     console.print()
 
-    api_url = os.environ.get("DEVOGRAPH_API_URL", "http://localhost:8000/api")
-    console.print(f"API URL: {api_url}")
-    console.print(f"  [dim]Set via DEVOGRAPH_API_URL environment variable[/dim]")
+    console.print(f"API URL: {client.base_url}")
+    console.print("  [dim]Set via --api-url or the DEVOGRAPH_API_URL environment variable[/dim]")
 
-    client = AexyClient()
     console.print(f"Authenticated: {'Yes' if client.is_authenticated else 'No'}")
+    console.print(f"Response cache: {default_cache_dir()}")
+    console.print(f"  [dim]Disable with --no-cache or {NO_CACHE_ENV}=1[/dim]")
+
+
+@cli.command("clear-cache")
+def clear_cache():
+    """Remove cached API responses."""
+    ResponseCache(default_cache_dir()).clear()
+    console.print("[green]Response cache cleared[/green]")
 
 
 # Add command groups
@@ -0,0 +1,77 @@
+"""Tests for the on-disk response cache."""
+
+import time
+
+from aexy_cli.api.cache import CachedResponse, ResponseCache
+
+
+class TestMakeKey:
+    """Test cache keys."""
+
+    def test_body_key_order_is_ignored(self):
+        assert ResponseCache.make_key("get", "/a", {"x": 1, "y": 2}) == ResponseCache.make_key(
+            "GET", "/a", {"y": 2, "x": 1}
+        )
+
+    def test_method_url_body_and_token_are_part_of_the_key(self):
+        key = ResponseCache.make_key("GET", "/a", {"x": 1}, "token-1")
+
+        assert key != ResponseCache.make_key("POST", "/a", {"x": 1}, "token-1")
+        assert key != ResponseCache.make_key("GET", "/b", {"x": 1}, "token-1")
+        assert key != ResponseCache.make_key("GET", "/a", {"x": 2}, "token-1")
+        assert key != ResponseCache.make_key("GET", "/a", {"x": 1}, "token-2")
+        assert key != ResponseCache.make_key("GET", "/a", {"x": 1})
+
+
+class TestResponseCache:
+    """Test storing, expiring and clearing entries."""
+
+    def test_entry_is_fresh_within_its_ttl(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.set("k1", {"a": 1}, ttl=60, etag='"v1"')
+
+        entry = cache.get("k1")
+        assert entry.body == {"a": 1} and entry.is_fresh
+        assert cache.get("k2") is None
+
+    def test_expired_entry_is_kept_for_revalidation(self):
+        entry = CachedResponse(
+            {
+                "body": [1],
+                "etag": '"v1"',
+                "last_modified": "Mon, 01 Jun 2026 00:00:00 GMT",
+                "stored_at": time.time() - 61,
+                "ttl": 60,
+            }
+        )
+
+        assert not entry.is_fresh
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jun 2026 00:00:00 GMT",
+        }
+        assert CachedResponse({"body": [1]}).conditional_headers() == {}
+
+    def test_touch_restarts_the_ttl(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path)
+        clock = [1000.0]
+        monkeypatch.setattr("aexy_cli.api.cache.time.time", lambda: clock[0])
+        cache.set("k1", {"a": 1}, ttl=60, etag='"v1"')
+
+        clock[0] += 61
+        entry = cache.get("k1")
+        assert not entry.is_fresh
+
+        cache.touch("k1", entry)
+        touched = cache.get("k1")
+        assert touched.is_fresh and touched.etag == '"v1"' and touched.body == {"a": 1}
+
+    def test_clear(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.set("k1", 1, ttl=60)
+        cache.set("k2", 2, ttl=60)
+
+        cache.clear()
+
+        assert cache.get("k1") is None and cache.get("k2") is None
+        ResponseCache(tmp_path / "missing").clear()
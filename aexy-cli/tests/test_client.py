@@ -0,0 +1,142 @@
+"""Tests for the API client's cache, connection pool and fan-out."""
+
+import asyncio
+
+import click
+import httpx
+import pytest
+
+from aexy_cli.api import client as client_module
+from aexy_cli.api.cache import NO_CACHE_ENV, ResponseCache
+from aexy_cli.api.client import AexyClient, get_client
+
+
+class FakeServer:
+    """Serves ``/teams`` with an ETag and records the requests it gets."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": "team-1"}], headers={"ETag": '"v1"'})
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    monkeypatch.setattr(client_module, "_get_http_client", lambda: http)
+    monkeypatch.delenv(NO_CACHE_ENV, raising=False)
+    return server
+
+
+def make_client(tmp_path, **kwargs) -> AexyClient:
+    return AexyClient(base_url="http://api", token="token-1", cache=ResponseCache(tmp_path), **kwargs)
+
+
+class TestCachedRequests:
+    """Test serving and revalidating cached responses."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_without_a_request(self, server, tmp_path):
+        client = make_client(tmp_path)
+
+        assert await client.list_teams() == [{"id": "team-1"}]
+        assert await client.list_teams() == [{"id": "team-1"}]
+        assert len(server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_revalidated_and_touched(self, server, tmp_path, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("aexy_cli.api.cache.time.time", lambda: clock[0])
+        client = make_client(tmp_path)
+        await client.list_teams()
+
+        clock[0] += client_module.LIST_TTL + 1
+        assert await client.list_teams() == [{"id": "team-1"}]
+        assert server.requests[-1].headers["If-None-Match"] == '"v1"'
+
+        # The 304 restarted the TTL
+        assert await client.list_teams() == [{"id": "team-1"}]
+        assert len(server.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_always_requests(self, server, tmp_path):
+        client = make_client(tmp_path, use_cache=False)
+
+        await client.list_teams()
+        await client.list_teams()
+
+        assert len(server.requests) == 2
+        assert "If-None-Match" not in server.requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_tokens_do_not_share_entries(self, server, tmp_path):
+        await make_client(tmp_path).list_teams()
+        other = AexyClient(base_url="http://api", token="token-2", cache=ResponseCache(tmp_path))
+
+        await other.list_teams()
+
+        assert len(server.requests) == 2
+
+
+class TestGetClient:
+    """Test building clients from the command group's options."""
+
+    def test_uses_root_context_options(self, monkeypatch):
+        monkeypatch.delenv(NO_CACHE_ENV, raising=False)
+        root = click.Context(click.Group(), obj={"api_url": "http://other/api", "no_cache": True})
+
+        with root, click.Context(click.Command("teams"), parent=root):
+            client = get_client()
+
+        assert client.base_url == "http://other/api"
+        assert client._cache is None
+
+    def test_defaults_outside_a_command(self, monkeypatch):
+        monkeypatch.delenv(NO_CACHE_ENV, raising=False)
+
+        client = get_client()
+
+        assert client._cache is not None
+
+
+class TestConnectionPool:
+    """Test sharing the HTTP client."""
+
+    def test_reused_within_a_loop_and_recreated_on_a_new_one(self):
+        async def two_lookups():
+            try:
+                return client_module._get_http_client(), client_module._get_http_client()
+            finally:
+                await client_module.close_http_client()
+
+        first, same = asyncio.run(two_lookups())
+        second, _ = asyncio.run(two_lookups())
+
+        assert first is same
+        assert second is not first
+        assert first.is_closed and client_module._http_client is None
+
+
+class TestGather:
+    """Test concurrent fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_order_and_respects_the_limit(self, tmp_path):
+        client = make_client(tmp_path)
+        running, peak = 0, 0
+
+        async def fetch(n):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (5 - n))
+            running -= 1
+            return n
+
+        assert await client.gather(*(fetch(n) for n in range(5)), limit=2) == [0, 1, 2, 3, 4]
+        assert peak == 2
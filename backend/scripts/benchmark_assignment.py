@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Compare greedy and optimal task assignment under developer capacity.
+
+Builds random developers and tasks with skill signals, then assigns them
+with the previous greedy algorithm (sort every task-developer pair by
+score) and with the assignment solver used by WhatIfAnalyzer. Reports
+wall time, tasks assigned and total match score for each.
+
+Usage:
+    python scripts/benchmark_assignment.py
+    python scripts/benchmark_assignment.py --tasks 500 --developers 200 --capacity 2
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aexy.services.assignment_solver import solve_assignment, total_score
+from aexy.services.whatif_analyzer import WhatIfAnalyzer
+
+SKILLS = [
+    "python", "typescript", "go", "rust", "java", "react", "django", "fastapi",
+    "postgres", "redis", "kubernetes", "terraform", "graphql", "kafka", "spark",
+]
+DOMAINS = ["payments", "auth", "search", "infra", "ml", "mobile"]
+
+
+def make_developers(count: int, rng: random.Random) -> list[SimpleNamespace]:
+    developers = []
+    for i in range(count):
+        developers.append(SimpleNamespace(
+            id=f"dev-{i}",
+            name=f"Developer {i}",
+            skill_fingerprint={
+                "languages": [
+                    {"name": s, "proficiency_score": rng.randint(30, 100)}
+                    for s in rng.sample(SKILLS[:5], 2)
+                ],
+                "frameworks": [
+                    {"name": s, "proficiency_score": rng.randint(30, 100)}
+                    for s in rng.sample(SKILLS[5:], 3)
+                ],
+                "domains": [
+                    {"name": d, "confidence_score": rng.randint(30, 100)}
+                    for d in rng.sample(DOMAINS, 2)
+                ],
+            },
+        ))
+    return developers
+
+
+def make_tasks(count: int, rng: random.Random) -> list[dict]:
+    return [
+        {
+            "id": f"task-{i}",
+            "title": f"Task {i}",
+            "signals": {
+                "required_skills": rng.sample(SKILLS, 2),
+                "preferred_skills": rng.sample(SKILLS, 1),
+                "domain": rng.choice(DOMAINS),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def greedy(scores: list[list[float]], capacity: int) -> list[int | None]:
+    """The previous algorithm: sort all pairs by score, take greedily."""
+    pairs = [
+        (score, task, dev)
+        for task, row in enumerate(scores)
+        for dev, score in enumerate(row)
+    ]
+    pairs.sort(reverse=True)
+    result: list[int | None] = [None] * len(scores)
+    load = [0] * len(scores[0])
+    for _, task, dev in pairs:
+        if result[task] is None and load[dev] < capacity:
+            result[task] = dev
+            load[dev] += 1
+    return result
+
+
+def report(name: str, seconds: float, scores, result) -> None:
+    assigned = sum(1 for dev in result if dev is not None)
+    print(
+        f"{name:<10} {seconds * 1000:9.1f} ms  "
+        f"assigned {assigned:4d}  total score {total_score(scores, result):8.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--developers", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=3, help="Tasks per developer")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    developers = make_developers(args.developers, rng)
+    tasks = make_tasks(args.tasks, rng)
+    analyzer = WhatIfAnalyzer()
+
+    print(f"{args.tasks} tasks x {args.developers} developers, capacity {args.capacity}")
+
+    start = time.perf_counter()
+    matrix = analyzer.match_matrix(tasks, developers)
+    scores = [[overall for overall, _, _ in row] for row in matrix]
+    print(f"{'matrix':<10} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    start = time.perf_counter()
+    result = greedy(scores, args.capacity)
+    report("greedy", time.perf_counter() - start, scores, result)
+
+    start = time.perf_counter()
+    result = solve_assignment(scores, [args.capacity] * args.developers)
+    report("optimal", time.perf_counter() - start, scores, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Compare REST and GraphQL fetching of pull requests with reviews.
+
+Runs both fetch paths used by SyncService against the in-process GitHub
+stand-in (tests/fakes/github.py) with a simulated round-trip latency, and
+reports API calls and wall time for each.
+
+Usage:
+    python scripts/benchmark_github_fetch.py
+    python scripts/benchmark_github_fetch.py --prs 1000 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add backend/src (aexy) and backend (tests.fakes) to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from aexy.services.github_graphql import GitHubGraphQLFetcher
+from aexy.services.github_service import GitHubService
+from tests.fakes.github import FakeGitHub
+
+
+def _service(fake: FakeGitHub) -> GitHubService:
+    service = GitHubService(access_token="benchmark")
+    service._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(fake.handler),
+        base_url="https://api.github.com",
+    )
+    return service
+
+
+async def fetch_rest(gh: GitHubService) -> tuple[int, int]:
+    """Same call pattern as the REST sync: one PR pass, then a review pass."""
+    prs_seen = reviews_seen = 0
+    for pass_name in ("pulls", "reviews"):
+        page = 1
+        while True:
+            prs = await gh.get_pull_requests("acme", "app", state="all", per_page=100, page=page)
+            if not prs:
+                break
+            if pass_name == "pulls":
+                prs_seen += len(prs)
+            else:
+                for pr in prs:
+                    reviews_seen += len(await gh.get_pull_request_reviews("acme", "app", pr["number"]))
+            if len(prs) < 100:
+                break
+            page += 1
+    return prs_seen, reviews_seen
+
+
+async def fetch_graphql(gh: GitHubService, page_size: int) -> tuple[int, int]:
+    fetcher = GitHubGraphQLFetcher(gh, page_size=page_size)
+    prs_seen = reviews_seen = 0
+    async for prs in fetcher.iter_pull_requests("acme", "app"):
+        prs_seen += len(prs)
+        for pr in prs:
+            reviews = pr["reviews"]
+            if not pr["reviews_complete"]:
+                reviews = await gh.get_pull_request_reviews("acme", "app", pr["number"])
+            reviews_seen += len(reviews)
+    return prs_seen, reviews_seen
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"{args.prs} PRs, up to {args.max_reviews} reviews each, {args.latency * 1000:.0f}ms latency\n")
+    print(f"{'path':<10} {'calls':>7} {'seconds':>9} {'prs':>6} {'reviews':>8}")
+
+    for name in ("rest", "graphql"):
+        fake = FakeGitHub(num_prs=args.prs, max_reviews=args.max_reviews, latency=args.latency)
+        gh = _service(fake)
+        started = time.perf_counter()
+        if name == "rest":
+            prs, reviews = await fetch_rest(gh)
+        else:
+            prs, reviews = await fetch_graphql(gh, args.page_size)
+        elapsed = time.perf_counter() - started
+        await gh._client.aclose()
+        calls = sum(fake.requests.values())
+        print(f"{name:<10} {calls:>7} {elapsed:>9.2f} {prs:>6} {reviews:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prs", type=int, default=500)
+    parser.add_argument("--max-reviews", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per request")
+    parser.add_argument("--page-size", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
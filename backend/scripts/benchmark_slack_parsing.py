@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for Slack message parsing and task reference lookup.
+
+Builds a seeded corpus of real-shaped channel messages (standups in the
+formats people actually use, blocker reports, task chatter with Jira and
+GitHub references, mentions, links and code) and times each parsing
+stage over it, plus task-reference parsing of the same text and task
+lookups against a workspace reference index. Reports the best of several
+runs in microseconds per message.
+
+Usage:
+    python scripts/benchmark_slack_parsing.py
+    python scripts/benchmark_slack_parsing.py --messages 20000 --tasks 50000 --repeat 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add backend/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from aexy.services.slack_message_parser import SlackMessageParser
+from aexy.services.task_reference_parser import TaskReferenceParser
+from aexy.services.workspace_reference_index import WorkspaceReferenceIndex, task_key
+
+PROJECTS = ["PAY", "AUTH", "SEARCH", "INFRA", "MOBILE", "DATA"]
+WORK = [
+    "the retry logic for webhooks", "flaky integration tests", "the billing export",
+    "dashboard load time", "the onboarding emails", "token refresh on mobile",
+    "the search reindex job", "terraform drift in staging", "the CSV importer",
+]
+BLOCKERS = [
+    "blocked by the staging deploy", "waiting on design review", "stuck on a migration lock",
+    "need help with the VPN config", "waiting for API keys from the vendor",
+]
+CHATTER = [
+    "lunch?", "thanks!", "nice work on the release :tada:", "can someone review my PR?",
+    "meeting moved to 3pm", "who owns the on-call rotation this week?", "ack",
+]
+
+
+def make_ref(rng: random.Random) -> str:
+    if rng.random() < 0.6:
+        return f"{rng.choice(PROJECTS)}-{rng.randint(1, 5000)}"
+    if rng.random() < 0.7:
+        return f"#{rng.randint(1, 3000)}"
+    return f"acme/api#{rng.randint(1, 3000)}"
+
+
+def make_message(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.15:
+        return (
+            f"Yesterday: finished {rng.choice(WORK)} ({make_ref(rng)}) | "
+            f"Today: {rng.choice(WORK)} | Blockers: {rng.choice(['none', rng.choice(BLOCKERS)])}"
+        )
+    if kind < 0.25:
+        return (
+            f"Daily standup\nDone: {rng.choice(WORK)}\nToday: {rng.choice(WORK)} {make_ref(rng)}\n"
+            f"Blocked: {rng.choice(BLOCKERS)}"
+        )
+    if kind < 0.35:
+        return f"I'm {rng.choice(BLOCKERS)} on {make_ref(rng)}. Critical for the release."
+    if kind < 0.65:
+        return (
+            f"<@U{rng.randint(100, 999)}|dev{rng.randint(1, 50)}> pushed a fix for {make_ref(rng)} — "
+            f"see <https://github.com/acme/api/pull/{rng.randint(1, 900)}|the PR>, "
+            f"touches `{rng.choice(['billing.py', 'auth.ts', 'search.go'])}`"
+        )
+    if kind < 0.75:
+        return (
+            f"Deploy log for {make_ref(rng)}:\n```\nStep 1/9 : FROM python:3.12\n"
+            f"ERROR: {rng.choice(WORK)} failed\n```\nlooking into it"
+        )
+    return rng.choice(CHATTER)
+
+
+def make_index(task_count: int, rng: random.Random) -> tuple[WorkspaceReferenceIndex, list[str]]:
+    index = WorkspaceReferenceIndex(workspace_id="ws-bench")
+    for i in range(task_count):
+        source_id = (
+            f"{rng.choice(PROJECTS)}-{rng.randint(1, 5000)}" if i % 3 else str(rng.randint(1, 3000))
+        )
+        index.tasks_by_key.setdefault(task_key(source_id), []).append(
+            (f"task-{i}", f"sprint-{i % 20}")
+        )
+    references = [make_ref(rng) for _ in range(task_count)]
+    return index, references
+
+
+def best_of(repeat: int, fn: Callable[[], object]) -> float:
+    """Best wall time of *repeat* runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(name: str, seconds: float, count: int) -> None:
+    print(f"{name:<28} {seconds * 1e6 / count:8.2f} us/op  {count / seconds:12,.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=20000, help="Tasks in the reference index")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_message(rng) for _ in range(args.messages)]
+    slack_parser = SlackMessageParser()
+    reference_parser = TaskReferenceParser()
+    cleaned = [slack_parser._clean_slack_text(text) for text in corpus]
+
+    print(f"{args.messages} messages, {args.tasks} indexed tasks, best of {args.repeat}")
+
+    stages = [
+        ("clean", lambda: [slack_parser._clean_slack_text(t) for t in corpus]),
+        ("task references", lambda: [slack_parser.extract_task_references(t) for t in cleaned]),
+        ("standup detection", lambda: [slack_parser.detect_standup_format(t) for t in cleaned]),
+        ("blocker detection", lambda: [slack_parser.detect_blockers(t) for t in cleaned]),
+        ("parse_message", lambda: [slack_parser.parse_message(t) for t in corpus]),
+        ("TaskReferenceParser.parse", lambda: [reference_parser.parse(t) for t in corpus]),
+    ]
+    for name, fn in stages:
+        report(name, best_of(args.repeat, fn), len(corpus))
+
+    index, references = make_index(args.tasks, rng)
+    report(
+        "index find_task",
+        best_of(args.repeat, lambda: [index.find_task(r, "sprint-3") for r in references]),
+        len(references),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+-- Code Ownership: per-repository path x developer touch matrices
+-- Backs file- and directory-level bus factor, knowledge silo and rotation impact queries
+
+CREATE TABLE IF NOT EXISTS repository_ownership_matrices (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    repository VARCHAR(255) NOT NULL,
+    paths JSONB NOT NULL DEFAULT '[]',
+    developer_ids JSONB NOT NULL DEFAULT '[]',
+    cells JSONB NOT NULL DEFAULT '[]',
+    commits_applied INTEGER NOT NULL DEFAULT 0,
+    backfilled_at TIMESTAMPTZ,
+    backfill_cursor UUID,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_repository_ownership_matrices_repository
+ON repository_ownership_matrices(repository);
+
+-- Lets team queries find matrices containing any of their developers
+CREATE INDEX IF NOT EXISTS ix_repository_ownership_matrices_developer_ids
+ON repository_ownership_matrices USING GIN (developer_ids);
+
+-- Marks matrices whose pre-existing commit history has been folded in
+ALTER TABLE repository_ownership_matrices ADD COLUMN IF NOT EXISTS backfilled_at TIMESTAMPTZ;
+
+-- Last commit folded in by the backfill, so a failed or capped run resumes after it
+ALTER TABLE repository_ownership_matrices ADD COLUMN IF NOT EXISTS backfill_cursor UUID;
@@ -0,0 +1,42 @@
+-- Collaboration Graph: precomputed weekly review interaction edges
+-- Replaces per-request scans of code_reviews/pull_requests in collaboration queries
+
+CREATE TABLE IF NOT EXISTS collaboration_edge_buckets (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    reviewer_id UUID NOT NULL REFERENCES developers(id) ON DELETE CASCADE,
+    author_id UUID NOT NULL REFERENCES developers(id) ON DELETE CASCADE,
+    bucket_start DATE NOT NULL,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    last_interaction_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_collaboration_edge_buckets_reviewer_id ON collaboration_edge_buckets(reviewer_id);
+CREATE INDEX IF NOT EXISTS ix_collaboration_edge_buckets_author_id ON collaboration_edge_buckets(author_id);
+CREATE INDEX IF NOT EXISTS ix_collaboration_edge_buckets_bucket_start ON collaboration_edge_buckets(bucket_start);
+
+DO $$ BEGIN
+    ALTER TABLE collaboration_edge_buckets
+        ADD CONSTRAINT uq_collaboration_edge_bucket
+        UNIQUE (reviewer_id, author_id, bucket_start);
+EXCEPTION
+    WHEN duplicate_table THEN NULL;
+    WHEN duplicate_object THEN NULL;
+END $$;
+
+-- Backfill from existing reviews (no-op for buckets that already exist)
+INSERT INTO collaboration_edge_buckets (reviewer_id, author_id, bucket_start, review_count, last_interaction_at)
+SELECT
+    cr.developer_id,
+    pr.developer_id,
+    date_trunc('week', cr.submitted_at)::date,
+    COUNT(*),
+    MAX(cr.submitted_at)
+FROM code_reviews cr
+JOIN pull_requests pr ON pr.github_id = cr.pull_request_github_id
+WHERE cr.submitted_at IS NOT NULL
+  AND cr.developer_id IS NOT NULL
+  AND pr.developer_id IS NOT NULL
+  AND cr.developer_id <> pr.developer_id
+GROUP BY cr.developer_id, pr.developer_id, date_trunc('week', cr.submitted_at)::date
+ON CONFLICT (reviewer_id, author_id, bucket_start) DO NOTHING;
@@ -0,0 +1,5 @@
+-- Export jobs: streaming progress counters
+-- Updated every few thousand rows while a streamed export is written
+
+ALTER TABLE export_jobs ADD COLUMN IF NOT EXISTS rows_processed INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE export_jobs ADD COLUMN IF NOT EXISTS rows_total INTEGER;
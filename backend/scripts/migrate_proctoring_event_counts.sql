@@ -0,0 +1,24 @@
+-- Assessment attempts: running proctoring event counters
+-- Trust scores are computed from these instead of recounting every event
+
+ALTER TABLE assessment_attempts ADD COLUMN IF NOT EXISTS proctoring_event_counts JSONB NOT NULL DEFAULT '{}';
+ALTER TABLE assessment_attempts ADD COLUMN IF NOT EXISTS critical_event_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill counters for attempts with events logged before this migration
+UPDATE assessment_attempts a
+SET proctoring_event_counts = c.counts,
+    critical_event_count = c.critical
+FROM (
+    SELECT attempt_id,
+           jsonb_object_agg(event_type, n) AS counts,
+           SUM(critical)::INTEGER AS critical
+    FROM (
+        SELECT attempt_id, event_type, COUNT(*) AS n,
+               COUNT(*) FILTER (WHERE severity = 'critical') AS critical
+        FROM proctoring_events
+        GROUP BY attempt_id, event_type
+    ) per_type
+    GROUP BY attempt_id
+) c
+WHERE a.id = c.attempt_id
+  AND a.proctoring_event_counts = '{}'::jsonb;
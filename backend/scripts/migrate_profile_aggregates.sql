@@ -0,0 +1,23 @@
+-- Developer profile aggregates: stored commit counters for incremental profile sync
+-- Each sync folds only commits ingested since folded_through instead of reloading full history
+
+CREATE TABLE IF NOT EXISTS developer_profile_aggregates (
+    developer_id UUID PRIMARY KEY REFERENCES developers(id) ON DELETE CASCADE,
+    commit_aggregates JSONB NOT NULL DEFAULT '{}',
+    commits_folded INTEGER NOT NULL DEFAULT 0,
+    folded_through TIMESTAMPTZ,
+    last_full_rebuild_at TIMESTAMPTZ,
+    last_sync_mode VARCHAR(20),
+    last_sync_ms INTEGER,
+    last_synced_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Finds the slowest profiles
+CREATE INDEX IF NOT EXISTS ix_developer_profile_aggregates_last_sync_ms
+ON developer_profile_aggregates(last_sync_ms);
+
+-- Incremental folds scan a developer's commits by ingestion time
+CREATE INDEX IF NOT EXISTS ix_commits_developer_id_created_at
+ON commits(developer_id, created_at);
@@ -0,0 +1,67 @@
+-- Reminder Dashboard Counters: materialized instance counts per workspace and owner
+-- Replaces per-request aggregation over reminder_instances on the dashboard pages
+
+CREATE TABLE IF NOT EXISTS reminder_stats_counters (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    workspace_id UUID NOT NULL REFERENCES workspaces(id) ON DELETE CASCADE,
+    scope VARCHAR(64) NOT NULL,
+    key VARCHAR(320) NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_reminder_stats_counters_workspace_id ON reminder_stats_counters(workspace_id);
+
+DO $$ BEGIN
+    ALTER TABLE reminder_stats_counters
+        ADD CONSTRAINT uq_reminder_stats_counter
+        UNIQUE (workspace_id, scope, key);
+EXCEPTION
+    WHEN duplicate_table THEN NULL;
+    WHEN duplicate_object THEN NULL;
+END $$;
+
+-- Backfill from existing instances (no-op for counters that already exist).
+-- Scope is 'workspace' for totals or the assigned owner's developer id.
+WITH instance_counts AS (
+    SELECT r.workspace_id, ri.assigned_owner_id, ri.status, r.category, r.priority, r.domain, COUNT(*) AS n
+    FROM reminder_instances ri
+    JOIN reminders r ON r.id = ri.reminder_id
+    GROUP BY r.workspace_id, ri.assigned_owner_id, ri.status, r.category, r.priority, r.domain
+),
+keyed AS (
+    SELECT workspace_id, assigned_owner_id, 'status:' || status AS key, n FROM instance_counts
+    UNION ALL
+    SELECT workspace_id, assigned_owner_id, 'category:' || category || ':' || status, n FROM instance_counts
+    UNION ALL
+    SELECT workspace_id, assigned_owner_id, 'priority:' || priority || ':' || status, n FROM instance_counts
+    UNION ALL
+    SELECT workspace_id, assigned_owner_id, 'domain:' || domain || ':' || status, n
+    FROM instance_counts WHERE domain IS NOT NULL
+    UNION ALL
+    SELECT r.workspace_id, ri.assigned_owner_id,
+           'completed:week:' || to_char(date_trunc('week', ri.completed_at AT TIME ZONE 'UTC'), 'YYYY-MM-DD'),
+           COUNT(*)
+    FROM reminder_instances ri
+    JOIN reminders r ON r.id = ri.reminder_id
+    WHERE ri.status = 'completed' AND ri.completed_at IS NOT NULL
+    GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT r.workspace_id, ri.assigned_owner_id,
+           'completed:month:' || to_char(ri.completed_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+           COUNT(*)
+    FROM reminder_instances ri
+    JOIN reminders r ON r.id = ri.reminder_id
+    WHERE ri.status = 'completed' AND ri.completed_at IS NOT NULL
+    GROUP BY 1, 2, 3
+),
+scoped AS (
+    SELECT workspace_id, 'workspace' AS scope, key, n FROM keyed
+    UNION ALL
+    SELECT workspace_id, assigned_owner_id::text, key, n FROM keyed WHERE assigned_owner_id IS NOT NULL
+)
+INSERT INTO reminder_stats_counters (workspace_id, scope, key, value)
+SELECT workspace_id, scope, key, SUM(n)
+FROM scoped
+GROUP BY workspace_id, scope, key
+ON CONFLICT (workspace_id, scope, key) DO NOTHING;
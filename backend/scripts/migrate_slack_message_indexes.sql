@@ -0,0 +1,9 @@
+-- Tracking records imported from Slack: look up by source message
+-- History imports check each page of messages against these with one query
+
+CREATE INDEX IF NOT EXISTS ix_standups_slack_message
+    ON developer_standups (slack_channel_id, slack_message_ts);
+CREATE INDEX IF NOT EXISTS ix_work_logs_slack_message
+    ON work_logs (slack_channel_id, slack_message_ts);
+CREATE INDEX IF NOT EXISTS ix_blockers_slack_message
+    ON blockers (slack_channel_id, slack_message_ts);
@@ -0,0 +1,11 @@
+-- Synced emails: track whether the message body has been fetched
+-- Gmail sync now stores headers and snippet first and fetches bodies lazily
+
+ALTER TABLE synced_emails ADD COLUMN IF NOT EXISTS body_fetched_at TIMESTAMPTZ;
+
+-- Emails synced before this migration were fetched in full (safe to re-run:
+-- metadata-only rows have no body yet)
+UPDATE synced_emails
+SET body_fetched_at = created_at
+WHERE body_fetched_at IS NULL
+  AND (body_text IS NOT NULL OR body_html IS NOT NULL);
@@ -302,7 +302,7 @@ async def match_task_to_developers(
     """Find the best developer matches for a task.
 
     Analyzes the task description to extract required skills,
-    then scores all available developers for the best match.
+    shortlists developers by skill profile and scores the shortlist.
 
     Args:
         task: Task to match
@@ -404,11 +404,12 @@ async def bulk_match_tasks(
             for dev in developers
         ]
 
-        # Match each task
+        # Match each task against one shared skill index
         results = {}
+        index = matcher.build_index(developer_dicts)
         for task in tasks:
             try:
-                match_result = await matcher.match_task(task, developer_dicts)
+                match_result = await matcher.match_task(task, developer_dicts, index=index)
                 results[task.title] = match_result
             except Exception as e:
                 logger.warning(f"Failed to match task '{task.title}': {e}")
@@ -657,8 +658,8 @@ async def optimize_assignments(
 ) -> WhatIfResponse:
     """Generate an optimized assignment scenario.
 
-    Uses a greedy algorithm to assign tasks to developers
-    based on skill match, experience, and workload balance.
+    Finds the assignment with the highest total skill match
+    that keeps every developer within the workload limit.
     """
     result = await db.execute(select(Developer))
     developers = list(result.scalars().all())
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.api.developers import get_current_developer_id
-from aexy.core.database import get_db
+from aexy.core.database import read_only
 from aexy.schemas.analytics import (
     SkillHeatmapRequest,
     SkillHeatmapData,
@@ -25,7 +25,7 @@ router = APIRouter(prefix="/analytics")
 @router.post("/heatmap/skills", response_model=SkillHeatmapData)
 async def get_skill_heatmap(
     request: SkillHeatmapRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_only),
     _: str = Depends(get_current_developer_id),
 ) -> SkillHeatmapData:
     """Generate a team skill heatmap.
@@ -51,7 +51,7 @@ async def get_skill_heatmap(
 async def get_activity_heatmap(
     developer_id: str,
     days: int = 365,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_only),
     _: str = Depends(get_current_developer_id),
 ) -> ActivityHeatmapData:
     """Generate an activity heatmap for a developer.
@@ -75,7 +75,7 @@ async def get_activity_heatmap(
 @router.post("/productivity", response_model=ProductivityTrends)
 async def get_productivity_trends(
     request: ProductivityRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_only),
     _: str = Depends(get_current_developer_id),
 ) -> ProductivityTrends:
     """Get productivity trends for developers.
@@ -100,7 +100,7 @@ async def get_productivity_trends(
 @router.post("/workload", response_model=WorkloadDistribution)
 async def get_workload_distribution(
     request: WorkloadRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_only),
     _: str = Depends(get_current_developer_id),
 ) -> WorkloadDistribution:
     """Get workload distribution across developers.
@@ -124,7 +124,7 @@ async def get_workload_distribution(
 @router.post("/collaboration", response_model=CollaborationGraph)
 async def get_collaboration_network(
     request: CollaborationRequest,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_only),
     _: str = Depends(get_current_developer_id),
 ) -> CollaborationGraph:
     """Get collaboration network for developers.
@@ -126,6 +126,26 @@ class ProctoringEventResponse(BaseModel):
     trust_score: int
 
 
+class BufferedProctoringEvent(BaseModel):
+    """A proctoring event buffered on the client."""
+    event_type: str = Field(..., description="Type of event")
+    data: dict[str, Any] | None = Field(None, description="Additional event data")
+    screenshot_url: str | None = Field(None, description="Screenshot URL if available")
+    timestamp: datetime | None = Field(None, description="When the event happened on the client")
+    duration_seconds: int | None = Field(None, ge=0, description="Duration for ongoing events")
+
+
+class ProctoringEventBatchRequest(BaseModel):
+    """Request to log a batch of buffered proctoring events."""
+    events: list[BufferedProctoringEvent] = Field(..., min_length=1, max_length=500)
+
+
+class ProctoringEventBatchResponse(BaseModel):
+    """Response after logging a batch of proctoring events."""
+    accepted: int
+    trust_score: int
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -796,17 +816,47 @@ async def log_proctoring_event(
 
     proctoring_service = ProctoringService(db)
 
-    event = await proctoring_service.log_event(
-        attempt_id=str(attempt.id),
-        event_type=request.event_type,
-        data=request.data,
-        screenshot_url=request.screenshot_url,
+    events, trust_score = await proctoring_service.log_events(
+        str(attempt.id),
+        [request.model_dump()],
     )
 
-    trust_score = await proctoring_service.calculate_trust_score(str(attempt.id))
-
     return ProctoringEventResponse(
-        event_id=str(event.id),
+        event_id=str(events[0].id),
+        trust_score=trust_score,
+    )
+
+
+@router.post("/{token}/proctoring/events", response_model=ProctoringEventBatchResponse)
+async def log_proctoring_events(
+    token: str,
+    request: ProctoringEventBatchRequest,
+    db: AsyncSession = Depends(get_db),
+) -> ProctoringEventBatchResponse:
+    """Log a batch of proctoring events buffered by the client.
+
+    Clients should buffer events for a few seconds and send them together
+    rather than posting each one.
+    """
+    invitation = await get_invitation_by_token(token, db)
+
+    # Get active attempt
+    attempt = await get_active_attempt(invitation, db)
+    if not attempt:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No active attempt found",
+        )
+
+    proctoring_service = ProctoringService(db)
+
+    events, trust_score = await proctoring_service.log_events(
+        str(attempt.id),
+        [event.model_dump() for event in request.events],
+    )
+
+    return ProctoringEventBatchResponse(
+        accepted=len(events),
         trust_score=trust_score,
     )
 
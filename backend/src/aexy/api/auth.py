@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.core.config import get_settings
 from aexy.core.database import get_db
+from aexy.core.http_clients import get_http_transport
 from aexy.schemas.auth import TokenResponse
 from aexy.services.developer_service import DeveloperService
 from aexy.services.github_service import GitHubAPIError, GitHubAuthError, GitHubService
@@ -332,7 +333,7 @@ async def google_callback(
 
     try:
         # Exchange code for tokens
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             token_response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -224,6 +224,7 @@ async def calendar_oauth_callback(
     connection, and redirects the user back to the frontend.
     """
     import httpx
+    from aexy.core.http_clients import get_http_transport
     from datetime import datetime, timedelta
     from zoneinfo import ZoneInfo
 
@@ -283,7 +284,7 @@ async def calendar_oauth_callback(
                 "redirect_uri": callback_url,
             }
 
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 token_response = await client.post(token_url, data=token_data)
 
                 if token_response.status_code != 200:
@@ -357,7 +358,7 @@ async def calendar_oauth_callback(
                 "scope": " ".join(MICROSOFT_CALENDAR_SCOPES) + " offline_access",
             }
 
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 token_response = await client.post(token_url, data=token_data)
 
                 if token_response.status_code != 200:
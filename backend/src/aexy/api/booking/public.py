@@ -23,6 +23,7 @@ from aexy.schemas.booking import (
     BookingCancelRequest,
     BookingRescheduleRequest,
     AvailableSlotsResponse,
+    HostBusyTiming,
     TimeSlot,
 )
 from aexy.services.booking import BookingService, AvailabilityService, CalendarSyncService
@@ -325,7 +326,7 @@ async def get_available_slots(
     availability_service = AvailabilityService(db)
     calendar_service = CalendarSyncService(db)
 
-    slots = await availability_service.get_available_slots(
+    result = await availability_service.get_available_slots_result(
         event_type_id=event_type.id,
         target_date=target_date,
         timezone=timezone,
@@ -343,7 +344,16 @@ async def get_available_slots(
                 end_time=s["end_time"],
                 available=s["available"],
             )
-            for s in slots
+            for s in result.slots
+        ],
+        partial=result.partial,
+        host_timings=[
+            HostBusyTiming(
+                host_id=host.host_id,
+                status=host.status,
+                duration_ms=round(host.duration_ms, 1),
+            )
+            for host in result.host_timings
         ],
     )
 
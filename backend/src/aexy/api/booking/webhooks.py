@@ -227,6 +227,7 @@ async def test_webhook(
 ):
     """Test a webhook by sending a test payload."""
     import httpx
+    from aexy.core.http_clients import get_http_transport
     import time
     import hashlib
     import hmac
@@ -266,7 +267,7 @@ async def test_webhook(
     start_time = time.time()
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 webhook.url,
                 json=test_payload,
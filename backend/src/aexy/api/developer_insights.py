@@ -21,7 +21,7 @@ from sqlalchemy import and_, distinct, func, or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.api.developers import get_current_developer_id
-from aexy.core.database import get_db
+from aexy.core.database import get_db, read_only
 from aexy.models.developer import Developer
 from aexy.models.developer_insights import PeriodType
 from aexy.models.workspace import WorkspaceMember
@@ -29,6 +29,7 @@ from aexy.models.team import TeamMember
 from aexy.models.project import ProjectMember
 from aexy.models.developer_insights import InsightSettings, DeveloperWorkingSchedule, InsightAlertRule, InsightAlertHistory
 from aexy.models.repository import Repository, DeveloperRepository
+from aexy.schemas.analytics import ExportFormat, ExportJobResponse, ExportRequest, ExportType
 from aexy.schemas.developer_insights import (
     DeveloperInsightsResponse,
     DeveloperSnapshotResponse,
@@ -231,7 +232,7 @@ async def _get_project_developer_ids(
 async def get_developer_insights(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -311,7 +312,7 @@ async def get_developer_insights(
 async def get_velocity_forecast(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     periods_back: int = Query(default=6, ge=2, le=24),
@@ -336,7 +337,7 @@ async def get_velocity_forecast(
 async def get_gaming_flags(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -365,7 +366,7 @@ async def get_gaming_flags(
 async def get_developer_code_churn(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -396,7 +397,7 @@ async def get_developer_code_churn(
 async def get_developer_pr_sizes(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -425,7 +426,7 @@ async def get_developer_pr_sizes(
 async def get_developer_health_score(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -454,7 +455,7 @@ async def get_developer_health_score(
 async def get_developer_percentile(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     team_id: str | None = Query(default=None),
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
@@ -494,7 +495,7 @@ async def get_developer_percentile(
 async def get_role_benchmark(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -523,7 +524,7 @@ async def get_role_benchmark(
 async def get_developer_trends(
     workspace_id: str,
     dev_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     limit: int = Query(default=12, ge=1, le=52),
@@ -563,7 +564,7 @@ async def get_developer_trends(
 @router.get("/team", response_model=TeamInsightsResponse)
 async def get_team_insights(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     team_id: str | None = Query(default=None),
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
@@ -649,7 +650,7 @@ async def get_team_insights(
 @router.get("/team/export-csv")
 async def export_team_csv(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -709,7 +710,7 @@ async def export_team_csv(
 @router.get("/team/compare", response_model=list[DeveloperInsightsResponse])
 async def compare_developers(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     developer_ids: str = Query(description="Comma-separated developer IDs"),
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
@@ -764,7 +765,7 @@ async def compare_developers(
 @router.get("/team/leaderboard", response_model=LeaderboardResponse)
 async def get_leaderboard(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     metric: str = Query(default="commits", description="commits|prs_merged|lines_changed|reviews_given"),
     team_id: str | None = Query(default=None),
@@ -963,14 +964,33 @@ async def export_developer_data(
     dev_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
+    format: ExportFormat | None = Query(default=None),
+    compress: bool = Query(default=False),
 ):
-    """Export all personal insight data for a developer (GDPR compliance)."""
-    from aexy.services.developer_insights_service import DeveloperInsightsService
-
-    service = DeveloperInsightsService(db)
-    result = await service.export_developer_data(dev_id, workspace_id)
+    """Export all personal insight data for a developer (GDPR compliance).
 
-    return result
+    Without `format` the data is returned inline. With a format an export
+    job is queued and the export worker streams the rows into its file;
+    poll /exports/{job_id} and download via /exports/{job_id}/download.
+    """
+    from aexy.services.developer_insights_service import DeveloperInsightsService
+    from aexy.services.export_service import ExportService
+
+    if format is None:
+        return await DeveloperInsightsService(db).export_developer_data(dev_id, workspace_id)
+
+    request = ExportRequest(
+        export_type=ExportType.DEVELOPER_PROFILE,
+        format=format,
+        config={
+            "developer_id": dev_id,
+            "workspace_id": workspace_id,
+            "compress": compress,
+            "title": "Developer Insights Data Export",
+        },
+    )
+    job = await ExportService().submit_export_job(request, developer_id, db)
+    return ExportJobResponse.model_validate(job)
 
 
 # ---------------------------------------------------------------------------
@@ -980,7 +1000,7 @@ async def export_developer_data(
 @router.get("/team/sprint-capacity")
 async def get_sprint_capacity(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     team_id: str | None = Query(default=None),
     sprint_length_days: int = Query(default=14, ge=7, le=30),
@@ -1034,7 +1054,7 @@ async def get_sprint_capacity(
 @router.get("/executive/summary")
 async def get_executive_summary(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -1090,15 +1110,21 @@ async def get_executive_summary(
 @router.get("/team/bus-factor")
 async def get_bus_factor(
     workspace_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     team_id: str | None = Query(default=None),
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
     end_date: datetime | None = Query(default=None),
     threshold: float = Query(default=0.8, ge=0.5, le=1.0),
+    granularity: str = Query(default="repository", pattern="^(repository|directory|file)$"),
+    depth: int = Query(default=1, ge=1, le=10),
 ):
-    """Get bus factor analysis per repository for team or workspace."""
+    """Get bus factor analysis per repository for team or workspace.
+
+    `granularity=directory|file` breaks each repository down by path using the
+    ownership matrices maintained at ingest time.
+    """
     from aexy.services.developer_insights_service import DeveloperInsightsService
 
     if not start_date or not end_date:
@@ -1114,7 +1140,9 @@ async def get_bus_factor(
         raise HTTPException(status_code=404, detail="No team members found")
 
     service = DeveloperInsightsService(db)
-    bus_factors = await service.compute_bus_factor(dev_ids, start_date, end_date, threshold)
+    bus_factors = await service.compute_bus_factor(
+        dev_ids, start_date, end_date, threshold, granularity=granularity, depth=depth
+    )
 
     return {
         "workspace_id": workspace_id,
@@ -1122,6 +1150,7 @@ async def get_bus_factor(
         "period_start": start_date.isoformat(),
         "period_end": end_date.isoformat(),
         "threshold": threshold,
+        "granularity": granularity,
         "repositories": bus_factors,
     }
 
@@ -1134,7 +1163,7 @@ async def get_bus_factor(
 async def get_project_insights(
     workspace_id: str,
     project_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
     start_date: datetime | None = Query(default=None),
@@ -1190,7 +1219,7 @@ async def get_project_insights(
 async def get_project_leaderboard(
     workspace_id: str,
     project_id: str,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(read_only)],
     developer_id: Annotated[str, Depends(verify_workspace_membership)],
     metric: str = Query(default="commits"),
     period_type: PeriodTypeParam = Query(default=PeriodTypeParam.weekly),
@@ -211,6 +211,7 @@ async def track_image(
         from aexy.services.tracking_service import TrackingService
         from aexy.models.email_marketing import HostedImage
         import httpx
+        from aexy.core.http_clients import get_http_transport
 
         # Get the image
         result = await db.execute(
@@ -229,7 +230,7 @@ async def track_image(
 
         # Fetch and serve the image from storage
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 response = await client.get(image.storage_url, timeout=10.0)
 
                 if response.status_code != 200:
@@ -59,7 +59,8 @@ async def ses_webhook(
             if subscribe_url:
                 # Auto-confirm by fetching the URL
                 import httpx
-                async with httpx.AsyncClient() as client:
+                from aexy.core.http_clients import get_http_transport
+                async with httpx.AsyncClient(transport=get_http_transport()) as client:
                     await client.get(subscribe_url)
                 logger.info(f"Confirmed SNS subscription: {payload.get('TopicArn')}")
             return {"status": "subscription_confirmed"}
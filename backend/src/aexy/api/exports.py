@@ -39,7 +39,7 @@ async def create_export(
     service = ExportService()
 
     try:
-        job = await service.create_export_job(
+        job = await service.submit_export_job(
             request=request,
             requester_id=current_user_id,
             db=db,
@@ -119,11 +119,14 @@ async def download_export(
         ExportFormat.PDF: "application/pdf",
         ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     }
+    media_type = content_types.get(format_type, "application/octet-stream")
+    if file_path.suffix == ".gz":
+        media_type = "application/gzip"
 
     return FileResponse(
         path=str(file_path),
         filename=file_path.name,
-        media_type=content_types.get(format_type, "application/octet-stream"),
+        media_type=media_type,
     )
 
 
@@ -266,6 +266,7 @@ async def oauth_callback(
     Redirects to frontend with success/error status.
     """
     import httpx
+    from aexy.core.http_clients import get_http_transport
 
     settings = get_settings()
     frontend_url = settings.frontend_url
@@ -292,7 +293,7 @@ async def oauth_callback(
 
     try:
         # Exchange code for tokens
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -315,7 +316,7 @@ async def oauth_callback(
             token_data = response.json()
 
         # Get user info
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 GOOGLE_USERINFO_URL,
                 headers={"Authorization": f"Bearer {token_data['access_token']}"},
@@ -391,6 +392,7 @@ async def google_oauth_callback(
     Workspace ID is extracted from the state parameter.
     """
     import httpx
+    from aexy.core.http_clients import get_http_transport
 
     settings = get_settings()
     frontend_url = settings.frontend_url
@@ -422,7 +424,7 @@ async def google_oauth_callback(
 
     try:
         # Exchange code for tokens
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -445,7 +447,7 @@ async def google_oauth_callback(
             token_data = response.json()
 
         # Get user info
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 GOOGLE_USERINFO_URL,
                 headers={"Authorization": f"Bearer {token_data['access_token']}"},
@@ -829,6 +831,18 @@ async def get_email(
     if not email:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Email not found")
 
+    # Sync stores metadata only; fetch the body the first time it is viewed
+    if email.body_fetched_at is None:
+        from aexy.services.gmail_sync_service import GmailSyncService, GmailSyncError
+
+        integration = await get_integration(workspace_id, db, required=False)
+        if integration:
+            try:
+                await GmailSyncService(db).fetch_bodies(integration, [email])
+                await db.commit()
+            except GmailSyncError as e:
+                logger.warning(f"Failed to fetch body for email {email_id}: {e}")
+
     return SyncedEmailResponse(
         id=email.id,
         gmail_id=email.gmail_id,
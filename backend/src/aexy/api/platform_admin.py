@@ -16,7 +16,8 @@ from sqlalchemy.orm import selectinload
 
 from aexy.api.developers import get_current_developer_id
 from aexy.core.config import get_settings
-from aexy.core.database import get_db
+from aexy.core.database import database_pool_stats, get_db
+from aexy.core.http_clients import http_client_stats
 from aexy.models.developer import Developer
 from aexy.models.notification import EmailNotificationLog, Notification
 from aexy.models.workspace import Workspace, WorkspaceMember
@@ -710,3 +711,25 @@ async def list_users(
         per_page=per_page,
         has_next=(page * per_page) < total,
     )
+
+
+@router.get("/http-clients")
+async def get_http_client_metrics(
+    admin: Developer = Depends(get_platform_admin),
+) -> dict[str, dict[str, Any]]:
+    """Get per-upstream latency and pool wait metrics of outbound HTTP pools.
+
+    Metrics are per process (this API instance), since pools are.
+    """
+    return http_client_stats()
+
+
+@router.get("/db-pools")
+async def get_db_pool_metrics(
+    admin: Developer = Depends(get_platform_admin),
+) -> dict[str, dict[str, Any]]:
+    """Get checkout wait times and usage of the primary and replica pools.
+
+    Metrics are per process (this API instance), since pools are.
+    """
+    return database_pool_stats()
@@ -46,6 +46,7 @@ from aexy.schemas.reminder import (
     SuggestionListResponse,
     # Dashboard schemas
     ReminderDashboardStats,
+    MyReminderCounts,
     MyRemindersResponse,
     # Calendar schemas
     ReminderCalendarResponse,
@@ -279,6 +280,7 @@ async def get_my_reminders(
         overdue=[instance_to_response(i) for i in data["overdue"]],
         due_today=[instance_to_response(i) for i in data["due_today"]],
         due_this_week=[instance_to_response(i) for i in data["due_this_week"]],
+        counts=MyReminderCounts(**data["counts"]),
     )
 
 
@@ -682,10 +682,9 @@ async def add_comment(
 # Export Endpoints
 # ============================================================================
 
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse
 from aexy.schemas.analytics import ExportFormat
 from aexy.services.export_service import ExportService
-import io
 
 
 @router.get("/export/{format}")
@@ -715,50 +714,7 @@ async def export_sprint_tasks(
             detail="You don't have permission to access this sprint",
         )
 
-    # Get all tasks for the sprint
-    tasks = await task_service.get_sprint_tasks(sprint_id)
-
-    # Calculate stats
-    stats = {
-        "total": len(tasks),
-        "completed": len([t for t in tasks if t.status == "done"]),
-        "in_progress": len([t for t in tasks if t.status == "in_progress"]),
-        "todo": len([t for t in tasks if t.status in ["todo", "backlog"]]),
-        "review": len([t for t in tasks if t.status == "review"]),
-        "total_points": sum(t.story_points or 0 for t in tasks),
-        "completed_points": sum(t.story_points or 0 for t in tasks if t.status == "done"),
-    }
-
-    # Convert tasks to export format
-    export_tasks = []
-    for task in tasks:
-        assignee = task.assignee
-        epic = task.epic if hasattr(task, "epic") else None
-        export_tasks.append({
-            "id": str(task.id),
-            "title": task.title,
-            "description": task.description or "",
-            "status": task.status,
-            "priority": task.priority,
-            "story_points": task.story_points,
-            "labels": task.labels or [],
-            "assignee_id": str(task.assignee_id) if task.assignee_id else None,
-            "assignee_name": assignee.name if assignee else None,
-            "epic_id": str(task.epic_id) if task.epic_id else None,
-            "epic_title": epic.title if epic else None,
-            "created_at": task.created_at.isoformat() if task.created_at else None,
-            "updated_at": task.updated_at.isoformat() if task.updated_at else None,
-        })
-
-    data = {
-        "title": f"Sprint: {sprint.name}",
-        "sprint_name": sprint.name,
-        "sprint_id": str(sprint.id),
-        "stats": stats,
-        "tasks": export_tasks,
-    }
-
-    # Use export service
+    # Use export service; task rows are streamed from the database
     from aexy.schemas.analytics import ExportRequest, ExportType
     export_service = ExportService()
     request = ExportRequest(
@@ -770,7 +726,12 @@ async def export_sprint_tasks(
     job = await export_service.create_export_job(request, str(current_user.id), db)
     await db.commit()
 
-    completed_job = await export_service.process_export(job.id, db, data)
+    completed_job = await export_service.process_export_stream(
+        job.id,
+        db,
+        task_service.iter_sprint_export_tables(sprint_id),
+        title=f"Sprint: {sprint.name}",
+    )
     await db.commit()
 
     if not completed_job or not completed_job.file_path:
@@ -798,11 +759,8 @@ async def export_sprint_tasks(
 
     filename = f"{sprint.name.replace(' ', '_')}_tasks.{extensions[format]}"
 
-    with open(file_path, "rb") as f:
-        content = f.read()
-
-    return StreamingResponse(
-        io.BytesIO(content),
+    return FileResponse(
+        file_path,
         media_type=content_types[format],
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        filename=filename,
     )
@@ -1,11 +1,29 @@
 """Caching layer for LLM analysis results."""
 
 from aexy.cache.analysis_cache import AnalysisCache, get_analysis_cache
+from aexy.cache.company_domain_cache import CompanyDomainCache, get_company_domain_cache
+from aexy.cache.github_etag_cache import GitHubETagCache, get_github_etag_cache
 from aexy.cache.insights_cache import InsightsCache, get_insights_cache
+from aexy.cache.installation_token_cache import (
+    InstallationTokenCache,
+    get_installation_token_cache,
+)
+from aexy.cache.slack_user_cache import SlackUserCache, get_slack_user_cache
+from aexy.cache.widget_cache import WidgetCache, get_widget_cache
 
 __all__ = [
     "AnalysisCache",
     "get_analysis_cache",
+    "CompanyDomainCache",
+    "get_company_domain_cache",
+    "GitHubETagCache",
+    "get_github_etag_cache",
     "InsightsCache",
     "get_insights_cache",
+    "InstallationTokenCache",
+    "get_installation_token_cache",
+    "SlackUserCache",
+    "get_slack_user_cache",
+    "WidgetCache",
+    "get_widget_cache",
 ]
@@ -0,0 +1,86 @@
+"""Redis-based cache of email domain to CRM company record matches."""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600  # 1 day
+
+
+class CompanyDomainCache:
+    """Maps ``(workspace, email domain)`` to the company record for that domain.
+
+    Contact enrichment resolves the company of every sender it sees; a
+    mailbox usually has a few hundred domains across tens of thousands of
+    messages, so caching the match avoids re-querying company records for
+    every batch. Values are record IDs; callers re-load the records and
+    treat IDs that no longer resolve as a miss. All methods degrade to a
+    miss / no-op when Redis is unavailable.
+    """
+
+    PREFIX = "aexy:crm:company_domain:"
+
+    def __init__(self, redis_client: Any) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def make_key(workspace_id: str, domain: str) -> str:
+        """Build the cache key for a workspace and lower-cased domain."""
+        return f"{CompanyDomainCache.PREFIX}{workspace_id}:{domain.lower()}"
+
+    async def get_many(self, workspace_id: str, domains: list[str]) -> dict[str, str]:
+        """Return ``{domain: record_id}`` for the cached domains among *domains*."""
+        if not domains:
+            return {}
+        try:
+            values = await self._redis.mget([self.make_key(workspace_id, d) for d in domains])
+        except Exception as e:
+            logger.warning("Company domain cache get failed for workspace %s: %s", workspace_id, e)
+            return {}
+        return {
+            domain: value.decode() if isinstance(value, bytes) else value
+            for domain, value in zip(domains, values)
+            if value
+        }
+
+    async def set_many(
+        self, workspace_id: str, record_ids: dict[str, str], ttl: int = DEFAULT_TTL
+    ) -> None:
+        """Store ``{domain: record_id}`` matches with the given TTL (seconds)."""
+        if not record_ids:
+            return
+        try:
+            pipe = self._redis.pipeline()
+            for domain, record_id in record_ids.items():
+                pipe.setex(self.make_key(workspace_id, domain), ttl, record_id)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Company domain cache set failed for workspace %s: %s", workspace_id, e)
+
+
+_company_domain_cache: CompanyDomainCache | None = None
+
+
+def get_company_domain_cache() -> CompanyDomainCache | None:
+    """Return a module-level :class:`CompanyDomainCache` singleton.
+
+    Returns ``None`` if a Redis client cannot be created, in which case
+    companies are matched against the database on every batch.
+    """
+    global _company_domain_cache
+
+    if _company_domain_cache is not None:
+        return _company_domain_cache
+
+    try:
+        import redis.asyncio as aioredis
+        from aexy.core.config import get_settings
+
+        settings = get_settings()
+        client = aioredis.from_url(settings.redis_url)
+        _company_domain_cache = CompanyDomainCache(client)
+        return _company_domain_cache
+    except Exception as e:
+        logger.warning("Failed to create CompanyDomainCache (Redis unavailable): %s", e)
+        return None
@@ -0,0 +1,84 @@
+"""Redis-based ETag cache for conditional GitHub API requests."""
+
+import hashlib
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 3600  # 7 days
+
+
+class GitHubETagCache:
+    """Stores ETags and response bodies of GitHub list endpoints.
+
+    GitHub answers a request carrying a matching ``If-None-Match`` header
+    with ``304 Not Modified``, which does not count against the primary
+    rate limit. The cached body is then reused as the response.
+
+    Keys are scoped by a hash of the access token, since GitHub ETags vary
+    with the authenticated user. All methods degrade to a miss / no-op when
+    Redis is unavailable.
+    """
+
+    PREFIX = "aexy:github:etag:"
+
+    def __init__(self, redis_client: Any) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def make_key(access_token: str | None, path: str, params: dict[str, Any] | None) -> str:
+        """Build a cache key from the token, request path and query params."""
+        token_hash = hashlib.sha256((access_token or "").encode()).hexdigest()[:16]
+        raw = json.dumps({"path": path, "params": params or {}}, sort_keys=True, default=str)
+        request_hash = hashlib.sha256(raw.encode()).hexdigest()[:24]
+        return f"{GitHubETagCache.PREFIX}{token_hash}:{request_hash}"
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return ``{"etag": ..., "body": ...}`` for *cache_key*, or ``None``."""
+        try:
+            data = await self._redis.get(cache_key)
+            if data is None:
+                return None
+            return json.loads(data)
+        except Exception as e:
+            logger.warning("GitHub ETag cache get failed for %s: %s", cache_key, e)
+            return None
+
+    async def set(
+        self, cache_key: str, etag: str, body: Any, ttl: int = DEFAULT_TTL
+    ) -> None:
+        """Store the ETag and body of a 200 response."""
+        try:
+            payload = json.dumps({"etag": etag, "body": body})
+            await self._redis.setex(cache_key, ttl, payload)
+        except Exception as e:
+            logger.warning("GitHub ETag cache set failed for %s: %s", cache_key, e)
+
+
+_github_etag_cache: GitHubETagCache | None = None
+
+
+def get_github_etag_cache() -> GitHubETagCache | None:
+    """Return a module-level :class:`GitHubETagCache` singleton.
+
+    Returns ``None`` if a Redis client cannot be created, in which case
+    requests are made unconditionally.
+    """
+    global _github_etag_cache
+
+    if _github_etag_cache is not None:
+        return _github_etag_cache
+
+    try:
+        import redis.asyncio as aioredis
+        from aexy.core.config import get_settings
+
+        settings = get_settings()
+        client = aioredis.from_url(settings.redis_url)
+        _github_etag_cache = GitHubETagCache(client)
+        return _github_etag_cache
+    except Exception as e:
+        logger.warning("Failed to create GitHubETagCache (Redis unavailable): %s", e)
+        return None
@@ -0,0 +1,197 @@
+"""Two-level cache for GitHub App installation access tokens."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from aexy.core.encryption import get_fernet
+
+logger = logging.getLogger(__name__)
+
+# Installation tokens live for one hour; hand out a new one this long before expiry
+REFRESH_MARGIN = timedelta(minutes=5)
+# How long another process may hold the mint lock before we mint ourselves
+LOCK_TTL = 10
+LOCK_POLL_INTERVAL = 0.2
+
+TokenMinter = Callable[[], Awaitable[tuple[str, datetime]]]
+
+
+class InstallationTokenCache:
+    """Caches installation tokens in process memory and Redis.
+
+    Minting a token costs a JWT signature and a POST to GitHub, so tokens
+    are reused until ``REFRESH_MARGIN`` before their ``expires_at``.
+
+    Lookups check memory first, then Redis (shared by API and worker
+    processes). Refreshes are single-flight: concurrent callers in one
+    process await the same mint, and a short Redis lock lets other
+    processes wait for the token instead of minting their own. Tokens are
+    encrypted at rest in Redis. Without Redis the cache is memory-only.
+    """
+
+    PREFIX = "aexy:github:installation-token:"
+
+    def __init__(
+        self,
+        redis_client: Any | None,
+        refresh_margin: timedelta = REFRESH_MARGIN,
+    ) -> None:
+        self._redis = redis_client
+        self.refresh_margin = refresh_margin
+        self._memory: dict[int, tuple[str, datetime]] = {}
+        self._inflight: dict[int, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(installation_id: int) -> str:
+        return f"{InstallationTokenCache.PREFIX}{installation_id}"
+
+    def _is_fresh(self, expires_at: datetime) -> bool:
+        return expires_at - self.refresh_margin > datetime.now(timezone.utc)
+
+    async def get(self, installation_id: int) -> tuple[str, datetime] | None:
+        """Return a cached ``(token, expires_at)`` that is not due for refresh."""
+        cached = self._memory.get(installation_id)
+        if cached and self._is_fresh(cached[1]):
+            return cached
+
+        if self._redis is None:
+            return None
+        try:
+            data = await self._redis.get(self.make_key(installation_id))
+            if data is None:
+                return None
+            payload = json.loads(get_fernet().decrypt(data))
+            cached = payload["token"], datetime.fromisoformat(payload["expires_at"])
+        except Exception as e:
+            logger.warning("Installation token cache get failed for %s: %s", installation_id, e)
+            return None
+
+        if not self._is_fresh(cached[1]):
+            return None
+        self._memory[installation_id] = cached
+        return cached
+
+    async def set(self, installation_id: int, token: str, expires_at: datetime) -> None:
+        """Store a freshly minted token until it is due for refresh."""
+        self._memory[installation_id] = (token, expires_at)
+
+        if self._redis is None:
+            return
+        ttl = int((expires_at - self.refresh_margin - datetime.now(timezone.utc)).total_seconds())
+        if ttl <= 0:
+            return
+        try:
+            payload = json.dumps({"token": token, "expires_at": expires_at.isoformat()})
+            await self._redis.setex(
+                self.make_key(installation_id), ttl, get_fernet().encrypt(payload.encode())
+            )
+        except Exception as e:
+            logger.warning("Installation token cache set failed for %s: %s", installation_id, e)
+
+    async def invalidate(self, installation_id: int) -> None:
+        """Drop a token, e.g. after the installation was suspended or deleted."""
+        self._memory.pop(installation_id, None)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(self.make_key(installation_id))
+        except Exception as e:
+            logger.warning(
+                "Installation token cache invalidate failed for %s: %s", installation_id, e
+            )
+
+    async def get_or_refresh(
+        self, installation_id: int, mint: TokenMinter
+    ) -> tuple[str, datetime]:
+        """Return a cached token, or mint one with *mint* exactly once.
+
+        Concurrent callers for the same installation share one in-flight
+        refresh; if it fails, all of them see the error.
+        """
+        cached = await self.get(installation_id)
+        if cached:
+            return cached
+
+        inflight = self._inflight.get(installation_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[installation_id] = future
+        try:
+            result = await self._refresh(installation_id, mint)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Nobody else may be waiting; mark the exception as retrieved
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(installation_id, None)
+
+    async def _refresh(self, installation_id: int, mint: TokenMinter) -> tuple[str, datetime]:
+        lock_key = f"{self.make_key(installation_id)}:lock"
+        locked = await self._acquire_lock(lock_key)
+        try:
+            if not locked:
+                # Another process is minting; wait for its token to land
+                for _ in range(int(LOCK_TTL / LOCK_POLL_INTERVAL)):
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+                    cached = await self.get(installation_id)
+                    if cached:
+                        return cached
+
+            token, expires_at = await mint()
+            await self.set(installation_id, token, expires_at)
+            return token, expires_at
+        finally:
+            if locked:
+                await self._release_lock(lock_key)
+
+    async def _acquire_lock(self, lock_key: str) -> bool:
+        """Try to take the cross-process mint lock. True when there is no Redis."""
+        if self._redis is None:
+            return True
+        try:
+            return bool(await self._redis.set(lock_key, "1", nx=True, ex=LOCK_TTL))
+        except Exception as e:
+            logger.warning("Installation token lock failed for %s: %s", lock_key, e)
+            return True
+
+    async def _release_lock(self, lock_key: str) -> None:
+        try:
+            await self._redis.delete(lock_key)
+        except Exception as e:
+            logger.warning("Installation token unlock failed for %s: %s", lock_key, e)
+
+
+_installation_token_cache: InstallationTokenCache | None = None
+
+
+def get_installation_token_cache() -> InstallationTokenCache:
+    """Return a module-level :class:`InstallationTokenCache` singleton.
+
+    Unlike the other caches this never returns ``None``: without Redis it
+    still deduplicates and reuses tokens within the process.
+    """
+    global _installation_token_cache
+
+    if _installation_token_cache is not None:
+        return _installation_token_cache
+
+    redis_client = None
+    try:
+        import redis.asyncio as aioredis
+        from aexy.core.config import get_settings
+
+        redis_client = aioredis.from_url(get_settings().redis_url)
+    except Exception as e:
+        logger.warning("Installation token cache is memory-only (Redis unavailable): %s", e)
+
+    _installation_token_cache = InstallationTokenCache(redis_client)
+    return _installation_token_cache
@@ -0,0 +1,91 @@
+"""Redis-based cache of Slack user profiles."""
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600  # 1 day
+
+
+class SlackUserCache:
+    """Caches ``users.info`` results per Slack workspace.
+
+    History imports see the same few hundred authors across every channel,
+    and ``users.info`` is rate limited per workspace, so profiles are
+    shared between imports and worker processes. Only the fields imports
+    use are stored. All methods degrade to a miss / no-op when Redis is
+    unavailable.
+    """
+
+    PREFIX = "aexy:slack:user:"
+
+    def __init__(self, redis_client: Any) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def make_key(team_id: str, user_id: str) -> str:
+        """Build the cache key for a Slack team and user."""
+        return f"{SlackUserCache.PREFIX}{team_id}:{user_id}"
+
+    async def get_many(self, team_id: str, user_ids: list[str]) -> dict[str, dict]:
+        """Return ``{user_id: profile}`` for the cached users among *user_ids*."""
+        if not user_ids:
+            return {}
+        try:
+            values = await self._redis.mget([self.make_key(team_id, u) for u in user_ids])
+        except Exception as e:
+            logger.warning("Slack user cache get failed for team %s: %s", team_id, e)
+            return {}
+
+        users = {}
+        for user_id, value in zip(user_ids, values):
+            if not value:
+                continue
+            try:
+                users[user_id] = json.loads(value)
+            except (TypeError, ValueError):
+                continue
+        return users
+
+    async def set_many(
+        self, team_id: str, users: dict[str, dict], ttl: int = DEFAULT_TTL
+    ) -> None:
+        """Store ``{user_id: profile}`` with the given TTL (seconds)."""
+        if not users:
+            return
+        try:
+            pipe = self._redis.pipeline()
+            for user_id, user in users.items():
+                pipe.setex(self.make_key(team_id, user_id), ttl, json.dumps(user))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Slack user cache set failed for team %s: %s", team_id, e)
+
+
+_slack_user_cache: SlackUserCache | None = None
+
+
+def get_slack_user_cache() -> SlackUserCache | None:
+    """Return a module-level :class:`SlackUserCache` singleton.
+
+    Returns ``None`` if a Redis client cannot be created, in which case
+    profiles are only cached for the lifetime of a sync.
+    """
+    global _slack_user_cache
+
+    if _slack_user_cache is not None:
+        return _slack_user_cache
+
+    try:
+        import redis.asyncio as aioredis
+        from aexy.core.config import get_settings
+
+        settings = get_settings()
+        client = aioredis.from_url(settings.redis_url)
+        _slack_user_cache = SlackUserCache(client)
+        return _slack_user_cache
+    except Exception as e:
+        logger.warning("Failed to create SlackUserCache (Redis unavailable): %s", e)
+        return None
@@ -0,0 +1,129 @@
+"""Redis-based cache for report widget results."""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 900  # 15 minutes
+TIME_BUCKET = timedelta(minutes=15)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def floor_to_bucket(value: datetime, bucket: timedelta = TIME_BUCKET) -> datetime:
+    """Round *value* down to the start of its time bucket."""
+    naive = value.replace(tzinfo=None)
+    floored = _EPOCH + (naive - _EPOCH) // bucket * bucket
+    return floored.replace(tzinfo=value.tzinfo)
+
+
+class WidgetCache:
+    """Redis-based cache for computed report widget data.
+
+    Widgets with the same metric, config, developer scope and time bucket
+    produce the same data, so results are shared across every report in a
+    workspace. Keys are prefixed with ``aexy:widgets:`` and expire after
+    roughly one time bucket. All methods degrade to a miss / no-op when
+    Redis is unavailable.
+    """
+
+    PREFIX = "aexy:widgets:"
+
+    def __init__(self, redis_client: Any) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def make_key(
+        workspace_id: str | None,
+        widget_type: str,
+        metric: str | None,
+        config: dict,
+        developer_ids: list[str] | None,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> str:
+        """Build a deterministic cache key for a widget evaluation.
+
+        The key layout is::
+
+            aexy:widgets:ws:{workspace_id}:{widget_type}:{metric}:{hash}
+
+        ``hash`` covers the normalized config (sorted keys, ``None`` values
+        dropped), the sorted developer IDs and the bucketed date range, so
+        widgets that differ only in title, position or key order collide.
+        """
+        normalized = {
+            "config": {k: v for k, v in sorted(config.items()) if v is not None},
+            "developer_ids": sorted(developer_ids or []),
+            "start": floor_to_bucket(start_date).isoformat(),
+            "end": floor_to_bucket(end_date).isoformat(),
+        }
+        raw = json.dumps(normalized, sort_keys=True, default=str)
+        digest = hashlib.sha256(raw.encode()).hexdigest()[:16]
+        return f"{WidgetCache.PREFIX}ws:{workspace_id or '-'}:{widget_type}:{metric or '-'}:{digest}"
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """Return cached widget data for *cache_key*, or ``None`` on miss / error."""
+        try:
+            data = await self._redis.get(cache_key)
+            if data is None:
+                return None
+            logger.debug("Widget cache HIT: %s", cache_key)
+            return json.loads(data)
+        except Exception as e:
+            logger.warning("Widget cache get failed for %s: %s", cache_key, e)
+            return None
+
+    async def set(
+        self, cache_key: str, data: dict[str, Any], ttl: int = DEFAULT_TTL
+    ) -> None:
+        """Store widget *data* under *cache_key* with the given TTL (seconds)."""
+        try:
+            await self._redis.setex(cache_key, ttl, json.dumps(data, default=str))
+            logger.debug("Widget cache SET: %s (ttl=%ds)", cache_key, ttl)
+        except Exception as e:
+            logger.warning("Widget cache set failed for %s: %s", cache_key, e)
+
+    async def invalidate_workspace(self, workspace_id: str) -> int:
+        """Delete all cached widgets for a workspace. Returns keys deleted."""
+        pattern = f"{self.PREFIX}ws:{workspace_id}:*"
+        try:
+            keys: list[bytes | str] = []
+            async for key in self._redis.scan_iter(pattern):
+                keys.append(key)
+            if keys:
+                await self._redis.delete(*keys)
+            return len(keys)
+        except Exception as e:
+            logger.warning("Widget cache invalidate failed for %s: %s", pattern, e)
+            return 0
+
+
+_widget_cache: WidgetCache | None = None
+
+
+def get_widget_cache() -> WidgetCache | None:
+    """Return a module-level :class:`WidgetCache` singleton.
+
+    Returns ``None`` if a Redis client cannot be created, so callers can
+    simply skip caching.
+    """
+    global _widget_cache
+
+    if _widget_cache is not None:
+        return _widget_cache
+
+    try:
+        import redis.asyncio as aioredis
+        from aexy.core.config import get_settings
+
+        settings = get_settings()
+        client = aioredis.from_url(settings.redis_url)
+        _widget_cache = WidgetCache(client)
+        return _widget_cache
+    except Exception as e:
+        logger.warning("Failed to create WidgetCache (Redis unavailable): %s", e)
+        return None
@@ -1,16 +1,23 @@
 """Database configuration and session management."""
 
+import logging
 import os
+import time
+from collections import deque
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager, contextmanager
-from typing import Generator
+from typing import Any, Generator
 
 from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from aexy.core.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base class."""
@@ -18,9 +25,100 @@ class Base(DeclarativeBase):
     pass
 
 
+class PoolStats:
+    """Checkout wait times for one connection pool."""
+
+    def __init__(self, name: str, window: int = 1000) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: deque[float] = deque(maxlen=window)
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._recent.append(wait)
+
+    def to_dict(self) -> dict[str, Any]:
+        recent = sorted(self._recent)
+
+        def percentile(q: float) -> float:
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(q * len(recent)))] * 1000, 2)
+
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms_avg": round(self.total_wait / self.checkouts * 1000, 2) if self.checkouts else 0.0,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p95": percentile(0.95),
+            "wait_ms_max": round(self.max_wait * 1000, 2),
+        }
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited."""
+
+    stats: PoolStats
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.timeouts += 1
+            logger.warning("Database pool %s timed out waiting for a connection", self.stats.name)
+            raise
+        wait = time.perf_counter() - started
+        self.stats.record(wait)
+        if wait * 1000 >= get_settings().database_pool_slow_wait_ms:
+            logger.info(
+                "Database pool %s checkout waited %.0f ms (%s)", self.stats.name, wait * 1000, self.status()
+            )
+        return connection
+
+
+# Pool stats survive engine disposal and are keyed by pool name
+_pool_stats: dict[str, PoolStats] = {}
+
+
+def configure_process_role(role: str) -> None:
+    """Set the pool sizing role ("api" or "worker") before any engine is created."""
+    get_settings().process_role = role
+
+
+def _pool_options(name: str, url: str) -> dict[str, Any]:
+    """Engine keyword arguments for a pool sized to this process's role."""
+    settings = get_settings()
+    options: dict[str, Any] = {"pool_pre_ping": settings.database_pool_pre_ping}
+    if not url.startswith("postgresql"):
+        # SQLite and friends use their own pools
+        return options
+
+    if settings.process_role == "worker":
+        pool_size, max_overflow = settings.database_worker_pool_size, settings.database_worker_max_overflow
+    else:
+        pool_size, max_overflow = settings.database_pool_size, settings.database_max_overflow
+
+    stats = _pool_stats.setdefault(name, PoolStats(name))
+    options.update(
+        poolclass=type(f"{name.title()}Pool", (TimedQueuePool,), {"stats": stats}),
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+    )
+    return options
+
+
 # Store engine per-process to handle forked workers correctly.
 # asyncpg connections cannot be shared across forked processes.
 _engine_cache: dict[int, tuple] = {}
+_read_engine_cache: dict[int, tuple] = {}
 
 
 def _get_engine():
@@ -35,7 +133,7 @@ def _get_engine():
         engine = create_async_engine(
             settings.database_url,
             echo=settings.database_echo,
-            pool_pre_ping=True,
+            **_pool_options("primary", settings.database_url),
         )
         session_maker = async_sessionmaker(
             engine,
@@ -46,17 +144,89 @@ def _get_engine():
     return _engine_cache[pid]
 
 
+def _get_read_engine():
+    """Get or create the read-replica engine for the current process.
+
+    Falls back to the primary engine when no replica is configured.
+    Replica sessions run read-only transactions.
+    """
+    settings = get_settings()
+    if not settings.database_read_url:
+        return _get_engine()
+
+    pid = os.getpid()
+    if pid not in _read_engine_cache:
+        engine = create_async_engine(
+            settings.database_read_url,
+            echo=settings.database_echo,
+            execution_options={"postgresql_readonly": True},
+            **_pool_options("replica", settings.database_read_url),
+        )
+        session_maker = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        _read_engine_cache[pid] = (engine, session_maker)
+    return _read_engine_cache[pid]
+
+
 def get_engine():
     """Get the async engine for the current process."""
     return _get_engine()[0]
 
 
+def get_read_engine():
+    """Get the read-replica engine (or the primary) for the current process."""
+    return _get_read_engine()[0]
+
+
 def async_session_maker():
     """Get a new async session for the current process."""
     _, session_factory = _get_engine()
     return session_factory()
 
 
+def read_session_maker():
+    """Get a new session on the read replica, or the primary without one.
+
+    For services that only read and can tolerate replication lag.
+    """
+    _, session_factory = _get_read_engine()
+    return session_factory()
+
+
+def database_pool_stats() -> dict[str, dict[str, Any]]:
+    """Checkout wait metrics and current usage of this process's pools."""
+    pools = {"primary": _engine_cache.get(os.getpid())}
+    if get_settings().database_read_url:
+        pools["replica"] = _read_engine_cache.get(os.getpid())
+
+    stats = {}
+    for name, cached in pools.items():
+        pool_stats = _pool_stats.get(name)
+        entry: dict[str, Any] = pool_stats.to_dict() if pool_stats else {}
+        if cached is not None:
+            pool = cached[0].sync_engine.pool
+            if isinstance(pool, TimedQueuePool):
+                entry.update(
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=pool.overflow(),
+                )
+        stats[name] = entry
+    return stats
+
+
+async def dispose_engines() -> None:
+    """Dispose this process's primary and replica engines."""
+    pid = os.getpid()
+    for cache in (_read_engine_cache, _engine_cache):
+        cached = cache.pop(pid, None)
+        if cached is not None:
+            await cached[0].dispose()
+
+
 class _EngineProxy:
     """Proxy class for lazy engine access.
 
@@ -91,6 +261,20 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def read_only() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only database session dependency.
+
+    Uses the read replica when one is configured, otherwise the primary.
+    Nothing is committed, so endpoints using it must not write.
+    """
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
 @asynccontextmanager
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Get an async database session as a context manager.
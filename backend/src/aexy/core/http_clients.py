@@ -0,0 +1,236 @@
+"""Process-wide pooled HTTP connections for outbound integrations.
+
+Creating an ``httpx.AsyncClient`` per call throws away TCP/TLS connections
+(and HTTP/2 sessions) every time. Instead, every call site builds its client
+on top of a shared transport::
+
+    async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
+        ...
+
+The transport routes each request to a connection pool keyed by upstream
+(scheme, host, port and TLS settings). Closing the client leaves the pools
+open; they are closed once, on FastAPI lifespan shutdown or Temporal worker
+stop, via :func:`close_http_clients`.
+
+Each upstream records request latency (time to response headers) and pool
+wait (time until a connection was acquired), exposed by :func:`http_client_stats`.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from aexy.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# (origin, verify, http2)
+UpstreamKey = tuple[str, bool, bool]
+TransportFactory = Callable[[UpstreamKey], httpx.AsyncBaseTransport]
+
+
+def upstream_origin(url: httpx.URL) -> str:
+    """Return ``scheme://host:port`` for *url*, with the default port filled in."""
+    port = url.port or (443 if url.scheme == "https" else 80)
+    return f"{url.scheme}://{url.host}:{port}"
+
+
+@dataclass
+class UpstreamStats:
+    """Latency and pool wait counters for one upstream."""
+
+    requests: int = 0
+    errors: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    pool_wait_total: float = 0.0
+    pool_wait_max: float = 0.0
+    pool_wait_samples: int = 0
+
+    def record(self, latency: float, pool_wait: float | None, failed: bool) -> None:
+        self.requests += 1
+        if failed:
+            self.errors += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        if pool_wait is not None:
+            self.pool_wait_samples += 1
+            self.pool_wait_total += pool_wait
+            self.pool_wait_max = max(self.pool_wait_max, pool_wait)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_avg_ms": round(self.latency_total / self.requests * 1000, 2) if self.requests else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 2),
+            "pool_wait_avg_ms": (
+                round(self.pool_wait_total / self.pool_wait_samples * 1000, 2)
+                if self.pool_wait_samples else 0.0
+            ),
+            "pool_wait_max_ms": round(self.pool_wait_max * 1000, 2),
+        }
+
+
+class _RoutingTransport(httpx.AsyncBaseTransport):
+    """Dispatches requests to the registry's per-upstream pools.
+
+    ``aclose`` is a no-op so that short-lived clients built on top of it can
+    be closed freely without tearing down the shared connections.
+    """
+
+    def __init__(self, registry: "HTTPClientRegistry", verify: bool, http2: bool) -> None:
+        self._registry = registry
+        self._verify = verify
+        self._http2 = http2
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = (upstream_origin(request.url), self._verify, self._http2)
+        pool = await self._registry._pool(key)
+        stats = self._registry._stats.setdefault(key[0], UpstreamStats())
+
+        started = time.perf_counter()
+        acquired: list[float] = []
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            # The first connection-level event fires once a connection has
+            # been taken from (or added to) the pool.
+            if not acquired:
+                acquired.append(time.perf_counter())
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        failed = True
+        try:
+            response = await pool.handle_async_request(request)
+            failed = response.status_code >= 500
+            return response
+        finally:
+            pool_wait = acquired[0] - started if acquired else None
+            stats.record(time.perf_counter() - started, pool_wait, failed)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HTTPClientRegistry:
+    """Owns one connection pool per upstream for the whole process.
+
+    Pools are created lazily on first use. If the registry is used from a
+    new event loop (tests, scripts calling ``asyncio.run`` repeatedly), the
+    pools bound to the old loop are closed and recreated.
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport_factory: TransportFactory | None = None,
+    ) -> None:
+        self.limits = limits or httpx.Limits()
+        self.http2 = http2 and _h2_available()
+        self._transport_factory = transport_factory or self._default_transport
+        self._pools: dict[UpstreamKey, httpx.AsyncBaseTransport] = {}
+        self._stats: dict[str, UpstreamStats] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def transport(self, verify: bool = True, http2: bool | None = None) -> httpx.AsyncBaseTransport:
+        """Return a transport that routes requests to the shared pools.
+
+        Args:
+            verify: Verify TLS certificates. Upstreams reached with
+                different TLS settings get separate pools.
+            http2: Override the registry default for HTTP/2 negotiation.
+        """
+        use_http2 = self.http2 if http2 is None else (http2 and _h2_available())
+        return _RoutingTransport(self, verify, use_http2)
+
+    def _default_transport(self, key: UpstreamKey) -> httpx.AsyncBaseTransport:
+        _, verify, http2 = key
+        return httpx.AsyncHTTPTransport(verify=verify, http2=http2, limits=self.limits)
+
+    async def _pool(self, key: UpstreamKey) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            stale, self._pools = list(self._pools.values()), {}
+            self._loop = loop
+            await self._close_pools(stale)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._transport_factory(key)
+            self._pools[key] = pool
+            logger.debug(f"Opened HTTP pool for {key[0]} (verify={key[1]}, http2={key[2]})")
+        return pool
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-upstream request, latency and pool wait metrics."""
+        return {origin: s.to_dict() for origin, s in sorted(self._stats.items())}
+
+    async def aclose(self) -> None:
+        """Close every pool. The registry can be reused afterwards."""
+        pools, self._pools = list(self._pools.values()), {}
+        await self._close_pools(pools)
+
+    @staticmethod
+    async def _close_pools(pools: list[httpx.AsyncBaseTransport]) -> None:
+        for pool in pools:
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP pool: {e}")
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Return the process-wide :class:`HTTPClientRegistry`."""
+    global _registry
+
+    if _registry is None:
+        settings = get_settings()
+        if settings.http_pool_http2 and not _h2_available():
+            logger.warning("http_pool_http2 is enabled but the h2 package is not installed")
+        _registry = HTTPClientRegistry(
+            limits=httpx.Limits(
+                max_connections=settings.http_pool_max_connections,
+                max_keepalive_connections=settings.http_pool_max_keepalive,
+                keepalive_expiry=settings.http_pool_keepalive_expiry,
+            ),
+            http2=settings.http_pool_http2,
+        )
+    return _registry
+
+
+def get_http_transport(verify: bool = True, http2: bool | None = None) -> httpx.AsyncBaseTransport:
+    """Shorthand for ``get_http_client_registry().transport(...)``."""
+    return get_http_client_registry().transport(verify=verify, http2=http2)
+
+
+def http_client_stats() -> dict[str, dict[str, Any]]:
+    """Per-upstream metrics of the process-wide registry."""
+    return get_http_client_registry().stats()
+
+
+async def close_http_clients() -> None:
+    """Close the process-wide pools, logging their final metrics."""
+    if _registry is None:
+        return
+    for origin, stats in _registry.stats().items():
+        logger.info(f"HTTP upstream {origin}: {stats}")
+    await _registry.aclose()
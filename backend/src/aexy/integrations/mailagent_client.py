@@ -6,6 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel, EmailStr
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 
 
 class MailagentError(Exception):
@@ -175,7 +176,7 @@ class MailagentClient:
         **kwargs,
     ) -> dict:
         """Make HTTP request to Mailagent."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
             try:
                 response = await client.request(method, self._url(path), **kwargs)
 
@@ -526,7 +527,7 @@ class MailagentClient:
 
     async def health_check(self) -> dict:
         """Check Mailagent service health."""
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with httpx.AsyncClient(transport=get_http_transport(), timeout=5.0) as client:
             try:
                 response = await client.get(f"{self.base_url}/health")
                 return response.json()
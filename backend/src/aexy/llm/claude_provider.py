@@ -6,6 +6,7 @@ from typing import Any
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.llm.base import (
     AnalysisRequest,
     AnalysisResult,
@@ -55,6 +56,7 @@ class ClaudeProvider(LLMProvider):
             raise ValueError("Anthropic API key is required for Claude provider")
 
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=self.ANTHROPIC_API_URL,
             headers={
                 "x-api-key": config.api_key,
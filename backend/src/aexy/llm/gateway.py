@@ -1,6 +1,7 @@
 """Unified LLM gateway with provider selection and caching."""
 
 import hashlib
+import json
 import logging
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,11 @@ from aexy.llm.base import (
     MatchScore,
     TaskSignals,
 )
+from aexy.llm.prompts import (
+    MATCH_CANDIDATE_TEMPLATE,
+    MATCH_SCORING_SYSTEM_PROMPT,
+    MULTI_MATCH_SCORING_PROMPT,
+)
 
 if TYPE_CHECKING:
     from aexy.services.llm_rate_limiter import LLMRateLimiter
@@ -407,6 +413,79 @@ class LLMGateway:
         """
         return await self.provider.score_match(task_signals, developer_skills)
 
+    async def score_matches(
+        self,
+        task_signals: TaskSignals,
+        developers_skills: list[dict[str, Any]],
+        workspace_id: str | None = None,
+    ) -> list[MatchScore]:
+        """Score several developers for a task with a single LLM call.
+
+        Args:
+            task_signals: Extracted task signals.
+            developers_skills: Skill fingerprints, each with a developer_id.
+            workspace_id: Optional workspace ID for workspace-level rate limiting.
+
+        Returns:
+            Match scores for the candidates the model scored, in the order
+            given. Candidates missing from the response are left out.
+
+        Raises:
+            LLMRateLimitError: If rate limit is exceeded.
+        """
+        if not developers_skills:
+            return []
+
+        def names(items: list[dict[str, Any]]) -> str:
+            return ", ".join(i.get("name", "") for i in items) or "none"
+
+        candidates = "\n".join(
+            MATCH_CANDIDATE_TEMPLATE.format(
+                developer_id=skills.get("developer_id", ""),
+                languages=names(skills.get("languages", [])),
+                frameworks=names(skills.get("frameworks", [])),
+                developer_domains=names(skills.get("domains", [])),
+                recent_activity=skills.get("recent_activity", "unknown"),
+            )
+            for skills in developers_skills
+        )
+        prompt = MULTI_MATCH_SCORING_PROMPT.format(
+            required_skills=", ".join(task_signals.required_skills),
+            preferred_skills=", ".join(task_signals.preferred_skills),
+            domain=task_signals.domain or "unspecified",
+            complexity=task_signals.complexity,
+            candidates=candidates,
+        )
+
+        response_text, *_ = await self.call_llm(
+            MATCH_SCORING_SYSTEM_PROMPT,
+            prompt,
+            tokens_estimate=400 + 250 * len(developers_skills),
+            workspace_id=workspace_id,
+        )
+
+        text = response_text.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse multi-candidate match response: {e}")
+            return []
+
+        by_id: dict[str, MatchScore] = {}
+        for item in data.get("scores", []) if isinstance(data, dict) else []:
+            try:
+                score = MatchScore(**{**item, "developer_id": str(item.get("developer_id", ""))})
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid match score: {e}")
+                continue
+            by_id[score.developer_id] = score
+
+        return [
+            by_id[str(skills.get("developer_id", ""))]
+            for skills in developers_skills
+            if str(skills.get("developer_id", "")) in by_id
+        ]
+
     async def rank_developers(
         self,
         task_signals: TaskSignals,
@@ -6,6 +6,7 @@ from typing import Any
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.llm.base import (
     AnalysisRequest,
     AnalysisResult,
@@ -58,6 +59,7 @@ class GeminiProvider(LLMProvider):
 
         self._api_key = config.api_key
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=self.GEMINI_API_URL,
             headers={
                 "Content-Type": "application/json",
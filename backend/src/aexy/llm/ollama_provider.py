@@ -6,6 +6,7 @@ from typing import Any
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.llm.base import (
     AnalysisRequest,
     AnalysisResult,
@@ -53,6 +54,7 @@ class OllamaProvider(LLMProvider):
         self._base_url = config.base_url or self.DEFAULT_BASE_URL
 
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=self._base_url,
             timeout=config.timeout,
         )
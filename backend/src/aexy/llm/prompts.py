@@ -207,6 +207,40 @@ Respond with JSON:
   "gaps": ["skills or experience the developer lacks"]
 }}"""
 
+MULTI_MATCH_SCORING_PROMPT = """Score how well each of these developers matches the task.
+Score every candidate independently, on the same scale.
+
+Task Requirements:
+- Required skills: {required_skills}
+- Preferred skills: {preferred_skills}
+- Domain: {domain}
+- Complexity: {complexity}
+
+Candidates:
+{candidates}
+
+Respond with JSON:
+{{
+  "scores": [
+    {{
+      "developer_id": "id of the candidate as given above",
+      "overall_score": 0-100,
+      "skill_match": 0-100,
+      "experience_match": 0-100,
+      "growth_opportunity": 0-100,
+      "reasoning": "explanation of the score",
+      "strengths": ["what makes this developer a good fit"],
+      "gaps": ["skills or experience the developer lacks"]
+    }}
+  ]
+}}"""
+
+MATCH_CANDIDATE_TEMPLATE = """- Developer {developer_id}
+  - Languages: {languages}
+  - Frameworks: {frameworks}
+  - Domains: {developer_domains}
+  - Recent activity: {recent_activity}"""
+
 
 # ============================================================================
 # Phase 3: Career Intelligence Prompts
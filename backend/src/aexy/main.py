@@ -7,7 +7,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from aexy.api import api_router
 from aexy.core.config import get_settings
-from aexy.core.database import engine, Base
+from aexy.core.database import engine, Base, dispose_engines
+from aexy.core.http_clients import close_http_clients
 from aexy.middleware import UsageTrackingMiddleware
 
 settings = get_settings()
@@ -35,7 +36,8 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup on shutdown
-    await engine.dispose()
+    await close_http_clients()
+    await dispose_engines()
 
 
 def create_app() -> FastAPI:
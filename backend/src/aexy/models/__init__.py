@@ -12,6 +12,9 @@ from aexy.models.billing import (
     UsageType,
 )
 from aexy.models.activity import Commit, PullRequest, CodeReview
+from aexy.models.code_ownership import RepositoryOwnershipMatrix
+from aexy.models.collaboration import CollaborationEdgeBucket
+from aexy.models.profile_aggregate import DeveloperProfileAggregate
 from aexy.models.career import (
     CareerRole,
     LearningPath,
@@ -419,6 +422,7 @@ from aexy.models.reminder import (
     DomainTeamMapping,
     AssignmentRule,
     ReminderSuggestion,
+    ReminderStatsCounter,
     ReminderStatus,
     ReminderPriority,
     ReminderFrequency,
@@ -460,6 +464,9 @@ __all__ = [
     "Commit",
     "PullRequest",
     "CodeReview",
+    "RepositoryOwnershipMatrix",
+    "CollaborationEdgeBucket",
+    "DeveloperProfileAggregate",
     # Career
     "CareerRole",
     "LearningPath",
@@ -846,6 +853,7 @@ __all__ = [
     "DomainTeamMapping",
     "AssignmentRule",
     "ReminderSuggestion",
+    "ReminderStatsCounter",
     "ReminderStatus",
     "ReminderPriority",
     "ReminderFrequency",
@@ -595,6 +595,15 @@ class AssessmentAttempt(Base):
         JSONB,
         default=dict,
     )  # {total_violations, by_type: {...}, flags: [...]}
+    # Running proctoring event counters, updated as events are logged
+    proctoring_event_counts: Mapped[dict] = mapped_column(
+        JSONB,
+        default=dict,
+    )  # {event_type: count}
+    critical_event_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+    )
 
     # Recording URLs
     webcam_recording_url: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -0,0 +1,55 @@
+"""Code ownership models - per-repository path x developer touch matrices."""
+
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import DateTime, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from aexy.core.database import Base
+
+
+class RepositoryOwnershipMatrix(Base):
+    """Sparse file-level ownership matrix for a single repository.
+
+    Rows are file paths, columns are developers. Cells hold the number of
+    commits in which a developer touched a path, stored in coordinate form
+    as ``[path_index, developer_index, count]`` triplets so the row stays
+    compact for large monorepos. The matrix is folded forward on ingest and
+    never rebuilt from scratch; earlier history is backfilled once.
+    """
+
+    __tablename__ = "repository_ownership_matrices"
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid4()),
+    )
+    repository: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+
+    # Axis labels; list positions are the matrix indices
+    paths: Mapped[list[str]] = mapped_column(JSONB, server_default=text("'[]'"))
+    developer_ids: Mapped[list[str]] = mapped_column(JSONB, server_default=text("'[]'"))
+
+    # Non-zero cells as [path_index, developer_index, count]
+    cells: Mapped[list[list[int]]] = mapped_column(JSONB, server_default=text("'[]'"))
+
+    commits_applied: Mapped[int] = mapped_column(Integer, default=0)
+    # Set once commits stored before the row existed have been folded in
+    backfilled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # Id of the last commit folded in by the backfill, which resumes after it
+    backfill_cursor: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
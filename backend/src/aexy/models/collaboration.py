@@ -0,0 +1,60 @@
+"""Collaboration graph models - precomputed review interaction edges."""
+
+from datetime import date, datetime
+from uuid import uuid4
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from aexy.core.database import Base
+
+
+class CollaborationEdgeBucket(Base):
+    """Weekly review interaction count between a reviewer and a PR author.
+
+    Edges are directed (reviewer -> author) and bucketed by the Monday of the
+    week the review was submitted. Counts are incremented as reviews are
+    ingested; strength and recency decay are derived at read time.
+    """
+
+    __tablename__ = "collaboration_edge_buckets"
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid4()),
+    )
+    reviewer_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("developers.id", ondelete="CASCADE"),
+        index=True,
+    )
+    author_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("developers.id", ondelete="CASCADE"),
+        index=True,
+    )
+    bucket_start: Mapped[date] = mapped_column(Date)
+
+    review_count: Mapped[int] = mapped_column(Integer, default=0)
+    last_interaction_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "reviewer_id",
+            "author_id",
+            "bucket_start",
+            name="uq_collaboration_edge_bucket",
+        ),
+        Index("ix_collaboration_edge_buckets_bucket_start", "bucket_start"),
+    )
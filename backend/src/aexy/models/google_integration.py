@@ -145,6 +145,10 @@ class SyncedEmail(Base):
     snippet: Mapped[str | None] = mapped_column(Text, nullable=True)
     body_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     body_html: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Sync stores metadata first; bodies are fetched on demand
+    body_fetched_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Gmail metadata
     labels: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
@@ -0,0 +1,59 @@
+"""Stored commit aggregates backing incremental developer profile sync."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, func, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from aexy.core.database import Base
+
+
+class DeveloperProfileAggregate(Base):
+    """Per-developer commit aggregates folded forward by ProfileSyncService.
+
+    ``commit_aggregates`` holds language, domain, framework and hour counters
+    for every commit ingested up to ``folded_through`` (by ``commits.created_at``).
+    Each sync folds only commits ingested since then, and a periodic full
+    rebuild corrects drift from reassigned or deleted commits.
+
+    The ``last_sync_*`` columns record how long the latest sync took, so slow
+    profiles can be found with a single ordered query.
+    """
+
+    __tablename__ = "developer_profile_aggregates"
+
+    developer_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("developers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    commit_aggregates: Mapped[dict] = mapped_column(JSONB, server_default=text("'{}'"))
+    commits_folded: Mapped[int] = mapped_column(Integer, default=0)
+    folded_through: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    last_full_rebuild_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Timing of the latest sync
+    last_sync_mode: Mapped[str | None] = mapped_column(String(20), nullable=True)  # full, incremental
+    last_sync_ms: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    last_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
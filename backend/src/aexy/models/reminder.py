@@ -7,6 +7,7 @@ This module provides models for:
 - ControlOwner (domain-specific ownership)
 - DomainTeamMapping (team assignments by domain)
 - AssignmentRule (custom assignment logic)
+- ReminderStatsCounter (materialized dashboard counts)
 """
 
 from datetime import datetime
@@ -909,3 +910,46 @@ class ReminderSuggestion(Base):
         "Developer",
         lazy="selectin",
     )
+
+
+class ReminderStatsCounter(Base):
+    """Materialized instance count backing the reminder dashboards.
+
+    One row per (workspace, scope, key). Scope is "workspace" for the
+    workspace totals or a developer ID for that owner's totals; keys name
+    a bucket such as ``status:pending``, ``category:security:overdue`` or
+    ``completed:month:2026-10``. Rows are adjusted on instance status
+    transitions and rebuilt periodically by reconciliation.
+    """
+
+    __tablename__ = "reminder_stats_counters"
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        default=lambda: str(uuid4()),
+    )
+    workspace_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        index=True,
+    )
+    scope: Mapped[str] = mapped_column(String(64), nullable=False)
+    key: Mapped[str] = mapped_column(String(320), nullable=False)
+    value: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "workspace_id",
+            "scope",
+            "key",
+            name="uq_reminder_stats_counter",
+        ),
+    )
@@ -181,6 +181,7 @@ class DeveloperStandup(Base):
         ),
         Index("ix_standups_workspace_date", "workspace_id", "standup_date"),
         Index("ix_standups_team_date", "team_id", "standup_date"),
+        Index("ix_standups_slack_message", "slack_channel_id", "slack_message_ts"),
     )
 
 
@@ -256,6 +257,7 @@ class WorkLog(Base):
     __table_args__ = (
         Index("ix_work_logs_task_logged", "task_id", "logged_at"),
         Index("ix_work_logs_developer_logged", "developer_id", "logged_at"),
+        Index("ix_work_logs_slack_message", "slack_channel_id", "slack_message_ts"),
     )
 
 
@@ -481,6 +483,7 @@ class Blocker(Base):
         Index("ix_blockers_team_status", "team_id", "status"),
         Index("ix_blockers_workspace_status", "workspace_id", "status"),
         Index("ix_blockers_developer_status", "developer_id", "status"),
+        Index("ix_blockers_slack_message", "slack_channel_id", "slack_message_ts"),
     )
 
 
@@ -6,6 +6,7 @@ import and call the inner async helpers (e.g. _sync_gmail, _sync_calendar).
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -142,6 +143,7 @@ async def _sync_gmail(
     workspace_id: str,
     integration_id: str,
     max_messages: int,
+    heartbeat_fn: Callable[..., None] | None = None,
 ) -> dict[str, Any]:
     """Async implementation of Gmail sync with progress updates."""
     from sqlalchemy import select
@@ -187,7 +189,7 @@ async def _sync_gmail(
 
             # Sync with progress callback
             result = await _sync_gmail_with_progress(
-                service, integration, job, db, max_messages
+                service, integration, job, db, max_messages, heartbeat_fn=heartbeat_fn
             )
 
             # Mark complete
@@ -217,9 +219,23 @@ async def _sync_gmail_with_progress(
     job,
     db,
     max_messages: int,
+    heartbeat_fn: Callable[..., None] | None = None,
 ) -> dict[str, Any]:
-    """Gmail sync with progress updates - uses incremental sync when possible."""
-    from aexy.models.google_integration import EmailSyncCursor
+    """Gmail sync with progress updates - uses incremental sync when possible.
+
+    Messages are fetched in batch requests a page at a time; progress is
+    written to the job and heartbeated after every page.
+    """
+    from aexy.services.gmail_sync_service import GMAIL_BATCH_SIZE, history_message_ids
+
+    async def report(message: str, total: int | None = None) -> None:
+        job.processed_items = messages_synced
+        if total is not None:
+            job.total_items = total
+        job.progress_message = message
+        await db.commit()
+        if heartbeat_fn:
+            heartbeat_fn(message)
 
     # Get or create the sync cursor to check if we have a history_id
     cursor = await service.get_or_create_sync_cursor(integration)
@@ -229,8 +245,7 @@ async def _sync_gmail_with_progress(
 
     if is_incremental:
         # INCREMENTAL SYNC - only new messages since last sync
-        job.progress_message = "Checking for new emails..."
-        await db.commit()
+        await report("Checking for new emails...")
 
         try:
             response = await service._make_gmail_request(
@@ -243,34 +258,16 @@ async def _sync_gmail_with_progress(
                 },
             )
 
-            history = response.get("history", [])
             new_history_id = response.get("historyId")
-
-            # Collect unique message IDs
-            message_ids = set()
-            for record in history:
-                for msg_added in record.get("messagesAdded", []):
-                    message_ids.add(msg_added["message"]["id"])
+            message_ids = history_message_ids(response.get("history", []))
 
             total_messages = len(message_ids)
-            job.total_items = total_messages
-            job.progress_message = f"Found {total_messages} new emails to sync..."
-            await db.commit()
-
-            # Sync each new message
-            for idx, msg_id in enumerate(message_ids):
-                try:
-                    await service._sync_message(integration, msg_id)
-                    messages_synced += 1
-
-                    if messages_synced % 5 == 0 or messages_synced == total_messages:
-                        job.processed_items = messages_synced
-                        job.progress_message = f"Syncing new emails... ({messages_synced}/{total_messages})"
-                        await db.commit()
+            await report(f"Found {total_messages} new emails to sync...", total=total_messages)
 
-                except Exception as e:
-                    logger.error(f"Failed to sync message {msg_id}: {e}")
-                    continue
+            for start in range(0, total_messages, GMAIL_BATCH_SIZE):
+                chunk = message_ids[start:start + GMAIL_BATCH_SIZE]
+                messages_synced += await service.sync_messages(integration, chunk)
+                await report(f"Syncing new emails... ({messages_synced}/{total_messages})")
 
             # Update history ID for next incremental sync
             if new_history_id:
@@ -293,52 +290,22 @@ async def _sync_gmail_with_progress(
 
     if not is_incremental:
         # FULL SYNC - first time or history expired
-        job.progress_message = "Starting full email sync..."
-        await db.commit()
-
-        page_token = cursor.next_page_token  # Resume from where we left off
+        await report("Starting full email sync...")
 
-        while messages_synced < max_messages:
-            params = {
-                "maxResults": min(100, max_messages - messages_synced),
-                "labelIds": ["INBOX"],
-            }
-            if page_token:
-                params["pageToken"] = page_token
+        # Resume from where we left off
+        async for message_ids, page_token in service.iter_message_pages(
+            integration, cursor.next_page_token, max_messages - messages_synced
+        ):
+            messages_synced += await service.sync_messages(integration, message_ids)
 
-            response = await service._make_gmail_request(
-                integration, "GET", "/users/me/messages", params=params
-            )
-
-            messages = response.get("messages", [])
-            if not messages:
-                break
-
-            for msg_info in messages:
-                try:
-                    await service._sync_message(integration, msg_info["id"])
-                    messages_synced += 1
-
-                    if messages_synced % 10 == 0:
-                        job.processed_items = messages_synced
-                        job.progress_message = f"Syncing emails... ({messages_synced} synced)"
-                        await db.commit()
-
-                except Exception as e:
-                    logger.error(f"Failed to sync message {msg_info['id']}: {e}")
-                    continue
-
-                if messages_synced >= max_messages:
-                    break
-
-            page_token = response.get("nextPageToken")
             if not page_token:
                 cursor.full_sync_completed = True
                 cursor.full_sync_completed_at = datetime.now(timezone.utc)
-                break
+            else:
+                # Save progress for resume
+                cursor.next_page_token = page_token
 
-            # Save progress for resume
-            cursor.next_page_token = page_token
+            await report(f"Syncing emails... ({messages_synced} synced)")
 
         # Get history ID for future incremental syncs
         profile_response = await service._make_gmail_request(
@@ -350,6 +317,9 @@ async def _sync_gmail_with_progress(
         cursor.last_error = None
         await db.flush()
 
+    # Enrich senders still waiting in the last partial batch
+    await service.flush_enrichment(integration)
+
     # Final progress update
     job.processed_items = messages_synced
     await db.commit()
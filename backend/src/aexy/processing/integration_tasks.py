@@ -363,6 +363,7 @@ async def _deliver_webhook(
     from uuid import uuid4
 
     import httpx
+    from aexy.core.http_clients import get_http_transport
 
     from aexy.core.database import async_session_maker
     from aexy.models.crm import CRMWebhook, CRMWebhookDelivery
@@ -423,7 +424,7 @@ async def _deliver_webhook(
         # Send request
         started_at = datetime.now(timezone.utc)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
                 response = await client.post(
                     webhook.url,
                     json=payload,
@@ -7,6 +7,7 @@ These functions handle:
 - Flagging overdue reminders
 - Checking evidence freshness
 - Weekly Slack summaries
+- Reconciling dashboard counters
 
 Temporal activities in aexy.temporal.activities.reminders call the
 _*_async() functions defined here.
@@ -29,55 +30,60 @@ from aexy.models.reminder import (
 logger = logging.getLogger(__name__)
 
 
-async def _generate_reminder_instances_async():
+async def _generate_reminder_instances_async() -> dict:
     """Async implementation of instance generation."""
     async with async_session_maker() as db:
         try:
             reminder_service = ReminderService(db)
             notification_service = NotificationService(db)
 
-            # Get reminders that are due
-            reminders = await reminder_service.get_due_reminders()
-            created_count = 0
+            # Create all due instances and advance schedules in bulk
+            tick = await reminder_service.materialize_due_instances()
 
-            for reminder in reminders:
+            for reminder, instance in tick.created:
+                # Send assignment notification if owner assigned
+                if not instance.assigned_owner_id:
+                    continue
                 try:
-                    # Create instance
-                    instance = await reminder_service.create_instance(
-                        reminder=reminder,
-                        due_date=reminder.next_occurrence,
+                    await notification_service.create_notification(
+                        recipient_id=str(instance.assigned_owner_id),
+                        event_type=NotificationEventType.REMINDER_ASSIGNED,
+                        title=f"Reminder assigned: {reminder.title}",
+                        body=f"You have been assigned a reminder due on {instance.due_date.strftime('%Y-%m-%d')}",
+                        context={
+                            "reminder_id": str(reminder.id),
+                            "instance_id": str(instance.id),
+                            "reminder_title": reminder.title,
+                            "due_date": instance.due_date.isoformat(),
+                            "priority": reminder.priority,
+                            "category": reminder.category,
+                            "workspace_id": str(reminder.workspace_id),
+                        },
                     )
-                    created_count += 1
-
-                    # Send assignment notification if owner assigned
-                    if instance.assigned_owner_id:
-                        await notification_service.create_notification(
-                            recipient_id=str(instance.assigned_owner_id),
-                            event_type=NotificationEventType.REMINDER_ASSIGNED,
-                            title=f"Reminder assigned: {reminder.title}",
-                            body=f"You have been assigned a reminder due on {instance.due_date.strftime('%Y-%m-%d')}",
-                            context={
-                                "reminder_id": str(reminder.id),
-                                "instance_id": str(instance.id),
-                                "reminder_title": reminder.title,
-                                "due_date": instance.due_date.isoformat(),
-                                "priority": reminder.priority,
-                                "category": reminder.category,
-                                "workspace_id": str(reminder.workspace_id),
-                            },
-                        )
-
-                    # Advance to next occurrence
-                    await reminder_service.advance_reminder_schedule(reminder)
-
-                    logger.debug(f"Created instance for reminder {reminder.id}")
-
                 except Exception as e:
-                    logger.error(f"Error creating instance for reminder {reminder.id}: {e}")
-                    continue
+                    logger.error(f"Error notifying owner of instance {instance.id}: {e}")
 
             await db.commit()
-            logger.info(f"Generated {created_count} reminder instances")
+            logger.info(
+                f"Generated {len(tick.created)} reminder instances for {tick.due_count} due "
+                f"reminders in {tick.total_ms:.1f}ms (fetch {tick.fetch_ms:.1f}ms, "
+                f"assign {tick.assign_ms:.1f}ms, write {tick.write_ms:.1f}ms)"
+            )
+            if tick.failed_reminder_ids:
+                logger.warning(
+                    f"{len(tick.failed_reminder_ids)} due reminders could not be assigned "
+                    f"and will be retried"
+                )
+
+            return {
+                "due": tick.due_count,
+                "created": len(tick.created),
+                "failed": len(tick.failed_reminder_ids),
+                "fetch_ms": round(tick.fetch_ms, 1),
+                "assign_ms": round(tick.assign_ms, 1),
+                "write_ms": round(tick.write_ms, 1),
+                "total_ms": round(tick.total_ms, 1),
+            }
 
         except Exception as e:
             await db.rollback()
@@ -292,7 +298,9 @@ async def _flag_overdue_reminders_async():
             instances = list(result.scalars().all())
 
             flagged_count = 0
+            transitions = []
             for instance in instances:
+                transitions.append((instance.reminder, instance, instance.status))
                 instance.status = InstanceStatus.OVERDUE.value
                 flagged_count += 1
 
@@ -314,6 +322,9 @@ async def _flag_overdue_reminders_async():
                         },
                     )
 
+            # Move flagged instances to the overdue dashboard counters
+            await ReminderService(db).record_transitions(transitions)
+
             await db.commit()
             logger.info(f"Flagged {flagged_count} instances as overdue")
 
@@ -530,3 +541,28 @@ async def _send_reminder_notification_async(instance_id: str, notification_type:
             await db.rollback()
             logger.error(f"Error sending reminder notification: {e}")
             raise
+
+
+async def _reconcile_reminder_counters_async() -> dict:
+    """Async implementation of dashboard counter reconciliation."""
+    from sqlalchemy import select
+
+    async with async_session_maker() as db:
+        result = await db.execute(select(Reminder.workspace_id).distinct())
+        workspace_ids = [str(w) for w in result.scalars().all()]
+
+    reconciled = 0
+    rows = 0
+    for workspace_id in workspace_ids:
+        # One transaction per workspace keeps counter row locks short
+        async with async_session_maker() as db:
+            try:
+                rows += await ReminderService(db).reconcile_counters(workspace_id)
+                await db.commit()
+                reconciled += 1
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error reconciling reminder counters for workspace {workspace_id}: {e}")
+
+    logger.info(f"Reconciled reminder counters for {reconciled} workspaces ({rows} counters)")
+    return {"workspaces": reconciled, "counters": rows}
@@ -20,12 +20,13 @@ def run_async(coro):
     Always creates a new event loop to avoid conflicts between
     concurrent tasks sharing the same worker process.
 
-    IMPORTANT: This disposes the database connection pool after each run
-    to prevent asyncpg connections created on one event loop from being
-    reused on a different loop (which causes "Future attached to a
-    different loop" errors).
+    IMPORTANT: This disposes the database connection pool and closes the
+    shared HTTP pools after each run to prevent connections created on one
+    event loop from being reused on a different loop (which causes "Future
+    attached to a different loop" errors).
     """
     from aexy.core.database import get_engine
+    from aexy.core.http_clients import close_http_clients
 
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
@@ -40,6 +41,8 @@ def run_async(coro):
             loop.run_until_complete(engine.dispose())
         except Exception:
             pass  # Best effort - don't fail the task if disposal fails
+        # Pool close failures are logged, not raised
+        loop.run_until_complete(close_http_clients())
         loop.close()
 
 
@@ -336,6 +336,7 @@ async def _send_slack_notification(
         color: Color for the Slack attachment (hex code).
     """
     import httpx
+    from aexy.core.http_clients import get_http_transport
     from httpx import HTTPError
 
     integration = await get_slack_integration_for_workspace(db, workspace_id)
@@ -347,7 +348,7 @@ async def _send_slack_notification(
         return
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(transport=get_http_transport(), timeout=30) as client:
             response = await client.post(
                 "https://slack.com/api/chat.postMessage",
                 headers={
@@ -384,8 +385,9 @@ async def _send_webhook_notification(webhook_url: str, payload: dict):
     """Send a webhook notification."""
     try:
         import httpx
+        from aexy.core.http_clients import get_http_transport
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with httpx.AsyncClient(transport=get_http_transport(), timeout=30) as client:
             response = await client.post(
                 webhook_url,
                 json=payload,
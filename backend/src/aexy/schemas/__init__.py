@@ -364,6 +364,7 @@ from aexy.schemas.booking import (
     AvailabilityOverrideCreate,
     AvailabilityOverrideResponse,
     TimeSlot,
+    HostBusyTiming,
     AvailableSlotsResponse,
     # Booking
     BookingCreate,
@@ -442,6 +443,7 @@ from aexy.schemas.reminder import (
     # Dashboard schemas
     CategoryStats,
     ReminderDashboardStats,
+    MyReminderCounts,
     MyRemindersResponse,
     # Calendar schemas
     CalendarEvent,
@@ -866,6 +868,7 @@ __all__ = [
     "AvailabilityOverrideCreate",
     "AvailabilityOverrideResponse",
     "TimeSlot",
+    "HostBusyTiming",
     "AvailableSlotsResponse",
     "BookingCreate",
     "BookingUpdate",
@@ -930,6 +933,7 @@ __all__ = [
     "SuggestionListResponse",
     "CategoryStats",
     "ReminderDashboardStats",
+    "MyReminderCounts",
     "MyRemindersResponse",
     "CalendarEvent",
     "ReminderCalendarResponse",
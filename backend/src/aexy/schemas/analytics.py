@@ -270,7 +270,7 @@ class ExportRequest(BaseModel):
 
     export_type: ExportType
     format: ExportFormat
-    config: dict = {}  # Type-specific configuration
+    config: dict = {}  # Type-specific configuration; {"compress": true} gzips CSV/JSON
 
 
 class ExportJobResponse(BaseModel):
@@ -285,6 +285,8 @@ class ExportJobResponse(BaseModel):
     file_path: str | None = None
     file_size_bytes: int | None = None
     error_message: str | None = None
+    rows_processed: int = 0
+    rows_total: int | None = None
     created_at: datetime
     completed_at: datetime | None = None
     expires_at: datetime
@@ -16,6 +16,7 @@ from aexy.schemas.booking.availability import (
     AvailabilityOverrideCreate,
     AvailabilityOverrideResponse,
     TimeSlot,
+    HostBusyTiming,
     AvailableSlotsResponse,
 )
 from aexy.schemas.booking.booking import (
@@ -70,6 +71,7 @@ __all__ = [
     "AvailabilityOverrideCreate",
     "AvailabilityOverrideResponse",
     "TimeSlot",
+    "HostBusyTiming",
     "AvailableSlotsResponse",
     # Booking
     "BookingCreate",
@@ -105,6 +105,14 @@ class TimeSlot(BaseModel):
     available: bool = True
 
 
+class HostBusyTiming(BaseModel):
+    """Calendar lookup diagnostics for one host."""
+
+    host_id: str
+    status: str  # ok, timeout or error
+    duration_ms: float
+
+
 class AvailableSlotsResponse(BaseModel):
     """Available slots for a date range."""
 
@@ -112,6 +120,9 @@ class AvailableSlotsResponse(BaseModel):
     date: date
     timezone: str
     slots: list[TimeSlot]
+    # True when some host's calendar could not be checked in time
+    partial: bool = False
+    host_timings: list[HostBusyTiming] = Field(default_factory=list)
 
 
 class BulkAvailabilityUpdate(BaseModel):
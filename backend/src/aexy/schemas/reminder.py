@@ -627,12 +627,21 @@ class ReminderDashboardStats(BaseModel):
 
     # By category
     by_category: list[CategoryStats]
+    by_domain: list[CategoryStats] = Field(default_factory=list)
 
     # By priority
     critical_overdue: int
     high_overdue: int
 
 
+class MyReminderCounts(BaseModel):
+    """Counts for the current user's reminders."""
+    open: int = 0
+    overdue: int = 0
+    completed_this_week: int = 0
+    completed_this_month: int = 0
+
+
 class MyRemindersResponse(BaseModel):
     """Schema for my reminders response."""
     assigned_to_me: list[ReminderInstanceResponse]
@@ -640,6 +649,7 @@ class MyRemindersResponse(BaseModel):
     overdue: list[ReminderInstanceResponse]
     due_today: list[ReminderInstanceResponse]
     due_this_week: list[ReminderInstanceResponse]
+    counts: MyReminderCounts = Field(default_factory=MyReminderCounts)
 
 
 # =============================================================================
@@ -8,6 +8,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.activity import Commit, PullRequest, CodeReview
+from aexy.models.collaboration import CollaborationEdgeBucket
 from aexy.models.developer import Developer
 from aexy.schemas.analytics import (
     SkillHeatmapCell,
@@ -21,6 +22,26 @@ from aexy.schemas.analytics import (
     CollaborationGraph,
     DateRange,
 )
+from aexy.services.collaboration_network import week_bucket
+
+# Columns of the team analytics export tables, in file order
+PRODUCTIVITY_EXPORT_COLUMNS = [
+    "date",
+    "commits",
+    "prs_opened",
+    "prs_merged",
+    "reviews_given",
+    "lines_added",
+    "lines_removed",
+]
+WORKLOAD_EXPORT_COLUMNS = [
+    "developer_id",
+    "developer_name",
+    "active_prs",
+    "pending_reviews",
+    "recent_commits",
+    "workload_score",
+]
 
 
 class AnalyticsDashboardService:
@@ -447,6 +468,35 @@ class AnalyticsDashboardService:
             imbalance_score=imbalance_score,
         )
 
+    async def iter_team_export_tables(
+        self,
+        developer_ids: list[str],
+        db: AsyncSession,
+        date_range: DateRange,
+    ):
+        """Yield the team analytics export as ExportTable sections."""
+        from aexy.services.export_service import ExportTable
+
+        trends = await self.get_productivity_trends(developer_ids, db, date_range)
+        yield ExportTable(
+            title="Productivity Trends",
+            headers=PRODUCTIVITY_EXPORT_COLUMNS,
+            rows=[
+                [point.date.isoformat(), *(getattr(point, c) for c in PRODUCTIVITY_EXPORT_COLUMNS[1:])]
+                for point in trends.data
+            ],
+        )
+
+        workload = await self.get_workload_distribution(developer_ids, db)
+        yield ExportTable(
+            title="Workload Distribution",
+            headers=WORKLOAD_EXPORT_COLUMNS,
+            rows=[
+                [getattr(item, c) for c in WORKLOAD_EXPORT_COLUMNS]
+                for item in workload.items
+            ],
+        )
+
     async def get_collaboration_network(
         self,
         developer_ids: list[str],
@@ -473,24 +523,27 @@ class AnalyticsDashboardService:
         # Track collaboration: (dev_a, dev_b) -> interaction count
         collaborations: dict[tuple[str, str], int] = defaultdict(int)
 
-        # Get PR reviews: reviewer -> PR author
+        # Precomputed reviewer -> PR author edges, summed over the window
         review_stmt = (
-            select(CodeReview.developer_id, PullRequest.developer_id)
-            .join(PullRequest, CodeReview.pull_request_github_id == PullRequest.github_id)
+            select(
+                CollaborationEdgeBucket.reviewer_id,
+                CollaborationEdgeBucket.author_id,
+                func.sum(CollaborationEdgeBucket.review_count),
+            )
             .where(
                 and_(
-                    CodeReview.developer_id.in_(developer_ids),
-                    PullRequest.developer_id.in_(developer_ids),
-                    CodeReview.submitted_at >= cutoff,
-                    CodeReview.developer_id != PullRequest.developer_id,
+                    CollaborationEdgeBucket.reviewer_id.in_(developer_ids),
+                    CollaborationEdgeBucket.author_id.in_(developer_ids),
+                    CollaborationEdgeBucket.bucket_start >= week_bucket(cutoff),
                 )
             )
+            .group_by(CollaborationEdgeBucket.reviewer_id, CollaborationEdgeBucket.author_id)
         )
         result = await db.execute(review_stmt)
-        for reviewer_id, author_id in result:
+        for reviewer_id, author_id, count in result:
             # Normalize edge direction (smaller ID first)
             edge = tuple(sorted([reviewer_id, author_id]))
-            collaborations[edge] += 1
+            collaborations[edge] += int(count or 0)
 
         # Build nodes
         degree_count: dict[str, int] = defaultdict(int)
@@ -0,0 +1,122 @@
+"""Optimal task-to-developer assignment under per-developer capacity."""
+
+import math
+from collections.abc import Sequence
+
+INF = math.inf
+
+
+def solve_assignment(
+    scores: Sequence[Sequence[float | None]],
+    capacities: Sequence[int],
+    min_score: float = 0.0,
+) -> list[int | None]:
+    """Assign tasks to developers, maximizing the total match score.
+
+    Solves the capacitated assignment (transportation) problem exactly with
+    the Hungarian method's shortest augmenting paths: each developer column
+    takes up to its capacity of tasks, and a task may stay unassigned when
+    no developer has room or every score is below ``min_score``. Runs in
+    O(T^2 * D) in the worst case, typically far less since most tasks find
+    their best developer directly.
+
+    Args:
+        scores: Score matrix, one row per task and one column per developer.
+            None marks a pair that must not be assigned.
+        capacities: Maximum number of tasks per developer.
+        min_score: Pairs scoring below this are never assigned.
+
+    Returns:
+        Developer column for each task, or None if it stays unassigned.
+    """
+    n_tasks = len(scores)
+    n_devs = len(capacities)
+    unassigned = n_devs  # extra column with room for every task
+
+    # Minimize cost = -score; the unassigned column costs 0
+    costs = [
+        [-s if s is not None and s >= min_score else INF for s in row] + [0.0]
+        for row in scores
+    ]
+    room = [max(0, int(c)) for c in capacities] + [n_tasks]
+    columns = n_devs + 1
+
+    u = [0.0] * n_tasks  # task potentials
+    v = [0.0] * columns  # developer potentials
+    task_col = [-1] * n_tasks
+    col_tasks: list[set[int]] = [set() for _ in range(columns)]
+
+    for start in range(n_tasks):
+        min_reduced = [INF] * columns
+        reached_from = [-1] * columns  # task whose edge reached each column
+        done = [False] * columns
+        tree = [start]
+
+        _scan(start, costs[start], u[start], v, done, min_reduced, reached_from)
+        while True:
+            # Closest column not yet in the tree
+            delta, col = INF, -1
+            for j in range(columns):
+                if not done[j] and min_reduced[j] < delta:
+                    delta, col = min_reduced[j], j
+
+            # Shift potentials so the new tight edge has zero reduced cost
+            for task in tree:
+                u[task] += delta
+            for j in range(columns):
+                if done[j]:
+                    v[j] -= delta
+                else:
+                    min_reduced[j] -= delta
+            done[col] = True
+
+            if len(col_tasks[col]) < room[col]:
+                break
+            # Full column: its tasks may move elsewhere, so grow the tree
+            for task in col_tasks[col]:
+                tree.append(task)
+                _scan(task, costs[task], u[task], v, done, min_reduced, reached_from)
+
+        # Augment: shift tasks one step along the path back to the start
+        while True:
+            task = reached_from[col]
+            previous = task_col[task]
+            if previous >= 0:
+                col_tasks[previous].discard(task)
+            col_tasks[col].add(task)
+            task_col[task] = col
+            if task == start:
+                break
+            col = previous
+
+    return [col if col != unassigned else None for col in task_col]
+
+
+def _scan(
+    task: int,
+    row: list[float],
+    ut: float,
+    v: list[float],
+    done: list[bool],
+    min_reduced: list[float],
+    reached_from: list[int],
+) -> None:
+    """Relax the edges from a task newly added to the search tree."""
+    for j in range(len(v)):
+        if not done[j]:
+            reduced = row[j] - ut - v[j]
+            if reduced < min_reduced[j]:
+                min_reduced[j] = reduced
+                reached_from[j] = task
+
+
+def total_score(
+    scores: Sequence[Sequence[float | None]],
+    assignment: Sequence[int | None],
+) -> float:
+    """Sum the scores of an assignment."""
+    return sum(
+        scores[task][dev] or 0.0
+        for task, dev in enumerate(assignment)
+        if dev is not None
+    )
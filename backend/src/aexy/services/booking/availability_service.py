@@ -1,5 +1,8 @@
 """Availability service for booking module."""
 
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
 from uuid import uuid4
@@ -18,7 +21,9 @@ from aexy.models.booking import (
 )
 
 if TYPE_CHECKING:
-    from aexy.services.booking.calendar_sync_service import CalendarSyncService
+    from aexy.services.booking.calendar_sync_service import CalendarSyncService, HostBusyTimes
+
+logger = logging.getLogger(__name__)
 
 
 class AvailabilityServiceError(Exception):
@@ -33,6 +38,19 @@ class InvalidTimeRangeError(AvailabilityServiceError):
     pass
 
 
+@dataclass
+class AvailableSlotsResult:
+    """Slots for a date plus per-host calendar lookup diagnostics."""
+
+    slots: list[dict] = field(default_factory=list)
+    host_timings: list["HostBusyTimes"] = field(default_factory=list)
+
+    @property
+    def partial(self) -> bool:
+        """True if some host's calendar could not be checked."""
+        return any(host.status != "ok" for host in self.host_timings)
+
+
 class AvailabilityService:
     """Service for managing availability and calculating available slots."""
 
@@ -262,13 +280,32 @@ class AvailabilityService:
             user_ids: Optional list of specific user IDs to check availability for.
                       When provided, only returns slots when ALL specified users are free.
         """
+        result = await self.get_available_slots_result(
+            event_type_id, target_date, timezone, calendar_service, user_ids
+        )
+        return result.slots
+
+    async def get_available_slots_result(
+        self,
+        event_type_id: str,
+        target_date: date,
+        timezone: str = "UTC",
+        calendar_service: "CalendarSyncService | None" = None,
+        user_ids: list[str] | None = None,
+    ) -> AvailableSlotsResult:
+        """Get available time slots for a date, with per-host calendar timings.
+
+        Takes the same arguments as get_available_slots. Host calendars are
+        queried concurrently; a host whose calendar times out or fails is
+        reported in ``host_timings`` and its calendar is treated as free.
+        """
         # Get event type
         stmt = select(EventType).where(EventType.id == event_type_id)
         result = await self.db.execute(stmt)
         event_type = result.scalar_one_or_none()
 
         if not event_type:
-            return []
+            return AvailableSlotsResult()
 
         # Check if date is within booking window
         now = datetime.now(ZoneInfo(timezone))
@@ -284,7 +321,7 @@ class AvailabilityService:
         max_booking_date = today + timedelta(days=event_type.max_future_days)
 
         if target_date < min_booking_date or target_date > max_booking_date:
-            return []
+            return AvailableSlotsResult()
 
         # Get host ID(s)
         # If user_ids is provided, use those instead of the default team/owner lookup
@@ -299,7 +336,7 @@ class AvailabilityService:
             host_ids = [event_type.owner_id]
 
         if not host_ids:
-            return []
+            return AvailableSlotsResult()
 
         # Get base availability for the day
         day_of_week = target_date.weekday()  # 0=Monday, 6=Sunday
@@ -308,20 +345,19 @@ class AvailabilityService:
         )
 
         if not available_windows:
-            return []
+            return AvailableSlotsResult()
 
         # Get existing bookings
         busy_times = await self._get_busy_times(
             host_ids, target_date, timezone
         )
 
-        # Get calendar busy times if service is provided
-        if calendar_service:
-            for host_id in host_ids:
-                calendar_busy = await calendar_service.get_busy_times(
-                    host_id, target_date, target_date
-                )
-                busy_times.extend(calendar_busy)
+        # Get calendar busy times for all hosts at once if service is provided
+        calendar_busy = await self._get_calendar_busy(
+            calendar_service, host_ids, target_date, target_date
+        )
+        for host in calendar_busy.values():
+            busy_times.extend(host.busy)
 
         # Generate slots
         slots = self._generate_slots(
@@ -337,7 +373,7 @@ class AvailabilityService:
             else now,
         )
 
-        return slots
+        return AvailableSlotsResult(slots=slots, host_timings=list(calendar_busy.values()))
 
     async def check_slot_availability(
         self,
@@ -387,20 +423,33 @@ class AvailabilityService:
         day_of_week: int,
         target_date: date,
     ) -> list[dict]:
-        """Get availability windows for a specific day."""
-        windows = []
+        """Get availability windows for a specific day, for all users at once."""
+        override_stmt = select(AvailabilityOverride).where(
+            and_(
+                AvailabilityOverride.user_id.in_(user_ids),
+                AvailabilityOverride.date == target_date,
+            )
+        )
+        override_result = await self.db.execute(override_stmt)
+        overrides = {o.user_id: o for o in override_result.scalars().all()}
 
-        for user_id in user_ids:
-            # Check for override first
-            override_stmt = select(AvailabilityOverride).where(
-                and_(
-                    AvailabilityOverride.user_id == user_id,
-                    AvailabilityOverride.date == target_date,
-                )
+        avail_stmt = select(UserAvailability).where(
+            and_(
+                UserAvailability.user_id.in_(user_ids),
+                UserAvailability.workspace_id == workspace_id,
+                UserAvailability.day_of_week == day_of_week,
+                UserAvailability.is_active == True,
             )
-            override_result = await self.db.execute(override_stmt)
-            override = override_result.scalar_one_or_none()
+        )
+        avail_result = await self.db.execute(avail_stmt)
+        availabilities: dict[str, list[UserAvailability]] = defaultdict(list)
+        for avail in avail_result.scalars().all():
+            availabilities[avail.user_id].append(avail)
 
+        windows = []
+        for user_id in user_ids:
+            # An override replaces the regular schedule for the date
+            override = overrides.get(user_id)
             if override:
                 if override.is_available and override.start_time and override.end_time:
                     windows.append(
@@ -413,19 +462,7 @@ class AvailabilityService:
                 # If override exists but is_available=False, skip this user for this date
                 continue
 
-            # Get regular availability
-            avail_stmt = select(UserAvailability).where(
-                and_(
-                    UserAvailability.user_id == user_id,
-                    UserAvailability.workspace_id == workspace_id,
-                    UserAvailability.day_of_week == day_of_week,
-                    UserAvailability.is_active == True,
-                )
-            )
-            avail_result = await self.db.execute(avail_stmt)
-            availabilities = avail_result.scalars().all()
-
-            for avail in availabilities:
+            for avail in availabilities.get(user_id, []):
                 windows.append(
                     {
                         "user_id": user_id,
@@ -466,11 +503,32 @@ class AvailabilityService:
                 {
                     "start": booking.start_time,
                     "end": booking.end_time,
+                    "host_id": booking.host_id,
                 }
             )
 
         return busy_times
 
+    async def _get_calendar_busy(
+        self,
+        calendar_service: "CalendarSyncService | None",
+        host_ids: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, "HostBusyTimes"]:
+        """Get external calendar busy times for hosts, fetched concurrently."""
+        if not calendar_service:
+            return {}
+
+        hosts = await calendar_service.get_busy_times_for_hosts(host_ids, start_date, end_date)
+        for host in hosts.values():
+            if host.status != "ok":
+                logger.warning(
+                    f"Calendar for host {host.host_id} unavailable ({host.status}) "
+                    f"after {host.duration_ms:.0f}ms; using bookings only"
+                )
+        return hosts
+
     def _generate_slots(
         self,
         available_windows: list[dict],
@@ -571,16 +629,27 @@ class AvailabilityService:
         assignment_type = members[0].assignment_type
 
         if assignment_type == AssignmentType.COLLECTIVE.value:
-            # All members must be free - intersection of availability
+            # All members must be free - intersection of availability.
+            # Windows and bookings are loaded for all members in one pass and
+            # member calendars are queried concurrently.
+            member_ids = [member.user_id for member in members]
+            windows = await self._get_day_availability(
+                member_ids, event_type.workspace_id, target_date.weekday(), target_date
+            )
+            bookings_busy = await self._get_busy_times(member_ids, target_date, timezone)
+            calendar_busy = await self._get_calendar_busy(
+                calendar_service, member_ids, target_date, target_date
+            )
+
             all_slots = []
-            for member in members:
-                # Create a temporary single-user event type context
-                member_slots = await self._get_user_slots(
-                    member.user_id,
+            for member_id in member_ids:
+                member_slots = self._get_user_slots(
                     event_type,
                     target_date,
                     timezone,
-                    calendar_service,
+                    windows=[w for w in windows if w["user_id"] == member_id],
+                    busy_times=[b for b in bookings_busy if b["host_id"] == member_id]
+                    + (calendar_busy[member_id].busy if member_id in calendar_busy else []),
                 )
                 all_slots.append(set(s["start_time"] for s in member_slots if s["available"]))
 
@@ -604,36 +673,19 @@ class AvailabilityService:
                 event_type_id, target_date, timezone, calendar_service
             )
 
-    async def _get_user_slots(
+    def _get_user_slots(
         self,
-        user_id: str,
         event_type: EventType,
         target_date: date,
         timezone: str,
-        calendar_service: "CalendarSyncService | None",
+        windows: list[dict],
+        busy_times: list[dict],
     ) -> list[dict]:
-        """Get available slots for a single user."""
-        tz = ZoneInfo(timezone)
-        now = datetime.now(tz)
-        day_of_week = target_date.weekday()
-
-        # Get availability windows
-        windows = await self._get_day_availability(
-            [user_id], event_type.workspace_id, day_of_week, target_date
-        )
-
+        """Get available slots for a single user from prefetched windows and busy times."""
         if not windows:
             return []
 
-        # Get busy times
-        busy_times = await self._get_busy_times([user_id], target_date, timezone)
-
-        if calendar_service:
-            calendar_busy = await calendar_service.get_busy_times(
-                user_id, target_date, target_date
-            )
-            busy_times.extend(calendar_busy)
-
+        now = datetime.now(ZoneInfo(timezone))
         min_booking_datetime = now + timedelta(hours=event_type.min_notice_hours)
 
         return self._generate_slots(
@@ -710,6 +762,11 @@ class AvailabilityService:
         user_result = await self.db.execute(user_stmt)
         users = {u.id: u for u in user_result.scalars().all()}
 
+        # Query every member's calendars for the whole range at once
+        calendar_busy = await self._get_calendar_busy(
+            calendar_service, member_ids, start_date, end_date
+        )
+
         # Build response structure
         members_data = []
         all_available_times: dict[str, list[set]] = {}  # date -> list of time sets per user
@@ -720,6 +777,14 @@ class AvailabilityService:
             date_str = current_date.isoformat()
             all_available_times[date_str] = []
 
+            # Windows and bookings for all members on this day
+            day_windows = await self._get_day_availability(
+                member_ids, workspace_id, current_date.weekday(), current_date
+            )
+            day_bookings = await self._get_busy_times(member_ids, current_date, timezone)
+            utc_day_start = datetime.combine(current_date, time.min, tzinfo=ZoneInfo("UTC"))
+            utc_day_end = utc_day_start + timedelta(days=1)
+
             for user_id in member_ids:
                 # Initialize member data on first iteration
                 member_entry = next(
@@ -739,21 +804,16 @@ class AvailabilityService:
                     }
                     members_data.append(member_entry)
 
-                # Get day's availability
-                day_of_week = current_date.weekday()
-                windows = await self._get_day_availability(
-                    [user_id], workspace_id, day_of_week, current_date
-                )
-
-                # Get busy times from bookings
-                busy_times = await self._get_busy_times([user_id], current_date, timezone)
+                # Day's availability and busy times from bookings
+                windows = [w for w in day_windows if w["user_id"] == user_id]
+                busy_times = [b for b in day_bookings if b["host_id"] == user_id]
 
-                # Get calendar busy times if available
-                if calendar_service:
-                    calendar_busy = await calendar_service.get_busy_times(
-                        user_id, current_date, current_date
+                # Calendar busy times overlapping this (UTC) day
+                if user_id in calendar_busy:
+                    busy_times.extend(
+                        busy for busy in calendar_busy[user_id].busy
+                        if busy["start"] < utc_day_end and busy["end"] > utc_day_start
                     )
-                    busy_times.extend(calendar_busy)
 
                 # Format windows
                 formatted_windows = []
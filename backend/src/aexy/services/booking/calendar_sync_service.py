@@ -4,7 +4,11 @@ Provides actual integration with Google Calendar and Microsoft Graph APIs
 for busy time checking and event creation.
 """
 
+import asyncio
 import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from uuid import uuid4
 from zoneinfo import ZoneInfo
@@ -14,6 +18,7 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.booking import CalendarConnection, CalendarProvider, Booking
 
 logger = logging.getLogger(__name__)
@@ -45,6 +50,16 @@ class CalendarTokenRefreshError(CalendarSyncServiceError):
     pass
 
 
+@dataclass
+class HostBusyTimes:
+    """Calendar busy periods for one host, with fetch diagnostics."""
+
+    host_id: str
+    busy: list[dict] = field(default_factory=list)
+    status: str = "ok"  # ok, timeout or error; busy is empty unless ok
+    duration_ms: float = 0.0
+
+
 class CalendarSyncService:
     """Service for syncing with external calendars."""
 
@@ -310,6 +325,122 @@ class CalendarSyncService:
 
         return busy_times
 
+    async def get_busy_times_for_hosts(
+        self,
+        user_ids: list[str],
+        start_date: date,
+        end_date: date,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, HostBusyTimes]:
+        """Get busy times for several hosts, querying their calendars concurrently.
+
+        Connections for all hosts are loaded in one query, then each host's
+        calendars are queried with at most ``max_concurrency`` hosts in
+        flight. A host that exceeds ``timeout`` seconds or fails is returned
+        with no busy times and a non-ok status instead of failing the batch.
+
+        Returns:
+            HostBusyTimes per user ID, in the order given.
+        """
+        settings = get_settings()
+        max_concurrency = max_concurrency or settings.booking_busy_fetch_concurrency
+        timeout = timeout or settings.booking_busy_fetch_timeout_seconds
+
+        stmt = select(CalendarConnection).where(
+            and_(
+                CalendarConnection.user_id.in_(user_ids),
+                CalendarConnection.check_conflicts == True,
+                CalendarConnection.sync_enabled == True,
+            )
+        )
+        result = await self.db.execute(stmt)
+        connections_by_user: dict[str, list[CalendarConnection]] = defaultdict(list)
+        for connection in result.scalars().all():
+            connections_by_user[connection.user_id].append(connection)
+
+        start_dt = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=ZoneInfo("UTC"))
+        end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).replace(tzinfo=ZoneInfo("UTC"))
+        semaphore = asyncio.Semaphore(max_concurrency)
+        refreshed: list[CalendarConnection] = []
+
+        async def fetch(user_id: str) -> HostBusyTimes:
+            host = HostBusyTimes(host_id=user_id)
+            connections = connections_by_user.get(user_id)
+            if not connections:
+                return host
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    host.busy = await asyncio.wait_for(
+                        self._fetch_connections_busy(connections, start_dt, end_dt, refreshed),
+                        timeout,
+                    )
+                except asyncio.TimeoutError:
+                    host.status = "timeout"
+                    logger.warning(f"Busy time lookup for host {user_id} timed out after {timeout}s")
+                except Exception as e:
+                    host.status = "error"
+                    logger.error(f"Busy time lookup for host {user_id} failed: {e}")
+                host.duration_ms = (time.perf_counter() - started) * 1000
+            return host
+
+        hosts = await asyncio.gather(*(fetch(user_id) for user_id in dict.fromkeys(user_ids)))
+
+        # Token refreshes only touched the objects; persist them in one flush
+        if refreshed:
+            await self.db.flush()
+
+        return {host.host_id: host for host in hosts}
+
+    async def _fetch_connections_busy(
+        self,
+        connections: list[CalendarConnection],
+        start_dt: datetime,
+        end_dt: datetime,
+        refreshed: list[CalendarConnection],
+    ) -> list[dict]:
+        """Query one host's calendars without touching the session.
+
+        Safe to run concurrently: refreshed tokens are set on the
+        connection objects and collected in ``refreshed`` for the caller
+        to flush.
+        """
+        busy_times = []
+        failures: list[Exception] = []
+        settings = get_settings()
+
+        for connection in connections:
+            try:
+                if self._token_expires_soon(connection):
+                    if connection.provider == CalendarProvider.GOOGLE.value:
+                        await self._refresh_google_token(connection, settings)
+                    elif connection.provider == CalendarProvider.MICROSOFT.value:
+                        await self._refresh_microsoft_token(connection, settings)
+                    refreshed.append(connection)
+
+                if connection.provider == CalendarProvider.GOOGLE.value:
+                    busy_times.extend(
+                        await self._get_google_busy_times(connection, start_dt, end_dt)
+                    )
+                elif connection.provider == CalendarProvider.MICROSOFT.value:
+                    busy_times.extend(
+                        await self._get_microsoft_busy_times(connection, start_dt, end_dt)
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to get busy times from {connection.provider} "
+                    f"calendar {connection.calendar_id}: {e}"
+                )
+                failures.append(e)
+                # Continue with other calendars
+                continue
+
+        # Report the host as failed only if none of its calendars answered
+        if failures and len(failures) == len(connections):
+            raise failures[0]
+        return busy_times
+
     async def _get_google_busy_times(
         self,
         connection: CalendarConnection,
@@ -317,7 +448,7 @@ class CalendarSyncService:
         end_dt: datetime,
     ) -> list[dict]:
         """Get busy times from Google Calendar using freeBusy API."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 f"{GOOGLE_CALENDAR_API}/freeBusy",
                 headers={
@@ -363,7 +494,7 @@ class CalendarSyncService:
         end_dt: datetime,
     ) -> list[dict]:
         """Get busy times from Microsoft Graph using calendarView API."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             # Use calendarView to get events in the time range
             # This is more reliable than getSchedule for personal calendars
             params = {
@@ -581,7 +712,7 @@ class CalendarSyncService:
                 "entryPoints": [{"entryPointType": "video", "uri": booking.meeting_link}]
             }
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             # Add conferenceDataVersion=1 to enable Meet link generation
             url = f"{GOOGLE_CALENDAR_API}/calendars/{connection.calendar_id}/events"
             if create_meet_link and not booking.meeting_link:
@@ -667,7 +798,7 @@ class CalendarSyncService:
         else:
             url = f"{MICROSOFT_GRAPH_API}/me/calendars/{connection.calendar_id}/events"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 url,
                 headers={
@@ -838,7 +969,7 @@ class CalendarSyncService:
             },
         }
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.patch(
                 f"{GOOGLE_CALENDAR_API}/calendars/{connection.calendar_id}/events/{event_id}",
                 headers={
@@ -884,7 +1015,7 @@ class CalendarSyncService:
         else:
             url = f"{MICROSOFT_GRAPH_API}/me/calendars/{connection.calendar_id}/events/{event_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.patch(
                 url,
                 headers={
@@ -940,7 +1071,7 @@ class CalendarSyncService:
         event_id: str,
     ) -> None:
         """Delete event from Google Calendar."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.delete(
                 f"{GOOGLE_CALENDAR_API}/calendars/{connection.calendar_id}/events/{event_id}",
                 headers={
@@ -966,7 +1097,7 @@ class CalendarSyncService:
         else:
             url = f"{MICROSOFT_GRAPH_API}/me/calendars/{connection.calendar_id}/events/{event_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.delete(
                 url,
                 headers={
@@ -998,18 +1129,7 @@ class CalendarSyncService:
         connection: CalendarConnection,
     ) -> CalendarConnection:
         """Refresh OAuth token if expired or about to expire (internal)."""
-        if not connection.token_expires_at:
-            return connection
-
-        # Check if token expires within 5 minutes
-        now = datetime.now(ZoneInfo("UTC"))
-        expires_soon = connection.token_expires_at <= now + timedelta(minutes=5)
-
-        if not expires_soon:
-            return connection
-
-        if not connection.refresh_token:
-            logger.warning(f"No refresh token for connection {connection.id}")
+        if not self._token_expires_soon(connection):
             return connection
 
         settings = get_settings()
@@ -1028,13 +1148,28 @@ class CalendarSyncService:
 
         return connection
 
+    def _token_expires_soon(self, connection: CalendarConnection) -> bool:
+        """Whether a connection's token expires within 5 minutes and can be refreshed."""
+        if not connection.token_expires_at:
+            return False
+
+        now = datetime.now(ZoneInfo("UTC"))
+        if connection.token_expires_at > now + timedelta(minutes=5):
+            return False
+
+        if not connection.refresh_token:
+            logger.warning(f"No refresh token for connection {connection.id}")
+            return False
+
+        return True
+
     async def _refresh_google_token(
         self,
         connection: CalendarConnection,
         settings,
     ) -> None:
         """Refresh Google OAuth token."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -1069,7 +1204,7 @@ class CalendarSyncService:
         tenant = settings.microsoft_tenant_id or "common"
         token_url = MICROSOFT_TOKEN_URL.format(tenant=tenant)
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 token_url,
                 data={
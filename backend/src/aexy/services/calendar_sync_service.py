@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.google_integration import (
     GoogleIntegration,
     SyncedCalendarEvent,
@@ -66,7 +67,7 @@ class CalendarSyncService:
         if not integration.refresh_token:
             raise CalendarAuthError("No refresh token available")
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -100,7 +101,7 @@ class CalendarSyncService:
         """Make an authenticated request to the Calendar API."""
         access_token = await self._refresh_token_if_needed(integration)
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.request(
                 method,
                 f"{CALENDAR_API_BASE}{endpoint}",
@@ -0,0 +1,129 @@
+"""Fast local shortlisting of developers for a task from skill fingerprints."""
+
+import heapq
+import re
+from typing import Any
+
+from aexy.llm.base import TaskSignals
+
+# Language proficiency is scaled by its trend, so recent use counts for more
+TREND_FACTORS = {"growing": 1.15, "stable": 1.0, "declining": 0.75}
+
+# Weight of a skill recently acquired per growth trajectory, if not stronger already
+RECENT_SKILL_WEIGHT = 0.6
+
+# How much each kind of task signal contributes to a match
+TASK_SIGNAL_WEIGHTS = {
+    "required_skills": 1.0,
+    "domain": 0.75,
+    "preferred_skills": 0.5,
+    "keywords": 0.25,
+}
+
+_SEPARATORS = re.compile(r"[\s._\-/]+")
+
+
+def normalize_skill(name: str) -> str:
+    """Normalize a skill name so "Node.js", "node js" and "NodeJS" match."""
+    return _SEPARATORS.sub("", name.strip().lower())
+
+
+def task_vector(task_signals: TaskSignals) -> dict[str, float]:
+    """Build a sparse skill vector from task signals."""
+    vector: dict[str, float] = {}
+
+    def add(name: str | None, weight: float) -> None:
+        term = normalize_skill(name or "")
+        if term:
+            vector[term] = max(vector.get(term, 0.0), weight)
+
+    for field in ("required_skills", "preferred_skills", "keywords"):
+        for name in getattr(task_signals, field):
+            add(name, TASK_SIGNAL_WEIGHTS[field])
+    add(task_signals.domain, TASK_SIGNAL_WEIGHTS["domain"])
+    return vector
+
+
+def developer_vector(developer: dict[str, Any]) -> dict[str, float]:
+    """Build a sparse skill vector from a developer's skill fingerprint.
+
+    Weights are proficiency or confidence on a 0-1 scale. Languages are
+    scaled by their trend and skills acquired in the last six months get
+    at least RECENT_SKILL_WEIGHT.
+    """
+    fingerprint = developer.get("skill_fingerprint") or {}
+    vector: dict[str, float] = {}
+
+    def add(name: str | None, weight: float) -> None:
+        term = normalize_skill(name or "")
+        if term:
+            vector[term] = max(vector.get(term, 0.0), weight)
+
+    for language in fingerprint.get("languages", []):
+        trend = TREND_FACTORS.get(language.get("trend", "stable"), 1.0)
+        add(language.get("name"), language.get("proficiency_score", 0) / 100 * trend)
+    for framework in fingerprint.get("frameworks", []):
+        add(framework.get("name"), framework.get("proficiency_score", 0) / 100)
+    for domain in fingerprint.get("domains", []):
+        add(domain.get("name"), domain.get("confidence_score", 0) / 100)
+    for tool in fingerprint.get("tools", []):
+        add(tool, 0.5)
+
+    growth = developer.get("growth_trajectory") or {}
+    for skill in growth.get("skills_acquired_6m", []):
+        add(skill, RECENT_SKILL_WEIGHT)
+
+    return vector
+
+
+class SkillIndex:
+    """Inverted index of developer skill vectors for scoring many tasks.
+
+    Built once per developer list, it scores a task by walking only the
+    postings of the task's skills, so matching a batch of tasks costs
+    roughly the number of matching developer skills rather than
+    tasks x developers x skills.
+    """
+
+    def __init__(self, developers: list[dict[str, Any]]) -> None:
+        """Index developers by skill.
+
+        Args:
+            developers: Developer dicts with id and skill_fingerprint.
+        """
+        self.developers = developers
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for position, developer in enumerate(developers):
+            for term, weight in developer_vector(developer).items():
+                if weight > 0:
+                    self._postings.setdefault(term, []).append((position, weight))
+
+    def __len__(self) -> int:
+        return len(self.developers)
+
+    def scores(self, task_signals: TaskSignals) -> list[float]:
+        """Score every developer for a task on a 0-100 scale.
+
+        The score is the share of the task's weighted skills the developer
+        covers, each counted by the developer's proficiency in it.
+        """
+        query = task_vector(task_signals)
+        totals = [0.0] * len(self.developers)
+        norm = sum(query.values())
+        if not norm:
+            return totals
+
+        for term, task_weight in query.items():
+            for position, weight in self._postings.get(term, ()):
+                totals[position] += task_weight * weight
+
+        return [min(100.0, total / norm * 100) for total in totals]
+
+    def top_k(self, task_signals: TaskSignals, k: int) -> list[tuple[dict[str, Any], float]]:
+        """Return the k best developers for a task with their scores, best first.
+
+        Ties keep the original developer order.
+        """
+        scores = self.scores(task_signals)
+        best = heapq.nsmallest(k, range(len(scores)), key=lambda i: (-scores[i], i))
+        return [(self.developers[i], scores[i]) for i in best]
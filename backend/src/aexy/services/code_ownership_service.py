@@ -0,0 +1,415 @@
+"""Code ownership service.
+
+Maintains a sparse path x developer matrix per repository from commit file
+lists and answers ownership questions as reductions over that matrix:
+- File- and directory-level bus factor
+- Knowledge silos (paths dominated by a single developer)
+- Rotation exposure (paths left orphaned when developers leave)
+
+The matrix is updated incrementally as commits are ingested, so read paths
+never rescan the commits table. History ingested before tracking started is
+folded in by a resumable backfill, a bounded number of commits per sync.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aexy.models.activity import Commit
+from aexy.models.code_ownership import RepositoryOwnershipMatrix
+
+logger = logging.getLogger(__name__)
+
+OwnershipLevel = Literal["file", "directory"]
+
+# Pre-tracking commits fetched and committed together during a backfill
+BACKFILL_BATCH_SIZE = 500
+# Commits a single sync backfills, so each sync leaves API budget and makes progress
+BACKFILL_MAX_COMMITS = 2000
+
+
+def directory_of(path: str, depth: int = 1) -> str:
+    """Return the directory prefix of a path truncated to `depth` segments.
+
+    Files at the repository root are grouped under ".".
+    """
+    parts = path.split("/")[:-1]
+    return "/".join(parts[:depth]) or "."
+
+
+@dataclass
+class OwnershipMatrix:
+    """In-memory view of a repository's ownership matrix.
+
+    Each row is a sparse mapping of developer column index to touch count.
+    """
+
+    repository: str
+    paths: list[str] = field(default_factory=list)
+    developer_ids: list[str] = field(default_factory=list)
+    rows: list[dict[int, int]] = field(default_factory=list)
+    _path_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _dev_index: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._path_index = {p: i for i, p in enumerate(self.paths)}
+        self._dev_index = {d: i for i, d in enumerate(self.developer_ids)}
+        while len(self.rows) < len(self.paths):
+            self.rows.append({})
+
+    @classmethod
+    def from_record(cls, record: RepositoryOwnershipMatrix) -> "OwnershipMatrix":
+        """Build a matrix from its persisted coordinate form."""
+        paths = list(record.paths or [])
+        rows: list[dict[int, int]] = [{} for _ in paths]
+        for path_idx, dev_idx, count in record.cells or []:
+            rows[path_idx][dev_idx] = count
+        return cls(
+            repository=record.repository,
+            paths=paths,
+            developer_ids=list(record.developer_ids or []),
+            rows=rows,
+        )
+
+    def to_cells(self) -> list[list[int]]:
+        """Serialize non-zero cells as [path_index, developer_index, count]."""
+        return [
+            [path_idx, dev_idx, count]
+            for path_idx, row in enumerate(self.rows)
+            for dev_idx, count in row.items()
+            if count
+        ]
+
+    def add_commit(self, developer_id: str, paths: Iterable[str]) -> None:
+        """Fold one commit's file list into the matrix."""
+        dev_idx = self._dev_index.get(developer_id)
+        if dev_idx is None:
+            dev_idx = len(self.developer_ids)
+            self.developer_ids.append(developer_id)
+            self._dev_index[developer_id] = dev_idx
+
+        for path in set(paths):
+            if not path:
+                continue
+            path_idx = self._path_index.get(path)
+            if path_idx is None:
+                path_idx = len(self.paths)
+                self.paths.append(path)
+                self._path_index[path] = path_idx
+                self.rows.append({})
+            row = self.rows[path_idx]
+            row[dev_idx] = row.get(dev_idx, 0) + 1
+
+    def _columns(self, developer_ids: Iterable[str] | None) -> set[int] | None:
+        """Column indices for a developer subset (None means all columns)."""
+        if developer_ids is None:
+            return None
+        return {self._dev_index[d] for d in developer_ids if d in self._dev_index}
+
+    def _reduced_rows(
+        self,
+        level: OwnershipLevel = "file",
+        depth: int = 1,
+        developer_ids: Iterable[str] | None = None,
+    ) -> dict[str, dict[int, int]]:
+        """Project rows onto a developer subset and roll them up to `level`."""
+        columns = self._columns(developer_ids)
+        reduced: dict[str, dict[int, int]] = {}
+        for path, row in zip(self.paths, self.rows):
+            label = path if level == "file" else directory_of(path, depth)
+            target = reduced.setdefault(label, {})
+            for dev_idx, count in row.items():
+                if columns is not None and dev_idx not in columns:
+                    continue
+                target[dev_idx] = target.get(dev_idx, 0) + count
+        return {label: row for label, row in reduced.items() if row}
+
+    def bus_factors(
+        self,
+        level: OwnershipLevel = "file",
+        depth: int = 1,
+        developer_ids: Iterable[str] | None = None,
+        threshold: float = 0.8,
+    ) -> dict[str, dict]:
+        """Bus factor per path (or directory).
+
+        Bus factor = minimum developers covering `threshold` of touches.
+        """
+        results: dict[str, dict] = {}
+        for label, row in self._reduced_rows(level, depth, developer_ids).items():
+            total = sum(row.values())
+            cumulative = 0
+            bus_factor = 0
+            owners = []
+            for dev_idx, count in sorted(row.items(), key=lambda x: x[1], reverse=True):
+                cumulative += count
+                bus_factor += 1
+                owners.append({
+                    "developer_id": self.developer_ids[dev_idx],
+                    "touches": count,
+                    "share": round(count / total, 3),
+                })
+                if cumulative / total >= threshold:
+                    break
+            results[label] = {
+                "bus_factor": bus_factor,
+                "total_touches": total,
+                "contributors": len(row),
+                "top_owners": owners,
+            }
+        return results
+
+    def knowledge_silos(
+        self,
+        level: OwnershipLevel = "directory",
+        depth: int = 1,
+        developer_ids: Iterable[str] | None = None,
+        min_share: float = 0.8,
+        min_touches: int = 3,
+    ) -> list[dict]:
+        """Paths where a single developer holds at least `min_share` of touches."""
+        silos = []
+        for label, row in self._reduced_rows(level, depth, developer_ids).items():
+            total = sum(row.values())
+            if total < min_touches:
+                continue
+            dev_idx, count = max(row.items(), key=lambda x: x[1])
+            share = count / total
+            if share >= min_share:
+                silos.append({
+                    "path": label,
+                    "owner_id": self.developer_ids[dev_idx],
+                    "share": round(share, 3),
+                    "total_touches": total,
+                })
+        silos.sort(key=lambda s: (s["share"], s["total_touches"]), reverse=True)
+        return silos
+
+    def rotation_exposure(
+        self,
+        rotating_developer_ids: Iterable[str],
+        team_developer_ids: Iterable[str] | None = None,
+        level: OwnershipLevel = "directory",
+        depth: int = 1,
+        at_risk_share: float = 0.5,
+    ) -> dict:
+        """Knowledge lost when `rotating_developer_ids` leave the team.
+
+        A path is orphaned when only rotating developers have touched it and
+        at risk when they hold at least `at_risk_share` of its touches.
+        """
+        rotating = self._columns(rotating_developer_ids) or set()
+        total_touches = 0
+        departing_touches = 0
+        orphaned: list[dict] = []
+        at_risk: list[dict] = []
+
+        for label, row in self._reduced_rows(level, depth, team_developer_ids).items():
+            total = sum(row.values())
+            departing = sum(c for d, c in row.items() if d in rotating)
+            total_touches += total
+            departing_touches += departing
+            if not departing:
+                continue
+            share = departing / total
+            entry = {"path": label, "departing_share": round(share, 3), "total_touches": total}
+            if departing == total:
+                orphaned.append(entry)
+            elif share >= at_risk_share:
+                at_risk.append(entry)
+
+        orphaned.sort(key=lambda e: e["total_touches"], reverse=True)
+        at_risk.sort(key=lambda e: (e["departing_share"], e["total_touches"]), reverse=True)
+        return {
+            "knowledge_loss_pct": (
+                round(departing_touches / total_touches * 100, 1) if total_touches else 0
+            ),
+            "orphaned_paths": orphaned,
+            "at_risk_paths": at_risk,
+        }
+
+
+class CodeOwnershipService:
+    """Persists and queries repository ownership matrices."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _lock_record(self, repository: str) -> RepositoryOwnershipMatrix:
+        """Return the repository's matrix row, locked for update.
+
+        The row is created with INSERT ... ON CONFLICT DO NOTHING so
+        concurrent writers for a new repository don't race on the unique
+        repository key.
+        """
+        await self.db.execute(
+            pg_insert(RepositoryOwnershipMatrix)
+            .values(
+                id=str(uuid4()),
+                repository=repository,
+                paths=[],
+                developer_ids=[],
+                cells=[],
+                commits_applied=0,
+            )
+            .on_conflict_do_nothing(index_elements=["repository"])
+        )
+        stmt = (
+            select(RepositoryOwnershipMatrix)
+            .where(RepositoryOwnershipMatrix.repository == repository)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    @staticmethod
+    def _apply(
+        record: RepositoryOwnershipMatrix,
+        commits: list[tuple[str, list[str]]],
+    ) -> None:
+        matrix = OwnershipMatrix.from_record(record)
+        for dev_id, paths in commits:
+            matrix.add_commit(dev_id, paths)
+
+        # Reassign (not mutate) so the JSONB columns are flagged dirty
+        record.paths = list(matrix.paths)
+        record.developer_ids = list(matrix.developer_ids)
+        record.cells = matrix.to_cells()
+        record.commits_applied = (record.commits_applied or 0) + len(commits)
+
+    async def record_commits(
+        self,
+        repository: str,
+        commits: list[tuple[str | None, list[str]]],
+    ) -> None:
+        """Fold newly ingested commits into the repository's matrix.
+
+        Callers pass every commit of a push or sync page at once, so the
+        matrix row is locked and rewritten once per batch rather than once
+        per commit. The update joins the caller's transaction.
+
+        Args:
+            repository: Repository full name (owner/repo).
+            commits: (developer_id, file paths) per new commit. Commits without
+                a developer or without files are ignored.
+        """
+        commits = [(dev_id, paths) for dev_id, paths in commits if dev_id and paths]
+        if not commits:
+            return
+
+        record = await self._lock_record(repository)
+        self._apply(record, commits)
+        await self.db.flush()
+
+    async def needs_backfill(self, repository: str) -> bool:
+        """Whether commits ingested before ownership tracking are still missing."""
+        result = await self.db.execute(
+            select(RepositoryOwnershipMatrix.backfilled_at).where(
+                RepositoryOwnershipMatrix.repository == repository
+            )
+        )
+        row = result.first()
+        return row is None or row[0] is None
+
+    async def backfill(
+        self,
+        repository: str,
+        fetch_paths: Callable[[str], Awaitable[list[str]]],
+        batch_size: int = BACKFILL_BATCH_SIZE,
+        max_commits: int = BACKFILL_MAX_COMMITS,
+    ) -> int:
+        """Fold commits ingested before ownership tracking into the matrix.
+
+        The commits table doesn't keep file lists, so `fetch_paths` is called
+        for each commit SHA (typically a GitHub commit details request).
+        Commits stored before the matrix row was created were never recorded
+        incrementally; later ones already were and are left alone.
+
+        History is walked in commit id order and each batch is committed
+        with the id of its last commit as a cursor, so a failed fetch only
+        loses the current batch. At most `max_commits` are fetched per call;
+        later calls resume from the cursor until the history is exhausted.
+
+        Returns:
+            Number of commits folded in by this call.
+        """
+        record = await self._lock_record(repository)
+        cutoff, cursor, done = record.created_at, record.backfill_cursor, record.backfilled_at
+        await self.db.commit()  # Don't hold the row lock while fetching
+        if done is not None:
+            return 0
+
+        folded = 0
+        fetched = 0
+        while fetched < max_commits:
+            limit = min(batch_size, max_commits - fetched)
+            stmt = (
+                select(Commit.id, Commit.sha, Commit.developer_id)
+                .where(
+                    Commit.repository == repository,
+                    Commit.developer_id.is_not(None),
+                    Commit.created_at < cutoff,
+                )
+                .order_by(Commit.id)
+                .limit(limit)
+            )
+            if cursor is not None:
+                stmt = stmt.where(Commit.id > cursor)
+            batch = (await self.db.execute(stmt)).all()
+
+            file_lists = await asyncio.gather(*(fetch_paths(sha) for _, sha, _ in batch))
+            commits = [
+                (dev_id, paths) for (_, _, dev_id), paths in zip(batch, file_lists) if paths
+            ]
+
+            record = await self._lock_record(repository)
+            if record.backfill_cursor != cursor or record.backfilled_at is not None:
+                await self.db.commit()
+                break  # Another backfill moved past this batch
+            if commits:
+                self._apply(record, commits)
+            if batch:
+                cursor = record.backfill_cursor = batch[-1][0]
+            if len(batch) < limit:
+                record.backfilled_at = datetime.now(timezone.utc)
+            await self.db.commit()
+
+            folded += len(commits)
+            fetched += len(batch)
+            if record.backfilled_at is not None:
+                break
+
+        logger.info(f"Backfilled ownership for {repository} from {folded} commits")
+        return folded
+
+    async def get_matrix(self, repository: str) -> OwnershipMatrix | None:
+        """Load a single repository's matrix."""
+        stmt = select(RepositoryOwnershipMatrix).where(
+            RepositoryOwnershipMatrix.repository == repository
+        )
+        result = await self.db.execute(stmt)
+        record = result.scalar_one_or_none()
+        return OwnershipMatrix.from_record(record) if record else None
+
+    async def get_matrices_for_developers(
+        self,
+        developer_ids: list[str],
+    ) -> list[OwnershipMatrix]:
+        """Load every matrix with at least one of the given developers."""
+        if not developer_ids:
+            return []
+        stmt = select(RepositoryOwnershipMatrix).where(
+            RepositoryOwnershipMatrix.developer_ids.has_any(array(developer_ids))
+        )
+        result = await self.db.execute(stmt)
+        return [OwnershipMatrix.from_record(r) for r in result.scalars().all()]
@@ -13,13 +13,15 @@ Builds a collaboration graph to identify:
 
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Literal
+from uuid import uuid4
 
 from sqlalchemy import select, func, and_, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from aexy.models.activity import CodeReview, PullRequest
+from aexy.models.collaboration import CollaborationEdgeBucket
 from aexy.models.developer import Developer
 
 logger = logging.getLogger(__name__)
@@ -102,12 +104,123 @@ class TeamCohesion:
         }
 
 
+# Half-life in days for read-time decay of edge interaction weight
+EDGE_HALF_LIFE_DAYS = 90
+
+
+def week_bucket(ts: datetime) -> date:
+    """Return the Monday of the week containing `ts` (edge bucket key)."""
+    return (ts - timedelta(days=ts.weekday())).date()
+
+
+def decay_factor(bucket_start: date, now: datetime | None = None) -> float:
+    """Exponential decay weight for a bucket based on its age."""
+    now = now or datetime.now(timezone.utc)
+    age_days = max(0, (now.date() - bucket_start).days)
+    return 0.5 ** (age_days / EDGE_HALF_LIFE_DAYS)
+
+
+@dataclass
+class _EdgeTotals:
+    """Aggregated buckets for one directed reviewer -> author edge."""
+    reviews: int = 0
+    weight: float = 0.0
+    last_interaction: datetime | None = None
+
+
 class CollaborationNetworkAnalyzer:
-    """Analyzes collaboration patterns between developers."""
+    """Analyzes collaboration patterns between developers.
+
+    Reads from the precomputed `collaboration_edge_buckets` table, which is
+    maintained by `record_review_interactions` as reviews are ingested.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def record_review_interactions(
+        self,
+        interactions: list[tuple[str | None, str | None, datetime | None]],
+    ) -> None:
+        """Increment edge buckets for newly ingested reviews.
+
+        Args:
+            interactions: (reviewer_id, author_id, submitted_at) per new review.
+                Self-reviews and rows missing either side are ignored.
+        """
+        counts: dict[tuple[str, str, date], _EdgeTotals] = {}
+        for reviewer_id, author_id, submitted_at in interactions:
+            if not reviewer_id or not author_id or not submitted_at or reviewer_id == author_id:
+                continue
+            totals = counts.setdefault(
+                (reviewer_id, author_id, week_bucket(submitted_at)), _EdgeTotals()
+            )
+            totals.reviews += 1
+            if totals.last_interaction is None or submitted_at > totals.last_interaction:
+                totals.last_interaction = submitted_at
+
+        if not counts:
+            return
+
+        stmt = pg_insert(CollaborationEdgeBucket).values([
+            {
+                "id": str(uuid4()),
+                "reviewer_id": reviewer_id,
+                "author_id": author_id,
+                "bucket_start": bucket_start,
+                "review_count": totals.reviews,
+                "last_interaction_at": totals.last_interaction,
+            }
+            for (reviewer_id, author_id, bucket_start), totals in counts.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_collaboration_edge_bucket",
+            set_={
+                "review_count": CollaborationEdgeBucket.review_count + stmt.excluded.review_count,
+                "last_interaction_at": func.greatest(
+                    CollaborationEdgeBucket.last_interaction_at,
+                    stmt.excluded.last_interaction_at,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def _load_edges(
+        self,
+        condition,
+        days: int,
+    ) -> dict[tuple[str, str], _EdgeTotals]:
+        """Aggregate edge buckets within the window, keyed by (reviewer, author)."""
+        now = datetime.now(timezone.utc)
+        stmt = select(
+            CollaborationEdgeBucket.reviewer_id,
+            CollaborationEdgeBucket.author_id,
+            CollaborationEdgeBucket.bucket_start,
+            CollaborationEdgeBucket.review_count,
+            CollaborationEdgeBucket.last_interaction_at,
+        ).where(
+            condition,
+            CollaborationEdgeBucket.bucket_start >= week_bucket(now - timedelta(days=days)),
+        )
+        result = await self.db.execute(stmt)
+
+        edges: dict[tuple[str, str], _EdgeTotals] = {}
+        for reviewer_id, author_id, bucket_start, count, last in result.all():
+            totals = edges.setdefault((reviewer_id, author_id), _EdgeTotals())
+            totals.reviews += count
+            totals.weight += count * decay_factor(bucket_start, now)
+            if last and (totals.last_interaction is None or last > totals.last_interaction):
+                totals.last_interaction = last
+        return edges
+
+    async def _get_developers(self, developer_ids) -> dict[str, Developer]:
+        ids = list(developer_ids)
+        if not ids:
+            return {}
+        result = await self.db.execute(select(Developer).where(Developer.id.in_(ids)))
+        return {d.id: d for d in result.scalars().all()}
+
     async def build_collaboration_graph(
         self,
         developer_ids: list[str],
@@ -122,87 +235,48 @@ class CollaborationNetworkAnalyzer:
         Returns:
             List of collaboration edges.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        # Get all code reviews where reviewer is in our set
-        # and the PR author is also in our set
-        review_stmt = (
-            select(CodeReview)
-            .where(
-                CodeReview.developer_id.in_(developer_ids),
-                CodeReview.submitted_at >= cutoff,
-            )
-        )
-        review_result = await self.db.execute(review_stmt)
-        reviews = review_result.scalars().all()
-
-        # Get PRs to find authors
-        pr_github_ids = list(set(r.pull_request_github_id for r in reviews))
-        pr_stmt = (
-            select(PullRequest)
-            .where(PullRequest.github_id.in_(pr_github_ids))
+        directed = await self._load_edges(
+            and_(
+                CollaborationEdgeBucket.reviewer_id.in_(developer_ids),
+                CollaborationEdgeBucket.author_id.in_(developer_ids),
+            ),
+            days,
         )
-        pr_result = await self.db.execute(pr_stmt)
-        prs = {pr.github_id: pr for pr in pr_result.scalars().all()}
-
-        # Get developer names
-        dev_stmt = select(Developer).where(Developer.id.in_(developer_ids))
-        dev_result = await self.db.execute(dev_stmt)
-        developers = {d.id: d for d in dev_result.scalars().all()}
+        return await self._to_undirected_edges(directed, developer_ids)
 
-        # Build edge map
-        edge_map: dict[tuple[str, str], dict] = {}
-
-        for review in reviews:
-            pr = prs.get(review.pull_request_github_id)
-            if not pr or pr.developer_id not in developer_ids:
-                continue
-
-            reviewer_id = review.developer_id
-            author_id = pr.developer_id
-
-            # Skip self-reviews
-            if reviewer_id == author_id:
-                continue
-
-            # Normalize edge key (smaller ID first)
+    async def _to_undirected_edges(
+        self,
+        directed: dict[tuple[str, str], _EdgeTotals],
+        developer_ids: list[str],
+    ) -> list[CollaborationEdge]:
+        """Merge directed edges into undirected CollaborationEdge objects."""
+        # Normalize edge key (smaller ID first)
+        edge_map: dict[tuple[str, str], _EdgeTotals] = {}
+        for (reviewer_id, author_id), totals in directed.items():
             key = tuple(sorted([reviewer_id, author_id]))
+            merged = edge_map.setdefault(key, _EdgeTotals())
+            merged.reviews += totals.reviews
+            merged.weight += totals.weight
+            if totals.last_interaction and (
+                merged.last_interaction is None or totals.last_interaction > merged.last_interaction
+            ):
+                merged.last_interaction = totals.last_interaction
 
-            if key not in edge_map:
-                edge_map[key] = {
-                    "review_count": 0,
-                    "co_author_count": 0,
-                    "last_interaction": None,
-                    "types": set(),
-                }
+        developers = await self._get_developers(developer_ids)
 
-            edge_map[key]["review_count"] += 1
-            edge_map[key]["types"].add("reviewed")
-            if edge_map[key]["last_interaction"] is None or review.submitted_at > edge_map[key]["last_interaction"]:
-                edge_map[key]["last_interaction"] = review.submitted_at
-
-        # Convert to CollaborationEdge objects
         edges = []
-        for (dev_a, dev_b), data in edge_map.items():
-            interaction_count = data["review_count"] + data["co_author_count"]
-            strength = self._calculate_strength(
-                interaction_count,
-                data["review_count"],
-                data["co_author_count"],
-                data["last_interaction"],
-            )
-
+        for (dev_a, dev_b), totals in edge_map.items():
             edges.append(CollaborationEdge(
                 developer_a_id=dev_a,
                 developer_b_id=dev_b,
-                developer_a_name=developers.get(dev_a, {}).name if dev_a in developers else None,
-                developer_b_name=developers.get(dev_b, {}).name if dev_b in developers else None,
-                interaction_count=interaction_count,
-                review_count=data["review_count"],
-                co_author_count=data["co_author_count"],
-                strength_score=strength,
-                interaction_types=list(data["types"]),
-                last_interaction_at=data["last_interaction"],
+                developer_a_name=developers[dev_a].name if dev_a in developers else None,
+                developer_b_name=developers[dev_b].name if dev_b in developers else None,
+                interaction_count=totals.reviews,
+                review_count=totals.reviews,
+                co_author_count=0,
+                strength_score=self._calculate_strength(totals.weight, 0),
+                interaction_types=["reviewed"],
+                last_interaction_at=totals.last_interaction,
             ))
 
         # Sort by strength
@@ -212,26 +286,23 @@ class CollaborationNetworkAnalyzer:
 
     def _calculate_strength(
         self,
-        total_interactions: int,
-        reviews: int,
+        decayed_interactions: float,
         co_authors: int,
-        last_interaction: datetime | None,
     ) -> float:
-        """Calculate collaboration strength score (0-1)."""
+        """Calculate collaboration strength score (0-1).
+
+        `decayed_interactions` is the interaction count with each week's
+        contribution halved every EDGE_HALF_LIFE_DAYS, so recency is
+        already accounted for.
+        """
         # Base score from interaction count (log scale)
         import math
-        base_score = min(1.0, math.log10(total_interactions + 1) / 2)
+        base_score = min(1.0, math.log10(decayed_interactions + 1) / 2)
 
         # Boost for co-authorship (stronger signal)
         co_author_boost = min(0.2, co_authors * 0.05)
 
-        # Recency factor
-        recency = 1.0
-        if last_interaction:
-            days_ago = (datetime.now(timezone.utc) - last_interaction).days
-            recency = max(0.5, 1.0 - (days_ago / 365))
-
-        return min(1.0, (base_score + co_author_boost) * recency)
+        return min(1.0, base_score + co_author_boost)
 
     async def get_developer_collaborators(
         self,
@@ -249,80 +320,43 @@ class CollaborationNetworkAnalyzer:
         Returns:
             CollaboratorProfile with top collaborators.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        # Get developer info
-        dev_stmt = select(Developer).where(Developer.id == developer_id)
-        dev_result = await self.db.execute(dev_stmt)
-        developer = dev_result.scalar_one_or_none()
-
-        # Get reviews this developer made
-        reviews_given_stmt = (
-            select(CodeReview)
-            .where(
-                CodeReview.developer_id == developer_id,
-                CodeReview.submitted_at >= cutoff,
-            )
+        directed = await self._load_edges(
+            or_(
+                CollaborationEdgeBucket.reviewer_id == developer_id,
+                CollaborationEdgeBucket.author_id == developer_id,
+            ),
+            days,
         )
-        reviews_given_result = await self.db.execute(reviews_given_stmt)
-        reviews_given = reviews_given_result.scalars().all()
-
-        # Get PRs this developer authored that were reviewed
-        prs_authored_stmt = (
-            select(PullRequest)
-            .where(
-                PullRequest.developer_id == developer_id,
-                PullRequest.created_at_github >= cutoff,
+        counts = self._collaborator_counts(directed).get(developer_id, {})
+        developers = await self._get_developers([developer_id, *counts])
+        return self._build_profile(developer_id, counts, developers, limit)
+
+    @staticmethod
+    def _collaborator_counts(
+        directed: dict[tuple[str, str], _EdgeTotals],
+    ) -> dict[str, dict[str, dict[str, int]]]:
+        """Per developer: collaborator -> {"reviews_given", "reviews_received"}."""
+        counts: dict[str, dict[str, dict[str, int]]] = {}
+        for (reviewer_id, author_id), totals in directed.items():
+            given = counts.setdefault(reviewer_id, {}).setdefault(
+                author_id, {"reviews_given": 0, "reviews_received": 0}
             )
-        )
-        prs_authored_result = await self.db.execute(prs_authored_stmt)
-        prs_authored = prs_authored_result.scalars().all()
-
-        # Get reviews on this developer's PRs
-        pr_github_ids = [pr.github_id for pr in prs_authored]
-        reviews_received_stmt = (
-            select(CodeReview)
-            .where(
-                CodeReview.pull_request_github_id.in_(pr_github_ids),
-                CodeReview.developer_id != developer_id,
+            given["reviews_given"] += totals.reviews
+            received = counts.setdefault(author_id, {}).setdefault(
+                reviewer_id, {"reviews_given": 0, "reviews_received": 0}
             )
-        )
-        reviews_received_result = await self.db.execute(reviews_received_stmt)
-        reviews_received = reviews_received_result.scalars().all()
-
-        # Build collaborator map
-        collaborator_counts: dict[str, dict] = {}
-
-        # From reviews given
-        pr_ids = [r.pull_request_github_id for r in reviews_given]
-        if pr_ids:
-            pr_stmt = select(PullRequest).where(PullRequest.github_id.in_(pr_ids))
-            pr_result = await self.db.execute(pr_stmt)
-            pr_map = {pr.github_id: pr for pr in pr_result.scalars().all()}
-
-            for review in reviews_given:
-                pr = pr_map.get(review.pull_request_github_id)
-                if pr and pr.developer_id != developer_id:
-                    author_id = pr.developer_id
-                    if author_id not in collaborator_counts:
-                        collaborator_counts[author_id] = {"reviews_given": 0, "reviews_received": 0}
-                    collaborator_counts[author_id]["reviews_given"] += 1
-
-        # From reviews received
-        for review in reviews_received:
-            reviewer_id = review.developer_id
-            if reviewer_id not in collaborator_counts:
-                collaborator_counts[reviewer_id] = {"reviews_given": 0, "reviews_received": 0}
-            collaborator_counts[reviewer_id]["reviews_received"] += 1
-
-        # Get collaborator names
-        collab_ids = list(collaborator_counts.keys())
-        if collab_ids:
-            collab_dev_stmt = select(Developer).where(Developer.id.in_(collab_ids))
-            collab_dev_result = await self.db.execute(collab_dev_stmt)
-            collab_devs = {d.id: d for d in collab_dev_result.scalars().all()}
-        else:
-            collab_devs = {}
+            received["reviews_received"] += totals.reviews
+        return counts
+
+    def _build_profile(
+        self,
+        developer_id: str,
+        collaborator_counts: dict[str, dict[str, int]],
+        developers: dict[str, Developer],
+        limit: int,
+    ) -> CollaboratorProfile:
+        """Build a CollaboratorProfile from per-collaborator review counts."""
+        developer = developers.get(developer_id)
 
         # Build top collaborators list
         top_collaborators = []
@@ -330,7 +364,7 @@ class CollaborationNetworkAnalyzer:
             collaborator_counts.items(),
             key=lambda x: -(x[1]["reviews_given"] + x[1]["reviews_received"]),
         )[:limit]:
-            collab_dev = collab_devs.get(collab_id)
+            collab_dev = developers.get(collab_id)
             total = counts["reviews_given"] + counts["reviews_received"]
             top_collaborators.append({
                 "developer_id": collab_id,
@@ -343,33 +377,30 @@ class CollaborationNetworkAnalyzer:
 
         # Calculate collaboration diversity
         total_collaborators = len(collaborator_counts)
-        if total_collaborators == 0:
+        interaction_counts = [
+            c["reviews_given"] + c["reviews_received"]
+            for c in collaborator_counts.values()
+        ]
+        total_interactions = sum(interaction_counts)
+        if total_collaborators == 0 or total_interactions == 0:
             diversity = 0.0
         else:
             # Higher diversity = interactions spread across many people
-            interaction_counts = [
-                c["reviews_given"] + c["reviews_received"]
-                for c in collaborator_counts.values()
-            ]
-            total_interactions = sum(interaction_counts)
-            if total_interactions > 0:
-                # Entropy-based diversity
-                import math
-                entropy = 0
-                for count in interaction_counts:
-                    if count > 0:
-                        p = count / total_interactions
-                        entropy -= p * math.log2(p)
-                max_entropy = math.log2(total_collaborators) if total_collaborators > 1 else 1
-                diversity = entropy / max_entropy if max_entropy > 0 else 0
-            else:
-                diversity = 0.0
+            # Entropy-based diversity
+            import math
+            entropy = 0
+            for count in interaction_counts:
+                if count > 0:
+                    p = count / total_interactions
+                    entropy -= p * math.log2(p)
+            max_entropy = math.log2(total_collaborators) if total_collaborators > 1 else 1
+            diversity = entropy / max_entropy if max_entropy > 0 else 0
 
         # Detect knowledge silo indicators
         silo_indicators = []
         is_silo = False
 
-        if total_collaborators <= 2 and len(reviews_given) + len(reviews_received) > 10:
+        if total_collaborators <= 2 and total_interactions > 10:
             is_silo = True
             silo_indicators.append("Limited collaborator diversity despite high activity")
 
@@ -404,7 +435,20 @@ class CollaborationNetworkAnalyzer:
         Returns:
             TeamCohesion metrics.
         """
-        edges = await self.build_collaboration_graph(developer_ids, days)
+        # One read covers both the in-team graph and each member's
+        # collaborators outside the team (for silo detection)
+        directed = await self._load_edges(
+            or_(
+                CollaborationEdgeBucket.reviewer_id.in_(developer_ids),
+                CollaborationEdgeBucket.author_id.in_(developer_ids),
+            ),
+            days,
+        )
+        team = set(developer_ids)
+        edges = await self._to_undirected_edges(
+            {k: v for k, v in directed.items() if k[0] in team and k[1] in team},
+            developer_ids,
+        )
 
         team_size = len(developer_ids)
         total_edges = len(edges)
@@ -433,9 +477,15 @@ class CollaborationNetworkAnalyzer:
                    for dev_id, count in sorted_by_collab[:3] if count > 0]
 
         # Identify knowledge silos
+        per_developer = self._collaborator_counts(directed)
+        involved = set(developer_ids)
+        for dev_id in developer_ids:
+            involved.update(per_developer.get(dev_id, {}))
+        developers = await self._get_developers(involved)
+
         knowledge_silos = []
         for dev_id in developer_ids:
-            profile = await self.get_developer_collaborators(dev_id, days, limit=5)
+            profile = self._build_profile(dev_id, per_developer.get(dev_id, {}), developers, limit=5)
             if profile.is_knowledge_silo:
                 knowledge_silos.append({
                     "developer_id": dev_id,
@@ -1,28 +1,40 @@
 """Contact Enrichment Service for AI-powered contact extraction and classification."""
 
+import asyncio
 import json
 import logging
 import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache.company_domain_cache import CompanyDomainCache, get_company_domain_cache
+from aexy.core.config import get_settings
 from aexy.llm.gateway import get_llm_gateway
 from aexy.models.crm import (
     CRMObject,
     CRMObjectType,
     CRMRecord,
+    CRMRecordRelation,
     CRMActivity,
     CRMActivityType,
 )
-from aexy.models.google_integration import SyncedEmail
+from aexy.models.google_integration import SyncedEmail, SyncedEmailRecordLink
 
 logger = logging.getLogger(__name__)
 
+# Mailbox providers whose domains never identify a company
+FREE_EMAIL_DOMAINS = frozenset({
+    "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com", "aol.com", "protonmail.com",
+})
+
 
 # Prompt templates for AI extraction
 SIGNATURE_EXTRACTION_SYSTEM_PROMPT = """You are a data extraction expert. Your task is to extract contact information from email signatures.
@@ -661,6 +673,9 @@ class ContactEnrichmentService:
     ) -> dict[str, Any]:
         """Process new emails to extract and enrich contacts.
 
+        Senders are enriched as one batch: signatures are extracted once per
+        sender and companies are resolved once per domain.
+
         Args:
             workspace_id: The workspace ID
             email_ids: Optional list of specific email IDs to process
@@ -670,14 +685,6 @@ class ContactEnrichmentService:
         Returns:
             Processing statistics
         """
-        stats = {
-            "emails_processed": 0,
-            "contacts_created": 0,
-            "contacts_enriched": 0,
-            "companies_created": 0,
-            "errors": 0,
-        }
-
         # Get emails to process
         query = select(SyncedEmail).where(
             SyncedEmail.workspace_id == workspace_id
@@ -693,75 +700,78 @@ class ContactEnrichmentService:
         result = await self.db.execute(query)
         emails = result.scalars().all()
 
+        # Signatures are read from the body, which Gmail sync fetches lazily
+        await self._fetch_missing_bodies(emails)
+
+        queue = ContactEnrichmentQueue(
+            self.db,
+            workspace_id,
+            batch_size=max(len(emails), 1),
+            extract_signatures=True,
+            create_records=auto_create_contacts,
+            create_objects=True,
+            service=self,
+        )
         for email in emails:
-            try:
-                stats["emails_processed"] += 1
-
-                # Extract signature info
-                signature_info = {}
-                if email.body_text:
-                    signature_info = await self.extract_signature_info(email.body_text)
-                    email.signature_data = signature_info
-
-                # Process sender
-                if email.from_email and auto_create_contacts:
-                    try:
-                        # Get domain for company
-                        domain = email.from_email.split("@")[-1] if "@" in email.from_email else None
-
-                        # Create/find person
-                        person = await self.find_or_create_person(
-                            workspace_id,
-                            email.from_email,
-                            name=email.from_name,
-                            source="email_sync",
-                            additional_values=signature_info.get("contact_info", {}),
-                        )
-
-                        # Track if new
-                        if person.created_at >= datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0):
-                            stats["contacts_created"] += 1
-
-                        # Create company if business domain
-                        if domain and domain not in {"gmail.com", "yahoo.com", "hotmail.com", "outlook.com"}:
-                            try:
-                                company_name = signature_info.get("contact_info", {}).get("company")
-                                company = await self.find_or_create_company(
-                                    workspace_id,
-                                    domain,
-                                    name=company_name,
-                                )
-                                if company.created_at >= datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0):
-                                    stats["companies_created"] += 1
-                            except ContactEnrichmentError:
-                                pass
-
-                    except Exception as e:
-                        logger.error(f"Error creating contact from email {email.id}: {e}")
-                        stats["errors"] += 1
-
-                # Store extracted contacts
-                extracted = []
-                if email.from_email:
-                    extracted.append({
-                        "email": email.from_email,
-                        "name": email.from_name,
-                        "type": "from",
-                    })
-                for to in email.to_emails or []:
-                    extracted.append({
-                        "email": to.get("email"),
-                        "name": to.get("name"),
-                        "type": "to",
-                    })
-                email.extracted_contacts = extracted
+            queue.enqueue(email)
 
-            except Exception as e:
-                logger.error(f"Error processing email {email.id}: {e}")
-                stats["errors"] += 1
+        try:
+            batch = await queue.flush()
+        except Exception as e:
+            logger.error(f"Error enriching contacts for workspace {workspace_id}: {e}")
+            batch = EnrichmentBatchResult(emails_processed=len(emails), errors=len(emails))
+
+        for email in emails:
+            signature_info = batch.signatures.get((email.from_email or "").lower())
+            if email.body_text and signature_info:
+                email.signature_data = signature_info
+
+            # Store extracted contacts
+            extracted = []
+            if email.from_email:
+                extracted.append({
+                    "email": email.from_email,
+                    "name": email.from_name,
+                    "type": "from",
+                })
+            for to in email.to_emails or []:
+                extracted.append({
+                    "email": to.get("email"),
+                    "name": to.get("name"),
+                    "type": "to",
+                })
+            email.extracted_contacts = extracted
 
         await self.db.flush()
-        return stats
+        return {
+            "emails_processed": len(emails),
+            "contacts_created": batch.contacts_created,
+            "contacts_enriched": 0,
+            "companies_created": batch.companies_created,
+            "errors": batch.errors,
+        }
+
+    async def _fetch_missing_bodies(self, emails: list[SyncedEmail]) -> None:
+        """Fetch bodies for emails that were synced as metadata only."""
+        from aexy.models.google_integration import GoogleIntegration
+        from aexy.services.gmail_sync_service import GmailSyncError, GmailSyncService
+
+        by_integration: dict[str, list[SyncedEmail]] = defaultdict(list)
+        for email in emails:
+            if email.body_fetched_at is None:
+                by_integration[email.integration_id].append(email)
+        if not by_integration:
+            return
+
+        result = await self.db.execute(
+            select(GoogleIntegration).where(GoogleIntegration.id.in_(list(by_integration)))
+        )
+        gmail = GmailSyncService(self.db)
+        for integration in result.scalars().all():
+            try:
+                await gmail.fetch_bodies(integration, by_integration[integration.id])
+            except GmailSyncError as e:
+                logger.warning(f"Failed to fetch email bodies for integration {integration.id}: {e}")
 
     async def _get_or_create_object(
         self,
@@ -819,3 +829,460 @@ class ContactEnrichmentService:
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             return {}
+
+
+def _email_domain(email: str) -> str | None:
+    """Return the lower-cased domain of an email address."""
+    return email.rsplit("@", 1)[1].lower() if "@" in email else None
+
+
+def _domain_to_company_name(domain: str) -> str:
+    """Simple company name from a domain (``acme-corp.io`` -> ``Acme-Corp``)."""
+    return domain.split(".")[0].title()
+
+
+@dataclass
+class _Sender:
+    """A unique sender in a batch and the emails they sent."""
+
+    email: str
+    name: str | None
+    emails: list[SyncedEmail] = field(default_factory=list)
+
+    def latest_body(self) -> str | None:
+        """Body of the most recent email that has one."""
+        with_body = [e for e in self.emails if e.body_text]
+        if not with_body:
+            return None
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        return max(with_body, key=lambda e: e.gmail_date or oldest).body_text
+
+
+@dataclass
+class EnrichmentBatchResult:
+    """Outcome of enriching one batch of synced emails."""
+
+    emails_processed: int = 0
+    unique_senders: int = 0
+    unique_domains: int = 0
+    contacts_created: int = 0
+    companies_created: int = 0
+    company_cache_hits: int = 0
+    provider_lookups: int = 0
+    errors: int = 0
+    # (email, person, company) for every email whose sender has a person record
+    enriched: list[tuple[SyncedEmail, CRMRecord, CRMRecord | None]] = field(default_factory=list)
+    # Lower-cased sender address -> signature extraction result
+    signatures: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def merge(self, other: "EnrichmentBatchResult") -> None:
+        """Add another result's counts and records to this one.
+
+        ``emails_processed`` is left alone; the caller sets it for the
+        whole batch.
+        """
+        self.unique_senders += other.unique_senders
+        self.unique_domains += other.unique_domains
+        self.contacts_created += other.contacts_created
+        self.companies_created += other.companies_created
+        self.company_cache_hits += other.company_cache_hits
+        self.provider_lookups += other.provider_lookups
+        self.errors += other.errors
+        self.enriched.extend(other.enriched)
+        self.signatures.update(other.signatures)
+
+
+class _RatePacer:
+    """Spaces out call starts so at most ``rate`` begin per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ContactEnrichmentQueue:
+    """Collects synced emails and enriches their senders in batches.
+
+    Enriching inline costs several queries per email, and a mailbox has far
+    fewer senders and domains than messages. A batch instead:
+
+    - dedupes emails by sender and senders by domain,
+    - resolves companies once per domain, through the domain cache first
+      and then one query for the misses,
+    - finds existing people with one query,
+    - runs provider lookups (signature extraction) once per sender,
+      concurrently under a concurrency limit and a start-rate limit,
+    - writes new companies, people, relations and email links with one flush.
+
+    Database access stays sequential on the shared session; only provider
+    lookups run concurrently.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        workspace_id: str,
+        *,
+        batch_size: int | None = None,
+        extract_signatures: bool = False,
+        create_records: bool = True,
+        create_objects: bool = False,
+        own_email: str | None = None,
+        max_concurrency: int | None = None,
+        rate_per_second: float | None = None,
+        cache: CompanyDomainCache | None = None,
+        service: ContactEnrichmentService | None = None,
+    ):
+        settings = get_settings()
+        self.db = db
+        self.workspace_id = workspace_id
+        self.batch_size = batch_size or settings.crm_enrichment_batch_size
+        self.extract_signatures = extract_signatures
+        self.create_records = create_records
+        self.create_objects = create_objects
+        self.own_email = own_email.lower() if own_email else None
+        self.max_concurrency = max_concurrency or settings.crm_enrichment_concurrency
+        self._pacer = _RatePacer(
+            settings.crm_enrichment_rate_per_second if rate_per_second is None else rate_per_second
+        )
+        self._cache = cache if cache is not None else get_company_domain_cache()
+        self._cache_ttl = settings.crm_company_cache_ttl_seconds
+        self._service = service or ContactEnrichmentService(db)
+        self._pending: list[SyncedEmail] = []
+
+    @property
+    def pending(self) -> list[SyncedEmail]:
+        """Emails waiting for the next flush."""
+        return list(self._pending)
+
+    def enqueue(self, synced_email: SyncedEmail) -> bool:
+        """Add an email to the next batch. Returns True once the batch is full."""
+        if synced_email.from_email:
+            self._pending.append(synced_email)
+        return len(self._pending) >= self.batch_size
+
+    async def flush(self) -> EnrichmentBatchResult:
+        """Enrich the senders of all queued emails.
+
+        Emails leave the queue only once their batch is written. If the
+        batch fails they stay queued, for a later flush or for
+        flush_per_sender.
+        """
+        batch = list(self._pending)
+        result = await self._enrich_in_savepoint(batch)
+        del self._pending[:len(batch)]
+        return result
+
+    async def flush_per_sender(self) -> EnrichmentBatchResult:
+        """Enrich the queued emails one sender at a time.
+
+        This is the fallback after a failed flush. A sender that still fails
+        is logged, counted in ``errors`` and dropped, and the other senders'
+        emails are still enriched.
+        """
+        batch, self._pending = self._pending, []
+        by_sender: dict[str, list[SyncedEmail]] = defaultdict(list)
+        for email in batch:
+            by_sender[email.from_email.lower()].append(email)
+
+        total = EnrichmentBatchResult(emails_processed=len(batch))
+        for key, emails in by_sender.items():
+            try:
+                part = await self._enrich_in_savepoint(emails)
+            except Exception as e:
+                logger.warning(f"Failed to enrich {len(emails)} emails from {key}: {e}")
+                total.errors += 1
+                continue
+            total.merge(part)
+        return total
+
+    async def _enrich_in_savepoint(self, batch: list[SyncedEmail]) -> EnrichmentBatchResult:
+        """Enrich a batch in a savepoint, so a failure rolls back only that batch.
+
+        Without it a failed flush would leave the whole session needing a
+        rollback, and the per-sender retries, deal creation and the sync's
+        own commit would all fail after it.
+        """
+        async with self.db.begin_nested():
+            return await self._enrich(batch)
+
+    async def _enrich(self, batch: list[SyncedEmail]) -> EnrichmentBatchResult:
+        result = EnrichmentBatchResult(emails_processed=len(batch))
+
+        senders: dict[str, _Sender] = {}
+        for email in batch:
+            key = email.from_email.lower()
+            if key == self.own_email:
+                continue
+            sender = senders.setdefault(key, _Sender(email.from_email, email.from_name))
+            sender.name = sender.name or email.from_name
+            sender.emails.append(email)
+        if not senders:
+            return result
+        result.unique_senders = len(senders)
+
+        if self.extract_signatures:
+            result.signatures = await self._lookup_signatures(senders, result)
+        if not self.create_records:
+            return result
+
+        person_obj, company_obj = await self.load_objects()
+        if not person_obj:
+            # No person object type configured, skip enrichment
+            return result
+
+        by_domain: dict[str, list[_Sender]] = defaultdict(list)
+        for key, sender in senders.items():
+            domain = _email_domain(key)
+            if domain and domain not in FREE_EMAIL_DOMAINS:
+                by_domain[domain].append(sender)
+        result.unique_domains = len(by_domain)
+
+        new_records: list[Any] = []
+        companies: dict[str, CRMRecord] = {}
+        if company_obj and by_domain:
+            companies = await self.resolve_companies(company_obj, list(by_domain), result)
+            for domain, domain_senders in by_domain.items():
+                if domain in companies:
+                    continue
+                company = self._new_company(company_obj, domain, domain_senders, result.signatures)
+                companies[domain] = company
+                new_records.append(company)
+            result.companies_created = len(new_records)
+
+        people = await self._find_people(person_obj, list(senders))
+        for key, sender in senders.items():
+            company = companies.get(_email_domain(key) or "")
+            person = people.get(key)
+            if person is None:
+                person = self._new_person(person_obj, sender, result.signatures.get(key))
+                new_records.append(person)
+                result.contacts_created += 1
+                if company:
+                    new_records.append(CRMRecordRelation(
+                        id=str(uuid4()),
+                        source_record_id=person.id,
+                        target_record_id=company.id,
+                        relation_type="works_at",
+                    ))
+            result.enriched.extend((email, person, company) for email in sender.emails)
+
+        linked = await self._existing_links(result.enriched)
+        for email, person, _ in result.enriched:
+            if (email.id, person.id) in linked:
+                continue
+            linked.add((email.id, person.id))
+            new_records.append(SyncedEmailRecordLink(
+                id=str(uuid4()),
+                email_id=email.id,
+                record_id=person.id,
+                link_type="from",
+                confidence=1.0,
+            ))
+
+        self.db.add_all(new_records)
+        await self.db.flush()
+
+        # Counts move only once the batch is written, so a retry can't double them
+        person_obj.record_count = (person_obj.record_count or 0) + result.contacts_created
+        if company_obj and result.companies_created:
+            company_obj.record_count = (company_obj.record_count or 0) + result.companies_created
+
+        if self._cache and companies:
+            await self._cache.set_many(
+                self.workspace_id,
+                {domain: company.id for domain, company in companies.items()},
+                ttl=self._cache_ttl,
+            )
+
+        logger.info(
+            f"Enriched {result.emails_processed} emails for workspace {self.workspace_id}: "
+            f"{result.unique_senders} senders, {result.unique_domains} domains "
+            f"({result.company_cache_hits} cached), {result.contacts_created} contacts and "
+            f"{result.companies_created} companies created, {result.provider_lookups} lookups"
+        )
+        return result
+
+    async def load_objects(self) -> tuple[CRMObject | None, CRMObject | None]:
+        """Load the workspace's person and company object types."""
+        if self.create_objects:
+            return (
+                await self._service._get_or_create_object(self.workspace_id, "person", CRMObjectType.PERSON),
+                await self._service._get_or_create_object(self.workspace_id, "company", CRMObjectType.COMPANY),
+            )
+        result = await self.db.execute(
+            select(CRMObject).where(
+                CRMObject.workspace_id == self.workspace_id,
+                CRMObject.slug.in_(["person", "company"]),
+            )
+        )
+        objects = {obj.slug: obj for obj in result.scalars().all()}
+        return objects.get("person"), objects.get("company")
+
+    async def resolve_companies(
+        self,
+        company_obj: CRMObject,
+        domains: list[str],
+        result: EnrichmentBatchResult | None = None,
+    ) -> dict[str, CRMRecord]:
+        """Find existing company records for lower-cased *domains*.
+
+        A company matches a domain when its ``domain`` value equals it or
+        its ``website`` contains it.
+        """
+        found: dict[str, CRMRecord] = {}
+
+        cached = await self._cache.get_many(self.workspace_id, domains) if self._cache else {}
+        if cached:
+            rows = await self.db.execute(
+                select(CRMRecord).where(
+                    CRMRecord.id.in_(set(cached.values())),
+                    CRMRecord.object_id == company_obj.id,
+                )
+            )
+            by_id = {record.id: record for record in rows.scalars().all()}
+            found = {domain: by_id[record_id] for domain, record_id in cached.items() if record_id in by_id}
+            if result is not None:
+                result.company_cache_hits = len(found)
+
+        misses = [domain for domain in domains if domain not in found]
+        if misses:
+            domain_value = func.lower(CRMRecord.values["domain"].astext)
+            website_value = func.lower(CRMRecord.values["website"].astext)
+            rows = await self.db.execute(
+                select(CRMRecord).where(
+                    CRMRecord.workspace_id == self.workspace_id,
+                    CRMRecord.object_id == company_obj.id,
+                    or_(domain_value.in_(misses), *(website_value.like(f"%{d}%") for d in misses)),
+                )
+            )
+            for record in rows.scalars().all():
+                record_domain = (record.values.get("domain") or "").lower()
+                record_website = (record.values.get("website") or "").lower()
+                for domain in misses:
+                    if domain not in found and (domain == record_domain or domain in record_website):
+                        found[domain] = record
+
+        return found
+
+    async def _find_people(self, person_obj: CRMObject, emails: list[str]) -> dict[str, CRMRecord]:
+        """Existing person records keyed by lower-cased email address."""
+        rows = await self.db.execute(
+            select(CRMRecord).where(
+                CRMRecord.workspace_id == self.workspace_id,
+                CRMRecord.object_id == person_obj.id,
+                func.lower(CRMRecord.values["email"].astext).in_(emails),
+            )
+        )
+        people: dict[str, CRMRecord] = {}
+        for record in rows.scalars().all():
+            people.setdefault(record.values["email"].lower(), record)
+        return people
+
+    async def _existing_links(
+        self, enriched: list[tuple[SyncedEmail, CRMRecord, CRMRecord | None]]
+    ) -> set[tuple[str, str]]:
+        """``(email_id, record_id)`` pairs that are already linked."""
+        if not enriched:
+            return set()
+        rows = await self.db.execute(
+            select(SyncedEmailRecordLink.email_id, SyncedEmailRecordLink.record_id).where(
+                SyncedEmailRecordLink.email_id.in_({email.id for email, _, _ in enriched}),
+                SyncedEmailRecordLink.record_id.in_({person.id for _, person, _ in enriched}),
+            )
+        )
+        return {(email_id, record_id) for email_id, record_id in rows.all()}
+
+    async def _lookup_signatures(
+        self, senders: dict[str, _Sender], result: EnrichmentBatchResult
+    ) -> dict[str, dict[str, Any]]:
+        """Extract each sender's signature from their latest email, concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def lookup(body: str) -> dict[str, Any]:
+            async with semaphore:
+                await self._pacer.wait()
+                return await self._service.extract_signature_info(body)
+
+        bodies = {key: body for key, sender in senders.items() if (body := sender.latest_body())}
+        result.provider_lookups = len(bodies)
+        outcomes = await asyncio.gather(*(lookup(body) for body in bodies.values()), return_exceptions=True)
+
+        signatures: dict[str, dict[str, Any]] = {}
+        for key, outcome in zip(bodies, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Signature lookup failed for {key}: {outcome}")
+                result.errors += 1
+            elif outcome.get("extracted"):
+                signatures[key] = outcome
+        return signatures
+
+    def _new_company(
+        self,
+        company_obj: CRMObject,
+        domain: str,
+        senders: list[_Sender],
+        signatures: dict[str, dict[str, Any]],
+    ) -> CRMRecord:
+        """Build a company record for a domain, named from a sender's signature if known."""
+        company_name = next(
+            (
+                signatures[sender.email.lower()]["contact_info"]["company"]
+                for sender in senders
+                if (signatures.get(sender.email.lower()) or {}).get("contact_info", {}).get("company")
+            ),
+            None,
+        ) or _domain_to_company_name(domain)
+        return CRMRecord(
+            id=str(uuid4()),
+            workspace_id=self.workspace_id,
+            object_id=company_obj.id,
+            display_name=company_name[:500],
+            values={
+                "name": company_name,
+                "domain": domain,
+                "website": f"https://{domain}",
+            },
+            source="email_sync",
+        )
+
+    def _new_person(
+        self,
+        person_obj: CRMObject,
+        sender: _Sender,
+        signature: dict[str, Any] | None,
+    ) -> CRMRecord:
+        """Build a person record for a sender."""
+        values: dict[str, Any] = {
+            key: value
+            for key, value in ((signature or {}).get("contact_info") or {}).items()
+            if value
+        }
+        values["email"] = sender.email
+        if sender.name:
+            name_parts = sender.name.strip().split(" ", 1)
+            values["name"] = sender.name
+            values["first_name"] = name_parts[0]
+            if len(name_parts) > 1:
+                values["last_name"] = name_parts[1]
+
+        display_name = sender.name or sender.email
+        return CRMRecord(
+            id=str(uuid4()),
+            workspace_id=self.workspace_id,
+            object_id=person_obj.id,
+            display_name=display_name[:500],
+            values=values,
+            source="email_sync",
+        )
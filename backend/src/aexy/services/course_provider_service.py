@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.schemas.external_course import ExternalCourse
 
 logger = logging.getLogger(__name__)
@@ -78,7 +79,7 @@ class CourseProviderService:
             return self._get_mock_youtube_results(skill_name, max_results)
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 # Search for videos
                 search_params = {
                     "part": "snippet",
@@ -301,7 +302,7 @@ class CourseProviderService:
 
             auth = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
 
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 response = await client.get(
                     "https://www.udemy.com/api-2.0/courses/",
                     params={
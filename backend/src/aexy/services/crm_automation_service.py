@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.core.http_clients import get_http_transport
 from aexy.models.crm import (
     CRMAutomation,
     CRMAutomationRun,
@@ -616,7 +617,7 @@ class CRMAutomationService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
                 response = await client.request(
                     method=method,
                     url=url,
@@ -2905,7 +2906,7 @@ class CRMWebhookService:
         # Make request
         start_time = datetime.now(timezone.utc)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
                 response = await client.post(
                     webhook.url,
                     json=full_payload,
@@ -30,6 +30,31 @@ from aexy.models.sprint import Sprint, SprintTask
 from aexy.models.team import TeamMember
 from aexy.models.workspace import WorkspaceMember
 
+# Columns of the GDPR export tables, in file order
+SNAPSHOT_EXPORT_COLUMNS = [
+    "id",
+    "period_start",
+    "period_end",
+    "period_type",
+    "velocity_metrics",
+    "efficiency_metrics",
+    "quality_metrics",
+    "sustainability_metrics",
+    "collaboration_metrics",
+    "raw_counts",
+    "computed_at",
+]
+ALERT_EXPORT_COLUMNS = [
+    "id",
+    "rule_id",
+    "metric_value",
+    "threshold_value",
+    "severity",
+    "status",
+    "message",
+    "triggered_at",
+]
+
 
 # ---------------------------------------------------------------------------
 # Data classes for structured return values
@@ -1044,15 +1069,28 @@ class DeveloperInsightsService:
         start: datetime,
         end: datetime,
         threshold: float = 0.8,
+        granularity: str = "repository",
+        depth: int = 1,
+        limit: int = 50,
     ) -> dict:
         """Compute bus factor per repository.
 
         Bus factor = minimum developers covering `threshold` (default 80%) of commits.
         Returns {repo: {"bus_factor": int, "top_contributors": [{dev_id, commits, share}]}}
+
+        With granularity "file" or "directory" the result is read from the
+        repository ownership matrices instead, covering all ingested history
+        (`start`/`end` do not apply). Each repo then carries its `limit`
+        lowest-bus-factor paths.
         """
         if not developer_ids:
             return {}
 
+        if granularity in ("file", "directory"):
+            return await self._compute_path_bus_factor(
+                developer_ids, threshold, granularity, depth, limit
+            )
+
         # Get commit counts per (repo, developer)
         stmt = select(
             Commit.repository,
@@ -1111,6 +1149,38 @@ class DeveloperInsightsService:
 
         return bus_factors
 
+    async def _compute_path_bus_factor(
+        self,
+        developer_ids: list[str],
+        threshold: float,
+        level: str,
+        depth: int,
+        limit: int,
+    ) -> dict:
+        """File/directory bus factor as a reduction over ownership matrices."""
+        from aexy.services.code_ownership_service import CodeOwnershipService
+
+        matrices = await CodeOwnershipService(self.db).get_matrices_for_developers(developer_ids)
+
+        bus_factors: dict[str, dict] = {}
+        for matrix in matrices:
+            paths = matrix.bus_factors(level, depth, developer_ids, threshold)
+            if not paths:
+                continue
+            riskiest = sorted(
+                paths.items(),
+                key=lambda item: (item[1]["bus_factor"], -item[1]["total_touches"]),
+            )[:limit]
+            bus_factors[matrix.repository] = {
+                "granularity": level,
+                "paths_analyzed": len(paths),
+                "single_owner_paths": sum(1 for p in paths.values() if p["bus_factor"] == 1),
+                "paths": [{"path": label, **data} for label, data in riskiest],
+                "knowledge_silos": matrix.knowledge_silos(level, depth, developer_ids)[:limit],
+            }
+
+        return bus_factors
+
     # -----------------------------------------------------------------------
     # Team Distribution
     # -----------------------------------------------------------------------
@@ -2606,23 +2676,43 @@ class DeveloperInsightsService:
                 "note": "Assumes replacements produce ~30% of departing dev output in first sprint",
             },
             "departing_developers": departing_details,
+            "knowledge_exposure": await self._compute_rotation_exposure(
+                team_dev_ids, rotating_dev_ids
+            ),
         }
 
+    async def _compute_rotation_exposure(
+        self,
+        team_dev_ids: list[str],
+        rotating_dev_ids: list[str],
+        limit: int = 20,
+    ) -> dict:
+        """Per-repository directories orphaned or at risk after a rotation."""
+        from aexy.services.code_ownership_service import CodeOwnershipService
+
+        matrices = await CodeOwnershipService(self.db).get_matrices_for_developers(rotating_dev_ids)
+
+        exposure: dict[str, dict] = {}
+        for matrix in matrices:
+            result = matrix.rotation_exposure(rotating_dev_ids, team_dev_ids)
+            if not result["orphaned_paths"] and not result["at_risk_paths"]:
+                continue
+            exposure[matrix.repository] = {
+                "knowledge_loss_pct": result["knowledge_loss_pct"],
+                "orphaned_count": len(result["orphaned_paths"]),
+                "at_risk_count": len(result["at_risk_paths"]),
+                "orphaned_paths": result["orphaned_paths"][:limit],
+                "at_risk_paths": result["at_risk_paths"][:limit],
+            }
+        return exposure
+
     # ------------------------------------------------------------------
     # GDPR Data Export
     # ------------------------------------------------------------------
 
-    async def export_developer_data(
-        self,
-        developer_id: str,
-        workspace_id: str,
-    ) -> dict:
-        """Export all personal insight data for a developer (GDPR compliance).
-
-        Returns snapshots, working schedule, and alert history.
-        """
-        # Snapshots
-        stmt = (
+    def _developer_export_statements(self, developer_id: str, workspace_id: str):
+        """Queries for the snapshot and alert sections of a GDPR export."""
+        snapshots = (
             select(DeveloperMetricsSnapshot)
             .where(
                 and_(
@@ -2632,27 +2722,52 @@ class DeveloperInsightsService:
             )
             .order_by(DeveloperMetricsSnapshot.period_start.desc())
         )
-        result = await self.db.execute(stmt)
-        snapshots = result.scalars().all()
-
-        snapshot_data = [
-            {
-                "id": s.id,
-                "period_start": s.period_start.isoformat() if s.period_start else None,
-                "period_end": s.period_end.isoformat() if s.period_end else None,
-                "period_type": s.period_type.value if hasattr(s.period_type, "value") else str(s.period_type),
-                "velocity_metrics": s.velocity_metrics,
-                "efficiency_metrics": s.efficiency_metrics,
-                "quality_metrics": s.quality_metrics,
-                "sustainability_metrics": s.sustainability_metrics,
-                "collaboration_metrics": s.collaboration_metrics,
-                "raw_counts": s.raw_counts,
-                "computed_at": s.computed_at.isoformat() if s.computed_at else None,
-            }
-            for s in snapshots
-        ]
+        alerts = (
+            select(InsightAlertHistory)
+            .where(
+                and_(
+                    InsightAlertHistory.developer_id == developer_id,
+                    InsightAlertHistory.workspace_id == workspace_id,
+                )
+            )
+            .order_by(InsightAlertHistory.triggered_at.desc())
+        )
+        return snapshots, alerts
+
+    @staticmethod
+    def _snapshot_export_row(s: DeveloperMetricsSnapshot) -> dict:
+        return {
+            "id": s.id,
+            "period_start": s.period_start.isoformat() if s.period_start else None,
+            "period_end": s.period_end.isoformat() if s.period_end else None,
+            "period_type": s.period_type.value if hasattr(s.period_type, "value") else str(s.period_type),
+            "velocity_metrics": s.velocity_metrics,
+            "efficiency_metrics": s.efficiency_metrics,
+            "quality_metrics": s.quality_metrics,
+            "sustainability_metrics": s.sustainability_metrics,
+            "collaboration_metrics": s.collaboration_metrics,
+            "raw_counts": s.raw_counts,
+            "computed_at": s.computed_at.isoformat() if s.computed_at else None,
+        }
 
-        # Working schedule
+    @staticmethod
+    def _alert_export_row(a: InsightAlertHistory) -> dict:
+        return {
+            "id": a.id,
+            "rule_id": a.rule_id,
+            "metric_value": a.metric_value,
+            "threshold_value": a.threshold_value,
+            "severity": a.severity,
+            "status": a.status,
+            "message": a.message,
+            "triggered_at": a.triggered_at.isoformat() if a.triggered_at else None,
+        }
+
+    async def _get_working_schedule_export(
+        self,
+        developer_id: str,
+        workspace_id: str,
+    ) -> dict | None:
         stmt = select(DeveloperWorkingSchedule).where(
             and_(
                 DeveloperWorkingSchedule.developer_id == developer_id,
@@ -2661,45 +2776,36 @@ class DeveloperInsightsService:
         )
         result = await self.db.execute(stmt)
         schedule = result.scalar_one_or_none()
+        if not schedule:
+            return None
+        return {
+            "timezone": schedule.timezone,
+            "start_hour": schedule.start_hour,
+            "end_hour": schedule.end_hour,
+            "working_days": schedule.working_days,
+            "late_night_threshold_hour": schedule.late_night_threshold_hour,
+            "engineering_role": schedule.engineering_role,
+        }
 
-        schedule_data = None
-        if schedule:
-            schedule_data = {
-                "timezone": schedule.timezone,
-                "start_hour": schedule.start_hour,
-                "end_hour": schedule.end_hour,
-                "working_days": schedule.working_days,
-                "late_night_threshold_hour": schedule.late_night_threshold_hour,
-                "engineering_role": schedule.engineering_role,
-            }
+    async def export_developer_data(
+        self,
+        developer_id: str,
+        workspace_id: str,
+    ) -> dict:
+        """Export all personal insight data for a developer (GDPR compliance).
 
-        # Alert history for this developer
-        stmt = (
-            select(InsightAlertHistory)
-            .where(
-                and_(
-                    InsightAlertHistory.developer_id == developer_id,
-                    InsightAlertHistory.workspace_id == workspace_id,
-                )
-            )
-            .order_by(InsightAlertHistory.triggered_at.desc())
-        )
-        result = await self.db.execute(stmt)
-        alerts = result.scalars().all()
-
-        alert_data = [
-            {
-                "id": a.id,
-                "rule_id": a.rule_id,
-                "metric_value": a.metric_value,
-                "threshold_value": a.threshold_value,
-                "severity": a.severity,
-                "status": a.status,
-                "message": a.message,
-                "triggered_at": a.triggered_at.isoformat() if a.triggered_at else None,
-            }
-            for a in alerts
-        ]
+        Returns snapshots, working schedule, and alert history. For large
+        histories use `iter_developer_export_tables` with the export service.
+        """
+        snapshot_stmt, alert_stmt = self._developer_export_statements(developer_id, workspace_id)
+
+        result = await self.db.execute(snapshot_stmt)
+        snapshot_data = [self._snapshot_export_row(s) for s in result.scalars().all()]
+
+        schedule_data = await self._get_working_schedule_export(developer_id, workspace_id)
+
+        result = await self.db.execute(alert_stmt)
+        alert_data = [self._alert_export_row(a) for a in result.scalars().all()]
 
         return {
             "developer_id": developer_id,
@@ -2710,6 +2816,54 @@ class DeveloperInsightsService:
             "alert_history": alert_data,
         }
 
+    async def iter_developer_export_tables(
+        self,
+        developer_id: str,
+        workspace_id: str,
+        batch_size: int = 500,
+    ):
+        """Yield the GDPR export as ExportTable sections with streamed rows.
+
+        Snapshot and alert rows are read through server-side cursors in
+        batches of `batch_size`, so the export never holds the full history.
+        """
+        from aexy.services.export_service import ExportTable
+
+        snapshot_stmt, alert_stmt = self._developer_export_statements(developer_id, workspace_id)
+
+        async def stream(stmt, to_row, columns):
+            rows = await self.db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+            async for obj in rows:
+                row = to_row(obj)
+                yield [row[column] for column in columns]
+
+        async def count(stmt) -> int:
+            result = await self.db.execute(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            )
+            return result.scalar() or 0
+
+        yield ExportTable(
+            title="Metrics Snapshots",
+            headers=SNAPSHOT_EXPORT_COLUMNS,
+            rows=stream(snapshot_stmt, self._snapshot_export_row, SNAPSHOT_EXPORT_COLUMNS),
+            total_rows=await count(snapshot_stmt),
+        )
+
+        schedule = await self._get_working_schedule_export(developer_id, workspace_id)
+        yield ExportTable(
+            title="Working Schedule",
+            headers=["setting", "value"],
+            rows=[[k, v] for k, v in (schedule or {}).items()],
+        )
+
+        yield ExportTable(
+            title="Alert History",
+            headers=ALERT_EXPORT_COLUMNS,
+            rows=stream(alert_stmt, self._alert_export_row, ALERT_EXPORT_COLUMNS),
+            total_rows=await count(alert_stmt),
+        )
+
     # -----------------------------------------------------------------------
     # Repository Insights
     # -----------------------------------------------------------------------
@@ -1,15 +1,19 @@
 """Export service for generating reports in various formats."""
 
 import csv
+import gzip
 import io
 import json
+import logging
 import os
 import tempfile
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.analytics import ExportJob
@@ -26,8 +30,7 @@ from aexy.schemas.analytics import (
 try:
     from reportlab.lib import colors
     from reportlab.lib.pagesizes import letter, A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
+    from reportlab.lib.styles import getSampleStyleSheet
     from reportlab.platypus import (
         SimpleDocTemplate,
         Paragraph,
@@ -42,23 +45,136 @@ except ImportError:
 
 try:
     from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    from openpyxl.styles import Font, PatternFill
     from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
 
+logger = logging.getLogger(__name__)
+
 # Default export directory
 DEFAULT_EXPORT_DIR = Path(tempfile.gettempdir()) / "aexy_exports"
 
+# Rows written between progress updates on the ExportJob
+PROGRESS_INTERVAL = 1000
+
+# PDF tables are split into chunks of this many rows (header repeated on each)
+PDF_ROWS_PER_TABLE = 250
+
+# PDF is a presentation format; past this many rows use CSV/XLSX instead
+PDF_MAX_ROWS = 5000
+
+# Columns of the developer table built from developer profile dicts
+DEVELOPER_EXPORT_COLUMNS = ["id", "github_username", "email", "github_url", "top_skills", "created_at"]
+
+# Default analytics window for team exports without a date_range in config
+TEAM_EXPORT_DEFAULT_DAYS = 30
+
+
+@dataclass
+class ExportTable:
+    """One tabular section of a streamed export.
+
+    `rows` may be a sync or async iterable so producers can yield rows
+    straight from a database cursor instead of building lists up front.
+    """
+
+    title: str
+    headers: list[str]
+    rows: Iterable[list] | AsyncIterable[list]
+    total_rows: int | None = None
+
+
+@dataclass
+class _ExportProgress:
+    """Running row counts for a streamed export job."""
+
+    job_id: str
+    rows_processed: int = 0
+    rows_total: int | None = None
+
+
+async def _aiter(rows: Iterable[list] | AsyncIterable[list]):
+    """Iterate sync and async iterables uniformly."""
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+def _flatten(data: dict, prefix: str = "") -> Iterator[list]:
+    """Flatten a nested dict to [key, value] rows with dotted keys."""
+    for key, value in data.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten(value, full_key)
+        elif isinstance(value, list):
+            yield [full_key, json.dumps(value, default=str)]
+        else:
+            yield [full_key, value]
+
+
+def _tabulate(data: dict | list) -> tuple[list[str], Iterable[list]]:
+    """Headers and rows for one section of a computed result."""
+    if isinstance(data, dict) and "headers" in data and "rows" in data:
+        return list(data["headers"]), data["rows"]
+    if isinstance(data, list) and data and isinstance(data[0], dict):
+        headers = list(data[0].keys())
+        return headers, ([item.get(h) for h in headers] for item in data)
+    if isinstance(data, list):
+        return ["Value"], ([item] for item in data)
+    return ["Key", "Value"], _flatten(data)
+
+
+def widget_tables(widgets: dict) -> Iterator[ExportTable]:
+    """One table per report widget, in widget order."""
+    for widget_id, widget in widgets.items():
+        title = widget.get("title", widget_id)
+        if "error" in widget:
+            yield ExportTable(title, ["Error"], [[widget["error"]]])
+            continue
+        headers, rows = _tabulate(widget.get("data", {}))
+        yield ExportTable(title, headers, rows)
+
+
+def _developer_row(developer: dict) -> list:
+    row = [developer.get(column) for column in DEVELOPER_EXPORT_COLUMNS]
+    row[DEVELOPER_EXPORT_COLUMNS.index("top_skills")] = ", ".join(developer.get("top_skills") or [])
+    return row
+
+
+def data_tables(data: dict) -> Iterator[ExportTable]:
+    """Split a computed result dict into export tables."""
+    if "widgets" in data:
+        yield from widget_tables(data["widgets"])
+    elif "developers" in data:
+        yield ExportTable(
+            "Developers",
+            DEVELOPER_EXPORT_COLUMNS,
+            (_developer_row(developer) for developer in data["developers"]),
+        )
+    else:
+        headers, rows = _tabulate(data)
+        yield ExportTable(data.get("title", "Export"), headers, rows)
+
 
 class ExportService:
     """Service for generating exportable reports in various formats."""
 
-    def __init__(self, export_dir: Path | None = None):
+    def __init__(
+        self,
+        export_dir: Path | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ):
         self.export_dir = export_dir or DEFAULT_EXPORT_DIR
         self.export_dir.mkdir(parents=True, exist_ok=True)
+        # Progress is written through its own short-lived sessions so it is
+        # visible to pollers while the export's session holds an open cursor
+        self._session_factory = session_factory
 
     # -------------------------------------------------------------------------
     # Export Job Management
@@ -91,6 +207,26 @@ class ExportService:
         await db.refresh(job)
         return job
 
+    async def submit_export_job(
+        self,
+        request: ExportRequest,
+        requester_id: str,
+        db: AsyncSession,
+    ) -> ExportJob:
+        """Create an export job and queue it for the export worker."""
+        from aexy.temporal.activities.exports import ProcessExportJobInput
+        from aexy.temporal.dispatch import dispatch
+        from aexy.temporal.task_queues import TaskQueue
+
+        job = await self.create_export_job(request, requester_id, db)
+        await dispatch(
+            "process_export_job",
+            ProcessExportJobInput(job_id=job.id),
+            task_queue=TaskQueue.OPERATIONS,
+            workflow_id=f"export-{job.id}",
+        )
+        return job
+
     async def get_export_job(
         self,
         job_id: str,
@@ -153,6 +289,31 @@ class ExportService:
         await db.refresh(job)
         return job
 
+    async def _report_progress(
+        self,
+        job_id: str,
+        rows_processed: int,
+        rows_total: int | None = None,
+    ) -> None:
+        """Persist streaming progress on the export job."""
+        values: dict = {"rows_processed": rows_processed}
+        if rows_total is not None:
+            values["rows_total"] = rows_total
+
+        if self._session_factory is None:
+            from aexy.core.database import async_session_maker
+            self._session_factory = async_session_maker
+
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    update(ExportJob).where(ExportJob.id == job_id).values(**values)
+                )
+                await session.commit()
+        except Exception as e:
+            # Progress is advisory; never fail an export over it
+            logger.warning(f"Failed to record export progress for job {job_id}: {e}")
+
     async def cleanup_expired_exports(self, db: AsyncSession) -> int:
         """Delete expired export jobs and their files."""
         now = datetime.utcnow()
@@ -187,33 +348,52 @@ class ExportService:
         db: AsyncSession,
         data: dict,
     ) -> ExportJob | None:
-        """Process an export job with the provided data."""
+        """Process an export job from an already computed result dict.
+
+        The dict is split into tables by `data_tables` and written through
+        the streaming writers. Large exports should not build a dict at all;
+        they provide an ExportTable producer to `run_export_job`.
+        """
+        title = data.get("title", data.get("report_name", "Aexy Export"))
+        return await self.process_export_stream(job_id, db, data_tables(data), title=title)
+
+    async def process_export_stream(
+        self,
+        job_id: str,
+        db: AsyncSession,
+        tables: Iterable[ExportTable] | AsyncIterable[ExportTable],
+        title: str = "Aexy Export",
+    ) -> ExportJob | None:
+        """Process an export job from lazily produced tables.
+
+        Rows are written as they arrive, so memory stays bounded regardless
+        of export size. Set `compress` in the job config to gzip CSV/JSON
+        output. Progress is recorded on the job every PROGRESS_INTERVAL rows.
+        """
         job = await self.get_export_job(job_id, db)
         if not job:
             return None
 
         try:
-            # Mark as processing
             await self.update_job_status(job_id, db, ExportStatus.PROCESSING)
 
             format_type = ExportFormat(job.format)
+            compress = bool((job.config or {}).get("compress"))
             file_path: str
 
             if format_type == ExportFormat.CSV:
-                file_path = await self._export_csv(job, data)
+                file_path = await self._stream_csv(job, tables, compress)
             elif format_type == ExportFormat.JSON:
-                file_path = await self._export_json(job, data)
-            elif format_type == ExportFormat.PDF:
-                file_path = await self._export_pdf(job, data)
+                file_path = await self._stream_json(job, tables, compress)
             elif format_type == ExportFormat.XLSX:
-                file_path = await self._export_xlsx(job, data)
+                file_path = await self._stream_xlsx(job, tables)
+            elif format_type == ExportFormat.PDF:
+                file_path = await self._stream_pdf(job, tables, title)
             else:
                 raise ValueError(f"Unsupported export format: {format_type}")
 
-            # Get file size
             file_size = os.path.getsize(file_path)
 
-            # Mark as completed
             return await self.update_job_status(
                 job_id, db, ExportStatus.COMPLETED,
                 file_path=file_path,
@@ -227,604 +407,302 @@ class ExportService:
             )
             raise
 
-    def get_download_path(self, job: ExportJob) -> Path | None:
-        """Get the download path for a completed export."""
-        if not job.file_path:
-            return None
-        path = Path(job.file_path)
-        return path if path.exists() else None
-
-    # -------------------------------------------------------------------------
-    # Format-Specific Export Implementations
-    # -------------------------------------------------------------------------
-
-    async def _export_csv(self, job: ExportJob, data: dict) -> str:
-        """Export data to CSV format."""
-        filename = f"{job.id}.csv"
-        file_path = self.export_dir / filename
+    async def run_export_job(
+        self,
+        job_id: str,
+        db: AsyncSession,
+    ) -> ExportJob | None:
+        """Write a queued export job's file. Called by the export worker.
 
-        with open(file_path, "w", newline="") as f:
-            writer = csv.writer(f)
+        Tables come from the service that owns the job's data and are
+        streamed straight into the file. Jobs already completed are left
+        alone so a retried activity doesn't redo the export.
+        """
+        job = await self.get_export_job(job_id, db)
+        if not job or job.status == ExportStatus.COMPLETED.value:
+            return job
 
-            # Handle different data structures
-            if "rows" in data:
-                # Standard tabular data
-                if "headers" in data:
-                    writer.writerow(data["headers"])
-                for row in data["rows"]:
-                    writer.writerow(row)
+        config = job.config or {}
+        tables = self._job_tables(job, db)
+        if tables is None:
+            return await self.update_job_status(
+                job_id, db, ExportStatus.FAILED,
+                error_message=f"Unsupported export type: {job.export_type}",
+            )
 
-            elif "tasks" in data:
-                # Sprint tasks export
-                headers = ["ID", "Title", "Status", "Priority", "Story Points", "Assignee", "Epic", "Labels", "Created At", "Updated At"]
-                writer.writerow(headers)
-                for task in data["tasks"]:
-                    labels = ", ".join(task.get("labels", []))
-                    writer.writerow([
-                        task.get("id", ""),
-                        task.get("title", ""),
-                        task.get("status", ""),
-                        task.get("priority", ""),
-                        task.get("story_points", ""),
-                        task.get("assignee_name", ""),
-                        task.get("epic_title", ""),
-                        labels,
-                        task.get("created_at", ""),
-                        task.get("updated_at", ""),
-                    ])
-
-            elif "developers" in data:
-                # Developer list export
-                headers = ["ID", "Username", "Email", "GitHub URL", "Skills", "Created At"]
-                writer.writerow(headers)
-                for dev in data["developers"]:
-                    skills = ", ".join(dev.get("top_skills", []))
-                    writer.writerow([
-                        dev.get("id", ""),
-                        dev.get("github_username", ""),
-                        dev.get("email", ""),
-                        dev.get("github_url", ""),
-                        skills,
-                        dev.get("created_at", ""),
-                    ])
-
-            elif "widgets" in data:
-                # Report widget data
-                writer.writerow(["Widget", "Type", "Data"])
-                for widget_id, widget_data in data["widgets"].items():
-                    writer.writerow([
-                        widget_data.get("title", widget_id),
-                        widget_data.get("type", ""),
-                        json.dumps(widget_data.get("data", {})),
-                    ])
-
-            elif "skills" in data and "developers" not in data:
-                # Skill heatmap data
-                if "developer_skills" in data:
-                    headers = ["Developer"] + data["skills"]
-                    writer.writerow(headers)
-                    for dev_data in data["developer_skills"]:
-                        row = [dev_data["developer_name"]]
-                        skill_values = {s["skill"]: s["value"] for s in dev_data["skills"]}
-                        for skill in data["skills"]:
-                            row.append(skill_values.get(skill, 0))
-                        writer.writerow(row)
-
-            elif "trends" in data or "developer_trends" in data:
-                # Productivity trends
-                trends = data.get("developer_trends", data.get("trends", []))
-                if trends:
-                    # Flatten trends to CSV
-                    headers = ["Developer", "Metric", "Period", "Value"]
-                    writer.writerow(headers)
-                    for trend in trends:
-                        dev_id = trend.get("developer_id", "")
-                        for i, val in enumerate(trend.get("commits", [])):
-                            writer.writerow([dev_id, "commits", i, val])
-                        for i, val in enumerate(trend.get("prs_merged", [])):
-                            writer.writerow([dev_id, "prs_merged", i, val])
-                        for i, val in enumerate(trend.get("reviews", [])):
-                            writer.writerow([dev_id, "reviews", i, val])
+        return await self.process_export_stream(
+            job_id, db, tables, title=config.get("title", "Aexy Export"),
+        )
 
-            else:
-                # Generic dict export - flatten to key-value pairs
-                writer.writerow(["Key", "Value"])
-                self._flatten_dict_to_csv(writer, data)
+    def _job_tables(
+        self,
+        job: ExportJob,
+        db: AsyncSession,
+    ) -> AsyncIterable[ExportTable] | None:
+        """Table producer for a job's export_type and config, if supported."""
+        config = job.config or {}
 
-        return str(file_path)
+        if job.export_type == ExportType.DEVELOPER_PROFILE.value and config.get("workspace_id"):
+            from aexy.services.developer_insights_service import DeveloperInsightsService
 
-    def _flatten_dict_to_csv(self, writer, data: dict, prefix: str = "") -> None:
-        """Recursively flatten a dict to CSV rows."""
-        for key, value in data.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                self._flatten_dict_to_csv(writer, value, full_key)
-            elif isinstance(value, list):
-                writer.writerow([full_key, json.dumps(value)])
-            else:
-                writer.writerow([full_key, value])
-
-    async def _export_json(self, job: ExportJob, data: dict) -> str:
-        """Export data to JSON format."""
-        filename = f"{job.id}.json"
-        file_path = self.export_dir / filename
-
-        export_data = {
-            "export_info": {
-                "job_id": job.id,
-                "export_type": job.export_type,
-                "generated_at": datetime.utcnow().isoformat(),
-            },
-            "data": data,
-        }
+            return DeveloperInsightsService(db).iter_developer_export_tables(
+                config["developer_id"], config["workspace_id"],
+            )
 
-        with open(file_path, "w") as f:
-            json.dump(export_data, f, indent=2, default=str)
+        if job.export_type == ExportType.SPRINT_TASKS.value and config.get("sprint_id"):
+            from aexy.services.sprint_task_service import SprintTaskService
 
-        return str(file_path)
+            return SprintTaskService(db).iter_sprint_export_tables(config["sprint_id"])
 
-    async def _export_pdf(self, job: ExportJob, data: dict) -> str:
-        """Export data to PDF format."""
-        if not REPORTLAB_AVAILABLE:
-            raise ImportError("reportlab is required for PDF export")
+        if job.export_type == ExportType.REPORT.value and config.get("report_id"):
+            from aexy.services.report_builder import get_report_builder_service
 
-        filename = f"{job.id}.pdf"
-        file_path = self.export_dir / filename
+            return get_report_builder_service().iter_report_export_tables(
+                config["report_id"], db, job.requested_by,
+            )
 
-        doc = SimpleDocTemplate(
-            str(file_path),
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72,
-        )
+        if job.export_type == ExportType.TEAM_ANALYTICS.value and config.get("developer_ids"):
+            from aexy.services.analytics_dashboard import AnalyticsDashboardService
 
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=18,
-            spaceAfter=30,
-        )
-        heading_style = ParagraphStyle(
-            "CustomHeading",
-            parent=styles["Heading2"],
-            fontSize=14,
-            spaceBefore=20,
-            spaceAfter=10,
-        )
-        body_style = styles["Normal"]
-
-        elements = []
+            if config.get("date_range"):
+                date_range = DateRange(**config["date_range"])
+            else:
+                end = datetime.utcnow()
+                date_range = DateRange(
+                    start_date=end - timedelta(days=TEAM_EXPORT_DEFAULT_DAYS),
+                    end_date=end,
+                )
+            return AnalyticsDashboardService().iter_team_export_tables(
+                config["developer_ids"], db, date_range,
+            )
 
-        # Title
-        title = data.get("title", data.get("report_name", "Aexy Export"))
-        elements.append(Paragraph(title, title_style))
-        elements.append(Paragraph(
-            f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
-            body_style,
-        ))
-        elements.append(Spacer(1, 20))
-
-        # Handle different data types
-        if "widgets" in data:
-            # Report with widgets
-            for widget_id, widget_data in data["widgets"].items():
-                elements.append(Paragraph(
-                    widget_data.get("title", widget_id),
-                    heading_style,
-                ))
+        return None
 
-                widget_content = widget_data.get("data", {})
-                if "error" in widget_content:
-                    elements.append(Paragraph(
-                        f"Error: {widget_content['error']}",
-                        body_style,
-                    ))
-                else:
-                    # Render as table if possible
-                    table_data = self._data_to_table(widget_content)
-                    if table_data:
-                        table = Table(table_data)
-                        table.setStyle(TableStyle([
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                            ("FONTSIZE", (0, 0), (-1, 0), 10),
-                            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-                            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ]))
-                        elements.append(table)
-                    else:
-                        elements.append(Paragraph(
-                            json.dumps(widget_content, indent=2),
-                            body_style,
-                        ))
-
-                elements.append(Spacer(1, 20))
-
-        elif "tasks" in data:
-            # Sprint tasks export
-            sprint_name = data.get("sprint_name", "Tasks")
-            elements.append(Paragraph(f"Sprint: {sprint_name}", heading_style))
-
-            # Summary stats if available
-            if "stats" in data:
-                stats = data["stats"]
-                elements.append(Paragraph(
-                    f"Total: {stats.get('total', 0)} | "
-                    f"Completed: {stats.get('completed', 0)} | "
-                    f"In Progress: {stats.get('in_progress', 0)} | "
-                    f"To Do: {stats.get('todo', 0)}",
-                    body_style,
-                ))
-                elements.append(Spacer(1, 10))
-
-            # Tasks table
-            table_data = [["Title", "Status", "Priority", "Points", "Assignee"]]
-            for task in data["tasks"][:50]:  # Limit for PDF
-                table_data.append([
-                    task.get("title", "")[:40],  # Truncate long titles
-                    task.get("status", "").replace("_", " ").title(),
-                    task.get("priority", "").title(),
-                    str(task.get("story_points", "")),
-                    task.get("assignee_name", "Unassigned"),
-                ])
+    def get_download_path(self, job: ExportJob) -> Path | None:
+        """Get the download path for a completed export."""
+        if not job.file_path:
+            return None
+        path = Path(job.file_path)
+        return path if path.exists() else None
 
-            if len(table_data) > 1:
-                table = Table(table_data, colWidths=[3*inch, 0.8*inch, 0.7*inch, 0.5*inch, 1.2*inch])
-                table.setStyle(TableStyle([
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("ALIGN", (2, 0), (3, -1), "CENTER"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                    ("TOPPADDING", (0, 0), (-1, 0), 10),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F0F0F0")]),
-                ]))
-                elements.append(table)
-
-            if len(data["tasks"]) > 50:
-                elements.append(Paragraph(
-                    f"... and {len(data['tasks']) - 50} more tasks",
-                    body_style,
-                ))
+    # -------------------------------------------------------------------------
+    # Streaming Export Implementations
+    # -------------------------------------------------------------------------
 
-        elif "developers" in data:
-            # Developer profile(s)
-            elements.append(Paragraph("Developer Profiles", heading_style))
-            for dev in data["developers"]:
-                elements.append(Paragraph(
-                    f"<b>{dev.get('github_username', 'Unknown')}</b>",
-                    body_style,
-                ))
-                if dev.get("email"):
-                    elements.append(Paragraph(f"Email: {dev['email']}", body_style))
-                if dev.get("top_skills"):
-                    elements.append(Paragraph(
-                        f"Top Skills: {', '.join(dev['top_skills'][:5])}",
-                        body_style,
-                    ))
-                elements.append(Spacer(1, 10))
-
-        elif "developer_skills" in data:
-            # Skill heatmap
-            elements.append(Paragraph("Skill Distribution", heading_style))
-            table_data = [["Developer"] + data.get("skills", [])[:10]]
-            for dev_data in data["developer_skills"]:
-                row = [dev_data["developer_name"]]
-                skill_values = {s["skill"]: s["value"] for s in dev_data["skills"]}
-                for skill in data.get("skills", [])[:10]:
-                    row.append(str(skill_values.get(skill, 0)))
-                table_data.append(row)
-
-            if len(table_data) > 1:
-                table = Table(table_data)
-                table.setStyle(TableStyle([
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.darkblue),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                ]))
-                elements.append(table)
-
-        elif "risk_score" in data or "risk_level" in data:
-            # Predictive insight
-            elements.append(Paragraph("Risk Assessment", heading_style))
-            if "risk_level" in data:
-                elements.append(Paragraph(
-                    f"Risk Level: <b>{data['risk_level'].upper()}</b>",
-                    body_style,
-                ))
-            if "risk_score" in data:
-                elements.append(Paragraph(
-                    f"Risk Score: {data['risk_score']:.1%}",
-                    body_style,
-                ))
-            if "factors" in data:
-                elements.append(Paragraph("Contributing Factors:", body_style))
-                for factor in data["factors"]:
-                    elements.append(Paragraph(
-                        f"  • {factor.get('factor', factor)}",
-                        body_style,
-                    ))
-            if "recommendations" in data:
-                elements.append(Paragraph("Recommendations:", body_style))
-                for rec in data["recommendations"]:
-                    elements.append(Paragraph(f"  • {rec}", body_style))
+    async def _stream_table_rows(self, progress: _ExportProgress, table: ExportTable):
+        """Yield a table's rows, recording progress on the job as they pass.
+
+        `rows_total` grows as tables with a known `total_rows` are started,
+        since later tables may not have been produced yet.
+        """
+        if table.total_rows is not None:
+            progress.rows_total = (progress.rows_total or 0) + table.total_rows
+        async for row in _aiter(table.rows):
+            yield row
+            progress.rows_processed += 1
+            if progress.rows_processed % PROGRESS_INTERVAL == 0:
+                await self._report_progress(
+                    progress.job_id, progress.rows_processed, progress.rows_total
+                )
+
+    async def _finish_progress(self, progress: _ExportProgress) -> None:
+        await self._report_progress(
+            progress.job_id, progress.rows_processed, progress.rows_processed
+        )
 
-        else:
-            # Generic data dump
-            elements.append(Paragraph("Export Data", heading_style))
-            table_data = self._data_to_table(data)
-            if table_data:
-                table = Table(table_data)
-                table.setStyle(TableStyle([
-                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                ]))
-                elements.append(table)
-            else:
-                elements.append(Paragraph(
-                    json.dumps(data, indent=2, default=str),
-                    body_style,
-                ))
+    async def _stream_csv(
+        self,
+        job: ExportJob,
+        tables: Iterable[ExportTable] | AsyncIterable[ExportTable],
+        compress: bool = False,
+    ) -> str:
+        """Stream tables to CSV. Multiple tables are separated by a title row."""
+        file_path = self.export_dir / (f"{job.id}.csv.gz" if compress else f"{job.id}.csv")
+        opener = gzip.open if compress else open
+
+        progress = _ExportProgress(job.id)
+        with opener(file_path, "wt", newline="") as f:
+            writer = csv.writer(f)
+            first = True
+            async for table in _aiter(tables):
+                if not first:
+                    writer.writerow([])
+                    writer.writerow([table.title])
+                first = False
+                writer.writerow(table.headers)
+                async for row in self._stream_table_rows(progress, table):
+                    writer.writerow(row)
 
-        doc.build(elements)
+        await self._finish_progress(progress)
         return str(file_path)
 
-    def _data_to_table(self, data: dict) -> list[list] | None:
-        """Convert dict data to table rows if possible."""
-        if not data:
-            return None
-
-        # Handle rows with headers
-        if "rows" in data and "headers" in data:
-            return [data["headers"]] + data["rows"]
-
-        # Handle list of dicts
-        if isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            headers = list(data[0].keys())
-            rows = [headers]
-            for item in data[:50]:  # Limit rows
-                rows.append([str(item.get(h, "")) for h in headers])
-            return rows
-
-        # Handle simple key-value dict
-        if all(not isinstance(v, (dict, list)) for v in data.values()):
-            return [["Key", "Value"]] + [[k, str(v)] for k, v in data.items()]
+    async def _stream_json(
+        self,
+        job: ExportJob,
+        tables: Iterable[ExportTable] | AsyncIterable[ExportTable],
+        compress: bool = False,
+    ) -> str:
+        """Stream tables to JSON, writing one row object at a time."""
+        file_path = self.export_dir / (f"{job.id}.json.gz" if compress else f"{job.id}.json")
+        opener = gzip.open if compress else open
+
+        export_info = {
+            "job_id": job.id,
+            "export_type": job.export_type,
+            "generated_at": datetime.utcnow().isoformat(),
+        }
 
-        return None
+        progress = _ExportProgress(job.id)
+        with opener(file_path, "wt") as f:
+            f.write('{"export_info": ')
+            f.write(json.dumps(export_info))
+            f.write(', "tables": [')
+            first_table = True
+            async for table in _aiter(tables):
+                if not first_table:
+                    f.write(", ")
+                first_table = False
+                f.write(f'{{"title": {json.dumps(table.title)}, "rows": [')
+                first_row = True
+                async for row in self._stream_table_rows(progress, table):
+                    if not first_row:
+                        f.write(",")
+                    first_row = False
+                    f.write("\n")
+                    f.write(json.dumps(dict(zip(table.headers, row)), default=str))
+                f.write("]}")
+            f.write("]}\n")
+
+        await self._finish_progress(progress)
+        return str(file_path)
 
-    async def _export_xlsx(self, job: ExportJob, data: dict) -> str:
-        """Export data to Excel format."""
+    async def _stream_xlsx(
+        self,
+        job: ExportJob,
+        tables: Iterable[ExportTable] | AsyncIterable[ExportTable],
+    ) -> str:
+        """Stream tables to Excel using openpyxl's write-only mode, one sheet per table."""
         if not OPENPYXL_AVAILABLE:
             raise ImportError("openpyxl is required for Excel export")
 
-        filename = f"{job.id}.xlsx"
-        file_path = self.export_dir / filename
+        from openpyxl.cell import WriteOnlyCell
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Export"
+        file_path = self.export_dir / f"{job.id}.xlsx"
 
-        # Styles
+        wb = Workbook(write_only=True)
         header_font = Font(bold=True, color="FFFFFF")
         header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_alignment = Alignment(horizontal="center")
-        border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
 
-        row_num = 1
+        progress = _ExportProgress(job.id)
+        used_titles: set[str] = set()
+        async for table in _aiter(tables):
+            ws = wb.create_sheet(title=self._sheet_title(table.title, used_titles))
 
-        # Title
-        title = data.get("title", data.get("report_name", "Aexy Export"))
-        ws.cell(row=row_num, column=1, value=title).font = Font(size=16, bold=True)
-        row_num += 1
-        ws.cell(row=row_num, column=1, value=f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}")
-        row_num += 2
-
-        # Handle different data types
-        if "widgets" in data:
-            # Each widget as a section
-            for widget_id, widget_data in data["widgets"].items():
-                ws.cell(row=row_num, column=1, value=widget_data.get("title", widget_id)).font = Font(bold=True)
-                row_num += 1
-
-                widget_content = widget_data.get("data", {})
-                if "error" not in widget_content:
-                    row_num = self._write_data_to_sheet(ws, widget_content, row_num, header_font, header_fill, header_alignment, border)
-
-                row_num += 1
-
-        elif "tasks" in data:
-            # Sprint tasks table
-            ws.title = data.get("sprint_name", "Tasks")
-            headers = ["Title", "Status", "Priority", "Story Points", "Assignee", "Epic", "Labels", "Created At"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = border
-            row_num += 1
-
-            # Status colors
-            status_colors = {
-                "done": "00B050",
-                "in_progress": "FFEB9C",
-                "review": "BDD7EE",
-                "todo": "F8CBAD",
-                "backlog": "E0E0E0",
-            }
-            priority_colors = {
-                "critical": "FF6B6B",
-                "high": "FFA500",
-                "medium": "FFD93D",
-                "low": "87CEEB",
-            }
-
-            for task in data["tasks"]:
-                ws.cell(row=row_num, column=1, value=task.get("title", "")).border = border
-                status_cell = ws.cell(row=row_num, column=2, value=task.get("status", "").replace("_", " ").title())
-                status_cell.border = border
-                if task.get("status") in status_colors:
-                    status_cell.fill = PatternFill(start_color=status_colors[task["status"]], end_color=status_colors[task["status"]], fill_type="solid")
-
-                priority_cell = ws.cell(row=row_num, column=3, value=task.get("priority", "").title())
-                priority_cell.border = border
-                if task.get("priority") in priority_colors:
-                    priority_cell.fill = PatternFill(start_color=priority_colors[task["priority"]], end_color=priority_colors[task["priority"]], fill_type="solid")
-
-                ws.cell(row=row_num, column=4, value=task.get("story_points", "")).border = border
-                ws.cell(row=row_num, column=5, value=task.get("assignee_name", "")).border = border
-                ws.cell(row=row_num, column=6, value=task.get("epic_title", "")).border = border
-                ws.cell(row=row_num, column=7, value=", ".join(task.get("labels", []))).border = border
-                ws.cell(row=row_num, column=8, value=task.get("created_at", "")).border = border
-                row_num += 1
-
-        elif "developers" in data:
-            # Developer table
-            headers = ["Username", "Email", "GitHub URL", "Top Skills", "Created At"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = border
-            row_num += 1
-
-            for dev in data["developers"]:
-                ws.cell(row=row_num, column=1, value=dev.get("github_username", "")).border = border
-                ws.cell(row=row_num, column=2, value=dev.get("email", "")).border = border
-                ws.cell(row=row_num, column=3, value=dev.get("github_url", "")).border = border
-                ws.cell(row=row_num, column=4, value=", ".join(dev.get("top_skills", [])[:5])).border = border
-                ws.cell(row=row_num, column=5, value=dev.get("created_at", "")).border = border
-                row_num += 1
-
-        elif "developer_skills" in data:
-            # Skill heatmap as table
-            skills = data.get("skills", [])[:15]
-            headers = ["Developer"] + skills
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = border
-            row_num += 1
-
-            for dev_data in data["developer_skills"]:
-                ws.cell(row=row_num, column=1, value=dev_data["developer_name"]).border = border
-                skill_values = {s["skill"]: s["value"] for s in dev_data["skills"]}
-                for col, skill in enumerate(skills, 2):
-                    value = skill_values.get(skill, 0)
-                    cell = ws.cell(row=row_num, column=col, value=value)
-                    cell.border = border
-                    # Color code based on value
-                    if value >= 80:
-                        cell.fill = PatternFill(start_color="00B050", end_color="00B050", fill_type="solid")
-                    elif value >= 60:
-                        cell.fill = PatternFill(start_color="92D050", end_color="92D050", fill_type="solid")
-                    elif value >= 40:
-                        cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-                    elif value > 0:
-                        cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-                row_num += 1
-
-        elif "developer_trends" in data:
-            # Productivity trends
-            ws.title = "Productivity Trends"
-            headers = ["Developer", "Total Commits", "Total PRs", "Total Reviews"]
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
+            # Column widths must be set before any rows in write-only mode
+            for col, header in enumerate(table.headers, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(max(len(str(header)) + 2, 12), 50)
+
+            header_row = []
+            for header in table.headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.font = header_font
                 cell.fill = header_fill
-            row_num += 1
+                header_row.append(cell)
+            ws.append(header_row)
 
-            for trend in data["developer_trends"]:
-                ws.cell(row=row_num, column=1, value=trend.get("developer_id", ""))
-                ws.cell(row=row_num, column=2, value=sum(trend.get("commits", [])))
-                ws.cell(row=row_num, column=3, value=sum(trend.get("prs_merged", [])))
-                ws.cell(row=row_num, column=4, value=sum(trend.get("reviews", [])))
-                row_num += 1
+            async for row in self._stream_table_rows(progress, table):
+                ws.append([
+                    json.dumps(v, default=str) if isinstance(v, (dict, list)) else v
+                    for v in row
+                ])
 
-        else:
-            # Generic data
-            row_num = self._write_data_to_sheet(ws, data, row_num, header_font, header_fill, header_alignment, border)
-
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
+        if not used_titles:
+            wb.create_sheet(title="Export")
 
         wb.save(file_path)
+        await self._finish_progress(progress)
         return str(file_path)
 
-    def _write_data_to_sheet(self, ws, data: dict, row_num: int, header_font, header_fill, header_alignment, border) -> int:
-        """Write dict data to worksheet and return next row number."""
-        # Handle rows with headers
-        if "rows" in data and "headers" in data:
-            for col, header in enumerate(data["headers"], 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = border
-            row_num += 1
-
-            for row in data["rows"]:
-                for col, value in enumerate(row, 1):
-                    ws.cell(row=row_num, column=col, value=value).border = border
-                row_num += 1
-
-        # Handle list of dicts
-        elif isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict):
-            headers = list(data[0].keys())
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row_num, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-            row_num += 1
-
-            for item in data[:100]:  # Limit rows
-                for col, header in enumerate(headers, 1):
-                    ws.cell(row=row_num, column=col, value=str(item.get(header, "")))
-                row_num += 1
+    @staticmethod
+    def _sheet_title(title: str, used: set[str]) -> str:
+        """Make a unique, Excel-safe worksheet title (max 31 chars)."""
+        base = "".join(c for c in title if c not in '[]:*?/\\')[:31] or "Sheet"
+        candidate = base
+        n = 2
+        while candidate in used:
+            suffix = f" ({n})"
+            candidate = base[:31 - len(suffix)] + suffix
+            n += 1
+        used.add(candidate)
+        return candidate
+
+    async def _stream_pdf(
+        self,
+        job: ExportJob,
+        tables: Iterable[ExportTable] | AsyncIterable[ExportTable],
+        title: str,
+    ) -> str:
+        """Render tables to PDF as paged table chunks.
+
+        Each table is split every PDF_ROWS_PER_TABLE rows with the header
+        repeated, so reportlab never lays out a single huge table. Output is
+        capped at PDF_MAX_ROWS rows in total.
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("reportlab is required for PDF export")
 
-        # Handle simple key-value dict
-        else:
-            ws.cell(row=row_num, column=1, value="Key").font = header_font
-            ws.cell(row=row_num, column=2, value="Value").font = header_font
-            row_num += 1
+        file_path = self.export_dir / f"{job.id}.pdf"
 
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    value = json.dumps(value, default=str)
-                ws.cell(row=row_num, column=1, value=key)
-                ws.cell(row=row_num, column=2, value=str(value))
-                row_num += 1
+        doc = SimpleDocTemplate(
+            str(file_path),
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72,
+        )
+        styles = getSampleStyleSheet()
+        body_style = styles["Normal"]
+        table_style = TableStyle([
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4472C4")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, -1), 8),
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#F0F0F0")]),
+        ])
+
+        elements = [
+            Paragraph(title, styles["Heading1"]),
+            Paragraph(f"Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}", body_style),
+            Spacer(1, 20),
+        ]
+
+        progress = _ExportProgress(job.id)
+        async for table in _aiter(tables):
+            elements.append(Paragraph(table.title, styles["Heading2"]))
+            chunk: list[list] = []
+            skipped = 0
+            async for row in self._stream_table_rows(progress, table):
+                if progress.rows_processed >= PDF_MAX_ROWS:
+                    skipped += 1
+                    continue
+                chunk.append([str(v)[:60] if v is not None else "" for v in row])
+                if len(chunk) >= PDF_ROWS_PER_TABLE:
+                    elements.append(Table([table.headers] + chunk, repeatRows=1, style=table_style))
+                    chunk = []
+            if chunk:
+                elements.append(Table([table.headers] + chunk, repeatRows=1, style=table_style))
+            if skipped:
+                elements.append(Paragraph(
+                    f"... and {skipped} more rows (use CSV or Excel for the full export)",
+                    body_style,
+                ))
+            elements.append(Spacer(1, 20))
 
-        return row_num
+        doc.build(elements)
+        await self._finish_progress(progress)
+        return str(file_path)
 
     # -------------------------------------------------------------------------
     # Convenience Methods
@@ -848,35 +726,38 @@ class ExportService:
 
     async def export_team_analytics(
         self,
-        analytics_data: dict,
+        developer_ids: list[str],
         format: ExportFormat,
         db: AsyncSession,
         requester_id: str,
+        date_range: DateRange | None = None,
     ) -> ExportJob:
-        """Export team analytics data."""
+        """Queue a team analytics export for the export worker."""
         request = ExportRequest(
             export_type=ExportType.TEAM_ANALYTICS,
             format=format,
-            config={},
+            config={
+                "developer_ids": developer_ids,
+                "date_range": date_range.model_dump(mode="json") if date_range else None,
+                "title": "Team Analytics",
+            },
         )
-        job = await self.create_export_job(request, requester_id, db)
-        return await self.process_export(job.id, db, analytics_data)
+        return await self.submit_export_job(request, requester_id, db)
 
     async def export_report(
         self,
-        report_data: dict,
+        report_id: str,
         format: ExportFormat,
         db: AsyncSession,
         requester_id: str,
     ) -> ExportJob:
-        """Export a custom report."""
+        """Queue a custom report export for the export worker."""
         request = ExportRequest(
             export_type=ExportType.REPORT,
             format=format,
-            config={"report_id": report_data.get("report_id")},
+            config={"report_id": report_id},
         )
-        job = await self.create_export_job(request, requester_id, db)
-        return await self.process_export(job.id, db, report_data)
+        return await self.submit_export_job(request, requester_id, db)
 
 
 # Convenience function
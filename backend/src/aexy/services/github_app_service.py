@@ -11,7 +11,12 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache.installation_token_cache import (
+    InstallationTokenCache,
+    get_installation_token_cache,
+)
 from aexy.core.config import settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.developer import GitHubConnection, GitHubInstallation
 
 
@@ -24,8 +29,13 @@ class GitHubAppError(Exception):
 class GitHubAppService:
     """Service for GitHub App authentication and installation management."""
 
-    def __init__(self, db: AsyncSession | None = None):
+    def __init__(
+        self,
+        db: AsyncSession | None = None,
+        token_cache: InstallationTokenCache | None = None,
+    ):
         self.db = db
+        self.token_cache = token_cache or get_installation_token_cache()
         self.app_id = settings.github_app_id
         self.private_key = settings.get_github_private_key()
         self.api_base_url = settings.github_api_base_url
@@ -53,14 +63,30 @@ class GitHubAppService:
     async def get_installation_access_token(
         self,
         installation_id: int,
+        force_refresh: bool = False,
     ) -> tuple[str, datetime]:
         """Get an installation access token for API calls.
 
+        Tokens are cached (memory and Redis) and reused until shortly before
+        they expire; concurrent callers share a single refresh.
+
         Returns (token, expires_at).
         """
+        if force_refresh:
+            await self.token_cache.invalidate(installation_id)
+        return await self.token_cache.get_or_refresh(
+            installation_id,
+            lambda: self._mint_installation_token(installation_id),
+        )
+
+    async def _mint_installation_token(
+        self,
+        installation_id: int,
+    ) -> tuple[str, datetime]:
+        """Exchange an app JWT for a new installation access token."""
         app_jwt = self._generate_jwt()
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 f"{self.api_base_url}/app/installations/{installation_id}/access_tokens",
                 headers={
@@ -86,7 +112,7 @@ class GitHubAppService:
         """Get all installations of this GitHub App."""
         app_jwt = self._generate_jwt()
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 f"{self.api_base_url}/app/installations",
                 headers={
@@ -111,7 +137,7 @@ class GitHubAppService:
         """Get installation for a specific account."""
         app_jwt = self._generate_jwt()
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 f"{self.api_base_url}/{account_type}/{account_name}/installation",
                 headers={
@@ -141,7 +167,7 @@ class GitHubAppService:
         all_repos = []
         page = 1
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             while True:
                 response = await client.get(
                     f"{self.api_base_url}/installation/repositories",
@@ -354,6 +380,10 @@ class GitHubAppService:
         installation_id = installation_data["id"]
         account = installation_data["account"]
 
+        if action in ("deleted", "suspend", "new_permissions_accepted"):
+            # Cached tokens are revoked or carry stale permissions
+            await self.token_cache.invalidate(installation_id)
+
         if action == "deleted":
             # Remove installation
             stmt = select(GitHubInstallation).where(
@@ -410,7 +440,7 @@ class GitHubAppService:
 
         url = f"{self.api_base_url}/repos/{owner}/{repo}/contents/{path}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 url,
                 params={"ref": ref},
@@ -480,7 +510,7 @@ class GitHubAppService:
 
         url = f"{self.api_base_url}/repos/{owner}/{repo}/contents/{path}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 url,
                 params={"ref": ref},
@@ -541,7 +571,7 @@ class GitHubAppService:
 
         url = f"{self.api_base_url}/repos/{owner}/{repo}/branches"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 url,
                 params={"per_page": 100},
@@ -0,0 +1,204 @@
+"""GraphQL batch fetcher for GitHub pull requests and reviews.
+
+One GraphQL page returns up to 100 pull requests with their additions,
+deletions, counts and nested reviews, replacing a REST list call plus one
+reviews call per pull request. Results are normalized to the REST payload
+shape so the sync code can treat both sources the same way.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from aexy.services.github_service import GitHubGraphQLError, GitHubService
+
+logger = logging.getLogger(__name__)
+
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String, $reviewsFirst: Int!) {
+  rateLimit { limit cost remaining resetAt }
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        number
+        title
+        state
+        createdAt
+        updatedAt
+        mergedAt
+        closedAt
+        additions
+        deletions
+        changedFiles
+        commits { totalCount }
+        comments { totalCount }
+        author { login ... on User { databaseId } }
+        reviews(first: $reviewsFirst) {
+          totalCount
+          nodes {
+            databaseId
+            state
+            body
+            submittedAt
+            author { login ... on User { databaseId } }
+            comments { totalCount }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@dataclass
+class GraphQLUsage:
+    """Requests made and rate limit points spent by a fetcher."""
+
+    requests: int = 0
+    cost: int = 0
+    remaining: int | None = None
+    reset_at: datetime | None = None
+
+
+class GitHubGraphQLFetcher:
+    """Pages through a repository's pull requests via the GraphQL API.
+
+    Pagination is cost-aware: the rateLimit node returned with every page is
+    used to pause until the reset time before the next page would dip into
+    `cost_reserve`. Timeouts and node-limit errors halve the page size and
+    retry the same page.
+    """
+
+    MIN_PAGE_SIZE = 10
+    MAX_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        gh: GitHubService,
+        page_size: int = 50,
+        reviews_per_pr: int = 50,
+        cost_reserve: int = 100,
+        max_wait_seconds: float = 900,
+    ) -> None:
+        self.gh = gh
+        self.page_size = max(self.MIN_PAGE_SIZE, min(page_size, self.MAX_PAGE_SIZE))
+        self.reviews_per_pr = reviews_per_pr
+        self.cost_reserve = cost_reserve
+        self.max_wait_seconds = max_wait_seconds
+        self.usage = GraphQLUsage()
+
+    async def iter_pull_requests(self, owner: str, repo: str) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of pull requests, each with a nested `reviews` list.
+
+        Each pull request carries `reviews_complete`; it is False when the PR
+        has more reviews than `reviews_per_pr` and the caller should fetch
+        the rest separately.
+        """
+        cursor = None
+        page_size = self.page_size
+
+        while True:
+            variables = {
+                "owner": owner,
+                "name": repo,
+                "first": page_size,
+                "after": cursor,
+                "reviewsFirst": self.reviews_per_pr,
+            }
+            try:
+                data = await self.gh.graphql(PULL_REQUESTS_QUERY, variables)
+            except GitHubGraphQLError as e:
+                self.usage.requests += 1
+                if e.retryable and page_size > self.MIN_PAGE_SIZE:
+                    page_size = max(self.MIN_PAGE_SIZE, page_size // 2)
+                    logger.info(f"GraphQL page failed for {owner}/{repo}, retrying with {page_size} PRs: {e}")
+                    continue
+                raise
+
+            self.usage.requests += 1
+            await self._account(data.get("rateLimit"))
+
+            connection = (data.get("repository") or {}).get("pullRequests") or {}
+            nodes = [n for n in connection.get("nodes") or [] if n]
+            if nodes:
+                yield [self._normalize_pull_request(n) for n in nodes]
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+
+    async def _account(self, rate_limit: dict | None) -> None:
+        """Record the cost of a page and pause if the next would exhaust the budget."""
+        if not rate_limit:
+            return
+
+        cost = rate_limit.get("cost") or 0
+        self.usage.cost += cost
+        self.usage.remaining = rate_limit.get("remaining")
+        reset_at = rate_limit.get("resetAt")
+        if reset_at:
+            self.usage.reset_at = datetime.fromisoformat(reset_at.replace("Z", "+00:00"))
+
+        if self.usage.remaining is None or self.usage.remaining - cost >= self.cost_reserve:
+            return
+
+        wait = 0.0
+        if self.usage.reset_at:
+            wait = (self.usage.reset_at - datetime.now(timezone.utc)).total_seconds()
+        wait = min(max(wait, 0.0), self.max_wait_seconds)
+        if wait > 0:
+            logger.info(
+                f"GraphQL rate limit low ({self.usage.remaining} remaining), "
+                f"waiting {wait:.0f}s until reset"
+            )
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _normalize_user(author: dict | None) -> dict[str, Any]:
+        if not author:
+            return {}
+        return {"id": author.get("databaseId"), "login": author.get("login")}
+
+    def _normalize_pull_request(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Convert a GraphQL pull request node to the REST payload shape."""
+        reviews = node.get("reviews") or {}
+        review_nodes = [r for r in reviews.get("nodes") or [] if r]
+
+        return {
+            "id": node.get("databaseId"),
+            "number": node.get("number"),
+            "title": node.get("title"),
+            "state": "open" if node.get("state") == "OPEN" else "closed",
+            "created_at": node.get("createdAt"),
+            "updated_at": node.get("updatedAt"),
+            "merged_at": node.get("mergedAt"),
+            "closed_at": node.get("closedAt"),
+            "additions": node.get("additions") or 0,
+            "deletions": node.get("deletions") or 0,
+            "changed_files": node.get("changedFiles") or 0,
+            "commits": (node.get("commits") or {}).get("totalCount", 0),
+            "comments": (node.get("comments") or {}).get("totalCount", 0),
+            "review_comments": sum(
+                (r.get("comments") or {}).get("totalCount", 0) for r in review_nodes
+            ),
+            "user": self._normalize_user(node.get("author")),
+            "reviews": [
+                {
+                    "id": r.get("databaseId"),
+                    "state": r.get("state"),
+                    "body": r.get("body"),
+                    "submitted_at": r.get("submittedAt"),
+                    "user": self._normalize_user(r.get("author")),
+                }
+                for r in review_nodes
+            ],
+            "reviews_complete": reviews.get("totalCount", 0) <= len(review_nodes),
+        }
@@ -1,12 +1,18 @@
 """GitHub API integration service."""
 
-from typing import Any
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.schemas.auth import GitHubAuthResponse, GitHubUserInfo
 
+if TYPE_CHECKING:
+    from aexy.cache.github_etag_cache import GitHubETagCache
+    from aexy.services.github_rate_limiter import GitHubRateLimiter
+
 
 class GitHubServiceError(Exception):
     """Base exception for GitHub service errors."""
@@ -26,13 +32,40 @@ class GitHubAPIError(GitHubServiceError):
     pass
 
 
+class GitHubGraphQLError(GitHubAPIError):
+    """Error from the GitHub GraphQL API.
+
+    `retryable` is set for timeouts and node/resource limit errors, which
+    usually succeed with a smaller page size.
+    """
+
+    def __init__(self, message: str, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
 class GitHubService:
     """Service for interacting with GitHub API."""
 
-    def __init__(self, access_token: str | None = None) -> None:
-        """Initialize GitHub service."""
+    def __init__(
+        self,
+        access_token: str | None = None,
+        etag_cache: "GitHubETagCache | None" = None,
+        rate_limiter: "GitHubRateLimiter | None" = None,
+    ) -> None:
+        """Initialize GitHub service.
+
+        Args:
+            access_token: OAuth or installation token.
+            etag_cache: When set, list endpoints send If-None-Match and reuse
+                cached bodies on 304, which does not count against quota.
+            rate_limiter: When set, every request waits for rate limit budget
+                and every response records the rate limit headers.
+        """
         self.settings = get_settings()
         self.access_token = access_token
+        self.etag_cache = etag_cache
+        self.rate_limiter = rate_limiter
         self._client: httpx.AsyncClient | None = None
 
     def _check_response(self, response: httpx.Response, action: str) -> None:
@@ -48,13 +81,59 @@ class GitHubService:
         if self.access_token:
             headers["Authorization"] = f"Bearer {self.access_token}"
 
+        event_hooks: dict[str, list] = {}
+        if self.rate_limiter and self.access_token:
+            event_hooks = {
+                "request": [self._wait_for_rate_limit],
+                "response": [self._record_rate_limit],
+            }
+
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=self.settings.github_api_base_url,
             headers=headers,
             timeout=30.0,
+            event_hooks=event_hooks,
         )
         return self
 
+    async def _wait_for_rate_limit(self, request: httpx.Request) -> None:
+        await self.rate_limiter.check_and_wait(self.access_token)
+
+    async def _record_rate_limit(self, response: httpx.Response) -> None:
+        await self.rate_limiter.record_rate_limit(self.access_token, dict(response.headers))
+
+    async def _get_conditional(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        action: str,
+    ) -> Any:
+        """GET a JSON resource, revalidating against the ETag cache if configured."""
+        cache_key = None
+        cached = None
+        headers = {}
+        if self.etag_cache is not None:
+            cache_key = self.etag_cache.make_key(self.access_token, path, params)
+            cached = await self.etag_cache.get(cache_key)
+            if cached:
+                headers["If-None-Match"] = cached["etag"]
+
+        response = await self._client.get(path, params=params, headers=headers)
+        self._check_response(response, action)
+
+        if response.status_code == 304 and cached:
+            return cached["body"]
+
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to {action}: {response.text}")
+
+        data = response.json()
+        etag = response.headers.get("etag")
+        if cache_key and etag:
+            await self.etag_cache.set(cache_key, etag, data)
+        return data
+
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
         if self._client:
@@ -73,7 +152,7 @@ class GitHubService:
 
     async def exchange_code_for_token(self, code: str) -> GitHubAuthResponse:
         """Exchange authorization code for access token."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 f"{self.settings.github_oauth_url}/access_token",
                 data={
@@ -159,22 +238,23 @@ class GitHubService:
         author: str | None = None,
         per_page: int = 100,
         page: int = 1,
+        since: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        """Get commits from a repository."""
+        """Get commits from a repository, optionally only those after `since`."""
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
         params: dict[str, Any] = {"per_page": per_page, "page": page}
         if author:
             params["author"] = author
+        if since:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            params["since"] = since.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/commits", params=params)
-        self._check_response(response, "get commits")
-
-        if response.status_code != 200:
-            raise GitHubAPIError(f"Failed to get commits: {response.text}")
-
-        return response.json()
+        return await self._get_conditional(
+            f"/repos/{owner}/{repo}/commits", params, "get commits"
+        )
 
     async def get_commit_details(self, owner: str, repo: str, sha: str) -> dict[str, Any]:
         """Get detailed commit information including file changes."""
@@ -189,6 +269,46 @@ class GitHubService:
 
         return response.json()
 
+    def _graphql_url(self) -> str:
+        base = self.settings.github_api_base_url.rstrip("/")
+        # GitHub Enterprise serves REST at /api/v3 and GraphQL at /api/graphql
+        if base.endswith("/v3"):
+            return base[: -len("/v3")] + "/graphql"
+        return base + "/graphql"
+
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Run a GraphQL query and return its `data` object."""
+        if not self._client:
+            raise GitHubServiceError("Service not initialized. Use async context manager.")
+
+        response = await self._client.post(
+            self._graphql_url(),
+            json={"query": query, "variables": variables or {}},
+        )
+        self._check_response(response, "graphql query")
+
+        if response.status_code in (502, 504):
+            raise GitHubGraphQLError(
+                f"GraphQL query timed out ({response.status_code})", retryable=True
+            )
+        if response.status_code != 200:
+            raise GitHubAPIError(f"Failed to run graphql query: {response.text}")
+
+        payload = response.json()
+        errors = payload.get("errors")
+        if errors and not payload.get("data"):
+            retryable = any(
+                e.get("type") in ("MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED")
+                for e in errors
+            )
+            raise GitHubGraphQLError(f"GraphQL query failed: {errors}", retryable=retryable)
+
+        return payload.get("data") or {}
+
     async def get_pull_requests(
         self,
         owner: str,
@@ -201,16 +321,11 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(
+        return await self._get_conditional(
             f"/repos/{owner}/{repo}/pulls",
-            params={"state": state, "per_page": per_page, "page": page},
+            {"state": state, "per_page": per_page, "page": page},
+            "get pull requests",
         )
-        self._check_response(response, "get pull requests")
-
-        if response.status_code != 200:
-            raise GitHubAPIError(f"Failed to get pull requests: {response.text}")
-
-        return response.json()
 
     async def get_pull_request_reviews(
         self,
@@ -222,13 +337,9 @@ class GitHubService:
         if not self._client:
             raise GitHubServiceError("Service not initialized. Use async context manager.")
 
-        response = await self._client.get(f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews")
-        self._check_response(response, "get PR reviews")
-
-        if response.status_code != 200:
-            raise GitHubAPIError(f"Failed to get PR reviews: {response.text}")
-
-        return response.json()
+        return await self._get_conditional(
+            f"/repos/{owner}/{repo}/pulls/{pull_number}/reviews", None, "get PR reviews"
+        )
 
     # Organization methods
 
@@ -379,6 +379,7 @@ class GitHubSyncService:
         Returns the commit SHA.
         """
         import httpx
+        from aexy.core.http_clients import get_http_transport
 
         url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}"
         headers = {
@@ -398,7 +399,7 @@ class GitHubSyncService:
         if sha:
             data["sha"] = sha
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.put(url, headers=headers, json=data)
             response.raise_for_status()
             result = response.json()
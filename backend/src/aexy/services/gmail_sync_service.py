@@ -1,17 +1,22 @@
 """Gmail Sync Service for syncing emails from Google."""
 
+import asyncio
 import base64
+import json
 import logging
+import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from email.utils import parseaddr
 from typing import Any
+from uuid import uuid4
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.google_integration import (
     EmailSyncCursor,
     GoogleIntegration,
@@ -19,6 +24,7 @@ from aexy.models.google_integration import (
     SyncedEmailRecordLink,
 )
 from aexy.models.crm import CRMRecord, CRMObject, CRMObjectType, CRMRecordRelation
+from aexy.services.contact_enrichment_service import ContactEnrichmentQueue
 
 logger = logging.getLogger(__name__)
 
@@ -49,181 +55,31 @@ async def auto_enrich_contact_from_email(
 
     Also creates company record from email domain if applicable.
     Returns a tuple of (contact_record, company_record).
+
+    This enriches a single email; syncs enqueue emails on a
+    ContactEnrichmentQueue instead so senders are enriched in batches.
     """
     if not from_email:
         return None, None
 
-    # Skip common personal email domains
-    personal_domains = {"gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com", "aol.com", "protonmail.com"}
-    domain = from_email.split("@")[1].lower() if "@" in from_email else None
-
     # Skip if it's likely the user's own email
+    own_email = None
     try:
         int_result = await db.execute(
             select(GoogleIntegration).where(GoogleIntegration.workspace_id == workspace_id)
         )
         integration = int_result.scalar_one_or_none()
-        if integration and integration.google_email and from_email.lower() == integration.google_email.lower():
-            return None, None
+        own_email = integration.google_email if integration else None
     except Exception:
         pass
 
-    # Get the Person object type
-    person_obj_result = await db.execute(
-        select(CRMObject).where(
-            CRMObject.workspace_id == workspace_id,
-            CRMObject.slug == "person",
-        )
-    )
-    person_obj = person_obj_result.scalar_one_or_none()
-
-    if not person_obj:
-        # No person object type configured, skip enrichment
+    queue = ContactEnrichmentQueue(db, workspace_id, batch_size=1, own_email=own_email)
+    queue.enqueue(synced_email)
+    batch = await queue.flush()
+    if not batch.enriched:
         return None, None
-
-    # Get the Company object type
-    company_obj_result = await db.execute(
-        select(CRMObject).where(
-            CRMObject.workspace_id == workspace_id,
-            CRMObject.slug == "company",
-        )
-    )
-    company_obj = company_obj_result.scalar_one_or_none()
-
-    # Create company from domain if not a personal email
-    company_record = None
-    if company_obj and domain and domain not in personal_domains:
-        # Check if company with this domain exists
-        company_records_result = await db.execute(
-            select(CRMRecord).where(
-                CRMRecord.workspace_id == workspace_id,
-                CRMRecord.object_id == company_obj.id,
-            )
-        )
-        company_records = company_records_result.scalars().all()
-
-        for record in company_records:
-            if record.values:
-                record_domain = record.values.get("domain", "").lower()
-                record_website = record.values.get("website", "").lower()
-                if domain == record_domain or domain in record_website:
-                    company_record = record
-                    break
-
-        if not company_record:
-            # Create a new company from domain
-            from uuid import uuid4
-
-            company_name = domain.split(".")[0].title()  # Simple name from domain
-            company_record = CRMRecord(
-                id=str(uuid4()),
-                workspace_id=workspace_id,
-                object_id=company_obj.id,
-                display_name=company_name[:500],
-                values={
-                    "name": company_name,
-                    "domain": domain,
-                    "website": f"https://{domain}",
-                },
-                source="email_sync",
-            )
-            db.add(company_record)
-            # Update object record count
-            company_obj.record_count = (company_obj.record_count or 0) + 1
-            await db.flush()
-            logger.info(f"Auto-created company {company_name} from email domain")
-
-    # Check if a person record already exists with this email
-    person_records_result = await db.execute(
-        select(CRMRecord).where(
-            CRMRecord.workspace_id == workspace_id,
-            CRMRecord.object_id == person_obj.id,
-        )
-    )
-    person_records = person_records_result.scalars().all()
-
-    # Find person with matching email
-    existing_record = None
-    for record in person_records:
-        if record.values:
-            for key, value in record.values.items():
-                if isinstance(value, str) and value.lower() == from_email.lower():
-                    existing_record = record
-                    break
-        if existing_record:
-            break
-
-    if not existing_record:
-        # Create a new person record
-        from uuid import uuid4
-
-        # Parse the name
-        first_name, last_name = None, None
-        if from_name:
-            name_parts = from_name.strip().split(" ", 1)
-            first_name = name_parts[0] if name_parts else None
-            last_name = name_parts[1] if len(name_parts) > 1 else None
-
-        values = {
-            "email": from_email,
-        }
-        if first_name:
-            values["first_name"] = first_name
-        if last_name:
-            values["last_name"] = last_name
-        if from_name:
-            values["name"] = from_name
-
-        display_name = from_name or from_email
-
-        existing_record = CRMRecord(
-            id=str(uuid4()),
-            workspace_id=workspace_id,
-            object_id=person_obj.id,
-            display_name=display_name[:500],
-            values=values,
-            source="email_sync",
-        )
-        db.add(existing_record)
-        # Update object record count
-        person_obj.record_count = (person_obj.record_count or 0) + 1
-        await db.flush()
-        logger.info(f"Auto-created contact {display_name} from email sync")
-
-        # Link person to company if we have one
-        if company_record:
-            from aexy.models.crm import CRMRecordRelation
-
-            relation = CRMRecordRelation(
-                id=str(uuid4()),
-                source_record_id=existing_record.id,
-                target_record_id=company_record.id,
-                relation_type="works_at",
-            )
-            db.add(relation)
-
-    # Link the email to this person record
-    link_result = await db.execute(
-        select(SyncedEmailRecordLink).where(
-            SyncedEmailRecordLink.email_id == synced_email.id,
-            SyncedEmailRecordLink.record_id == existing_record.id,
-        )
-    )
-    existing_link = link_result.scalar_one_or_none()
-
-    if not existing_link:
-        from uuid import uuid4 as uuid4_link
-
-        link = SyncedEmailRecordLink(
-            id=str(uuid4_link()),
-            email_id=synced_email.id,
-            record_id=existing_record.id,
-            link_type="from",
-            confidence=1.0,
-        )
-        db.add(link)
-
-    return existing_record, company_record
+    _, contact_record, company_record = batch.enriched[0]
+    return contact_record, company_record
 
 
 async def auto_create_or_update_deal_from_email(
@@ -497,33 +353,13 @@ async def _find_company_for_email(
     domain: str,
 ) -> CRMRecord | None:
     """Find an existing company record for a given domain."""
-    company_obj_result = await db.execute(
-        select(CRMObject).where(
-            CRMObject.workspace_id == workspace_id,
-            CRMObject.slug == "company",
-        )
-    )
-    company_obj = company_obj_result.scalar_one_or_none()
-
+    queue = ContactEnrichmentQueue(db, workspace_id)
+    _, company_obj = await queue.load_objects()
     if not company_obj:
         return None
 
-    company_records_result = await db.execute(
-        select(CRMRecord).where(
-            CRMRecord.workspace_id == workspace_id,
-            CRMRecord.object_id == company_obj.id,
-        )
-    )
-    company_records = company_records_result.scalars().all()
-
-    for record in company_records:
-        if record.values:
-            record_domain = record.values.get("domain", "").lower()
-            record_website = record.values.get("website", "").lower()
-            if domain == record_domain or domain in record_website:
-                return record
-
-    return None
+    companies = await queue.resolve_companies(company_obj, [domain.lower()])
+    return companies.get(domain.lower())
 
 
 settings = get_settings()
@@ -539,6 +375,74 @@ GMAIL_SCOPES = [
     "https://www.googleapis.com/auth/gmail.modify",
 ]
 
+# Gmail batch endpoint; each batch carries up to 100 calls
+GMAIL_BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+GMAIL_BATCH_SIZE = 100
+# Batch requests in flight at once
+GMAIL_BATCH_CONCURRENCY = 4
+# Attempts for calls that are rate limited or fail server-side
+GMAIL_BATCH_RETRIES = 3
+# Message list page size (Gmail maximum)
+GMAIL_LIST_PAGE_SIZE = 500
+# Headers requested by the metadata-only first pass
+METADATA_HEADERS = ["From", "To", "Cc", "Subject", "Date", "Content-Type"]
+# Emails resolved to CRM records per query in link_emails_to_records
+LINK_BATCH_SIZE = 500
+
+_CONTENT_ID_ITEM = re.compile(r"item(\d+)")
+
+
+def build_batch_body(paths: list[str], boundary: str) -> str:
+    """Build a multipart/mixed Gmail batch body of GET requests."""
+    parts = [
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <item{i}>\r\n"
+        "\r\n"
+        f"GET {path}\r\n"
+        "\r\n"
+        for i, path in enumerate(paths)
+    ]
+    return "".join(parts) + f"--{boundary}--\r\n"
+
+
+def parse_batch_response(content_type: str, body: str) -> dict[int, tuple[int, Any]]:
+    """Parse a Gmail batch response into ``{request index: (status, json body)}``.
+
+    Each part is an embedded HTTP response whose ``Content-ID`` echoes the
+    request's (``<response-item3>`` for ``<item3>``).
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        raise GmailSyncError("Gmail batch response has no multipart boundary")
+
+    results: dict[int, tuple[int, Any]] = {}
+    for part in body.replace("\r\n", "\n").split(f"--{match.group(1)}"):
+        part = part.strip()
+        if not part or part == "--":
+            continue
+        part_headers, _, http_response = part.partition("\n\n")
+        item = _CONTENT_ID_ITEM.search(part_headers)
+        status_line, _, rest = http_response.partition("\n")
+        if not item or len(status_line.split()) < 2:
+            continue
+        _, _, payload = rest.partition("\n\n")
+        try:
+            data = json.loads(payload) if payload.strip() else None
+        except json.JSONDecodeError:
+            data = None
+        results[int(item.group(1))] = (int(status_line.split()[1]), data)
+    return results
+
+
+def history_message_ids(history: list[dict]) -> list[str]:
+    """Unique IDs of messages added in Gmail history records, in order."""
+    return list(dict.fromkeys(
+        msg_added["message"]["id"]
+        for record in history
+        for msg_added in record.get("messagesAdded", [])
+    ))
+
 
 class GmailSyncError(Exception):
     """Gmail sync error."""
@@ -557,6 +461,69 @@ class GmailSyncService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self._enrichment_queue: ContactEnrichmentQueue | None = None
+
+    def _get_enrichment_queue(self, integration: GoogleIntegration) -> ContactEnrichmentQueue:
+        """Get or create the queue that batches contact enrichment for synced emails."""
+        if self._enrichment_queue is None:
+            self._enrichment_queue = ContactEnrichmentQueue(
+                self.db,
+                integration.workspace_id,
+                own_email=integration.google_email,
+            )
+        return self._enrichment_queue
+
+    async def flush_enrichment(self, integration: GoogleIntegration) -> None:
+        """Enrich the senders of queued emails and create deals for them.
+
+        Called automatically whenever the queue fills up; sync loops call it
+        once more when they finish.
+        """
+        queue = self._enrichment_queue
+        emails = queue.pending if queue else []
+        if not emails:
+            return
+
+        try:
+            batch = await queue.flush()
+        except Exception as e:
+            # Don't fail sync if enrichment fails; isolate the failing sender
+            logger.warning(
+                f"Failed to auto-enrich {len(emails)} emails as a batch, retrying per sender: {e}"
+            )
+            batch = await queue.flush_per_sender()
+
+        # Auto-create deals from emails if enabled
+        sync_settings = integration.sync_settings or {}
+        deal_settings = {**DEFAULT_DEAL_SETTINGS, **sync_settings.get("deal_settings", {})}
+        if not deal_settings.get("auto_create_deals", False):
+            return
+
+        # AI and body-keyword deal checks read the body, which sync fetches lazily
+        mode = deal_settings.get("deal_creation_mode", "auto")
+        if mode == "ai" or (mode == "criteria" and deal_settings.get("criteria", {}).get("body_keywords")):
+            try:
+                await self.fetch_bodies(integration, emails)
+            except GmailAuthError:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to fetch email bodies for deal checks: {e}")
+
+        records = {email.id: (contact, company) for email, contact, company in batch.enriched}
+        for synced_email in emails:
+            contact_record, company_record = records.get(synced_email.id, (None, None))
+            try:
+                await auto_create_or_update_deal_from_email(
+                    db=self.db,
+                    workspace_id=integration.workspace_id,
+                    synced_email=synced_email,
+                    contact_record=contact_record,
+                    company_record=company_record,
+                    deal_settings=deal_settings,
+                )
+            except Exception as e:
+                # Don't fail sync if deal creation fails
+                logger.warning(f"Failed to auto-create deal from email: {e}")
 
     async def _refresh_token_if_needed(
         self, integration: GoogleIntegration
@@ -575,7 +542,7 @@ class GmailSyncService:
         if not integration.refresh_token:
             raise GmailAuthError("No refresh token available")
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -604,12 +571,17 @@ class GmailSyncService:
         integration: GoogleIntegration,
         method: str,
         endpoint: str,
+        access_token: str | None = None,
         **kwargs,
     ) -> dict:
-        """Make an authenticated request to the Gmail API."""
-        access_token = await self._refresh_token_if_needed(integration)
+        """Make an authenticated request to the Gmail API.
+
+        Pass *access_token* to skip the refresh check (and its flush), e.g.
+        for requests that run concurrently with database work.
+        """
+        access_token = access_token or await self._refresh_token_if_needed(integration)
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.request(
                 method,
                 f"{GMAIL_API_BASE}{endpoint}",
@@ -626,6 +598,139 @@ class GmailSyncService:
 
             return response.json()
 
+    async def _batch_get(self, access_token: str, paths: list[str]) -> list[tuple[int, Any]]:
+        """Send up to GMAIL_BATCH_SIZE GET requests as one Gmail batch request.
+
+        Returns ``(status, body)`` for each path, in order.
+        """
+        boundary = f"batch_{uuid4().hex}"
+        async with httpx.AsyncClient(transport=get_http_transport(), timeout=60.0) as client:
+            response = await client.post(
+                GMAIL_BATCH_URL,
+                content=build_batch_body(paths, boundary),
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Content-Type": f"multipart/mixed; boundary={boundary}",
+                },
+            )
+
+        if response.status_code == 401:
+            raise GmailAuthError("Gmail authentication failed")
+        if response.status_code >= 400:
+            logger.error(f"Gmail batch error: {response.status_code} - {response.text[:500]}")
+            raise GmailSyncError(f"Gmail API error: {response.status_code}")
+
+        parts = parse_batch_response(response.headers.get("content-type", ""), response.text)
+        return [parts.get(i, (500, None)) for i in range(len(paths))]
+
+    async def fetch_messages(
+        self,
+        integration: GoogleIntegration,
+        message_ids: list[str],
+        format: str = "metadata",
+    ) -> dict[str, dict]:
+        """Fetch messages by ID with Gmail batch requests.
+
+        Up to GMAIL_BATCH_SIZE messages go in each batch, and up to
+        GMAIL_BATCH_CONCURRENCY batches are in flight at once. ``metadata``
+        fetches only the headers sync needs; ``full`` includes the body.
+        Rate-limited and failed calls are retried; messages that still
+        fail are logged and left out of the result.
+        """
+        if format == "metadata":
+            query = "format=metadata" + "".join(f"&metadataHeaders={h}" for h in METADATA_HEADERS)
+        else:
+            query = f"format={format}"
+
+        access_token = await self._refresh_token_if_needed(integration)
+        semaphore = asyncio.Semaphore(GMAIL_BATCH_CONCURRENCY)
+
+        async def fetch_chunk(chunk: list[str]) -> list[tuple[int, Any]]:
+            async with semaphore:
+                try:
+                    return await self._batch_get(
+                        access_token, [f"/gmail/v1/users/me/messages/{mid}?{query}" for mid in chunk]
+                    )
+                except GmailAuthError:
+                    raise
+                except (GmailSyncError, httpx.HTTPError) as e:
+                    logger.warning(f"Gmail batch of {len(chunk)} messages failed: {e}")
+                    return [(503, None)] * len(chunk)
+
+        messages: dict[str, dict] = {}
+        pending = list(dict.fromkeys(message_ids))
+        for attempt in range(GMAIL_BATCH_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                await asyncio.sleep(2 ** attempt)
+
+            chunks = [pending[i:i + GMAIL_BATCH_SIZE] for i in range(0, len(pending), GMAIL_BATCH_SIZE)]
+            results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+            pending = []
+            for chunk, chunk_results in zip(chunks, results):
+                for message_id, (status, body) in zip(chunk, chunk_results):
+                    if status == 200 and body:
+                        messages[message_id] = body
+                    elif status == 401:
+                        raise GmailAuthError("Gmail authentication failed")
+                    elif status == 429 or status >= 500:
+                        pending.append(message_id)
+                    else:
+                        logger.error(f"Failed to fetch message {message_id}: {status}")
+
+        if pending:
+            logger.error(f"Gave up fetching {len(pending)} messages after {GMAIL_BATCH_RETRIES} attempts")
+        return messages
+
+    async def iter_message_pages(
+        self,
+        integration: GoogleIntegration,
+        page_token: str | None,
+        max_messages: int,
+    ) -> AsyncIterator[tuple[list[str], str | None]]:
+        """Yield ``(message_ids, next_page_token)`` for INBOX list pages.
+
+        The next page is listed while the caller processes the current one.
+        """
+        remaining = max_messages
+        if remaining <= 0:
+            return
+
+        async def list_page(token: str | None, access_token: str) -> dict:
+            params: dict[str, Any] = {
+                "maxResults": min(GMAIL_LIST_PAGE_SIZE, remaining),
+                "labelIds": ["INBOX"],
+            }
+            if token:
+                params["pageToken"] = token
+            return await self._make_gmail_request(
+                integration, "GET", "/users/me/messages", access_token=access_token, params=params
+            )
+
+        access_token = await self._refresh_token_if_needed(integration)
+        next_page: asyncio.Task | None = asyncio.create_task(list_page(page_token, access_token))
+        try:
+            while next_page:
+                response = await next_page
+                next_page = None
+
+                message_ids = [m["id"] for m in response.get("messages", [])][:remaining]
+                if not message_ids:
+                    return
+                remaining -= len(message_ids)
+
+                page_token = response.get("nextPageToken")
+                if page_token and remaining > 0:
+                    access_token = await self._refresh_token_if_needed(integration)
+                    next_page = asyncio.create_task(list_page(page_token, access_token))
+
+                yield message_ids, page_token
+        finally:
+            if next_page:
+                next_page.cancel()
+
     async def get_or_create_sync_cursor(
         self, integration: GoogleIntegration
     ) -> EmailSyncCursor:
@@ -663,50 +768,20 @@ class GmailSyncService:
 
         cursor.full_sync_started_at = datetime.now(timezone.utc)
         messages_synced = 0
-        page_token = cursor.next_page_token
 
         try:
-            # Get list of messages
-            params: dict[str, Any] = {
-                "maxResults": min(100, max_messages),
-                "labelIds": ["INBOX"],  # Start with inbox only
-            }
-            if page_token:
-                params["pageToken"] = page_token
-
-            while messages_synced < max_messages:
-                response = await self._make_gmail_request(
-                    integration,
-                    "GET",
-                    "/users/me/messages",
-                    params=params,
-                )
-
-                messages = response.get("messages", [])
-                if not messages:
-                    break
-
-                # Fetch and store each message
-                for msg_info in messages:
-                    try:
-                        await self._sync_message(integration, msg_info["id"])
-                        messages_synced += 1
-                    except Exception as e:
-                        logger.error(f"Failed to sync message {msg_info['id']}: {e}")
-                        continue
-
-                    if messages_synced >= max_messages:
-                        break
+            async for message_ids, page_token in self.iter_message_pages(
+                integration, cursor.next_page_token, max_messages
+            ):
+                messages_synced += await self.sync_messages(integration, message_ids)
 
-                # Get next page token
-                page_token = response.get("nextPageToken")
                 if not page_token:
                     cursor.full_sync_completed = True
                     cursor.full_sync_completed_at = datetime.now(timezone.utc)
-                    break
+                else:
+                    cursor.next_page_token = page_token
 
-                cursor.next_page_token = page_token
-                params["pageToken"] = page_token
+            await self.flush_enrichment(integration)
 
             # Get history ID for incremental sync
             profile_response = await self._make_gmail_request(
@@ -748,7 +823,6 @@ class GmailSyncService:
             # No history ID - need full sync first
             return await self.start_full_sync(integration)
 
-        messages_synced = 0
         try:
             # Get history since last sync
             response = await self._make_gmail_request(
@@ -761,21 +835,11 @@ class GmailSyncService:
                 },
             )
 
-            history = response.get("history", [])
             new_history_id = response.get("historyId")
-
-            # Process each history record
-            seen_message_ids = set()
-            for record in history:
-                for msg_added in record.get("messagesAdded", []):
-                    msg_id = msg_added["message"]["id"]
-                    if msg_id not in seen_message_ids:
-                        seen_message_ids.add(msg_id)
-                        try:
-                            await self._sync_message(integration, msg_id)
-                            messages_synced += 1
-                        except Exception as e:
-                            logger.error(f"Failed to sync message {msg_id}: {e}")
+            messages_synced = await self.sync_messages(
+                integration, history_message_ids(response.get("history", []))
+            )
+            await self.flush_enrichment(integration)
 
             # Update cursor
             if new_history_id:
@@ -799,31 +863,83 @@ class GmailSyncService:
                 return await self.start_full_sync(integration)
             raise
 
-    async def _sync_message(
-        self, integration: GoogleIntegration, message_id: str
-    ) -> SyncedEmail:
-        """Fetch and store a single message."""
-        # Check if already synced
+    async def sync_messages(
+        self, integration: GoogleIntegration, message_ids: list[str]
+    ) -> int:
+        """Store the given messages, skipping ones that are already synced.
+
+        New messages are fetched as metadata (headers, snippet, labels) in
+        batch requests and written with one flush; bodies are fetched later
+        by :meth:`fetch_bodies` when something needs them.
+
+        Returns how many of the messages are now stored.
+        """
+        message_ids = list(dict.fromkeys(message_ids))
+        if not message_ids:
+            return 0
+
         result = await self.db.execute(
-            select(SyncedEmail).where(SyncedEmail.gmail_id == message_id)
+            select(SyncedEmail.gmail_id).where(SyncedEmail.gmail_id.in_(message_ids))
         )
-        existing = result.scalar_one_or_none()
-        if existing:
-            return existing
+        existing = set(result.scalars().all())
+        new_ids = [message_id for message_id in message_ids if message_id not in existing]
+
+        messages = await self.fetch_messages(integration, new_ids) if new_ids else {}
+        synced_emails = [
+            self._build_synced_email(integration, message_id, messages[message_id])
+            for message_id in new_ids
+            if message_id in messages
+        ]
+        if synced_emails:
+            self.db.add_all(synced_emails)
+            await self.db.flush()
 
-        # Fetch full message
-        message = await self._make_gmail_request(
-            integration,
-            "GET",
-            f"/users/me/messages/{message_id}",
-            params={"format": "full"},
+        # Contacts, companies and deals are created when the enrichment batch flushes
+        queue = self._get_enrichment_queue(integration)
+        for synced_email in synced_emails:
+            if queue.enqueue(synced_email):
+                await self.flush_enrichment(integration)
+
+        return len(existing) + len(synced_emails)
+
+    async def fetch_bodies(
+        self, integration: GoogleIntegration, emails: list[SyncedEmail]
+    ) -> int:
+        """Fetch and store full bodies for emails synced as metadata only.
+
+        Returns the number of emails updated.
+        """
+        missing = [email for email in emails if email.body_fetched_at is None]
+        if not missing:
+            return 0
+
+        messages = await self.fetch_messages(
+            integration, [email.gmail_id for email in missing], format="full"
         )
+        fetched_at = datetime.now(timezone.utc)
+        updated = 0
+        for email in missing:
+            message = messages.get(email.gmail_id)
+            if message is None:
+                continue
+            payload = message.get("payload", {})
+            email.body_text, email.body_html = self._extract_body(payload)
+            email.has_attachments = self._has_attachments(payload)
+            email.body_fetched_at = fetched_at
+            updated += 1
+
+        await self.db.flush()
+        return updated
 
-        # Parse message
+    def _build_synced_email(
+        self, integration: GoogleIntegration, message_id: str, message: dict
+    ) -> SyncedEmail:
+        """Build a synced email record from a metadata-format message."""
         email_data = self._parse_message(message)
+        labels = message.get("labelIds") or []
+        content_type = (email_data.get("content_type") or "").lower()
 
-        # Create synced email record
-        synced_email = SyncedEmail(
+        return SyncedEmail(
             workspace_id=integration.workspace_id,
             integration_id=integration.id,
             gmail_id=message_id,
@@ -834,53 +950,14 @@ class GmailSyncService:
             to_emails=email_data.get("to_emails"),
             cc_emails=email_data.get("cc_emails"),
             snippet=message.get("snippet"),
-            body_text=email_data.get("body_text"),
-            body_html=email_data.get("body_html"),
             labels=message.get("labelIds"),
-            is_read="UNREAD" not in (message.get("labelIds") or []),
-            is_starred="STARRED" in (message.get("labelIds") or []),
-            has_attachments=email_data.get("has_attachments", False),
+            is_read="UNREAD" not in labels,
+            is_starred="STARRED" in labels,
+            # Refined from the MIME parts once the body is fetched
+            has_attachments=content_type.startswith("multipart/mixed"),
             gmail_date=email_data.get("date"),
         )
 
-        self.db.add(synced_email)
-        await self.db.flush()
-
-        # Auto-enrich: create contact and company from email sender if not exists
-        contact_record = None
-        company_record = None
-        try:
-            contact_record, company_record = await auto_enrich_contact_from_email(
-                db=self.db,
-                workspace_id=integration.workspace_id,
-                from_email=email_data.get("from_email"),
-                from_name=email_data.get("from_name"),
-                synced_email=synced_email,
-            )
-        except Exception as e:
-            # Don't fail sync if enrichment fails
-            logger.warning(f"Failed to auto-enrich contact from email: {e}")
-
-        # Auto-create deal from email if enabled
-        try:
-            sync_settings = integration.sync_settings or {}
-            deal_settings = {**DEFAULT_DEAL_SETTINGS, **sync_settings.get("deal_settings", {})}
-
-            if deal_settings.get("auto_create_deals", False):
-                await auto_create_or_update_deal_from_email(
-                    db=self.db,
-                    workspace_id=integration.workspace_id,
-                    synced_email=synced_email,
-                    contact_record=contact_record,
-                    company_record=company_record,
-                    deal_settings=deal_settings,
-                )
-        except Exception as e:
-            # Don't fail sync if deal creation fails
-            logger.warning(f"Failed to auto-create deal from email: {e}")
-
-        return synced_email
-
     def _parse_message(self, message: dict) -> dict:
         """Parse Gmail message into structured data."""
         payload = message.get("payload", {})
@@ -924,6 +1001,7 @@ class GmailSyncService:
             "body_text": body_text,
             "body_html": body_html,
             "has_attachments": has_attachments,
+            "content_type": headers.get("content-type"),
         }
 
     def _parse_email_list(self, header_value: str) -> list[dict]:
@@ -982,79 +1060,82 @@ class GmailSyncService:
         workspace_id: str,
         email_ids: list[str] | None = None,
     ) -> dict:
-        """Link synced emails to CRM records by email address matching."""
+        """Link synced emails to CRM records by email address matching.
+
+        A record matches an address when any of its values equals it
+        (case-insensitively). Emails are handled LINK_BATCH_SIZE at a time,
+        each batch with one query matching addresses to records and one
+        query for links that already exist.
+        """
         # Get emails to process
-        query = select(SyncedEmail).where(SyncedEmail.workspace_id == workspace_id)
+        query = select(SyncedEmail.id, SyncedEmail.from_email, SyncedEmail.to_emails).where(
+            SyncedEmail.workspace_id == workspace_id
+        )
         if email_ids:
             query = query.where(SyncedEmail.id.in_(email_ids))
 
         result = await self.db.execute(query)
-        emails = result.scalars().all()
+        emails = result.all()
 
-        # Get all records with email attributes
-        records_result = await self.db.execute(
-            select(CRMRecord)
-            .where(CRMRecord.workspace_id == workspace_id)
-            .options(selectinload(CRMRecord.object))
-        )
-        records = records_result.scalars().all()
-
-        # Build email -> record mapping
-        email_to_records: dict[str, list[CRMRecord]] = {}
-        for record in records:
-            if not record.values:
-                continue
-            # Look for email fields in record values
-            for key, value in record.values.items():
-                if isinstance(value, str) and "@" in value:
-                    email_lower = value.lower()
-                    if email_lower not in email_to_records:
-                        email_to_records[email_lower] = []
-                    email_to_records[email_lower].append(record)
+        record_values = func.jsonb_each_text(CRMRecord.values).table_valued("key", "value")
+        matched_address = func.lower(record_values.c.value)
 
         links_created = 0
-        for email in emails:
-            # Check from email
-            if email.from_email:
-                for record in email_to_records.get(email.from_email.lower(), []):
-                    await self._create_email_link(email, record, "from")
-                    links_created += 1
-
-            # Check to emails
-            for to in email.to_emails or []:
-                to_email = to.get("email", "").lower()
-                for record in email_to_records.get(to_email, []):
-                    await self._create_email_link(email, record, "to")
-                    links_created += 1
+        for start in range(0, len(emails), LINK_BATCH_SIZE):
+            batch = emails[start:start + LINK_BATCH_SIZE]
+
+            # (email_id, address, link_type) for every sender and recipient
+            wanted: list[tuple[str, str, str]] = []
+            for email_id, from_email, to_emails in batch:
+                if from_email:
+                    wanted.append((email_id, from_email.lower(), "from"))
+                for to in to_emails or []:
+                    to_email = (to.get("email") or "").lower()
+                    if to_email:
+                        wanted.append((email_id, to_email, "to"))
+            addresses = {address for _, address, _ in wanted}
+            if not addresses:
+                continue
 
-        await self.db.flush()
-        return {"links_created": links_created}
+            records_result = await self.db.execute(
+                select(CRMRecord.id, matched_address)
+                .select_from(CRMRecord)
+                .join(record_values, true())
+                .where(
+                    CRMRecord.workspace_id == workspace_id,
+                    matched_address.in_(addresses),
+                )
+            )
+            address_records: dict[str, set[str]] = {}
+            for record_id, address in records_result.all():
+                address_records.setdefault(address, set()).add(record_id)
+            if not address_records:
+                continue
 
-    async def _create_email_link(
-        self,
-        email: SyncedEmail,
-        record: CRMRecord,
-        link_type: str,
-    ) -> SyncedEmailRecordLink | None:
-        """Create a link between an email and a record if it doesn't exist."""
-        # Check if link already exists
-        result = await self.db.execute(
-            select(SyncedEmailRecordLink).where(
-                SyncedEmailRecordLink.email_id == email.id,
-                SyncedEmailRecordLink.record_id == record.id,
+            links_result = await self.db.execute(
+                select(SyncedEmailRecordLink.email_id, SyncedEmailRecordLink.record_id).where(
+                    SyncedEmailRecordLink.email_id.in_([email_id for email_id, _, _ in batch])
+                )
             )
-        )
-        if result.scalar_one_or_none():
-            return None
+            linked = set(links_result.all())
 
-        link = SyncedEmailRecordLink(
-            email_id=email.id,
-            record_id=record.id,
-            link_type=link_type,
-            confidence=1.0,
-        )
-        self.db.add(link)
-        return link
+            new_links = []
+            for email_id, address, link_type in wanted:
+                for record_id in sorted(address_records.get(address, ())):
+                    if (email_id, record_id) in linked:
+                        continue
+                    linked.add((email_id, record_id))
+                    new_links.append(SyncedEmailRecordLink(
+                        email_id=email_id,
+                        record_id=record_id,
+                        link_type=link_type,
+                        confidence=1.0,
+                    ))
+            self.db.add_all(new_links)
+            links_created += len(new_links)
+
+        await self.db.flush()
+        return {"links_created": links_created}
 
     async def send_email(
         self,
@@ -17,6 +17,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.oncall import GoogleCalendarToken, OnCallSchedule, OnCallConfig
 
 logger = logging.getLogger(__name__)
@@ -114,7 +115,7 @@ class GoogleCalendarService:
             raise GoogleCalendarAuthError(f"Invalid state parameter: {e}")
 
         # Exchange code for tokens
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -140,7 +141,7 @@ class GoogleCalendarService:
             raise GoogleCalendarAuthError("No refresh token received. Please revoke access and try again.")
 
         # Get user email
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 GOOGLE_USERINFO_URL,
                 headers={"Authorization": f"Bearer {access_token}"},
@@ -191,7 +192,7 @@ class GoogleCalendarService:
         Returns:
             Updated token with new access token.
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 GOOGLE_TOKEN_URL,
                 data={
@@ -270,7 +271,7 @@ class GoogleCalendarService:
         if not token:
             raise GoogleCalendarAuthError("No valid token available")
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 f"{GOOGLE_CALENDAR_API}/users/me/calendarList",
                 headers={"Authorization": f"Bearer {token.access_token}"},
@@ -337,7 +338,7 @@ class GoogleCalendarService:
         if attendees:
             event_body["attendees"] = [{"email": email} for email in attendees]
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 f"{GOOGLE_CALENDAR_API}/calendars/{calendar_id}/events",
                 headers={
@@ -371,7 +372,7 @@ class GoogleCalendarService:
             raise GoogleCalendarAuthError("No valid token available")
 
         # Get existing event first
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.get(
                 f"{GOOGLE_CALENDAR_API}/calendars/{calendar_id}/events/{event_id}",
                 headers={"Authorization": f"Bearer {token.access_token}"},
@@ -391,7 +392,7 @@ class GoogleCalendarService:
         if end_time is not None:
             event["end"] = {"dateTime": end_time.isoformat(), "timeZone": "UTC"}
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.put(
                 f"{GOOGLE_CALENDAR_API}/calendars/{calendar_id}/events/{event_id}",
                 headers={
@@ -416,7 +417,7 @@ class GoogleCalendarService:
         if not token:
             raise GoogleCalendarAuthError("No valid token available")
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.delete(
                 f"{GOOGLE_CALENDAR_API}/calendars/{calendar_id}/events/{event_id}",
                 headers={"Authorization": f"Bearer {token.access_token}"},
@@ -1,14 +1,27 @@
 """Data Ingestion Service for GitHub events."""
 
+import logging
 import re
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.activity import Commit, PullRequest, CodeReview
 from aexy.models.developer import Developer, GitHubConnection
+from aexy.services.code_ownership_service import CodeOwnershipService
+from aexy.services.collaboration_network import CollaborationNetworkAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT / IN (...) lookup in the bulk ingest path
+BULK_CHUNK_SIZE = 500
 
 
 # Language detection by file extension
@@ -48,9 +61,115 @@ SKILL_KEYWORDS: dict[str, list[str]] = {
 }
 
 
+def _chunks(items: list, size: int = BULK_CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _parse_timestamp(ts: str | None) -> datetime | None:
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
+@dataclass
+class DeveloperMemo:
+    """Developer IDs resolved during a sync, keyed by email and GitHub ID.
+
+    Share one memo across the bulk ingest calls of a sync so each author is
+    looked up at most once. Misses are memoized as None.
+    """
+
+    by_email: dict[str, str | None] = field(default_factory=dict)
+    by_github_id: dict[int, str | None] = field(default_factory=dict)
+
+
+@dataclass
+class IngestStats:
+    """Throughput of a bulk ingest call."""
+
+    kind: str
+    rows: int = 0
+    written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "rows": self.rows,
+            "written": self.written,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
 class IngestionService:
     """Service for ingesting GitHub data into the database."""
 
+    @staticmethod
+    def language_for_path(file_path: str) -> str | None:
+        """Language for a single file path, by extension."""
+        if "." not in file_path:
+            return None
+        return LANGUAGE_EXTENSIONS.get("." + file_path.rsplit(".", 1)[-1])
+
+    def extract_languages_bulk(self, file_lists: list[list[str]]) -> list[list[str]]:
+        """Extract languages for many file lists in one pass.
+
+        Each distinct path is classified once via a direct extension lookup,
+        which matters when the same files recur across thousands of commits.
+        """
+        seen: dict[str, str | None] = {}
+        results = []
+        for files in file_lists:
+            languages = set()
+            for file_path in files:
+                if file_path not in seen:
+                    seen[file_path] = self.language_for_path(file_path)
+                language = seen[file_path]
+                if language:
+                    languages.add(language)
+            results.append(list(languages))
+        return results
+
+    def extract_skills_bulk(self, texts: list[str]) -> list[list[str]]:
+        """Extract skill domains for many texts in one pass.
+
+        Texts are lowercased into one NUL-separated buffer and each keyword is
+        located with a single scan of that buffer, instead of testing every
+        keyword against every text. Matches are identical to
+        extract_skills_from_pr (plain substring matching).
+        """
+        if not texts:
+            return []
+
+        lowered = [t.lower() for t in texts]
+        buffer = "\0".join(lowered)
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        detected: list[set[str]] = [set() for _ in texts]
+        for skill, keywords in SKILL_KEYWORDS.items():
+            for keyword in keywords:
+                pos = buffer.find(keyword)
+                while pos != -1:
+                    index = bisect_right(starts, pos) - 1
+                    detected[index].add(skill)
+                    # Skip the rest of this text; the skill is already recorded
+                    next_start = starts[index + 1] if index + 1 < len(starts) else len(buffer)
+                    pos = buffer.find(keyword, next_start)
+        return [list(skills) for skills in detected]
+
     def extract_languages(self, files: list[str]) -> list[str]:
         """Extract programming languages from file paths.
 
@@ -161,6 +280,24 @@ class IngestionService:
         Returns:
             Created or existing Commit record
         """
+        record, created = await self._store_commit(repository, commit, db)
+        if created:
+            await CodeOwnershipService(db).record_commits(
+                repository, [self._ownership_update(record, commit)]
+            )
+        return record
+
+    @staticmethod
+    def _ownership_update(record: Commit, commit: dict[str, Any]) -> tuple[str | None, list[str]]:
+        return record.developer_id, commit.get("added", []) + commit.get("modified", [])
+
+    async def _store_commit(
+        self,
+        repository: str,
+        commit: dict[str, Any],
+        db: AsyncSession,
+    ) -> tuple[Commit, bool]:
+        """Insert a commit unless its SHA exists; returns (record, created)."""
         sha = commit.get("id", commit.get("sha", ""))
 
         # Check for existing commit
@@ -168,7 +305,7 @@ class IngestionService:
         result = await db.execute(stmt)
         existing = result.scalar_one_or_none()
         if existing:
-            return existing
+            return existing, False
 
         # Get author info
         author = commit.get("author", {})
@@ -220,7 +357,7 @@ class IngestionService:
 
         db.add(commit_record)
         await db.flush()
-        return commit_record
+        return commit_record, True
 
     async def ingest_commits(
         self,
@@ -231,6 +368,9 @@ class IngestionService:
     ) -> list[Commit]:
         """Ingest multiple commits in batch.
 
+        New commits are written by ingest_commits_bulk; the stored records
+        (new and existing) are then loaded with one query.
+
         Args:
             repository: Repository full name
             commits: List of commit data
@@ -240,11 +380,12 @@ class IngestionService:
         Returns:
             List of created Commit records
         """
-        results = []
-        for commit in commits:
-            record = await self.ingest_commit(repository, commit, db)
-            results.append(record)
-        return results
+        await self.ingest_commits_bulk(repository, commits, db)
+
+        shas = [commit.get("id", commit.get("sha", "")) for commit in commits]
+        result = await db.execute(select(Commit).where(Commit.sha.in_(shas)))
+        by_sha = {record.sha: record for record in result.scalars().all()}
+        return [by_sha[sha] for sha in shas if sha in by_sha]
 
     async def ingest_pull_request(
         self,
@@ -256,6 +397,9 @@ class IngestionService:
     ) -> PullRequest:
         """Ingest a pull request into the database.
 
+        Written with the same INSERT ... ON CONFLICT upsert as
+        ingest_pull_requests_bulk.
+
         Args:
             repository: Repository full name
             pull_request: PR data from GitHub
@@ -266,87 +410,12 @@ class IngestionService:
         Returns:
             Created or updated PullRequest record
         """
-        github_id = pull_request.get("id")
+        await self.ingest_pull_requests_bulk(repository, [pull_request], db)
 
-        # Check for existing PR
-        stmt = select(PullRequest).where(PullRequest.github_id == github_id)
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        # Find associated developer
-        user = pull_request.get("user", {})
-        user_github_id = user.get("id")
-        developer = None
-        if user_github_id:
-            developer = await self.find_developer_by_github_id(user_github_id, db)
-        developer_id = developer.id if developer else None
-
-        # Extract skills from PR content
-        title = pull_request.get("title", "")
-        body = pull_request.get("body")
-        detected_skills = self.extract_skills_from_pr(title, body)
-
-        # Parse timestamps
-        created_at_str = pull_request.get("created_at", "")
-        updated_at_str = pull_request.get("updated_at")
-        merged_at_str = pull_request.get("merged_at")
-        closed_at_str = pull_request.get("closed_at")
-
-        def parse_timestamp(ts: str | None) -> datetime | None:
-            if not ts:
-                return None
-            try:
-                return datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                return None
-
-        if existing:
-            # Update existing PR
-            existing.state = pull_request.get("state", existing.state)
-            existing.title = title or existing.title
-            existing.description = body
-            existing.additions = pull_request.get("additions", existing.additions)
-            existing.deletions = pull_request.get("deletions", existing.deletions)
-            existing.files_changed = pull_request.get("changed_files", existing.files_changed)
-            existing.commits_count = pull_request.get("commits", existing.commits_count)
-            existing.comments_count = pull_request.get("comments", existing.comments_count)
-            existing.review_comments_count = pull_request.get("review_comments", existing.review_comments_count)
-            existing.detected_skills = detected_skills
-            existing.updated_at_github = parse_timestamp(updated_at_str)
-            existing.merged_at = parse_timestamp(merged_at_str)
-            existing.closed_at = parse_timestamp(closed_at_str)
-
-            if developer_id and not existing.developer_id:
-                existing.developer_id = developer_id
-
-            await db.flush()
-            return existing
-
-        # Create new PR
-        pr_record = PullRequest(
-            github_id=github_id,
-            number=pull_request.get("number", 0),
-            repository=repository,
-            developer_id=developer_id,
-            title=title,
-            description=body,
-            state=pull_request.get("state", "open"),
-            additions=pull_request.get("additions", 0),
-            deletions=pull_request.get("deletions", 0),
-            files_changed=pull_request.get("changed_files", 0),
-            commits_count=pull_request.get("commits", 0),
-            comments_count=pull_request.get("comments", 0),
-            review_comments_count=pull_request.get("review_comments", 0),
-            detected_skills=detected_skills,
-            created_at_github=parse_timestamp(created_at_str) or datetime.now(),
-            updated_at_github=parse_timestamp(updated_at_str),
-            merged_at=parse_timestamp(merged_at_str),
-            closed_at=parse_timestamp(closed_at_str),
+        result = await db.execute(
+            select(PullRequest).where(PullRequest.github_id == pull_request.get("id"))
         )
-
-        db.add(pr_record)
-        await db.flush()
-        return pr_record
+        return result.scalar_one()
 
     async def ingest_review(
         self,
@@ -358,6 +427,8 @@ class IngestionService:
     ) -> CodeReview:
         """Ingest a code review into the database.
 
+        Existing reviews are left as they are, as in ingest_reviews_bulk.
+
         Args:
             repository: Repository full name
             review: Review data from GitHub
@@ -366,45 +437,306 @@ class IngestionService:
             db: Database session
 
         Returns:
-            Created CodeReview record
+            Created or existing CodeReview record
         """
-        github_id = review.get("id")
+        pr_github_id = pull_request.get("id") if pull_request else 0
+        await self.ingest_reviews_bulk(repository, [(review, pr_github_id)], db)
 
-        # Check for existing review
-        stmt = select(CodeReview).where(CodeReview.github_id == github_id)
-        result = await db.execute(stmt)
-        existing = result.scalar_one_or_none()
-        if existing:
-            return existing
+        result = await db.execute(
+            select(CodeReview).where(CodeReview.github_id == review.get("id"))
+        )
+        return result.scalar_one()
 
-        # Find associated developer
-        user = review.get("user", {})
-        user_github_id = user.get("id")
-        developer = None
-        if user_github_id:
-            developer = await self.find_developer_by_github_id(user_github_id, db)
-        developer_id = developer.id if developer else None
+    # -------------------------------------------------------------------------
+    # Bulk ingestion
+    # -------------------------------------------------------------------------
 
-        # Parse timestamp
-        submitted_at_str = review.get("submitted_at", "")
-        try:
-            submitted_at = datetime.fromisoformat(submitted_at_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            submitted_at = datetime.now()
+    async def resolve_developers_by_email(
+        self,
+        emails: list[str],
+        db: AsyncSession,
+        memo: DeveloperMemo,
+    ) -> dict[str, str | None]:
+        """Resolve developer IDs for many emails with batched IN lookups."""
+        missing = list({e for e in emails if e and e not in memo.by_email})
+        for chunk in _chunks(missing):
+            result = await db.execute(
+                select(Developer.email, Developer.id).where(Developer.email.in_(chunk))
+            )
+            found = dict(result.all())
+            for email in chunk:
+                memo.by_email[email] = found.get(email)
+        return {e: memo.by_email.get(e) for e in emails if e}
 
-        pr_github_id = pull_request.get("id") if pull_request else 0
+    async def resolve_developers_by_github_id(
+        self,
+        github_ids: list[int],
+        db: AsyncSession,
+        memo: DeveloperMemo,
+    ) -> dict[int, str | None]:
+        """Resolve developer IDs for many GitHub user IDs with batched IN lookups."""
+        missing = list({g for g in github_ids if g and g not in memo.by_github_id})
+        for chunk in _chunks(missing):
+            result = await db.execute(
+                select(GitHubConnection.github_id, GitHubConnection.developer_id)
+                .where(GitHubConnection.github_id.in_(chunk))
+            )
+            found = dict(result.all())
+            for github_id in chunk:
+                memo.by_github_id[github_id] = found.get(github_id)
+        return {g: memo.by_github_id.get(g) for g in github_ids if g}
 
-        review_record = CodeReview(
-            github_id=github_id,
-            repository=repository,
-            developer_id=developer_id,
-            pull_request_github_id=pr_github_id,
-            state=review.get("state", ""),
-            body=review.get("body"),
-            comments_count=0,  # Would need additional API call
-            submitted_at=submitted_at,
+    async def _create_placeholder_developers(
+        self,
+        authors: dict[str, str | None],
+        db: AsyncSession,
+        memo: DeveloperMemo,
+    ) -> None:
+        """Insert placeholder developers for unknown commit author emails."""
+        rows = [
+            {"id": str(uuid4()), "email": email, "name": name}
+            for email, name in authors.items()
+        ]
+        for chunk in _chunks(rows):
+            stmt = (
+                pg_insert(Developer)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(Developer.email, Developer.id)
+            )
+            result = await db.execute(stmt)
+            memo.by_email.update(dict(result.all()))
+
+        # Rows skipped by ON CONFLICT were created concurrently; look them up
+        unresolved = [e for e in authors if not memo.by_email.get(e)]
+        for email in unresolved:
+            memo.by_email.pop(email, None)
+        if unresolved:
+            await self.resolve_developers_by_email(unresolved, db, memo)
+
+    async def ingest_commits_bulk(
+        self,
+        repository: str,
+        commits: list[dict[str, Any]],
+        db: AsyncSession,
+        memo: DeveloperMemo | None = None,
+    ) -> IngestStats:
+        """Ingest many commits with batched author lookup and multi-row inserts.
+
+        Existing commits (by SHA) are skipped via ON CONFLICT DO NOTHING, and
+        only newly inserted commits feed the code ownership matrix.
+        """
+        stats = IngestStats(kind="commits", rows=len(commits))
+        started = time.perf_counter()
+        memo = memo or DeveloperMemo()
+
+        authors = {}
+        for commit in commits:
+            author = commit.get("author") or {}
+            if author.get("email"):
+                authors.setdefault(author["email"], author.get("name"))
+        resolved = await self.resolve_developers_by_email(list(authors), db, memo)
+        unknown = {e: authors[e] for e, dev_id in resolved.items() if dev_id is None}
+        if unknown:
+            await self._create_placeholder_developers(unknown, db, memo)
+
+        file_lists = []
+        for commit in commits:
+            file_lists.append(
+                commit.get("added", []) + commit.get("modified", []) + commit.get("removed", [])
+            )
+        languages = self.extract_languages_bulk(file_lists)
+
+        rows = []
+        touched: dict[str, tuple[str | None, list[str]]] = {}
+        for commit, all_files, commit_languages in zip(commits, file_lists, languages):
+            sha = commit.get("id", commit.get("sha", ""))
+            email = (commit.get("author") or {}).get("email", "")
+            developer_id = memo.by_email.get(email) if email else None
+            added = commit.get("added", [])
+            removed = commit.get("removed", [])
+            rows.append({
+                "id": str(uuid4()),
+                "sha": sha,
+                "repository": repository,
+                "developer_id": developer_id,
+                "message": commit.get("message", ""),
+                "additions": len(added),
+                "deletions": len(removed),
+                "files_changed": len(all_files),
+                "languages": commit_languages,
+                "file_types": self.extract_file_types(all_files),
+                "author_email": email or None,
+                "committed_at": _parse_timestamp(commit.get("timestamp")) or datetime.now(),
+            })
+            touched[sha] = (developer_id, added + commit.get("modified", []))
+
+        inserted: list[str] = []
+        for chunk in _chunks(rows):
+            stmt = (
+                pg_insert(Commit)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["sha"])
+                .returning(Commit.sha)
+            )
+            result = await db.execute(stmt)
+            inserted.extend(result.scalars().all())
+
+        if inserted:
+            await CodeOwnershipService(db).record_commits(
+                repository, [touched[sha] for sha in inserted]
+            )
+
+        stats.written = len(inserted)
+        stats.seconds = time.perf_counter() - started
+        self._log_stats(repository, stats)
+        return stats
+
+    async def ingest_pull_requests_bulk(
+        self,
+        repository: str,
+        pull_requests: list[dict[str, Any]],
+        db: AsyncSession,
+        memo: DeveloperMemo | None = None,
+    ) -> IngestStats:
+        """Upsert many pull requests with one multi-row INSERT ... ON CONFLICT per chunk."""
+        stats = IngestStats(kind="pull_requests", rows=len(pull_requests))
+        started = time.perf_counter()
+        memo = memo or DeveloperMemo()
+
+        user_ids = [(pr.get("user") or {}).get("id") for pr in pull_requests]
+        resolved = await self.resolve_developers_by_github_id(user_ids, db, memo)
+        skills = self.extract_skills_bulk(
+            [f"{pr.get('title', '')} {pr.get('body') or ''}" for pr in pull_requests]
         )
 
-        db.add(review_record)
-        await db.flush()
-        return review_record
+        # Keyed by github_id: ON CONFLICT DO UPDATE cannot touch a row twice
+        rows_by_id: dict[int, dict] = {}
+        for pr, user_id, detected_skills in zip(pull_requests, user_ids, skills):
+            rows_by_id[pr.get("id")] = {
+                "id": str(uuid4()),
+                "github_id": pr.get("id"),
+                "number": pr.get("number", 0),
+                "repository": repository,
+                "developer_id": resolved.get(user_id) if user_id else None,
+                "title": pr.get("title", ""),
+                "description": pr.get("body"),
+                "state": pr.get("state", "open"),
+                "additions": pr.get("additions", 0),
+                "deletions": pr.get("deletions", 0),
+                "files_changed": pr.get("changed_files", 0),
+                "commits_count": pr.get("commits", 0),
+                "comments_count": pr.get("comments", 0),
+                "review_comments_count": pr.get("review_comments", 0),
+                "detected_skills": detected_skills,
+                "created_at_github": _parse_timestamp(pr.get("created_at")) or datetime.now(),
+                "updated_at_github": _parse_timestamp(pr.get("updated_at")),
+                "merged_at": _parse_timestamp(pr.get("merged_at")),
+                "closed_at": _parse_timestamp(pr.get("closed_at")),
+            }
+
+        for chunk in _chunks(list(rows_by_id.values())):
+            stmt = pg_insert(PullRequest).values(chunk)
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["github_id"],
+                set_={
+                    "state": excluded.state,
+                    "title": func.coalesce(func.nullif(excluded.title, ""), PullRequest.title),
+                    "description": excluded.description,
+                    "additions": excluded.additions,
+                    "deletions": excluded.deletions,
+                    "files_changed": excluded.files_changed,
+                    "commits_count": excluded.commits_count,
+                    "comments_count": excluded.comments_count,
+                    "review_comments_count": excluded.review_comments_count,
+                    "detected_skills": excluded.detected_skills,
+                    "updated_at_github": excluded.updated_at_github,
+                    "merged_at": excluded.merged_at,
+                    "closed_at": excluded.closed_at,
+                    "developer_id": func.coalesce(PullRequest.developer_id, excluded.developer_id),
+                },
+            )
+            result = await db.execute(stmt)
+            stats.written += result.rowcount or 0
+
+        stats.seconds = time.perf_counter() - started
+        self._log_stats(repository, stats)
+        return stats
+
+    async def ingest_reviews_bulk(
+        self,
+        repository: str,
+        reviews: list[tuple[dict[str, Any], int]],
+        db: AsyncSession,
+        memo: DeveloperMemo | None = None,
+    ) -> IngestStats:
+        """Ingest many reviews, given as (review, pull_request_github_id) pairs.
+
+        Existing reviews are skipped; newly inserted ones are recorded as
+        collaboration edges with PR authors resolved in one query.
+        """
+        stats = IngestStats(kind="reviews", rows=len(reviews))
+        started = time.perf_counter()
+        memo = memo or DeveloperMemo()
+
+        user_ids = [(review.get("user") or {}).get("id") for review, _ in reviews]
+        resolved = await self.resolve_developers_by_github_id(user_ids, db, memo)
+
+        rows = []
+        for (review, pr_github_id), user_id in zip(reviews, user_ids):
+            rows.append({
+                "id": str(uuid4()),
+                "github_id": review.get("id"),
+                "repository": repository,
+                "developer_id": resolved.get(user_id) if user_id else None,
+                "pull_request_github_id": pr_github_id or 0,
+                "state": review.get("state", ""),
+                "body": review.get("body"),
+                "comments_count": 0,
+                "submitted_at": _parse_timestamp(review.get("submitted_at")) or datetime.now(),
+            })
+
+        inserted = []
+        for chunk in _chunks(rows):
+            stmt = (
+                pg_insert(CodeReview)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["github_id"])
+                .returning(
+                    CodeReview.developer_id,
+                    CodeReview.pull_request_github_id,
+                    CodeReview.submitted_at,
+                )
+            )
+            result = await db.execute(stmt)
+            inserted.extend(result.all())
+
+        pr_ids = list({pr_id for dev_id, pr_id, _ in inserted if dev_id and pr_id})
+        pr_authors: dict[int, str | None] = {}
+        for chunk in _chunks(pr_ids):
+            result = await db.execute(
+                select(PullRequest.github_id, PullRequest.developer_id)
+                .where(PullRequest.github_id.in_(chunk))
+            )
+            pr_authors.update(dict(result.all()))
+
+        interactions = [
+            (dev_id, pr_authors.get(pr_id), submitted_at)
+            for dev_id, pr_id, submitted_at in inserted
+            if dev_id and pr_id
+        ]
+        if interactions:
+            await CollaborationNetworkAnalyzer(db).record_review_interactions(interactions)
+
+        stats.written = len(inserted)
+        stats.seconds = time.perf_counter() - started
+        self._log_stats(repository, stats)
+        return stats
+
+    @staticmethod
+    def _log_stats(repository: str, stats: IngestStats) -> None:
+        logger.info(
+            f"Bulk ingested {stats.written}/{stats.rows} {stats.kind} for {repository} "
+            f"in {stats.seconds:.2f}s ({stats.rows_per_second:.0f} rows/sec)"
+        )
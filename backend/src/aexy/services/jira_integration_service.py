@@ -10,6 +10,7 @@ import httpx
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aexy.core.http_clients import get_http_transport
 from aexy.models.integrations import JiraIntegration
 from aexy.models.sprint import Sprint, SprintTask
 from aexy.schemas.integrations import (
@@ -188,7 +189,7 @@ class JiraIntegrationService:
     ) -> dict[str, Any]:
         """Internal method to test Jira connection."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 # Test basic auth by getting user info
                 auth = httpx.BasicAuth(user_email, api_token)
                 response = await client.get(
@@ -291,7 +292,7 @@ class JiraIntegrationService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 auth = httpx.BasicAuth(integration.user_email, integration.api_token)
                 response = await client.get(
                     f"{integration.site_url}/rest/api/3/status",
@@ -321,7 +322,7 @@ class JiraIntegrationService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 auth = httpx.BasicAuth(integration.user_email, integration.api_token)
                 response = await client.get(
                     f"{integration.site_url}/rest/api/3/field",
@@ -392,7 +393,7 @@ class JiraIntegrationService:
         errors: list[str] = []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 auth = httpx.BasicAuth(integration.user_email, integration.api_token)
 
                 for mapped_team_id, project_config in mappings.items():
@@ -722,7 +723,7 @@ class JiraIntegrationService:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 auth = httpx.BasicAuth(integration.user_email, integration.api_token)
 
                 # Get available transitions for the issue
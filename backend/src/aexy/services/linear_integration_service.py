@@ -10,6 +10,7 @@ import httpx
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aexy.core.http_clients import get_http_transport
 from aexy.models.integrations import LinearIntegration
 from aexy.models.sprint import Sprint, SprintTask
 from aexy.schemas.integrations import (
@@ -165,7 +166,7 @@ class LinearIntegrationService:
     async def _test_connection(self, api_key: str) -> dict[str, Any]:
         """Internal method to test Linear connection."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 # Test API key by getting viewer info
                 query = """
                     query {
@@ -283,7 +284,7 @@ class LinearIntegrationService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 query = """
                     query {
                         workflowStates {
@@ -342,7 +343,7 @@ class LinearIntegrationService:
             return []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 query = """
                     query {
                         teams {
@@ -440,7 +441,7 @@ class LinearIntegrationService:
         errors: list[str] = []
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 for mapped_team_id, team_config in mappings.items():
                     linear_team_id = team_config.get("linear_team_id")
                     labels_filter = team_config.get("labels_filter", [])
@@ -828,7 +829,7 @@ class LinearIntegrationService:
                 return False
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 # Update issue state using GraphQL mutation
                 mutation = """
                     mutation($issueId: String!, $stateId: String!) {
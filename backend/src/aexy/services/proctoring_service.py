@@ -5,7 +5,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.llm.gateway import get_llm_gateway
@@ -61,8 +61,33 @@ MAX_DEDUCTIONS = {
 }
 
 
+# Most recent events sent to the LLM for behavior analysis
+MAX_ANALYSIS_EVENTS = 200
+
+
+def calculate_deductions(event_counts: dict[str, int]) -> dict[str, int]:
+    """Trust score deduction per event type for the given event counts."""
+    return {
+        event_type: min(
+            count * TRUST_SCORE_DEDUCTIONS.get(event_type, 0),
+            MAX_DEDUCTIONS.get(event_type, 100),
+        )
+        for event_type, count in event_counts.items()
+    }
+
+
+def trust_score_from_counts(event_counts: dict[str, int]) -> int:
+    """Trust score (0-100) for the given event counts."""
+    return max(0, 100 - sum(calculate_deductions(event_counts).values()))
+
+
 class ProctoringService:
-    """Service for managing proctoring events and trust scores."""
+    """Service for managing proctoring events and trust scores.
+
+    Each attempt keeps running per-type event counters, updated by delta
+    as events are logged, so trust scores and violation checks never
+    need to recount an attempt's events.
+    """
 
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -86,25 +111,99 @@ class ProctoringService:
         Returns:
             Created proctoring event.
         """
-        severity = EVENT_SEVERITY.get(event_type, ProctoringEventSeverity.INFO)
-
-        event = ProctoringEvent(
-            attempt_id=attempt_id,
-            event_type=event_type,
-            severity=severity,
-            event_data=data or {},
-            screenshot_url=screenshot_url,
-            timestamp=datetime.now(timezone.utc),
+        events, _ = await self.log_events(
+            attempt_id,
+            [{"event_type": event_type, "data": data, "screenshot_url": screenshot_url}],
         )
+        return events[0]
+
+    async def log_events(
+        self,
+        attempt_id: str,
+        events: list[dict[str, Any]],
+    ) -> tuple[list[ProctoringEvent], int]:
+        """Log a batch of proctoring events buffered by the client.
+
+        All events are inserted and the attempt's counters and trust score
+        updated in one transaction. The attempt row is locked while its
+        counters are updated, so concurrent batches are not lost.
+
+        Args:
+            attempt_id: The assessment attempt ID.
+            events: Events with event_type and optional data, screenshot_url,
+                timestamp (when it happened on the client) and duration_seconds.
+
+        Returns:
+            Tuple of (created events, updated trust score).
+        """
+        now = datetime.now(timezone.utc)
+        created = []
+        deltas: dict[str, int] = {}
+        critical = 0
+
+        for item in events:
+            event_type = item["event_type"]
+            severity = EVENT_SEVERITY.get(event_type, ProctoringEventSeverity.INFO)
+
+            # Client clocks may be ahead; never record events in the future
+            timestamp = item.get("timestamp") or now
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+            created.append(ProctoringEvent(
+                attempt_id=attempt_id,
+                event_type=event_type,
+                severity=severity,
+                event_data=item.get("data") or {},
+                screenshot_url=item.get("screenshot_url"),
+                duration_seconds=item.get("duration_seconds"),
+                timestamp=min(timestamp, now),
+            ))
+            deltas[event_type] = deltas.get(event_type, 0) + 1
+            if severity == ProctoringEventSeverity.CRITICAL:
+                critical += 1
+
+        self.db.add_all(created)
+
+        trust_score = 100
+        attempt = await self._get_attempt(attempt_id, for_update=True)
+        if attempt:
+            counts = dict(attempt.proctoring_event_counts or {})
+            for event_type, delta in deltas.items():
+                counts[event_type] = counts.get(event_type, 0) + delta
+
+            trust_score = trust_score_from_counts(counts)
+            attempt.proctoring_event_counts = counts
+            attempt.critical_event_count = (attempt.critical_event_count or 0) + critical
+            attempt.trust_score = trust_score
 
-        self.db.add(event)
         await self.db.commit()
-        await self.db.refresh(event)
+        return created, trust_score
 
-        # Update trust score after logging event
-        await self.update_trust_score(attempt_id)
+    async def _get_attempt(
+        self,
+        attempt_id: str,
+        for_update: bool = False,
+    ) -> AssessmentAttempt | None:
+        """Load an attempt, optionally locking its row for a counter update."""
+        query = select(AssessmentAttempt).where(AssessmentAttempt.id == attempt_id)
+        if for_update:
+            # Lock the row and read the counters as committed, not as cached
+            query = query.with_for_update().execution_options(populate_existing=True)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_event_counts(self, attempt_id: str) -> dict[str, int]:
+        """Get the number of events per type logged for an attempt.
 
-        return event
+        Args:
+            attempt_id: The assessment attempt ID.
+
+        Returns:
+            Dict mapping event type to count.
+        """
+        attempt = await self._get_attempt(attempt_id)
+        return dict(attempt.proctoring_event_counts or {}) if attempt else {}
 
     async def get_events(
         self,
@@ -145,31 +244,7 @@ class ProctoringService:
         Returns:
             Trust score (0-100).
         """
-        events = await self.get_events(attempt_id)
-
-        # Group events by type and count
-        event_counts: dict[str, int] = {}
-        for event in events:
-            event_type = event.event_type
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-
-        # Calculate deductions
-        total_deduction = 0
-        deduction_breakdown = {}
-
-        for event_type, count in event_counts.items():
-            deduction_per_event = TRUST_SCORE_DEDUCTIONS.get(event_type, 0)
-            max_deduction = MAX_DEDUCTIONS.get(event_type, 100)
-
-            # Calculate total deduction for this event type
-            type_deduction = min(count * deduction_per_event, max_deduction)
-            total_deduction += type_deduction
-            deduction_breakdown[event_type] = type_deduction
-
-        # Calculate final score
-        trust_score = max(0, 100 - total_deduction)
-
-        return trust_score
+        return trust_score_from_counts(await self.get_event_counts(attempt_id))
 
     async def update_trust_score(self, attempt_id: str) -> int:
         """Update the trust score for an attempt.
@@ -180,16 +255,13 @@ class ProctoringService:
         Returns:
             Updated trust score.
         """
-        trust_score = await self.calculate_trust_score(attempt_id)
+        attempt = await self._get_attempt(attempt_id)
+        if not attempt:
+            return trust_score_from_counts({})
 
-        # Update the attempt
-        attempt_query = select(AssessmentAttempt).where(AssessmentAttempt.id == attempt_id)
-        result = await self.db.execute(attempt_query)
-        attempt = result.scalar_one_or_none()
-
-        if attempt:
-            attempt.trust_score = trust_score
-            await self.db.commit()
+        trust_score = trust_score_from_counts(attempt.proctoring_event_counts or {})
+        attempt.trust_score = trust_score
+        await self.db.commit()
 
         return trust_score
 
@@ -220,22 +292,19 @@ class ProctoringService:
             )
 
         # Calculate deductions
-        deductions = {}
-        total_deduction = 0
-
-        for event_type, summary in event_summary.items():
-            count = summary["count"]
-            deduction_per_event = TRUST_SCORE_DEDUCTIONS.get(event_type, 0)
-            max_deduction = MAX_DEDUCTIONS.get(event_type, 100)
-
-            type_deduction = min(count * deduction_per_event, max_deduction)
-            deductions[event_type] = {
-                "count": count,
-                "deduction_per_event": deduction_per_event,
-                "max_deduction": max_deduction,
+        actual = calculate_deductions(
+            {event_type: summary["count"] for event_type, summary in event_summary.items()}
+        )
+        deductions = {
+            event_type: {
+                "count": event_summary[event_type]["count"],
+                "deduction_per_event": TRUST_SCORE_DEDUCTIONS.get(event_type, 0),
+                "max_deduction": MAX_DEDUCTIONS.get(event_type, 100),
                 "actual_deduction": type_deduction,
             }
-            total_deduction += type_deduction
+            for event_type, type_deduction in actual.items()
+        }
+        total_deduction = sum(actual.values())
 
         trust_score = max(0, 100 - total_deduction)
 
@@ -274,9 +343,11 @@ class ProctoringService:
         if not self.gateway:
             return None
 
-        events = await self.get_events(attempt_id)
+        attempt = await self._get_attempt(attempt_id)
+        event_counts = dict(attempt.proctoring_event_counts or {}) if attempt else {}
+        event_count = sum(event_counts.values())
 
-        if not events:
+        if not event_count:
             return {
                 "trust_score": 100,
                 "trust_level": "high",
@@ -290,30 +361,35 @@ class ProctoringService:
                 "summary": "No suspicious activity detected during the assessment.",
             }
 
-        # Get attempt for duration
-        attempt_query = select(AssessmentAttempt).where(AssessmentAttempt.id == attempt_id)
-        result = await self.db.execute(attempt_query)
-        attempt = result.scalar_one_or_none()
-
         duration = 0
         if attempt and attempt.started_at:
             end_time = attempt.completed_at or datetime.now(timezone.utc)
             duration = int((end_time - attempt.started_at).total_seconds() / 60)
 
-        # Format events for AI
-        events_data = []
-        for event in events:
-            events_data.append({
-                "type": event.event_type,
-                "severity": event.severity.value if hasattr(event.severity, 'value') else event.severity,
-                "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                "data": event.event_data,
-            })
+        # Format events for AI: totals per type plus the most recent events
+        recent = await self.db.execute(
+            select(ProctoringEvent)
+            .where(ProctoringEvent.attempt_id == attempt_id)
+            .order_by(ProctoringEvent.timestamp.desc())
+            .limit(MAX_ANALYSIS_EVENTS)
+        )
+        events_data = {
+            "counts_by_type": event_counts,
+            "recent_events": [
+                {
+                    "type": event.event_type,
+                    "severity": event.severity.value if hasattr(event.severity, 'value') else event.severity,
+                    "timestamp": event.timestamp.isoformat() if event.timestamp else None,
+                    "data": event.event_data,
+                }
+                for event in reversed(recent.scalars().all())
+            ],
+        }
 
         prompt = PROCTORING_BEHAVIOR_ANALYSIS_PROMPT.format(
             events=json.dumps(events_data, indent=2),
             duration=duration,
-            event_count=len(events),
+            event_count=event_count,
         )
 
         try:
@@ -361,23 +437,25 @@ class ProctoringService:
         Returns:
             Violation check result.
         """
-        trust_score = await self.calculate_trust_score(attempt_id)
-        events = await self.get_events(attempt_id)
-
-        # Count critical events
-        critical_events = [
-            e for e in events
-            if (e.severity == ProctoringEventSeverity.CRITICAL or
-                e.severity == ProctoringEventSeverity.CRITICAL.value)
-        ]
+        attempt = await self._get_attempt(attempt_id)
+        event_counts = dict(attempt.proctoring_event_counts or {}) if attempt else {}
+        critical_count = (attempt.critical_event_count or 0) if attempt else 0
+        trust_score = trust_score_from_counts(event_counts)
+
+        # Only critical events are listed, so only those are loaded
+        critical_events = []
+        if critical_count:
+            critical_events = await self.get_events(
+                attempt_id, severity=ProctoringEventSeverity.CRITICAL
+            )
 
         # Determine if flagged
-        is_flagged = trust_score < threshold or len(critical_events) >= 3
+        is_flagged = trust_score < threshold or critical_count >= 3
 
         # Determine action
-        if trust_score < 30 or len(critical_events) >= 5:
+        if trust_score < 30 or critical_count >= 5:
             recommended_action = "manual_review_required"
-        elif trust_score < 50 or len(critical_events) >= 3:
+        elif trust_score < 50 or critical_count >= 3:
             recommended_action = "flag_for_review"
         elif trust_score < 70:
             recommended_action = "minor_concerns"
@@ -387,8 +465,8 @@ class ProctoringService:
         return {
             "trust_score": trust_score,
             "is_flagged": is_flagged,
-            "critical_event_count": len(critical_events),
-            "total_event_count": len(events),
+            "critical_event_count": critical_count,
+            "total_event_count": sum(event_counts.values()),
             "recommended_action": recommended_action,
             "violations": [
                 {
@@ -419,9 +497,7 @@ class ProctoringService:
         ai_analysis = await self.analyze_behavior(attempt_id)
 
         # Get attempt info
-        attempt_query = select(AssessmentAttempt).where(AssessmentAttempt.id == attempt_id)
-        result = await self.db.execute(attempt_query)
-        attempt = result.scalar_one_or_none()
+        attempt = await self._get_attempt(attempt_id)
 
         session_info = {}
         if attempt:
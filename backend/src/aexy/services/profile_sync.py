@@ -1,15 +1,308 @@
-"""Profile Sync Service - Analyzes activity and updates developer profiles."""
-
+"""Profile Sync Service - Analyzes activity and updates developer profiles.
+
+Commit history is summarized into counters (languages by day, domains,
+frameworks, commit hours) stored per developer in DeveloperProfileAggregate.
+A sync folds only commits ingested since the previous one into those
+counters; pull request and review figures come from SQL aggregates.
+"""
+
+import asyncio
+import copy
+import logging
+import time
 from collections import Counter
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from aexy.models.activity import Commit, PullRequest, CodeReview
 from aexy.models.developer import Developer
+from aexy.models.profile_aggregate import DeveloperProfileAggregate
+
+logger = logging.getLogger(__name__)
+
+# Commits ingested within this window are folded into each sync's result but
+# not into the stored aggregates: commits.created_at is the start time of the
+# inserting transaction, and repository syncs run for up to two hours.
+FOLD_LAG = timedelta(hours=3)
+# Stored aggregates are rebuilt from scratch this often to correct drift from
+# reassigned or deleted commits
+FULL_REBUILD_INTERVAL = timedelta(days=7)
+
+PROFILE_SYNC_CONCURRENCY = 4
+SLOW_PROFILE_SECONDS = 5.0
+COMMIT_STREAM_BATCH = 1000
+
+RECENT_WINDOW = timedelta(days=180)
+HISTORY_WINDOW = timedelta(days=365)
+
+# Domain indicators from file types
+FILE_TYPE_DOMAINS = {
+    # Frontend
+    "tsx": "Frontend", "jsx": "Frontend", "vue": "Frontend",
+    "svelte": "Frontend", "css": "Frontend", "scss": "Frontend",
+    "html": "Frontend",
+    # Backend
+    "py": "Backend", "go": "Backend", "java": "Backend",
+    "rb": "Backend", "php": "Backend", "cs": "Backend",
+    # API
+    "graphql": "API Development", "proto": "API Development",
+    # DevOps
+    "dockerfile": "DevOps", "tf": "DevOps", "yaml": "DevOps",
+    "yml": "DevOps", "sh": "DevOps",
+    # Database
+    "sql": "Database", "prisma": "Database",
+    # Testing
+    "test": "Testing", "spec": "Testing",
+    # Mobile
+    "swift": "Mobile", "kt": "Mobile",
+    # Data
+    "ipynb": "Data Science", "csv": "Data Science",
+}
+
+# Domain keywords in commit messages
+DOMAIN_KEYWORDS = {
+    "api": "API Development",
+    "endpoint": "API Development",
+    "rest": "API Development",
+    "graphql": "API Development",
+    "frontend": "Frontend",
+    "ui": "Frontend",
+    "component": "Frontend",
+    "backend": "Backend",
+    "server": "Backend",
+    "database": "Database",
+    "migration": "Database",
+    "schema": "Database",
+    "test": "Testing",
+    "spec": "Testing",
+    "deploy": "DevOps",
+    "ci": "DevOps",
+    "docker": "DevOps",
+    "kubernetes": "DevOps",
+    "auth": "Security",
+    "security": "Security",
+    "encrypt": "Security",
+}
+
+# Framework to category mapping
+FRAMEWORK_CATEGORIES = {
+    "React": "web",
+    "TypeScript": "language",
+    "Vue.js": "web",
+    "Svelte": "web",
+    "Astro": "web",
+    "Angular": "web",
+    "Next.js": "web",
+    "Nuxt.js": "web",
+    "Express.js": "web",
+    "FastAPI": "web",
+    "Django": "web",
+    "Flask": "web",
+    "Spring": "web",
+    "Ruby on Rails": "web",
+    "Laravel": "web",
+    "NestJS": "web",
+    "Prisma": "data",
+    "GraphQL": "api",
+    "gRPC/Protobuf": "api",
+    "Docker": "devops",
+    "Kubernetes": "devops",
+    "Terraform": "devops",
+    "YAML Config": "config",
+    "Tailwind CSS": "web",
+    "Jest": "testing",
+    "pytest": "testing",
+    "Cypress": "testing",
+}
+
+# File type to framework mapping
+FILE_TYPE_FRAMEWORKS = {
+    "tsx": ["React", "TypeScript"],
+    "jsx": ["React"],
+    "vue": ["Vue.js"],
+    "svelte": ["Svelte"],
+    "astro": ["Astro"],
+    "prisma": ["Prisma"],
+    "graphql": ["GraphQL"],
+    "proto": ["gRPC/Protobuf"],
+    "dockerfile": ["Docker"],
+    "tf": ["Terraform"],
+    "yaml": ["YAML Config"],
+    "yml": ["YAML Config"],
+}
+
+# Framework mentions in commit messages
+FRAMEWORK_KEYWORDS = {
+    "react": "React",
+    "vue": "Vue.js",
+    "angular": "Angular",
+    "next": "Next.js",
+    "nuxt": "Nuxt.js",
+    "express": "Express.js",
+    "fastapi": "FastAPI",
+    "django": "Django",
+    "flask": "Flask",
+    "spring": "Spring",
+    "rails": "Ruby on Rails",
+    "laravel": "Laravel",
+    "nestjs": "NestJS",
+    "graphql": "GraphQL",
+    "prisma": "Prisma",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes",
+    "terraform": "Terraform",
+    "tailwind": "Tailwind CSS",
+    "jest": "Jest",
+    "pytest": "pytest",
+    "cypress": "Cypress",
+}
+
+
+def empty_commit_aggregates() -> dict[str, Any]:
+    """Counters for a developer with no commits folded yet.
+
+    - ``commits``: commits folded
+    - ``languages``: {lang: {"commits", "lines", "aged"}}; ``aged`` counts
+      dated commits older than HISTORY_WINDOW, collapsed out of ``language_days``
+    - ``language_days``: {lang: {"YYYY-MM-DD": commits}} within HISTORY_WINDOW
+    - ``domains`` / ``frameworks``: indicator counts
+    - ``hours``: {"0".."23": commits}
+    """
+    return {
+        "commits": 0,
+        "languages": {},
+        "language_days": {},
+        "domains": {},
+        "frameworks": {},
+        "hours": {},
+    }
+
+
+def _incr(counter: dict[str, int], key: str, amount: int = 1) -> None:
+    counter[key] = counter.get(key, 0) + amount
+
+
+def fold_commits(aggregates: dict[str, Any], commits: Iterable[Any]) -> int:
+    """Fold commit rows into *aggregates* in place. Returns commits folded.
+
+    Rows need ``languages``, ``file_types``, ``additions``, ``message`` and
+    ``committed_at`` attributes.
+    """
+    languages = aggregates["languages"]
+    language_days = aggregates["language_days"]
+    domains = aggregates["domains"]
+    frameworks = aggregates["frameworks"]
+    hours = aggregates["hours"]
+
+    folded = 0
+    for commit in commits:
+        folded += 1
+        additions = commit.additions or 0
+
+        day = None
+        if commit.committed_at:
+            _incr(hours, str(commit.committed_at.hour))
+            committed_at = commit.committed_at
+            # Make committed_at timezone-aware if it isn't
+            if committed_at.tzinfo is None:
+                committed_at = committed_at.replace(tzinfo=timezone.utc)
+            day = committed_at.astimezone(timezone.utc).date().isoformat()
+
+        for lang in commit.languages or []:
+            totals = languages.setdefault(lang, {"commits": 0, "lines": 0, "aged": 0})
+            totals["commits"] += 1
+            totals["lines"] += additions
+            if day:
+                _incr(language_days.setdefault(lang, {}), day)
+
+        for ft in commit.file_types or []:
+            ft_lower = ft.lower()
+            if ft_lower in FILE_TYPE_DOMAINS:
+                _incr(domains, FILE_TYPE_DOMAINS[ft_lower])
+            for fw in FILE_TYPE_FRAMEWORKS.get(ft_lower, ()):
+                _incr(frameworks, fw)
+
+        message_lower = (commit.message or "").lower()
+        for keyword, domain in DOMAIN_KEYWORDS.items():
+            if keyword in message_lower:
+                _incr(domains, domain)
+        for keyword, framework in FRAMEWORK_KEYWORDS.items():
+            if keyword in message_lower:
+                _incr(frameworks, framework)
+
+    aggregates["commits"] += folded
+    return folded
+
+
+def compact_commit_aggregates(aggregates: dict[str, Any], now: datetime) -> None:
+    """Collapse per-day language counts older than HISTORY_WINDOW into ``aged``."""
+    cutoff = (now - HISTORY_WINDOW).date()
+    for lang, days in aggregates["language_days"].items():
+        expired = [day for day in days if date.fromisoformat(day) <= cutoff]
+        for day in expired:
+            aggregates["languages"][lang]["aged"] += days.pop(day)
+    aggregates["language_days"] = {
+        lang: days for lang, days in aggregates["language_days"].items() if days
+    }
+
+
+@dataclass
+class PullRequestStats:
+    """Pull request figures used by the profile, computed in SQL."""
+
+    count: int = 0
+    sized_count: int = 0
+    size_total: int = 0
+    skill_counts: Counter[str] = field(default_factory=Counter)
+
+
+@dataclass
+class ProfileSyncTiming:
+    """How long one developer's profile sync took."""
+
+    developer_id: str
+    seconds: float
+    mode: str  # full, incremental, failed
+    commits_folded: int = 0
+    error: str | None = None
+
+
+@dataclass
+class ProfileSyncReport:
+    """Outcome of a batch profile sync."""
+
+    synced: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    timings: list[ProfileSyncTiming] = field(default_factory=list)
+
+    def add(self, timing: ProfileSyncTiming) -> None:
+        self.timings.append(timing)
+        if timing.error:
+            self.failed += 1
+        else:
+            self.synced += 1
+
+    def slowest(self, limit: int = 10) -> list[ProfileSyncTiming]:
+        return sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "synced": self.synced,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 2),
+            "slowest": [asdict(t) for t in self.slowest()],
+        }
+
+
+def shard_developer_ids(developer_ids: list[str], shard_index: int, shard_count: int) -> list[str]:
+    """Return the developer IDs belonging to one shard of a batch sync."""
+    return sorted(developer_ids)[shard_index::max(shard_count, 1)]
 
 
 class ProfileSyncService:
@@ -19,16 +312,29 @@ class ProfileSyncService:
         self,
         developer_id: str,
         db: AsyncSession,
+        full: bool = False,
     ) -> Developer:
         """Sync a developer's profile based on their activity.
 
         Args:
             developer_id: Developer ID to sync
             db: Database session
+            full: Rebuild the stored commit aggregates from all history
 
         Returns:
             Updated Developer with skill fingerprint, work patterns, and growth trajectory
         """
+        developer, _ = await self._sync(developer_id, db, full)
+        return developer
+
+    async def _sync(
+        self,
+        developer_id: str,
+        db: AsyncSession,
+        full: bool,
+    ) -> tuple[Developer, ProfileSyncTiming]:
+        started = time.perf_counter()
+
         # Get developer
         stmt = select(Developer).where(Developer.id == developer_id)
         result = await db.execute(stmt)
@@ -37,81 +343,140 @@ class ProfileSyncService:
         if not developer:
             raise ValueError(f"Developer {developer_id} not found")
 
-        # Get activity data
-        commits = await self._get_commits(developer_id, db)
-        pull_requests = await self._get_pull_requests(developer_id, db)
-        reviews = await self._get_reviews(developer_id, db)
-
-        # Build skill fingerprint
-        skill_fingerprint = self._build_skill_fingerprint(commits, pull_requests)
-
-        # Analyze work patterns
-        work_patterns = self._analyze_work_patterns(commits, pull_requests, reviews)
+        now = datetime.now(timezone.utc)
+        fold_through = now - FOLD_LAG
+
+        stored = await db.get(DeveloperProfileAggregate, developer_id)
+        if stored is None:
+            stored = DeveloperProfileAggregate(developer_id=developer_id, commits_folded=0)
+            db.add(stored)
+
+        rebuild = (
+            full
+            or stored.folded_through is None
+            or stored.last_full_rebuild_at is None
+            or stored.last_full_rebuild_at < now - FULL_REBUILD_INTERVAL
+        )
 
-        # Calculate growth trajectory
-        growth_trajectory = self._calculate_growth_trajectory(commits)
+        # Fold commits ingested since the last sync into the stored counters
+        if rebuild:
+            aggregates = empty_commit_aggregates()
+            folded = await self._fold_commits(developer_id, db, aggregates, None, fold_through)
+            stored.commits_folded = folded
+            stored.last_full_rebuild_at = now
+        else:
+            aggregates = copy.deepcopy(stored.commit_aggregates)
+            folded = await self._fold_commits(
+                developer_id, db, aggregates, stored.folded_through, fold_through
+            )
+            stored.commits_folded += folded
+        compact_commit_aggregates(aggregates, now)
+        stored.commit_aggregates = aggregates
+        stored.folded_through = fold_through
+
+        # Commits too fresh to persist are folded into this sync's copy only
+        current = copy.deepcopy(aggregates)
+        folded += await self._fold_commits(developer_id, db, current, fold_through, None)
+
+        pr_stats = await self._get_pull_request_stats(developer_id, db)
+        review_count = await self._count_reviews(developer_id, db)
 
         # Update developer
-        developer.skill_fingerprint = skill_fingerprint
-        developer.work_patterns = work_patterns
-        developer.growth_trajectory = growth_trajectory
+        developer.skill_fingerprint = self._build_skill_fingerprint(current, pr_stats, now)
+        developer.work_patterns = self._analyze_work_patterns(current, pr_stats, review_count)
+        developer.growth_trajectory = self._calculate_growth_trajectory(current, now)
+
+        elapsed = time.perf_counter() - started
+        mode = "full" if rebuild else "incremental"
+        stored.last_sync_mode = mode
+        stored.last_sync_ms = int(elapsed * 1000)
+        stored.last_synced_at = now
 
         await db.flush()
         await db.refresh(developer)
 
-        return developer
+        if elapsed > SLOW_PROFILE_SECONDS:
+            logger.warning(
+                f"Slow profile sync for developer {developer_id}: {elapsed:.1f}s "
+                f"({mode}, {folded} commits folded)"
+            )
+        return developer, ProfileSyncTiming(developer_id, round(elapsed, 3), mode, folded)
 
-    async def _get_commits(
+    async def _fold_commits(
         self,
         developer_id: str,
         db: AsyncSession,
-    ) -> list[Commit]:
-        """Get commits for a developer."""
-        stmt = (
-            select(Commit)
-            .where(Commit.developer_id == developer_id)
-            .order_by(Commit.committed_at.desc())
-        )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
-
-    async def _get_pull_requests(
+        aggregates: dict[str, Any],
+        ingested_after: datetime | None,
+        ingested_through: datetime | None,
+    ) -> int:
+        """Stream a developer's commits in an ingestion-time range into *aggregates*."""
+        stmt = select(
+            Commit.languages,
+            Commit.file_types,
+            Commit.additions,
+            Commit.message,
+            Commit.committed_at,
+        ).where(Commit.developer_id == developer_id)
+        if ingested_after is not None:
+            stmt = stmt.where(Commit.created_at > ingested_after)
+        if ingested_through is not None:
+            stmt = stmt.where(Commit.created_at <= ingested_through)
+
+        result = await db.stream(stmt.execution_options(yield_per=COMMIT_STREAM_BATCH))
+        folded = 0
+        async for rows in result.partitions():
+            folded += fold_commits(aggregates, rows)
+        return folded
+
+    async def _get_pull_request_stats(
         self,
         developer_id: str,
         db: AsyncSession,
-    ) -> list[PullRequest]:
-        """Get pull requests for a developer."""
-        stmt = (
-            select(PullRequest)
-            .where(PullRequest.developer_id == developer_id)
-            .order_by(PullRequest.created_at_github.desc())
+    ) -> PullRequestStats:
+        """Get pull request counts, sizes and detected skills for a developer."""
+        size = func.coalesce(PullRequest.additions, 0) + func.coalesce(PullRequest.deletions, 0)
+        stmt = select(
+            func.count(),
+            func.count().filter(size > 0),
+            func.coalesce(func.sum(size).filter(size > 0), 0),
+        ).where(PullRequest.developer_id == developer_id)
+        count, sized_count, size_total = (await db.execute(stmt)).one()
+
+        skills_stmt = select(PullRequest.detected_skills).where(
+            PullRequest.developer_id == developer_id,
+            PullRequest.detected_skills.isnot(None),
+        )
+        skill_counts: Counter[str] = Counter()
+        for skills in (await db.execute(skills_stmt)).scalars():
+            skill_counts.update(skills or [])
+
+        return PullRequestStats(
+            count=count,
+            sized_count=sized_count,
+            size_total=int(size_total),
+            skill_counts=skill_counts,
         )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
 
-    async def _get_reviews(
+    async def _count_reviews(
         self,
         developer_id: str,
         db: AsyncSession,
-    ) -> list[CodeReview]:
-        """Get code reviews for a developer."""
-        stmt = (
-            select(CodeReview)
-            .where(CodeReview.developer_id == developer_id)
-            .order_by(CodeReview.submitted_at.desc())
-        )
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+    ) -> int:
+        """Count code reviews by a developer."""
+        stmt = select(func.count()).where(CodeReview.developer_id == developer_id)
+        return (await db.execute(stmt)).scalar_one()
 
     def _build_skill_fingerprint(
         self,
-        commits: list[Commit],
-        pull_requests: list[PullRequest],
+        aggregates: dict[str, Any],
+        pr_stats: PullRequestStats,
+        now: datetime,
     ) -> dict[str, Any]:
         """Build skill fingerprint from activity."""
-        languages = self._aggregate_languages(commits)
-        domains = self._aggregate_domains(commits, pull_requests)
-        frameworks = self._detect_frameworks(commits, pull_requests)
+        languages = self._aggregate_languages(aggregates, now)
+        domains = self._aggregate_domains(aggregates, pr_stats)
+        frameworks = self._detect_frameworks(aggregates)
 
         return {
             "languages": languages,
@@ -120,48 +485,26 @@ class ProfileSyncService:
             "tools": [],  # Would need additional analysis
         }
 
-    def _aggregate_languages(self, commits: list[Commit]) -> list[dict[str, Any]]:
-        """Aggregate language skills from commits."""
-        if not commits:
-            return []
-
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-
-        # Count language usage
-        language_commits: Counter[str] = Counter()
-        language_lines: Counter[str] = Counter()
-        recent_language_commits: Counter[str] = Counter()
-        old_language_commits: Counter[str] = Counter()
-
-        for commit in commits:
-            languages = commit.languages or []
-            additions = commit.additions or 0
-            committed_at = commit.committed_at
-
-            # Make committed_at timezone-aware if it isn't
-            if committed_at and committed_at.tzinfo is None:
-                committed_at = committed_at.replace(tzinfo=timezone.utc)
-
-            for lang in languages:
-                language_commits[lang] += 1
-                language_lines[lang] += additions
-
-                if committed_at and committed_at > six_months_ago:
-                    recent_language_commits[lang] += 1
-                else:
-                    old_language_commits[lang] += 1
+    def _aggregate_languages(
+        self,
+        aggregates: dict[str, Any],
+        now: datetime,
+    ) -> list[dict[str, Any]]:
+        """Aggregate language skills from commit counters."""
+        languages = aggregates["languages"]
+        six_months_ago = (now - RECENT_WINDOW).date()
 
-        total_commits = sum(language_commits.values())
-        total_lines = sum(language_lines.values())
+        total_commits = sum(t["commits"] for t in languages.values())
+        total_lines = sum(t["lines"] for t in languages.values())
 
         if total_commits == 0:
             return []
 
         # Build language skills
         skills = []
-        for lang, commit_count in language_commits.items():
-            lines = language_lines.get(lang, 0)
+        for lang, totals in languages.items():
+            commit_count = totals["commits"]
+            lines = totals["lines"]
 
             # Calculate proficiency score (0-100 scale)
             # Weighted: 60% based on commit ratio, 40% based on lines ratio
@@ -171,9 +514,12 @@ class ProfileSyncService:
             score = (commit_ratio * 0.6 + lines_ratio * 0.4) * 100
             score = min(100, score + min(10, commit_count / 10))
 
-            # Calculate trend
-            recent = recent_language_commits.get(lang, 0)
-            old = old_language_commits.get(lang, 0)
+            # Calculate trend; undated commits count as old
+            recent = sum(
+                n for day, n in aggregates["language_days"].get(lang, {}).items()
+                if date.fromisoformat(day) > six_months_ago
+            )
+            old = commit_count - recent
 
             if old == 0 and recent > 0:
                 trend = "growing"
@@ -200,80 +546,12 @@ class ProfileSyncService:
 
     def _aggregate_domains(
         self,
-        commits: list[Commit],
-        pull_requests: list[PullRequest],
+        aggregates: dict[str, Any],
+        pr_stats: PullRequestStats,
     ) -> list[dict[str, Any]]:
-        """Aggregate domain expertise from commits and PRs."""
-        domain_counts: Counter[str] = Counter()
-
-        # Domain indicators from file types
-        file_type_domains = {
-            # Frontend
-            "tsx": "Frontend", "jsx": "Frontend", "vue": "Frontend",
-            "svelte": "Frontend", "css": "Frontend", "scss": "Frontend",
-            "html": "Frontend",
-            # Backend
-            "py": "Backend", "go": "Backend", "java": "Backend",
-            "rb": "Backend", "php": "Backend", "cs": "Backend",
-            # API
-            "graphql": "API Development", "proto": "API Development",
-            # DevOps
-            "dockerfile": "DevOps", "tf": "DevOps", "yaml": "DevOps",
-            "yml": "DevOps", "sh": "DevOps",
-            # Database
-            "sql": "Database", "prisma": "Database",
-            # Testing
-            "test": "Testing", "spec": "Testing",
-            # Mobile
-            "swift": "Mobile", "kt": "Mobile",
-            # Data
-            "ipynb": "Data Science", "csv": "Data Science",
-        }
-
-        # Check file types from commits
-        for commit in commits:
-            file_types = commit.file_types or []
-            for ft in file_types:
-                ft_lower = ft.lower()
-                if ft_lower in file_type_domains:
-                    domain_counts[file_type_domains[ft_lower]] += 1
-
-        # Domain keywords in commit messages
-        domain_keywords = {
-            "api": "API Development",
-            "endpoint": "API Development",
-            "rest": "API Development",
-            "graphql": "API Development",
-            "frontend": "Frontend",
-            "ui": "Frontend",
-            "component": "Frontend",
-            "backend": "Backend",
-            "server": "Backend",
-            "database": "Database",
-            "migration": "Database",
-            "schema": "Database",
-            "test": "Testing",
-            "spec": "Testing",
-            "deploy": "DevOps",
-            "ci": "DevOps",
-            "docker": "DevOps",
-            "kubernetes": "DevOps",
-            "auth": "Security",
-            "security": "Security",
-            "encrypt": "Security",
-        }
-
-        for commit in commits:
-            message_lower = (commit.message or "").lower()
-            for keyword, domain in domain_keywords.items():
-                if keyword in message_lower:
-                    domain_counts[domain] += 1
-
-        # Also check PR detected skills
-        for pr in pull_requests:
-            skills = pr.detected_skills or []
-            for skill in skills:
-                domain_counts[skill] += 1
+        """Aggregate domain expertise from commit counters and PR detected skills."""
+        domain_counts: Counter[str] = Counter(aggregates["domains"])
+        domain_counts.update(pr_stats.skill_counts)
 
         total = sum(domain_counts.values())
         if total == 0:
@@ -290,101 +568,9 @@ class ProfileSyncService:
 
         return domains
 
-    def _detect_frameworks(
-        self,
-        commits: list[Commit],
-        pull_requests: list[PullRequest],
-    ) -> list[dict[str, Any]]:
-        """Detect frameworks from activity based on file types and patterns."""
-        framework_indicators: Counter[str] = Counter()
-
-        # Framework to category mapping
-        framework_categories = {
-            "React": "web",
-            "TypeScript": "language",
-            "Vue.js": "web",
-            "Svelte": "web",
-            "Astro": "web",
-            "Angular": "web",
-            "Next.js": "web",
-            "Nuxt.js": "web",
-            "Express.js": "web",
-            "FastAPI": "web",
-            "Django": "web",
-            "Flask": "web",
-            "Spring": "web",
-            "Ruby on Rails": "web",
-            "Laravel": "web",
-            "NestJS": "web",
-            "Prisma": "data",
-            "GraphQL": "api",
-            "gRPC/Protobuf": "api",
-            "Docker": "devops",
-            "Kubernetes": "devops",
-            "Terraform": "devops",
-            "YAML Config": "config",
-            "Tailwind CSS": "web",
-            "Jest": "testing",
-            "pytest": "testing",
-            "Cypress": "testing",
-        }
-
-        # File type to framework mapping
-        file_type_frameworks = {
-            "tsx": ["React", "TypeScript"],
-            "jsx": ["React"],
-            "vue": ["Vue.js"],
-            "svelte": ["Svelte"],
-            "astro": ["Astro"],
-            "prisma": ["Prisma"],
-            "graphql": ["GraphQL"],
-            "proto": ["gRPC/Protobuf"],
-            "dockerfile": ["Docker"],
-            "tf": ["Terraform"],
-            "yaml": ["YAML Config"],
-            "yml": ["YAML Config"],
-        }
-
-        # Check file types from commits
-        for commit in commits:
-            file_types = commit.file_types or []
-            for ft in file_types:
-                ft_lower = ft.lower()
-                if ft_lower in file_type_frameworks:
-                    for fw in file_type_frameworks[ft_lower]:
-                        framework_indicators[fw] += 1
-
-        # Check commit messages for framework mentions
-        framework_keywords = {
-            "react": "React",
-            "vue": "Vue.js",
-            "angular": "Angular",
-            "next": "Next.js",
-            "nuxt": "Nuxt.js",
-            "express": "Express.js",
-            "fastapi": "FastAPI",
-            "django": "Django",
-            "flask": "Flask",
-            "spring": "Spring",
-            "rails": "Ruby on Rails",
-            "laravel": "Laravel",
-            "nestjs": "NestJS",
-            "graphql": "GraphQL",
-            "prisma": "Prisma",
-            "docker": "Docker",
-            "kubernetes": "Kubernetes",
-            "terraform": "Terraform",
-            "tailwind": "Tailwind CSS",
-            "jest": "Jest",
-            "pytest": "pytest",
-            "cypress": "Cypress",
-        }
-
-        for commit in commits:
-            message_lower = (commit.message or "").lower()
-            for keyword, framework in framework_keywords.items():
-                if keyword in message_lower:
-                    framework_indicators[framework] += 1
+    def _detect_frameworks(self, aggregates: dict[str, Any]) -> list[dict[str, Any]]:
+        """Detect frameworks from file type and commit message counters."""
+        framework_indicators: Counter[str] = Counter(aggregates["frameworks"])
 
         # Build framework list
         total = sum(framework_indicators.values())
@@ -397,7 +583,7 @@ class ProfileSyncService:
             proficiency = min(100, (count / total) * 100 + count * 2)
             frameworks.append({
                 "name": fw,
-                "category": framework_categories.get(fw, "other"),
+                "category": FRAMEWORK_CATEGORIES.get(fw, "other"),
                 "proficiency_score": round(proficiency, 1),
                 "usage_count": count,
             })
@@ -406,19 +592,15 @@ class ProfileSyncService:
 
     def _analyze_work_patterns(
         self,
-        commits: list[Commit],
-        pull_requests: list[PullRequest],
-        reviews: list[CodeReview],
+        aggregates: dict[str, Any],
+        pr_stats: PullRequestStats,
+        review_count: int,
     ) -> dict[str, Any]:
         """Analyze work patterns from activity."""
         # Calculate average PR size
-        pr_sizes = []
-        for pr in pull_requests:
-            size = (pr.additions or 0) + (pr.deletions or 0)
-            if size > 0:
-                pr_sizes.append(size)
-
-        avg_pr_size = int(sum(pr_sizes) / len(pr_sizes)) if pr_sizes else 0
+        avg_pr_size = (
+            int(pr_stats.size_total / pr_stats.sized_count) if pr_stats.sized_count else 0
+        )
 
         # Determine complexity preference
         if avg_pr_size > 500:
@@ -429,17 +611,11 @@ class ProfileSyncService:
             complexity = "simple"
 
         # Analyze peak hours
-        hours: list[int] = []
-        for commit in commits:
-            if commit.committed_at:
-                hours.append(commit.committed_at.hour)
-
-        hour_counts = Counter(hours)
+        hour_counts = Counter({int(h): n for h, n in aggregates["hours"].items()})
         peak_hours = [h for h, _ in hour_counts.most_common(3)]
 
         # Determine collaboration style based on review activity
-        review_count = len(reviews)
-        pr_count = len(pull_requests)
+        pr_count = pr_stats.count
 
         if review_count > pr_count * 2:
             collab_style = "collaborative"
@@ -456,9 +632,13 @@ class ProfileSyncService:
             "average_review_turnaround_hours": 0.0,  # Would need timestamp analysis
         }
 
-    def _calculate_growth_trajectory(self, commits: list[Commit]) -> dict[str, Any]:
-        """Calculate growth trajectory from commit history."""
-        if not commits:
+    def _calculate_growth_trajectory(
+        self,
+        aggregates: dict[str, Any],
+        now: datetime,
+    ) -> dict[str, Any]:
+        """Calculate growth trajectory from commit counters."""
+        if not aggregates["commits"]:
             return {
                 "skills_acquired_6m": [],
                 "skills_acquired_12m": [],
@@ -466,29 +646,22 @@ class ProfileSyncService:
                 "learning_velocity": 0.0,
             }
 
-        now = datetime.now(timezone.utc)
-        six_months_ago = now - timedelta(days=180)
-        twelve_months_ago = now - timedelta(days=365)
+        six_months_ago = (now - RECENT_WINDOW).date()
+        twelve_months_ago = (now - HISTORY_WINDOW).date()
 
         # Track languages by time period
         recent_languages: set[str] = set()
         old_languages: set[str] = set()
         mid_languages: set[str] = set()
 
-        for commit in commits:
-            languages = commit.languages or []
-            committed_at = commit.committed_at
-
-            if committed_at and committed_at.tzinfo is None:
-                committed_at = committed_at.replace(tzinfo=timezone.utc)
-
-            if not committed_at:
-                continue
-
-            for lang in languages:
-                if committed_at > six_months_ago:
+        for lang, totals in aggregates["languages"].items():
+            if totals["aged"]:
+                old_languages.add(lang)
+            for day in aggregates["language_days"].get(lang, {}):
+                committed_on = date.fromisoformat(day)
+                if committed_on > six_months_ago:
                     recent_languages.add(lang)
-                elif committed_at > twelve_months_ago:
+                elif committed_on > twelve_months_ago:
                     mid_languages.add(lang)
                 else:
                     old_languages.add(lang)
@@ -513,26 +686,87 @@ class ProfileSyncService:
             "learning_velocity": round(velocity, 2),
         }
 
+    async def list_developer_ids(self, db: AsyncSession) -> list[str]:
+        """Return the IDs of all developers."""
+        result = await db.execute(select(Developer.id))
+        return [row[0] for row in result.all()]
+
+    async def sync_profiles(
+        self,
+        developer_ids: list[str] | None = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+        concurrency: int = PROFILE_SYNC_CONCURRENCY,
+        full: bool = False,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        heartbeat: Callable[..., None] | None = None,
+    ) -> ProfileSyncReport:
+        """Sync many profiles concurrently, each in its own session.
+
+        Args:
+            developer_ids: Developers to sync. Defaults to all developers.
+            shard_index: Which shard of the sorted IDs to sync.
+            shard_count: Number of shards the batch is split into.
+            concurrency: Maximum profiles synced at once.
+            full: Rebuild stored commit aggregates from all history.
+            session_factory: Session factory; defaults to async_session_maker.
+            heartbeat: Called after each profile, e.g. ``activity.heartbeat``.
+
+        Returns:
+            Report with counts and per-developer timings
+        """
+        if session_factory is None:
+            from aexy.core.database import async_session_maker
+            session_factory = async_session_maker
+
+        if developer_ids is None:
+            async with session_factory() as db:
+                developer_ids = await self.list_developer_ids(db)
+        developer_ids = shard_developer_ids(developer_ids, shard_index, shard_count)
+
+        report = ProfileSyncReport()
+        semaphore = asyncio.Semaphore(concurrency)
+        started = time.perf_counter()
+
+        async def sync_one(developer_id: str) -> None:
+            async with semaphore:
+                profile_started = time.perf_counter()
+                try:
+                    async with session_factory() as db:
+                        _, timing = await self._sync(developer_id, db, full)
+                        await db.commit()
+                except Exception as e:
+                    logger.warning(f"Profile sync failed for developer {developer_id}: {e}")
+                    timing = ProfileSyncTiming(
+                        developer_id,
+                        round(time.perf_counter() - profile_started, 3),
+                        "failed",
+                        error=str(e),
+                    )
+                report.add(timing)
+                if heartbeat:
+                    heartbeat(f"{len(report.timings)}/{len(developer_ids)} profiles synced")
+
+        await asyncio.gather(*(sync_one(dev_id) for dev_id in developer_ids))
+        report.seconds = time.perf_counter() - started
+
+        slowest = ", ".join(f"{t.developer_id} {t.seconds:.1f}s" for t in report.slowest(3))
+        logger.info(
+            f"Profile sync shard {shard_index + 1}/{shard_count}: {report.synced} synced, "
+            f"{report.failed} failed in {report.seconds:.1f}s (slowest: {slowest or 'n/a'})"
+        )
+        return report
+
     async def sync_all_profiles(self, db: AsyncSession) -> int:
         """Sync all developer profiles.
 
         Args:
-            db: Database session
+            db: Database session, used to list developers; each profile is
+                synced in its own session
 
         Returns:
             Number of profiles synced
         """
-        stmt = select(Developer.id)
-        result = await db.execute(stmt)
-        developer_ids = [row[0] for row in result.all()]
-
-        count = 0
-        for dev_id in developer_ids:
-            try:
-                await self.sync_developer_profile(dev_id, db)
-                count += 1
-            except Exception:
-                # Log error but continue
-                pass
-
-        return count
+        developer_ids = await self.list_developer_ids(db)
+        report = await self.sync_profiles(developer_ids)
+        return report.synced
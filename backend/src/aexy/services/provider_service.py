@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from aexy.core.encryption import encrypt_credentials, decrypt_credentials
+from aexy.core.http_clients import get_http_transport
 from aexy.models.email_infrastructure import (
     EmailProvider,
     SendingDomain,
@@ -224,7 +225,7 @@ class SendGridClient(EmailProviderClient):
         if headers:
             payload["headers"] = headers
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 response = await client.post(
                     self.API_URL,
@@ -266,7 +267,7 @@ class SendGridClient(EmailProviderClient):
                 "message": "SendGrid credentials not configured. Please add api_key."
             }
         # Test by fetching user info
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 response = await client.get(
                     "https://api.sendgrid.com/v3/user/profile",
@@ -332,7 +333,7 @@ class MailgunClient(EmailProviderClient):
             for key, value in headers.items():
                 data[f"h:{key}"] = value
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 response = await client.post(
                     f"{self.base_url}/messages",
@@ -368,7 +369,7 @@ class MailgunClient(EmailProviderClient):
                 "success": False,
                 "message": "Mailgun credentials not configured. Please add api_key and domain."
             }
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 # Test by getting domain info
                 base = (
@@ -434,7 +435,7 @@ class PostmarkClient(EmailProviderClient):
         if headers:
             payload["Headers"] = [{"Name": k, "Value": v} for k, v in headers.items()]
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 response = await client.post(
                     self.API_URL,
@@ -474,7 +475,7 @@ class PostmarkClient(EmailProviderClient):
                 "success": False,
                 "message": "Postmark credentials not configured. Please add server_token."
             }
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             try:
                 response = await client.get(
                     "https://api.postmarkapp.com/server",
@@ -9,14 +9,22 @@ Provides functionality for:
 - Control owner management
 """
 
+import calendar
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Literal
 from uuid import uuid4
 
 from croniter import croniter
-from sqlalchemy import select, and_, or_, func, case
+from sqlalchemy import select, update, delete, or_, func, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from aexy.models.reminder import (
     Reminder,
@@ -26,6 +34,7 @@ from aexy.models.reminder import (
     DomainTeamMapping,
     AssignmentRule,
     ReminderSuggestion,
+    ReminderStatsCounter,
     ReminderStatus,
     ReminderFrequency,
     InstanceStatus,
@@ -59,6 +68,147 @@ from aexy.schemas.reminder import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Recurrence periods: fixed-length ones step in wall-clock time, the rest
+# step in calendar months anchored to the start date's day of month.
+FIXED_PERIODS = {
+    ReminderFrequency.DAILY.value: timedelta(days=1),
+    ReminderFrequency.WEEKLY.value: timedelta(weeks=1),
+    ReminderFrequency.BIWEEKLY.value: timedelta(weeks=2),
+}
+MONTH_PERIODS = {
+    ReminderFrequency.MONTHLY.value: 1,
+    ReminderFrequency.QUARTERLY.value: 3,
+    ReminderFrequency.SEMI_ANNUAL.value: 6,
+    ReminderFrequency.YEARLY.value: 12,
+}
+
+
+@lru_cache(maxsize=1024)
+def _compiled_cron(expression: str) -> croniter:
+    """Parse a cron expression once; callers reposition it per use."""
+    return croniter(expression)
+
+
+def next_cron_occurrence(expression: str, after: datetime) -> datetime:
+    """Next time a cron expression fires strictly after ``after``."""
+    cron = _compiled_cron(expression)
+    cron.set_current(after, force=True)
+    return cron.get_next(datetime)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Shift by whole months, clamping the day to the month's length."""
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def _next_fixed_period(start: datetime, now: datetime, period: timedelta) -> datetime:
+    """First ``start + k * period`` (k >= 1) after ``now``, in O(1)."""
+    local_now = now.astimezone(start.tzinfo).replace(tzinfo=None)
+    periods = max(1, (local_now - start.replace(tzinfo=None)) // period + 1)
+    # A DST change between start and now can put the estimate one step off
+    while periods > 1 and start + (periods - 1) * period > now:
+        periods -= 1
+    while start + periods * period <= now:
+        periods += 1
+    return start + periods * period
+
+
+def _next_month_period(start: datetime, now: datetime, months: int) -> datetime:
+    """First ``start`` plus a multiple of ``months`` months after ``now``, in O(1)."""
+    local_now = now.astimezone(start.tzinfo)
+    elapsed = (local_now.year - start.year) * 12 + local_now.month - start.month
+    periods = max(1, elapsed // months)
+    while periods > 1 and _add_months(start, (periods - 1) * months) > now:
+        periods -= 1
+    while _add_months(start, periods * months) <= now:
+        periods += 1
+    return _add_months(start, periods * months)
+
+
+@dataclass
+class ReminderTickResult:
+    """Outcome and latency of one instance-generation run."""
+
+    created: list[tuple[Reminder, ReminderInstance]] = field(default_factory=list)
+    due_count: int = 0
+    failed_reminder_ids: list[str] = field(default_factory=list)
+    fetch_ms: float = 0.0
+    assign_ms: float = 0.0
+    write_ms: float = 0.0
+    total_ms: float = 0.0
+
+
+# Dashboard counters: see ReminderStatsCounter. Keys are per instance status,
+# so "pending" and "overdue" figures are sums over the statuses below.
+WORKSPACE_SCOPE = "workspace"
+PENDING_STATUSES = (InstanceStatus.PENDING.value, InstanceStatus.NOTIFIED.value)
+OPEN_STATUSES = (*PENDING_STATUSES, InstanceStatus.ACKNOWLEDGED.value)
+OVERDUE_STATUSES = (InstanceStatus.OVERDUE.value, InstanceStatus.ESCALATED.value)
+COUNTER_UPSERT_CHUNK = 1000
+
+
+def _week_key(moment: datetime) -> str:
+    day = moment.astimezone(timezone.utc).date()
+    return f"completed:week:{(day - timedelta(days=day.weekday())).isoformat()}"
+
+
+def _month_key(moment: datetime) -> str:
+    return f"completed:month:{moment.astimezone(timezone.utc):%Y-%m}"
+
+
+def _count_instances(
+    counts: Counter,
+    workspace_id: str,
+    owner_id: str | None,
+    status: str,
+    category: str,
+    priority: str,
+    domain: str | None,
+    n: int = 1,
+) -> None:
+    """Add ``n`` instances in ``status`` to the workspace and owner counters."""
+    keys = [
+        f"status:{status}",
+        f"category:{category}:{status}",
+        f"priority:{priority}:{status}",
+    ]
+    if domain:
+        keys.append(f"domain:{domain}:{status}")
+    scopes = [WORKSPACE_SCOPE] + ([str(owner_id)] if owner_id else [])
+    for scope in scopes:
+        for key in keys:
+            counts[(str(workspace_id), scope, key)] += n
+
+
+def _count_completions(
+    counts: Counter,
+    workspace_id: str,
+    owner_id: str | None,
+    completed_at: datetime,
+    n: int = 1,
+) -> None:
+    """Add ``n`` completions to the week and month buckets of ``completed_at``."""
+    scopes = [WORKSPACE_SCOPE] + ([str(owner_id)] if owner_id else [])
+    for scope in scopes:
+        for key in (_week_key(completed_at), _month_key(completed_at)):
+            counts[(str(workspace_id), scope, key)] += n
+
+
+def _grouped_counts(values: dict[str, int], prefix: str) -> dict[str, dict[str, int]]:
+    """Split ``<prefix>:<name>:<status>`` counters into {name: {status: n}}."""
+    grouped: dict[str, dict[str, int]] = {}
+    for key, value in values.items():
+        if key.startswith(prefix):
+            name, status = key[len(prefix):].rsplit(":", 1)
+            grouped.setdefault(name, {})[status] = value
+    return grouped
+
+
 class ReminderServiceError(Exception):
     """Base exception for reminder service errors."""
     pass
@@ -121,7 +271,7 @@ class ReminderService:
 
         if data.cron_expression:
             try:
-                croniter(data.cron_expression)
+                _compiled_cron(data.cron_expression)
             except Exception as e:
                 raise InvalidConfigurationError(f"Invalid cron expression: {e}")
 
@@ -285,7 +435,7 @@ class ReminderService:
         if data.cron_expression is not None:
             if data.cron_expression:
                 try:
-                    croniter(data.cron_expression)
+                    _compiled_cron(data.cron_expression)
                 except Exception as e:
                     raise InvalidConfigurationError(f"Invalid cron expression: {e}")
             reminder.cron_expression = data.cron_expression
@@ -455,6 +605,7 @@ class ReminderService:
 
         self.db.add(instance)
         await self.db.flush()
+        await self.record_transitions([(reminder, instance, None)])
         await self.db.refresh(instance)
         return instance
 
@@ -479,12 +630,14 @@ class ReminderService:
                 f"Cannot acknowledge instance in {instance.status} status"
             )
 
+        previous = instance.status
         instance.status = InstanceStatus.ACKNOWLEDGED.value
         instance.acknowledged_at = datetime.now(timezone.utc)
         instance.acknowledged_by_id = acknowledged_by_id
         instance.acknowledgment_notes = data.notes
 
         await self.db.flush()
+        await self.record_transitions([(instance.reminder, instance, previous)])
         await self.db.refresh(instance)
         return instance
 
@@ -508,6 +661,7 @@ class ReminderService:
         if instance.reminder.requires_evidence and not data.evidence_links:
             raise InvalidStateError("Evidence is required to complete this reminder")
 
+        previous = instance.status
         instance.status = InstanceStatus.COMPLETED.value
         instance.completed_at = datetime.now(timezone.utc)
         instance.completed_by_id = completed_by_id
@@ -517,6 +671,7 @@ class ReminderService:
             instance.evidence_links = [e.model_dump() for e in data.evidence_links]
 
         await self.db.flush()
+        await self.record_transitions([(instance.reminder, instance, previous)])
         await self.db.refresh(instance)
         return instance
 
@@ -534,12 +689,14 @@ class ReminderService:
         if instance.status in [InstanceStatus.COMPLETED.value, InstanceStatus.SKIPPED.value]:
             raise InvalidStateError(f"Cannot skip instance in {instance.status} status")
 
+        previous = instance.status
         instance.status = InstanceStatus.SKIPPED.value
         instance.skipped_at = datetime.now(timezone.utc)
         instance.skipped_by_id = skipped_by_id
         instance.skip_reason = data.reason
 
         await self.db.flush()
+        await self.record_transitions([(instance.reminder, instance, previous)])
         await self.db.refresh(instance)
         return instance
 
@@ -558,12 +715,23 @@ class ReminderService:
                 f"Cannot reassign instance in {instance.status} status"
             )
 
+        previous_owner_id = instance.assigned_owner_id
         if data.new_owner_id is not None:
             instance.assigned_owner_id = data.new_owner_id
         if data.new_team_id is not None:
             instance.assigned_team_id = data.new_team_id
 
         await self.db.flush()
+        if instance.assigned_owner_id != previous_owner_id:
+            # Move the instance between owner counters; workspace totals net out
+            reminder = instance.reminder
+            counts: Counter = Counter()
+            for owner_id, n in ((previous_owner_id, -1), (instance.assigned_owner_id, 1)):
+                _count_instances(
+                    counts, reminder.workspace_id, owner_id, instance.status,
+                    reminder.category, reminder.priority, reminder.domain, n,
+                )
+            await self._upsert_counters(counts)
         await self.db.refresh(instance)
         return instance
 
@@ -613,50 +781,20 @@ class ReminderService:
 
         if frequency == ReminderFrequency.CUSTOM.value and cron_expression:
             try:
-                cron = croniter(cron_expression, now)
-                return cron.get_next(datetime)
+                return next_cron_occurrence(cron_expression, now)
             except Exception:
                 return None
 
         # Standard frequencies
-        base = start_date
-        while base <= now:
-            if frequency == ReminderFrequency.DAILY.value:
-                base += timedelta(days=1)
-            elif frequency == ReminderFrequency.WEEKLY.value:
-                base += timedelta(weeks=1)
-            elif frequency == ReminderFrequency.BIWEEKLY.value:
-                base += timedelta(weeks=2)
-            elif frequency == ReminderFrequency.MONTHLY.value:
-                # Move to next month
-                if base.month == 12:
-                    base = base.replace(year=base.year + 1, month=1)
-                else:
-                    base = base.replace(month=base.month + 1)
-            elif frequency == ReminderFrequency.QUARTERLY.value:
-                # Move forward 3 months
-                new_month = base.month + 3
-                if new_month > 12:
-                    base = base.replace(year=base.year + 1, month=new_month - 12)
-                else:
-                    base = base.replace(month=new_month)
-            elif frequency == ReminderFrequency.SEMI_ANNUAL.value:
-                # Move forward 6 months
-                new_month = base.month + 6
-                if new_month > 12:
-                    base = base.replace(year=base.year + 1, month=new_month - 12)
-                else:
-                    base = base.replace(month=new_month)
-            elif frequency == ReminderFrequency.YEARLY.value:
-                base = base.replace(year=base.year + 1)
-            else:
-                break
-
-        return base if base > now else None
+        if frequency in FIXED_PERIODS:
+            return _next_fixed_period(start_date, now, FIXED_PERIODS[frequency])
+        if frequency in MONTH_PERIODS:
+            return _next_month_period(start_date, now, MONTH_PERIODS[frequency])
+        return None
 
-    async def get_due_reminders(self) -> list[Reminder]:
+    async def get_due_reminders(self, now: datetime | None = None) -> list[Reminder]:
         """Get reminders that are due for instance creation."""
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         stmt = (
             select(Reminder)
@@ -672,13 +810,14 @@ class ReminderService:
                 selectinload(Reminder.default_owner),
                 selectinload(Reminder.default_team),
             )
+            .order_by(Reminder.next_occurrence)
         )
 
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def advance_reminder_schedule(self, reminder: Reminder) -> None:
-        """Advance a reminder to its next occurrence."""
+    def _next_schedule(self, reminder: Reminder) -> tuple[datetime | None, str]:
+        """Next occurrence and status for a reminder whose occurrence fired."""
         next_occ = self._calculate_next_occurrence(
             frequency=reminder.frequency,
             start_date=reminder.start_date,
@@ -691,14 +830,85 @@ class ReminderService:
         if reminder.end_date and next_occ and next_occ > reminder.end_date:
             next_occ = None
 
-        reminder.next_occurrence = next_occ
-
         # If single occurrence, mark as archived
         if reminder.frequency == ReminderFrequency.ONCE.value:
-            reminder.status = ReminderStatus.ARCHIVED.value
+            return next_occ, ReminderStatus.ARCHIVED.value
+        return next_occ, reminder.status
 
+    async def advance_reminder_schedule(self, reminder: Reminder) -> None:
+        """Advance a reminder to its next occurrence."""
+        reminder.next_occurrence, reminder.status = self._next_schedule(reminder)
         await self.db.flush()
 
+    async def materialize_due_instances(
+        self,
+        now: datetime | None = None,
+    ) -> ReminderTickResult:
+        """Create instances for all due reminders and advance their schedules.
+
+        Instances are written with one multi-row insert and the schedules
+        with one batched update, rather than a flush per reminder. A
+        reminder whose assignment cannot be resolved is left due and
+        retried on the next run.
+
+        Args:
+            now: Reference time, defaults to the current time.
+
+        Returns:
+            Created (reminder, instance) pairs with per-phase timings.
+        """
+        started = time.perf_counter()
+        result = ReminderTickResult()
+
+        reminders = await self.get_due_reminders(now)
+        result.due_count = len(reminders)
+        fetched = time.perf_counter()
+
+        for reminder in reminders:
+            try:
+                owner_id, team_id = await self._resolve_assignment(reminder)
+            except Exception as e:
+                logger.error(f"Error resolving assignment for reminder {reminder.id}: {e}")
+                result.failed_reminder_ids.append(reminder.id)
+                continue
+
+            instance = ReminderInstance(
+                id=str(uuid4()),
+                reminder_id=reminder.id,
+                due_date=reminder.next_occurrence,
+                status=InstanceStatus.PENDING.value,
+                assigned_owner_id=owner_id,
+                assigned_team_id=team_id,
+            )
+            result.created.append((reminder, instance))
+        assigned = time.perf_counter()
+
+        if result.created:
+            # One flush of same-shaped rows is sent as a multi-row INSERT
+            self.db.add_all([instance for _, instance in result.created])
+            await self.db.flush()
+            await self.record_transitions(
+                [(reminder, instance, None) for reminder, instance in result.created]
+            )
+
+            schedules = []
+            for reminder, _ in result.created:
+                next_occ, status = self._next_schedule(reminder)
+                schedules.append({"id": reminder.id, "next_occurrence": next_occ, "status": status})
+            await self.db.execute(update(Reminder), schedules)
+
+            # The bulk update bypasses the identity map; keep loaded objects current
+            for (reminder, _), row in zip(result.created, schedules):
+                set_committed_value(reminder, "next_occurrence", row["next_occurrence"])
+                set_committed_value(reminder, "status", row["status"])
+
+        finished = time.perf_counter()
+        result.fetch_ms = (fetched - started) * 1000
+        result.assign_ms = (assigned - fetched) * 1000
+        result.write_ms = (finished - assigned) * 1000
+        result.total_ms = (finished - started) * 1000
+        return result
+
     # =========================================================================
     # Assignment
     # =========================================================================
@@ -1028,167 +1238,208 @@ class ReminderService:
             notification_channels=notification_channels,
         )
 
+        previous = instance.status
         instance.status = InstanceStatus.ESCALATED.value
         instance.current_escalation_level = level
 
         self.db.add(escalation)
         await self.db.flush()
+        await self.record_transitions([(instance.reminder, instance, previous)])
         await self.db.refresh(escalation)
         return escalation
 
     # =========================================================================
-    # Dashboard
+    # Dashboard Counters
     # =========================================================================
 
-    async def get_dashboard_stats(
+    async def record_transitions(
         self,
-        workspace_id: str,
-    ) -> ReminderDashboardStats:
-        """Get dashboard statistics for reminders."""
-        now = datetime.now(timezone.utc)
-        week_start = now - timedelta(days=now.weekday())
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        transitions: list[tuple[Reminder, ReminderInstance, str | None]],
+    ) -> None:
+        """Move instances between dashboard counters after status changes.
 
-        # Reminder counts by status
-        reminder_counts = await self.db.execute(
-            select(Reminder.status, func.count(Reminder.id))
-            .where(Reminder.workspace_id == workspace_id)
-            .group_by(Reminder.status)
+        Args:
+            transitions: (reminder, instance, previous status) per changed
+                instance; previous status is None for a new instance.
+        """
+        counts: Counter = Counter()
+        for reminder, instance, previous in transitions:
+            if previous == instance.status:
+                continue
+            attrs = {
+                "category": reminder.category,
+                "priority": reminder.priority,
+                "domain": reminder.domain,
+            }
+            owner_id = instance.assigned_owner_id
+            if previous is not None:
+                _count_instances(counts, reminder.workspace_id, owner_id, previous, **attrs, n=-1)
+            _count_instances(counts, reminder.workspace_id, owner_id, instance.status, **attrs)
+            if instance.status == InstanceStatus.COMPLETED.value and instance.completed_at:
+                _count_completions(counts, reminder.workspace_id, owner_id, instance.completed_at)
+
+        await self._upsert_counters(counts)
+
+    async def _upsert_counters(self, counts: Counter, replace: bool = False) -> None:
+        """Add counts to the counter rows, or overwrite them if ``replace``."""
+        rows = [
+            {"id": str(uuid4()), "workspace_id": ws, "scope": scope, "key": key, "value": n}
+            for (ws, scope, key), n in sorted(counts.items())
+            if n
+        ]
+        # Sorted rows keep lock order stable across concurrent transactions
+        for start in range(0, len(rows), COUNTER_UPSERT_CHUNK):
+            stmt = pg_insert(ReminderStatsCounter).values(rows[start:start + COUNTER_UPSERT_CHUNK])
+            value = stmt.excluded.value if replace else ReminderStatsCounter.value + stmt.excluded.value
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_reminder_stats_counter",
+                set_={"value": value, "updated_at": func.now()},
+            )
+            await self.db.execute(stmt)
+
+    def _current_counter_keys(self, now: datetime):
+        """Filter for counters that are not past completion buckets."""
+        return or_(
+            ~ReminderStatsCounter.key.startswith("completed:"),
+            ReminderStatsCounter.key.in_([_week_key(now), _month_key(now)]),
         )
-        reminder_status_counts = dict(reminder_counts.all())
 
-        # Instance counts
-        pending_count = await self.db.execute(
-            select(func.count(ReminderInstance.id))
-            .join(Reminder)
-            .where(
-                Reminder.workspace_id == workspace_id,
-                ReminderInstance.status.in_([
-                    InstanceStatus.PENDING.value,
-                    InstanceStatus.NOTIFIED.value,
-                    InstanceStatus.ACKNOWLEDGED.value,
-                ])
+    async def _load_counters(
+        self,
+        workspace_id: str,
+        scope: str,
+        now: datetime,
+    ) -> dict[str, int]:
+        """Read the current counters for a workspace or owner."""
+        result = await self.db.execute(
+            select(ReminderStatsCounter.key, ReminderStatsCounter.value).where(
+                ReminderStatsCounter.workspace_id == workspace_id,
+                ReminderStatsCounter.scope == scope,
+                self._current_counter_keys(now),
             )
         )
-        total_pending = pending_count.scalar() or 0
+        return dict(result.all())
 
-        overdue_count = await self.db.execute(
-            select(func.count(ReminderInstance.id))
-            .join(Reminder)
-            .where(
-                Reminder.workspace_id == workspace_id,
-                ReminderInstance.status.in_([
-                    InstanceStatus.PENDING.value,
-                    InstanceStatus.NOTIFIED.value,
-                    InstanceStatus.OVERDUE.value,
-                    InstanceStatus.ESCALATED.value,
-                ]),
-                ReminderInstance.due_date < now,
-            )
+    async def reconcile_counters(self, workspace_id: str) -> int:
+        """Rebuild a workspace's dashboard counters from its instances.
+
+        Corrects drift from changes the transitions do not track, such as
+        edits to a reminder's category or deleted reminders. Only the
+        current week and month completion buckets are rebuilt.
+
+        The workspace's counter rows are locked before counting, so
+        transitions adjusting them wait for the rebuilt values instead of
+        being overwritten by them. Rows are updated in place; ones whose
+        count dropped to zero are deleted.
+
+        Returns:
+            Number of counter rows written.
+        """
+        now = datetime.now(timezone.utc)
+        today = now.date()
+        week_start = datetime.combine(
+            today - timedelta(days=today.weekday()), datetime.min.time(), tzinfo=timezone.utc
         )
-        total_overdue = overdue_count.scalar() or 0
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Completed this week/month
-        completed_week = await self.db.execute(
-            select(func.count(ReminderInstance.id))
-            .join(Reminder)
+        # Same order as the upserts, so lock order stays stable
+        result = await self.db.execute(
+            select(ReminderStatsCounter.id, ReminderStatsCounter.scope, ReminderStatsCounter.key)
             .where(
-                Reminder.workspace_id == workspace_id,
-                ReminderInstance.status == InstanceStatus.COMPLETED.value,
-                ReminderInstance.completed_at >= week_start,
+                ReminderStatsCounter.workspace_id == workspace_id,
+                self._current_counter_keys(now),
             )
+            .order_by(ReminderStatsCounter.scope, ReminderStatsCounter.key)
+            .with_for_update()
         )
-        completed_this_week = completed_week.scalar() or 0
-
-        completed_month = await self.db.execute(
-            select(func.count(ReminderInstance.id))
+        existing = result.all()
+
+        counts: Counter = Counter()
+        group = (
+            ReminderInstance.assigned_owner_id,
+            ReminderInstance.status,
+            Reminder.category,
+            Reminder.priority,
+            Reminder.domain,
+        )
+        result = await self.db.execute(
+            select(*group, func.count(ReminderInstance.id))
             .join(Reminder)
-            .where(
-                Reminder.workspace_id == workspace_id,
-                ReminderInstance.status == InstanceStatus.COMPLETED.value,
-                ReminderInstance.completed_at >= month_start,
-            )
+            .where(Reminder.workspace_id == workspace_id)
+            .group_by(*group)
         )
-        completed_this_month = completed_month.scalar() or 0
+        for owner_id, status, category, priority, domain, n in result.all():
+            _count_instances(counts, workspace_id, owner_id, status, category, priority, domain, n)
 
-        # By category
-        category_stats_result = await self.db.execute(
+        result = await self.db.execute(
             select(
-                Reminder.category,
-                func.count(Reminder.id).label("total"),
-                func.sum(case(
-                    (ReminderInstance.status.in_([
-                        InstanceStatus.PENDING.value,
-                        InstanceStatus.NOTIFIED.value,
-                    ]), 1),
-                    else_=0
-                )).label("pending"),
-                func.sum(case(
-                    (ReminderInstance.status == InstanceStatus.COMPLETED.value, 1),
-                    else_=0
-                )).label("completed"),
-                func.sum(case(
-                    (and_(
-                        ReminderInstance.status.in_([
-                            InstanceStatus.PENDING.value,
-                            InstanceStatus.NOTIFIED.value,
-                            InstanceStatus.OVERDUE.value,
-                        ]),
-                        ReminderInstance.due_date < now,
-                    ), 1),
-                    else_=0
-                )).label("overdue"),
+                ReminderInstance.assigned_owner_id,
+                func.count(ReminderInstance.id).filter(ReminderInstance.completed_at >= week_start),
+                func.count(ReminderInstance.id).filter(ReminderInstance.completed_at >= month_start),
             )
-            .outerjoin(ReminderInstance, Reminder.id == ReminderInstance.reminder_id)
-            .where(Reminder.workspace_id == workspace_id)
-            .group_by(Reminder.category)
-        )
-        category_rows = category_stats_result.all()
-        by_category = [
-            CategoryStats(
-                category=row.category,
-                total=row.total or 0,
-                pending=row.pending or 0,
-                completed=row.completed or 0,
-                overdue=row.overdue or 0,
-            )
-            for row in category_rows
-        ]
-
-        # Critical/high overdue
-        critical_overdue_count = await self.db.execute(
-            select(func.count(ReminderInstance.id))
             .join(Reminder)
             .where(
                 Reminder.workspace_id == workspace_id,
-                Reminder.priority == "critical",
-                ReminderInstance.status.in_([
-                    InstanceStatus.PENDING.value,
-                    InstanceStatus.NOTIFIED.value,
-                    InstanceStatus.OVERDUE.value,
-                    InstanceStatus.ESCALATED.value,
-                ]),
-                ReminderInstance.due_date < now,
+                ReminderInstance.status == InstanceStatus.COMPLETED.value,
+                ReminderInstance.completed_at >= min(week_start, month_start),
             )
+            .group_by(ReminderInstance.assigned_owner_id)
         )
-        critical_overdue = critical_overdue_count.scalar() or 0
-
-        high_overdue_count = await self.db.execute(
-            select(func.count(ReminderInstance.id))
-            .join(Reminder)
-            .where(
-                Reminder.workspace_id == workspace_id,
-                Reminder.priority == "high",
-                ReminderInstance.status.in_([
-                    InstanceStatus.PENDING.value,
-                    InstanceStatus.NOTIFIED.value,
-                    InstanceStatus.OVERDUE.value,
-                    InstanceStatus.ESCALATED.value,
-                ]),
-                ReminderInstance.due_date < now,
+        for owner_id, week, month in result.all():
+            for scope in [WORKSPACE_SCOPE] + ([str(owner_id)] if owner_id else []):
+                counts[(str(workspace_id), scope, _week_key(now))] += week
+                counts[(str(workspace_id), scope, _month_key(now))] += month
+
+        await self._upsert_counters(counts, replace=True)
+        stale = [
+            counter_id for counter_id, scope, key in existing
+            if not counts[(str(workspace_id), scope, key)]
+        ]
+        if stale:
+            await self.db.execute(
+                delete(ReminderStatsCounter).where(ReminderStatsCounter.id.in_(stale))
             )
+        return sum(1 for n in counts.values() if n)
+
+    # =========================================================================
+    # Dashboard
+    # =========================================================================
+
+    async def get_dashboard_stats(
+        self,
+        workspace_id: str,
+    ) -> ReminderDashboardStats:
+        """Get dashboard statistics for reminders.
+
+        Instance figures come from the materialized counters, so overdue
+        counts reflect instances flagged by the hourly overdue job.
+        """
+        now = datetime.now(timezone.utc)
+
+        # Reminder counts by status
+        reminder_counts = await self.db.execute(
+            select(Reminder.status, func.count(Reminder.id))
+            .where(Reminder.workspace_id == workspace_id)
+            .group_by(Reminder.status)
         )
-        high_overdue = high_overdue_count.scalar() or 0
+        reminder_status_counts = dict(reminder_counts.all())
+
+        counters = await self._load_counters(workspace_id, WORKSPACE_SCOPE, now)
+
+        def total(*keys: str) -> int:
+            return sum(counters.get(key, 0) for key in keys)
+
+        def group_stats(prefix: str) -> list[CategoryStats]:
+            return [
+                CategoryStats(
+                    category=name,
+                    total=sum(statuses.values()),
+                    pending=sum(statuses.get(s, 0) for s in PENDING_STATUSES),
+                    completed=statuses.get(InstanceStatus.COMPLETED.value, 0),
+                    overdue=sum(statuses.get(s, 0) for s in OVERDUE_STATUSES),
+                )
+                for name, statuses in sorted(_grouped_counts(counters, prefix).items())
+            ]
 
         total_reminders = sum(reminder_status_counts.values())
 
@@ -1197,13 +1448,14 @@ class ReminderService:
             active_reminders=reminder_status_counts.get(ReminderStatus.ACTIVE.value, 0),
             paused_reminders=reminder_status_counts.get(ReminderStatus.PAUSED.value, 0),
             archived_reminders=reminder_status_counts.get(ReminderStatus.ARCHIVED.value, 0),
-            total_pending_instances=total_pending,
-            total_overdue_instances=total_overdue,
-            completed_this_week=completed_this_week,
-            completed_this_month=completed_this_month,
-            by_category=by_category,
-            critical_overdue=critical_overdue,
-            high_overdue=high_overdue,
+            total_pending_instances=total(*(f"status:{s}" for s in OPEN_STATUSES)),
+            total_overdue_instances=total(*(f"status:{s}" for s in OVERDUE_STATUSES)),
+            completed_this_week=total(_week_key(now)),
+            completed_this_month=total(_month_key(now)),
+            by_category=group_stats("category:"),
+            by_domain=group_stats("domain:"),
+            critical_overdue=total(*(f"priority:critical:{s}" for s in OVERDUE_STATUSES)),
+            high_overdue=total(*(f"priority:high:{s}" for s in OVERDUE_STATUSES)),
         )
 
     async def get_my_reminders(
@@ -1216,84 +1468,48 @@ class ReminderService:
         today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
         week_end = now + timedelta(days=7 - now.weekday())
 
-        # Base query for open instances
-        base_stmt = (
+        # Open instances assigned to me or one of my teams, in one query
+        my_team_ids = select(TeamMember.team_id).where(
+            TeamMember.developer_id == developer_id
+        )
+        stmt = (
             select(ReminderInstance)
             .join(Reminder)
             .where(
                 Reminder.workspace_id == workspace_id,
-                ReminderInstance.status.in_([
-                    InstanceStatus.PENDING.value,
-                    InstanceStatus.NOTIFIED.value,
-                    InstanceStatus.ACKNOWLEDGED.value,
-                    InstanceStatus.OVERDUE.value,
-                    InstanceStatus.ESCALATED.value,
-                ]),
+                ReminderInstance.status.in_([*OPEN_STATUSES, *OVERDUE_STATUSES]),
+                or_(
+                    ReminderInstance.assigned_owner_id == developer_id,
+                    ReminderInstance.assigned_team_id.in_(my_team_ids),
+                ),
             )
             .options(
                 selectinload(ReminderInstance.reminder),
                 selectinload(ReminderInstance.assigned_owner),
                 selectinload(ReminderInstance.assigned_team),
             )
+            .order_by(ReminderInstance.due_date)
         )
+        result = await self.db.execute(stmt)
+        instances = list(result.scalars().all())
 
-        # Assigned to me
-        assigned_to_me_stmt = base_stmt.where(
-            ReminderInstance.assigned_owner_id == developer_id
-        ).order_by(ReminderInstance.due_date)
-        result = await self.db.execute(assigned_to_me_stmt)
-        assigned_to_me = list(result.scalars().all())
+        assigned_to_me = [i for i in instances if i.assigned_owner_id == developer_id]
+        my_team_reminders = [i for i in instances if i.assigned_owner_id != developer_id]
 
-        # Get developer's teams
-        team_stmt = select(TeamMember.team_id).where(
-            TeamMember.developer_id == developer_id
-        )
-        team_result = await self.db.execute(team_stmt)
-        team_ids = [t for t in team_result.scalars().all()]
-
-        # My team reminders (not directly assigned to me)
-        my_team_stmt = base_stmt.where(
-            ReminderInstance.assigned_team_id.in_(team_ids),
-            or_(
-                ReminderInstance.assigned_owner_id.is_(None),
-                ReminderInstance.assigned_owner_id != developer_id,
-            ),
-        ).order_by(ReminderInstance.due_date)
-        result = await self.db.execute(my_team_stmt)
-        my_team_reminders = list(result.scalars().all())
-
-        # Overdue (assigned to me)
-        overdue_stmt = base_stmt.where(
-            ReminderInstance.assigned_owner_id == developer_id,
-            ReminderInstance.due_date < now,
-        ).order_by(ReminderInstance.due_date)
-        result = await self.db.execute(overdue_stmt)
-        overdue = list(result.scalars().all())
-
-        # Due today
-        due_today_stmt = base_stmt.where(
-            ReminderInstance.assigned_owner_id == developer_id,
-            ReminderInstance.due_date >= now,
-            ReminderInstance.due_date <= today_end,
-        ).order_by(ReminderInstance.due_date)
-        result = await self.db.execute(due_today_stmt)
-        due_today = list(result.scalars().all())
-
-        # Due this week
-        due_week_stmt = base_stmt.where(
-            ReminderInstance.assigned_owner_id == developer_id,
-            ReminderInstance.due_date > today_end,
-            ReminderInstance.due_date <= week_end,
-        ).order_by(ReminderInstance.due_date)
-        result = await self.db.execute(due_week_stmt)
-        due_this_week = list(result.scalars().all())
+        counters = await self._load_counters(workspace_id, str(developer_id), now)
 
         return {
             "assigned_to_me": assigned_to_me,
             "my_team_reminders": my_team_reminders,
-            "overdue": overdue,
-            "due_today": due_today,
-            "due_this_week": due_this_week,
+            "overdue": [i for i in assigned_to_me if i.due_date < now],
+            "due_today": [i for i in assigned_to_me if now <= i.due_date <= today_end],
+            "due_this_week": [i for i in assigned_to_me if today_end < i.due_date <= week_end],
+            "counts": {
+                "open": sum(counters.get(f"status:{s}", 0) for s in OPEN_STATUSES),
+                "overdue": sum(counters.get(f"status:{s}", 0) for s in OVERDUE_STATUSES),
+                "completed_this_week": counters.get(_week_key(now), 0),
+                "completed_this_month": counters.get(_month_key(now), 0),
+            },
         }
 
     # =========================================================================
@@ -1669,9 +1885,11 @@ class ReminderService:
                 instance.initial_notified_at = now
             instance.last_notified_at = now
             instance.notification_count += 1
+            previous = instance.status
             if instance.status == InstanceStatus.PENDING.value:
                 instance.status = InstanceStatus.NOTIFIED.value
             await self.db.flush()
+            await self.record_transitions([(instance.reminder, instance, previous)])
 
     async def mark_instance_overdue(self, instance_id: str) -> None:
         """Mark an instance as overdue."""
@@ -1680,5 +1898,7 @@ class ReminderService:
             InstanceStatus.PENDING.value,
             InstanceStatus.NOTIFIED.value,
         ]:
+            previous = instance.status
             instance.status = InstanceStatus.OVERDUE.value
             await self.db.flush()
+            await self.record_transitions([(instance.reminder, instance, previous)])
@@ -1,11 +1,15 @@
 """Report builder service for custom reports and scheduling."""
 
+import asyncio
+import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta
 from uuid import uuid4
 
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aexy.cache.widget_cache import WidgetCache, floor_to_bucket, get_widget_cache
 from aexy.models.analytics import CustomReport, ScheduledReport
 from aexy.schemas.analytics import (
     CustomReportCreate,
@@ -24,6 +28,10 @@ from aexy.schemas.analytics import (
 )
 from aexy.services.analytics_dashboard import AnalyticsDashboardService
 
+logger = logging.getLogger(__name__)
+
+# Widgets evaluated at once; each runs in its own session
+WIDGET_CONCURRENCY = 4
 
 # Default report templates
 DEFAULT_TEMPLATES: list[dict] = [
@@ -307,8 +315,19 @@ DEFAULT_TEMPLATES: list[dict] = [
 class ReportBuilderService:
     """Service for custom report creation and management."""
 
-    def __init__(self, analytics_service: AnalyticsDashboardService | None = None):
+    def __init__(
+        self,
+        analytics_service: AnalyticsDashboardService | None = None,
+        widget_cache: WidgetCache | None = None,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        max_concurrency: int = WIDGET_CONCURRENCY,
+    ):
         self.analytics = analytics_service or AnalyticsDashboardService()
+        self._widget_cache = widget_cache
+        self._session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # In-flight widget evaluations by cache key, shared by identical widgets
+        self._inflight: dict[str, asyncio.Future] = {}
 
     # -------------------------------------------------------------------------
     # Report CRUD Operations
@@ -657,67 +676,195 @@ class ReportBuilderService:
         else:
             return {"error": f"Unknown metric type: {metric}"}
 
-    async def get_report_data(
+    def _get_widget_cache(self) -> WidgetCache | None:
+        if self._widget_cache is None:
+            self._widget_cache = get_widget_cache()
+        return self._widget_cache
+
+    def _resolve_date_range(
         self,
-        report_id: str,
-        db: AsyncSession,
-        user_id: str,
-        developer_ids: list[str] | None = None,
-        date_range: DateRange | None = None,
-    ) -> dict:
-        """Fetch all widget data for a report."""
-        report = await self.get_report(report_id, db, user_id)
-        if not report:
-            return {"error": "Report not found or access denied"}
+        report: CustomReport,
+        date_range: DateRange | None,
+    ) -> DateRange | None:
+        """Apply the report's date range filter if no override is given."""
+        if date_range is not None or not report.filters:
+            return date_range
+
+        filter_range = report.filters.get("date_range", {})
+        if "days" in filter_range:
+            now = floor_to_bucket(datetime.utcnow())
+            return DateRange(
+                start_date=now - timedelta(days=filter_range["days"]),
+                end_date=now,
+            )
+        if "start_date" in filter_range and "end_date" in filter_range:
+            return DateRange(
+                start_date=datetime.fromisoformat(filter_range["start_date"]),
+                end_date=datetime.fromisoformat(filter_range["end_date"]),
+            )
+        return None
+
+    @staticmethod
+    def _widget_date_range(widget: WidgetConfig, date_range: DateRange | None) -> DateRange:
+        """Date range a widget is evaluated over, aligned to the cache bucket."""
+        if date_range is not None:
+            return DateRange(
+                start_date=floor_to_bucket(date_range.start_date),
+                end_date=floor_to_bucket(date_range.end_date),
+            )
+        now = floor_to_bucket(datetime.utcnow())
+        days = (widget.config or {}).get("days", 30)
+        return DateRange(start_date=now - timedelta(days=days), end_date=now)
 
-        # Apply report filters if no overrides provided
-        if date_range is None and report.filters:
-            filter_range = report.filters.get("date_range", {})
-            if "days" in filter_range:
-                date_range = DateRange(
-                    start_date=datetime.utcnow() - timedelta(days=filter_range["days"]),
-                    end_date=datetime.utcnow(),
-                )
-            elif "start_date" in filter_range and "end_date" in filter_range:
-                date_range = DateRange(
-                    start_date=datetime.fromisoformat(filter_range["start_date"]),
-                    end_date=datetime.fromisoformat(filter_range["end_date"]),
-                )
+    def _widget_cache_key(
+        self,
+        workspace_id: str | None,
+        widget: WidgetConfig,
+        developer_ids: list[str] | None,
+        date_range: DateRange,
+    ) -> str:
+        return WidgetCache.make_key(
+            workspace_id=workspace_id,
+            widget_type=widget.type.value,
+            metric=widget.metric.value if widget.metric else None,
+            config=widget.config or {},
+            developer_ids=developer_ids,
+            start_date=date_range.start_date,
+            end_date=date_range.end_date,
+        )
 
-        if developer_ids is None:
-            developer_ids = report.filters.get("developer_ids", [])
+    async def _evaluate_widget(
+        self,
+        workspace_id: str | None,
+        widget: WidgetConfig,
+        developer_ids: list[str] | None,
+        date_range: DateRange | None,
+    ) -> dict:
+        """Evaluate a widget, sharing results between identical widgets.
+
+        Identical widgets (same cache key) that are evaluated at the same
+        time await a single computation; completed results are kept in the
+        widget cache for the rest of the time bucket.
+        """
+        widget_range = self._widget_date_range(widget, date_range)
+        key = self._widget_cache_key(workspace_id, widget, developer_ids, widget_range)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._compute_widget(key, widget, developer_ids, widget_range)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Other callers may be awaiting the same computation; a cancelled
+        # caller must not cancel it for them
+        return await asyncio.shield(future)
 
-        # Fetch data for each widget
-        widget_data = {}
-        for widget_dict in report.widgets:
-            widget = WidgetConfig(**widget_dict)
-            try:
+    async def _compute_widget(
+        self,
+        key: str,
+        widget: WidgetConfig,
+        developer_ids: list[str] | None,
+        date_range: DateRange,
+    ) -> dict:
+        cache = self._get_widget_cache()
+        if cache is not None:
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self._session_factory is None:
+            from aexy.core.database import async_session_maker
+            self._session_factory = async_session_maker
+
+        async with self._semaphore:
+            async with self._session_factory() as session:
                 data = await self.get_widget_data(
                     widget=widget,
-                    db=db,
+                    db=session,
                     developer_ids=developer_ids,
                     date_range=date_range,
                 )
+
+        if cache is not None and "error" not in data:
+            await cache.set(key, data)
+        return data
+
+    @staticmethod
+    def _assemble_widget_data(
+        widgets: list[WidgetConfig],
+        results: list[dict | BaseException],
+    ) -> dict:
+        widget_data = {}
+        for widget, result in zip(widgets, results):
+            if isinstance(result, BaseException):
                 widget_data[widget.id] = {
                     "title": widget.title,
                     "type": widget.type,
-                    "data": data,
+                    "error": str(result),
                 }
-            except Exception as e:
+            else:
                 widget_data[widget.id] = {
                     "title": widget.title,
                     "type": widget.type,
-                    "error": str(e),
+                    "data": result,
                 }
+        return widget_data
+
+    async def get_report_data(
+        self,
+        report_id: str,
+        db: AsyncSession,
+        user_id: str,
+        developer_ids: list[str] | None = None,
+        date_range: DateRange | None = None,
+    ) -> dict:
+        """Fetch all widget data for a report.
+
+        Widgets are evaluated concurrently (bounded by max_concurrency) and
+        served from the widget cache when an identical widget in the same
+        workspace was computed within the current time bucket.
+        """
+        report = await self.get_report(report_id, db, user_id)
+        if not report:
+            return {"error": "Report not found or access denied"}
+
+        date_range = self._resolve_date_range(report, date_range)
+        if developer_ids is None:
+            developer_ids = (report.filters or {}).get("developer_ids", [])
+
+        widgets = [WidgetConfig(**widget_dict) for widget_dict in report.widgets]
+        results = await asyncio.gather(
+            *(
+                self._evaluate_widget(report.organization_id, widget, developer_ids, date_range)
+                for widget in widgets
+            ),
+            return_exceptions=True,
+        )
 
         return {
             "report_id": report_id,
             "report_name": report.name,
             "generated_at": datetime.utcnow().isoformat(),
             "date_range": date_range.model_dump() if date_range else None,
-            "widgets": widget_data,
+            "widgets": self._assemble_widget_data(widgets, results),
         }
 
+    async def iter_report_export_tables(
+        self,
+        report_id: str,
+        db: AsyncSession,
+        user_id: str,
+    ):
+        """Yield a report's export as one ExportTable per widget."""
+        from aexy.services.export_service import widget_tables
+
+        data = await self.get_report_data(report_id, db, user_id)
+        if "error" in data:
+            raise ValueError(data["error"])
+        for table in widget_tables(data["widgets"]):
+            yield table
+
     # -------------------------------------------------------------------------
     # Schedule Operations
     # -------------------------------------------------------------------------
@@ -859,6 +1006,61 @@ class ReportBuilderService:
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    async def generate_due_reports(
+        self,
+        db: AsyncSession,
+    ) -> list[tuple[ScheduledReport, dict]]:
+        """Compute report data for every schedule due in this tick.
+
+        All widgets of all due reports are evaluated in one batch, so a
+        widget shared by several reports (or several schedules of the same
+        report) is computed once. Delivery is left to the caller, which
+        should call mark_schedule_run for each schedule it sends.
+        """
+        schedules = await self.get_due_schedules(db)
+        if not schedules:
+            return []
+
+        stmt = select(CustomReport).where(
+            CustomReport.id.in_({s.report_id for s in schedules})
+        )
+        result = await db.execute(stmt)
+        reports = {r.id: r for r in result.scalars().all()}
+
+        plans = []
+        for schedule in schedules:
+            report = reports.get(schedule.report_id)
+            if not report:
+                continue
+            date_range = self._resolve_date_range(report, None)
+            developer_ids = (report.filters or {}).get("developer_ids", [])
+            widgets = [WidgetConfig(**widget_dict) for widget_dict in report.widgets]
+            plans.append((schedule, report, date_range, developer_ids, widgets))
+
+        calls = [
+            self._evaluate_widget(report.organization_id, widget, developer_ids, date_range)
+            for _, report, date_range, developer_ids, widgets in plans
+            for widget in widgets
+        ]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        logger.info(
+            f"Evaluated {len(calls)} widgets for {len(plans)} due report schedules"
+        )
+
+        generated = []
+        offset = 0
+        for schedule, report, date_range, _, widgets in plans:
+            widget_results = results[offset:offset + len(widgets)]
+            offset += len(widgets)
+            generated.append((schedule, {
+                "report_id": report.id,
+                "report_name": report.name,
+                "generated_at": datetime.utcnow().isoformat(),
+                "date_range": date_range.model_dump() if date_range else None,
+                "widgets": self._assemble_widget_data(widgets, widget_results),
+            }))
+        return generated
+
     async def mark_schedule_run(
         self,
         schedule_id: str,
@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.models.developer import Developer
 from aexy.models.integrations import SlackIntegration
-from aexy.models.sprint import Sprint, SprintTask
+from aexy.models.sprint import Sprint
 from aexy.models.team import TeamMember
 from aexy.models.tracking import (
     Blocker,
@@ -19,12 +19,10 @@ from aexy.models.tracking import (
     WorkLog,
     WorkLogType,
 )
-from aexy.services.slack_message_parser import (
-    BlockerMention,
-    ParsedMessage,
-    SlackMessageParser,
-    StandupContent,
-    TaskReference,
+from aexy.services.slack_message_parser import SlackMessageParser, StandupContent
+from aexy.services.workspace_reference_index import (
+    WorkspaceReferenceIndexStore,
+    get_reference_index_store,
 )
 
 logger = logging.getLogger(__name__)
@@ -33,8 +31,9 @@ logger = logging.getLogger(__name__)
 class SlackChannelMonitorService:
     """Monitors designated Slack channels for tracking data."""
 
-    def __init__(self):
+    def __init__(self, index_store: WorkspaceReferenceIndexStore | None = None):
         self.parser = SlackMessageParser()
+        self.index_store = index_store or get_reference_index_store()
 
     async def get_channel_config(
         self,
@@ -116,42 +115,6 @@ class SlackChannelMonitorService:
 
         return team.id, team.workspace_id, sprint.id if sprint else None
 
-    async def resolve_task_ref(
-        self,
-        task_ref: TaskReference,
-        sprint_id: str | None,
-        workspace_id: str | None,
-        db: AsyncSession,
-    ) -> SprintTask | None:
-        """Resolve a task reference to an actual SprintTask."""
-        if not workspace_id:
-            return None
-
-        # Try external_id match first
-        query = select(SprintTask).where(
-            SprintTask.external_id.ilike(f"%{task_ref.ref_string}%")
-        )
-        if sprint_id:
-            query = query.where(SprintTask.sprint_id == sprint_id)
-
-        result = await db.execute(query.limit(1))
-        task = result.scalar_one_or_none()
-        if task:
-            return task
-
-        # Try issue number if available
-        if task_ref.issue_number:
-            result = await db.execute(
-                select(SprintTask).where(
-                    SprintTask.external_id.ilike(f"%{task_ref.issue_number}%")
-                ).limit(1)
-            )
-            task = result.scalar_one_or_none()
-            if task:
-                return task
-
-        return None
-
     async def process_channel_message(
         self,
         channel_id: str,
@@ -171,277 +134,282 @@ class SlackChannelMonitorService:
         Returns:
             Processing result with created records
         """
-        result = {
-            "processed": False,
-            "standup_created": False,
-            "blockers_created": 0,
-            "work_logs_created": 0,
-            "errors": [],
-        }
+        results = await self.process_channel_messages(channel_id, [message], integration, db)
+        return results[0]
+
+    async def process_channel_messages(
+        self,
+        channel_id: str,
+        messages: list[dict],
+        integration: SlackIntegration,
+        db: AsyncSession,
+    ) -> list[dict]:
+        """
+        Process a batch of messages from a monitored channel.
+
+        Authors and task references are resolved through the workspace
+        reference index, team context is looked up once per developer (or
+        once for the channel's team), existing standups and active blockers
+        are loaded with one query each, and all records are committed
+        together.
+
+        Returns:
+            One processing result per message, in order
+        """
+        results = [
+            {
+                "processed": False,
+                "standup_created": False,
+                "blockers_created": 0,
+                "work_logs_created": 0,
+                "errors": [],
+            }
+            for _ in messages
+        ]
 
         # Get channel config
         config = await self.get_channel_config(channel_id, integration.id, db)
         if not config:
-            result["errors"].append("Channel not configured for monitoring")
-            return result
-
-        # Get message text
-        text = message.get("text", "")
-        if not text or len(text) < 10:
-            return result
-
-        # Skip bot messages
-        if message.get("bot_id") or message.get("subtype") == "bot_message":
-            return result
-
-        # Get the message author
-        user_id = message.get("user")
-        if not user_id:
-            return result
-
-        developer = await self.get_developer_from_slack_user(user_id, integration, db)
-        if not developer:
-            logger.debug(f"No developer mapping for Slack user {user_id}")
-            return result
-
-        # Get team and sprint context
-        team_id, workspace_id, sprint_id = await self.get_developer_team_and_sprint(
-            developer.id, config.team_id, db
-        )
+            for result in results:
+                result["errors"].append("Channel not configured for monitoring")
+            return results
+
+        user_mappings = integration.user_mappings or {}
+        indexes = {}
+
+        async def get_index(workspace_id: str | None):
+            if workspace_id not in indexes:
+                indexes[workspace_id] = await self.index_store.get(workspace_id, db, user_mappings)
+            return indexes[workspace_id]
+
+        author_index = await get_index(integration.workspace_id or integration.organization_id)
+
+        # Get team and sprint context, once per developer or for the channel's team
+        contexts: dict[str, tuple[str | None, str | None, str | None]] = {}
+        pending = []
+        for result, message in zip(results, messages):
+            # Get message text
+            text = message.get("text", "")
+            if not text or len(text) < 10:
+                continue
+
+            # Skip bot messages
+            if message.get("bot_id") or message.get("subtype") == "bot_message":
+                continue
+
+            # Get the message author
+            user_id = message.get("user")
+            if not user_id:
+                continue
+
+            developer_id = author_index.developer_for(user_id)
+            if not developer_id:
+                logger.debug(f"No developer mapping for Slack user {user_id}")
+                continue
+
+            context_key = config.team_id or developer_id
+            if context_key not in contexts:
+                contexts[context_key] = await self.get_developer_team_and_sprint(
+                    developer_id, config.team_id, db
+                )
+            team_id, workspace_id, sprint_id = contexts[context_key]
+
+            if not team_id or not workspace_id:
+                result["errors"].append("Could not determine team for developer")
+                continue
 
-        if not team_id or not workspace_id:
-            result["errors"].append("Could not determine team for developer")
-            return result
+            # Parse the message
+            parsed = self.parser.parse_message(text)
+            pending.append((result, message, text, parsed, developer_id, team_id, workspace_id, sprint_id))
 
-        # Parse the message
-        parsed = self.parser.parse_message(text)
-        message_ts = message.get("ts")
+        if not pending:
+            return results
 
-        # Process standup if detected and enabled
-        if parsed.is_standup and parsed.standup_content and config.auto_parse_standups:
-            try:
-                standup = await self._process_standup(
-                    developer_id=developer.id,
+        standup_developers = {
+            item[4] for item in pending
+            if item[3].is_standup and item[3].standup_content and config.auto_parse_standups
+        }
+        blocker_developers = {
+            item[4] for item in pending
+            if item[3].blocker_mentions and config.auto_parse_blockers
+        }
+        standups = await self._existing_standups(standup_developers, date.today(), db)
+        active_blockers = await self._active_blocker_descriptions(blocker_developers, db)
+
+        records = []
+        for result, message, text, parsed, developer_id, team_id, workspace_id, sprint_id in pending:
+            message_ts = message.get("ts")
+            index = await get_index(workspace_id)
+
+            # Process standup if detected and enabled
+            if developer_id in standup_developers and parsed.is_standup and parsed.standup_content:
+                standup = self._apply_standup(
+                    standups.get(developer_id),
+                    developer_id=developer_id,
                     team_id=team_id,
                     workspace_id=workspace_id,
                     sprint_id=sprint_id,
                     content=parsed.standup_content,
                     message_ts=message_ts,
                     channel_id=channel_id,
-                    db=db,
                 )
                 if standup:
+                    if developer_id not in standups:
+                        records.append(standup)
+                    standups[developer_id] = standup
                     result["standup_created"] = True
-            except Exception as e:
-                logger.error(f"Error processing standup: {e}")
-                result["errors"].append(f"Standup error: {str(e)}")
-
-        # Process blockers if detected and enabled
-        if parsed.blocker_mentions and config.auto_parse_blockers:
-            for blocker_mention in parsed.blocker_mentions:
-                try:
-                    blocker = await self._process_blocker(
-                        developer_id=developer.id,
+
+            # Process blockers if detected and enabled
+            if parsed.blocker_mentions and config.auto_parse_blockers:
+                existing = active_blockers.setdefault(developer_id, [])
+                for mention in parsed.blocker_mentions:
+                    # Skip if a similar blocker is already active
+                    needle = mention.description[:50].lower()
+                    if any(needle in description for description in existing):
+                        continue
+                    existing.append(mention.description.lower())
+
+                    # Resolve task if referenced
+                    task_id = index.find_task(mention.task_ref, sprint_id) if mention.task_ref else None
+                    records.append(Blocker(
+                        developer_id=developer_id,
+                        task_id=task_id,
+                        sprint_id=sprint_id,
                         team_id=team_id,
                         workspace_id=workspace_id,
+                        description=mention.description,
+                        severity=mention.severity,
+                        status=BlockerStatus.ACTIVE.value,
+                        source=TrackingSource.SLACK_CHANNEL.value,
+                        slack_message_ts=message_ts,
+                        slack_channel_id=channel_id,
+                        external_task_ref=mention.task_ref if not task_id else None,
+                    ))
+                    result["blockers_created"] += 1
+
+            # Process task references if enabled; only for significant messages
+            if parsed.task_references and config.auto_parse_task_refs and len(text) >= 20:
+                log_type = self._work_log_type(text)
+                for task_ref in parsed.task_references:
+                    task_id = index.find_task(task_ref.ref_string, sprint_id)
+                    records.append(WorkLog(
+                        developer_id=developer_id,
+                        task_id=task_id,
                         sprint_id=sprint_id,
-                        mention=blocker_mention,
-                        message_ts=message_ts,
-                        channel_id=channel_id,
-                        db=db,
-                    )
-                    if blocker:
-                        result["blockers_created"] += 1
-                except Exception as e:
-                    logger.error(f"Error processing blocker: {e}")
-                    result["errors"].append(f"Blocker error: {str(e)}")
-
-        # Process task references if enabled
-        if parsed.task_references and config.auto_parse_task_refs:
-            for task_ref in parsed.task_references:
-                try:
-                    work_log = await self._process_task_reference(
-                        developer_id=developer.id,
                         workspace_id=workspace_id,
-                        sprint_id=sprint_id,
-                        task_ref=task_ref,
-                        message_text=text,
-                        message_ts=message_ts,
-                        channel_id=channel_id,
-                        db=db,
-                    )
-                    if work_log:
-                        result["work_logs_created"] += 1
-                except Exception as e:
-                    logger.error(f"Error processing task reference: {e}")
-                    result["errors"].append(f"Task ref error: {str(e)}")
-
-        result["processed"] = True
-        return result
-
-    async def _process_standup(
+                        notes=text[:1000],  # Limit notes length
+                        log_type=log_type,
+                        source=TrackingSource.SLACK_CHANNEL.value,
+                        slack_message_ts=message_ts,
+                        slack_channel_id=channel_id,
+                        external_task_ref=task_ref.ref_string if not task_id else None,
+                    ))
+                    result["work_logs_created"] += 1
+
+            result["processed"] = True
+
+        db.add_all(records)
+        try:
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Error saving monitored channel messages: {e}")
+            for result, *_ in pending:
+                result.update(standup_created=False, blockers_created=0, work_logs_created=0)
+                result["errors"].append(f"Save error: {str(e)}")
+            return results
+
+        logger.debug(
+            f"Processed {len(pending)} messages from channel {channel_id}: {len(records)} new records"
+        )
+        return results
+
+    async def _existing_standups(
         self,
-        developer_id: str,
-        team_id: str,
-        workspace_id: str,
-        sprint_id: str | None,
-        content: StandupContent,
-        message_ts: str | None,
-        channel_id: str,
+        developer_ids: set[str],
+        standup_date: date,
         db: AsyncSession,
-    ) -> DeveloperStandup | None:
-        """Process a detected standup message."""
-        today = date.today()
-
-        # Check for existing standup today
-        existing = await db.execute(
+    ) -> dict[str, DeveloperStandup]:
+        """Load the standups the given developers already have for a date."""
+        if not developer_ids:
+            return {}
+        result = await db.execute(
             select(DeveloperStandup).where(
-                DeveloperStandup.developer_id == developer_id,
-                DeveloperStandup.standup_date == today,
+                DeveloperStandup.developer_id.in_(developer_ids),
+                DeveloperStandup.standup_date == standup_date,
             )
         )
-        existing_standup = existing.scalar_one_or_none()
-
-        if existing_standup:
-            # Update existing standup only if from Slack channel (same source)
-            if existing_standup.source == TrackingSource.SLACK_CHANNEL.value:
-                existing_standup.yesterday_summary = content.yesterday
-                existing_standup.today_plan = content.today
-                existing_standup.blockers_summary = content.blockers
-                existing_standup.slack_message_ts = message_ts
-                existing_standup.slack_channel_id = channel_id
-                await db.commit()
-                return existing_standup
-            else:
-                # Don't overwrite command/web submissions
-                return None
+        return {standup.developer_id: standup for standup in result.scalars().all()}
 
-        # Create new standup
-        standup = DeveloperStandup(
-            developer_id=developer_id,
-            team_id=team_id,
-            sprint_id=sprint_id,
-            workspace_id=workspace_id,
-            standup_date=today,
-            yesterday_summary=content.yesterday,
-            today_plan=content.today,
-            blockers_summary=content.blockers,
-            source=TrackingSource.SLACK_CHANNEL.value,
-            slack_message_ts=message_ts,
-            slack_channel_id=channel_id,
-        )
-        db.add(standup)
-        await db.commit()
-        await db.refresh(standup)
-
-        logger.info(f"Created standup for developer {developer_id} from channel {channel_id}")
-        return standup
-
-    async def _process_blocker(
+    async def _active_blocker_descriptions(
         self,
-        developer_id: str,
-        team_id: str,
-        workspace_id: str,
-        sprint_id: str | None,
-        mention: BlockerMention,
-        message_ts: str | None,
-        channel_id: str,
+        developer_ids: set[str],
         db: AsyncSession,
-    ) -> Blocker | None:
-        """Process a blocker mention."""
-        # Check for similar active blockers to avoid duplicates
-        existing = await db.execute(
-            select(Blocker).where(
-                Blocker.developer_id == developer_id,
+    ) -> dict[str, list[str]]:
+        """Lower-cased descriptions of the given developers' active blockers."""
+        if not developer_ids:
+            return {}
+        result = await db.execute(
+            select(Blocker.developer_id, Blocker.description).where(
+                Blocker.developer_id.in_(developer_ids),
                 Blocker.status == BlockerStatus.ACTIVE.value,
-                Blocker.description.ilike(f"%{mention.description[:50]}%"),
             )
         )
-        if existing.scalar_one_or_none():
-            # Similar blocker already exists
-            return None
-
-        # Resolve task if referenced
-        task_id = None
-        if mention.task_ref:
-            from aexy.services.slack_message_parser import TaskReference, TaskRefType
-            task_ref = TaskReference(
-                ref_type=TaskRefType.GENERIC,
-                ref_string=mention.task_ref,
-            )
-            task = await self.resolve_task_ref(task_ref, sprint_id, workspace_id, db)
-            if task:
-                task_id = task.id
+        descriptions: dict[str, list[str]] = {}
+        for developer_id, description in result.all():
+            descriptions.setdefault(developer_id, []).append((description or "").lower())
+        return descriptions
 
-        blocker = Blocker(
-            developer_id=developer_id,
-            task_id=task_id,
-            sprint_id=sprint_id,
-            team_id=team_id,
-            workspace_id=workspace_id,
-            description=mention.description,
-            severity=mention.severity,
-            status=BlockerStatus.ACTIVE.value,
-            source=TrackingSource.SLACK_CHANNEL.value,
-            slack_message_ts=message_ts,
-            slack_channel_id=channel_id,
-            external_task_ref=mention.task_ref if not task_id else None,
-        )
-        db.add(blocker)
-        await db.commit()
-        await db.refresh(blocker)
-
-        logger.info(f"Created blocker for developer {developer_id}: {mention.description[:50]}")
-        return blocker
-
-    async def _process_task_reference(
+    def _apply_standup(
         self,
+        existing: DeveloperStandup | None,
         developer_id: str,
+        team_id: str,
         workspace_id: str,
         sprint_id: str | None,
-        task_ref: TaskReference,
-        message_text: str,
+        content: StandupContent,
         message_ts: str | None,
         channel_id: str,
-        db: AsyncSession,
-    ) -> WorkLog | None:
-        """Process a task reference in a message."""
-        # Only create work log for significant messages
-        if len(message_text) < 20:
-            return None
-
-        # Resolve the task
-        task = await self.resolve_task_ref(task_ref, sprint_id, workspace_id, db)
-
-        # Determine log type based on message content
-        log_type = WorkLogType.NOTE.value
-        text_lower = message_text.lower()
-        if any(kw in text_lower for kw in ["completed", "done", "finished", "merged"]):
-            log_type = WorkLogType.PROGRESS.value
-        elif "?" in message_text:
-            log_type = WorkLogType.QUESTION.value
-        elif any(kw in text_lower for kw in ["decided", "decision", "agreed"]):
-            log_type = WorkLogType.DECISION.value
-
-        # Create work log
-        work_log = WorkLog(
+    ) -> DeveloperStandup | None:
+        """Create today's standup, or update it if it came from a Slack channel."""
+        if existing:
+            # Update existing standup only if from Slack channel (same source)
+            if existing.source != TrackingSource.SLACK_CHANNEL.value:
+                # Don't overwrite command/web submissions
+                return None
+            existing.yesterday_summary = content.yesterday
+            existing.today_plan = content.today
+            existing.blockers_summary = content.blockers
+            existing.slack_message_ts = message_ts
+            existing.slack_channel_id = channel_id
+            return existing
+
+        logger.info(f"Creating standup for developer {developer_id} from channel {channel_id}")
+        return DeveloperStandup(
             developer_id=developer_id,
-            task_id=task.id if task else None,
+            team_id=team_id,
             sprint_id=sprint_id,
             workspace_id=workspace_id,
-            notes=message_text[:1000],  # Limit notes length
-            log_type=log_type,
+            standup_date=date.today(),
+            yesterday_summary=content.yesterday,
+            today_plan=content.today,
+            blockers_summary=content.blockers,
             source=TrackingSource.SLACK_CHANNEL.value,
             slack_message_ts=message_ts,
             slack_channel_id=channel_id,
-            external_task_ref=task_ref.ref_string if not task else None,
         )
-        db.add(work_log)
-        await db.commit()
-        await db.refresh(work_log)
 
-        logger.debug(f"Created work log for task {task_ref.ref_string}")
-        return work_log
+    @staticmethod
+    def _work_log_type(message_text: str) -> str:
+        """Determine log type based on message content."""
+        text_lower = message_text.lower()
+        if any(kw in text_lower for kw in ["completed", "done", "finished", "merged"]):
+            return WorkLogType.PROGRESS.value
+        if "?" in message_text:
+            return WorkLogType.QUESTION.value
+        if any(kw in text_lower for kw in ["decided", "decision", "agreed"]):
+            return WorkLogType.DECISION.value
+        return WorkLogType.NOTE.value
 
     async def is_monitored_channel(
         self,
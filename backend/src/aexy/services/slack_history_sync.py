@@ -1,13 +1,22 @@
 """Slack history import and continuous sync service."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
 from typing import Any
+from uuid import uuid4
 
 import httpx
-from sqlalchemy import select, and_
+from sqlalchemy import and_, func, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aexy.cache.slack_user_cache import SlackUserCache, get_slack_user_cache
+from aexy.core.config import get_settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.integrations import SlackIntegration
 from aexy.models.tracking import (
     DeveloperStandup,
@@ -23,6 +32,65 @@ from aexy.services.slack_message_parser import SlackMessageParser, ParsedMessage
 
 logger = logging.getLogger(__name__)
 
+# Requests per minute allowed by Slack's rate limit tiers; limits apply
+# per workspace, per method (https://api.slack.com/docs/rate-limits)
+SLACK_TIER_LIMITS: dict[int, float] = {2: 20, 3: 50, 4: 100}
+SLACK_METHOD_TIERS = {
+    "conversations.history": 3,
+    "conversations.join": 3,
+    "users.info": 4,
+}
+SLACK_MAX_RETRIES = 3
+
+
+class SlackRateLimiter:
+    """Paces Slack Web API calls to each method's rate limit tier.
+
+    Calls to the same method share one schedule, so concurrent channel
+    imports stay under the workspace limit together instead of each
+    running into HTTP 429s. Methods without a known tier are not paced.
+    """
+
+    def __init__(self, tier_limits: dict[int, float] | None = None):
+        self.tier_limits = SLACK_TIER_LIMITS if tier_limits is None else tier_limits
+        self._next_start: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, method: str) -> None:
+        """Wait until the next call to *method* may start."""
+        per_minute = self.tier_limits.get(SLACK_METHOD_TIERS.get(method))
+        if not per_minute:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(method, 0.0))
+            self._next_start[method] = start + 60.0 / per_minute
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def back_off(self, method: str, seconds: float) -> None:
+        """Hold back calls to *method* for *seconds* after a 429."""
+        self._next_start[method] = max(
+            self._next_start.get(method, 0.0), time.monotonic() + seconds
+        )
+
+
+def _slim_user(user: dict) -> dict:
+    """The parts of a ``users.info`` user that imports use."""
+    profile = user.get("profile") or {}
+    return {
+        "id": user.get("id"),
+        "name": user.get("name"),
+        "real_name": user.get("real_name"),
+        "is_bot": user.get("is_bot", False),
+        "deleted": user.get("deleted", False),
+        "profile": {
+            "email": profile.get("email"),
+            "display_name": profile.get("display_name"),
+            "real_name": profile.get("real_name"),
+        },
+    }
+
 
 class SlackHistorySyncService:
     """Service for importing Slack history and continuous sync."""
@@ -30,8 +98,18 @@ class SlackHistorySyncService:
     SLACK_API_BASE = "https://slack.com/api"
     MESSAGES_PER_PAGE = 200  # Max allowed by Slack API
 
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter: SlackRateLimiter | None = None,
+        user_cache: SlackUserCache | None = None,
+    ):
         self.parser = SlackMessageParser()
+        self.rate_limiter = rate_limiter or SlackRateLimiter()
+        self.user_cache = user_cache
+        # Profiles seen during this sync; None marks users Slack couldn't find
+        self._users: dict[str, dict | None] = {}
+        # Authors already matched against developers without a result
+        self._unmatched_users: set[str] = set()
 
     async def get_channels(
         self,
@@ -42,7 +120,7 @@ class SlackHistorySyncService:
         channels = []
         cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             while True:
                 params = {
                     "types": types,
@@ -80,7 +158,7 @@ class SlackHistorySyncService:
         members = []
         cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             while True:
                 params = {"channel": channel_id, "limit": 200}
                 if cursor:
@@ -105,23 +183,133 @@ class SlackHistorySyncService:
 
         return members
 
+    async def _call(
+        self,
+        client: httpx.AsyncClient,
+        integration: SlackIntegration,
+        http_method: str,
+        method: str,
+        **kwargs,
+    ) -> dict:
+        """Call a Slack Web API method, pacing it and retrying HTTP 429s."""
+        for attempt in range(SLACK_MAX_RETRIES + 1):
+            await self.rate_limiter.wait(method)
+            response = await client.request(
+                http_method,
+                f"{self.SLACK_API_BASE}/{method}",
+                headers={"Authorization": f"Bearer {integration.bot_token}"},
+                **kwargs,
+            )
+            if response.status_code != 429:
+                return response.json()
+            if attempt < SLACK_MAX_RETRIES:
+                retry_after = float(response.headers.get("Retry-After", 1))
+                logger.info(f"Slack {method} rate limited, retrying in {retry_after}s")
+                self.rate_limiter.back_off(method, retry_after)
+
+        return {"ok": False, "error": "ratelimited"}
+
     async def get_user_info(
         self,
         integration: SlackIntegration,
         user_id: str,
     ) -> dict | None:
         """Get user information from Slack."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.SLACK_API_BASE}/users.info",
-                headers={"Authorization": f"Bearer {integration.bot_token}"},
-                params={"user": user_id},
-            )
-            data = response.json()
+        users = await self.get_users_info(integration, [user_id])
+        return users.get(user_id)
 
-            if data.get("ok"):
-                return data.get("user")
-            return None
+    async def get_users_info(
+        self,
+        integration: SlackIntegration,
+        user_ids: list[str],
+    ) -> dict[str, dict]:
+        """Get user information for several Slack users.
+
+        Profiles come from this sync's memory, then the shared user cache;
+        the rest are fetched concurrently, paced to ``users.info``'s rate
+        limit, and cached. Users Slack can't find are left out.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        missing = [user_id for user_id in user_ids if user_id not in self._users]
+
+        user_cache = self.user_cache or get_slack_user_cache()
+        if missing and user_cache:
+            cached = await user_cache.get_many(integration.team_id, missing)
+            self._users.update(cached)
+            missing = [user_id for user_id in missing if user_id not in cached]
+
+        if missing:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
+                responses = await asyncio.gather(*(
+                    self._call(client, integration, "GET", "users.info", params={"user": user_id})
+                    for user_id in missing
+                ))
+            fetched = {
+                user_id: _slim_user(data["user"])
+                for user_id, data in zip(missing, responses)
+                if data.get("ok") and data.get("user")
+            }
+            for user_id in missing:
+                self._users[user_id] = fetched.get(user_id)
+            if user_cache:
+                await user_cache.set_many(
+                    integration.team_id, fetched, get_settings().slack_user_cache_ttl_seconds
+                )
+
+        return {user_id: self._users[user_id] for user_id in user_ids if self._users.get(user_id)}
+
+    async def iter_channel_history(
+        self,
+        integration: SlackIntegration,
+        channel_id: str,
+        oldest: datetime | None = None,
+        latest: datetime | None = None,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of message history from a channel, newest first.
+
+        The next page is requested while the caller handles the current one.
+        """
+        params: dict[str, Any] = {"channel": channel_id, "limit": self.MESSAGES_PER_PAGE}
+        if oldest:
+            params["oldest"] = str(oldest.timestamp())
+        if latest:
+            params["latest"] = str(latest.timestamp())
+
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
+
+            def request_page(cursor: str | None) -> asyncio.Task:
+                page_params = {**params, "cursor": cursor} if cursor else params
+                return asyncio.create_task(self._call(
+                    client, integration, "GET", "conversations.history", params=page_params
+                ))
+
+            cursor = None
+            joined = False
+            next_page: asyncio.Task | None = request_page(cursor)
+            try:
+                while next_page:
+                    data = await next_page
+                    next_page = None
+
+                    if not data.get("ok"):
+                        error = data.get("error")
+                        if error == "not_in_channel" and not joined:
+                            # Try to join the channel
+                            joined = True
+                            await self._join_channel(integration, channel_id, client)
+                            next_page = request_page(cursor)
+                            continue
+                        logger.error(f"Failed to fetch history: {error}")
+                        return
+
+                    cursor = data.get("response_metadata", {}).get("next_cursor")
+                    if cursor and data.get("has_more"):
+                        next_page = request_page(cursor)
+
+                    yield data.get("messages", [])
+            finally:
+                if next_page:
+                    next_page.cancel()
 
     async def fetch_channel_history(
         self,
@@ -133,49 +321,13 @@ class SlackHistorySyncService:
     ) -> list[dict]:
         """Fetch message history from a channel."""
         messages = []
-        cursor = None
-        fetched = 0
-
-        async with httpx.AsyncClient() as client:
-            while True:
-                params: dict[str, Any] = {
-                    "channel": channel_id,
-                    "limit": min(self.MESSAGES_PER_PAGE, limit - fetched if limit else self.MESSAGES_PER_PAGE),
-                }
-                if cursor:
-                    params["cursor"] = cursor
-                if oldest:
-                    params["oldest"] = str(oldest.timestamp())
-                if latest:
-                    params["latest"] = str(latest.timestamp())
-
-                response = await client.get(
-                    f"{self.SLACK_API_BASE}/conversations.history",
-                    headers={"Authorization": f"Bearer {integration.bot_token}"},
-                    params=params,
-                )
-                data = response.json()
-
-                if not data.get("ok"):
-                    error = data.get("error")
-                    if error == "not_in_channel":
-                        # Try to join the channel
-                        await self._join_channel(integration, channel_id, client)
-                        continue
-                    logger.error(f"Failed to fetch history: {error}")
-                    break
-
-                batch = data.get("messages", [])
-                messages.extend(batch)
-                fetched += len(batch)
-
-                if limit and fetched >= limit:
-                    break
-
-                cursor = data.get("response_metadata", {}).get("next_cursor")
-                if not cursor or not data.get("has_more"):
-                    break
-
+        async with aclosing(
+            self.iter_channel_history(integration, channel_id, oldest=oldest, latest=latest)
+        ) as pages:
+            async for page in pages:
+                messages.extend(page)
+                if limit and len(messages) >= limit:
+                    return messages[:limit]
         return messages
 
     async def _join_channel(
@@ -185,12 +337,9 @@ class SlackHistorySyncService:
         client: httpx.AsyncClient,
     ) -> bool:
         """Join a channel."""
-        response = await client.post(
-            f"{self.SLACK_API_BASE}/conversations.join",
-            headers={"Authorization": f"Bearer {integration.bot_token}"},
-            json={"channel": channel_id},
+        data = await self._call(
+            client, integration, "POST", "conversations.join", json={"channel": channel_id}
         )
-        data = response.json()
         return data.get("ok", False)
 
     async def import_channel_history(
@@ -201,153 +350,236 @@ class SlackHistorySyncService:
         days_back: int = 30,
         team_id: str | None = None,
         sprint_id: str | None = None,
+        oldest: datetime | None = None,
+        db_lock: asyncio.Lock | None = None,
     ) -> dict:
-        """Import and parse channel history into tracking data."""
-        oldest = datetime.utcnow() - timedelta(days=days_back)
-        messages = await self.fetch_channel_history(
-            integration, channel_id, oldest=oldest
-        )
+        """Import and parse channel history into tracking data.
+
+        History is imported a page at a time: unmapped authors are resolved
+        in bulk, one query finds the page's already-imported messages, each
+        tracking table gets one multi-row insert, and the page is committed.
+        Messages since *oldest* are imported, or since *days_back* days ago.
+
+        Pass the same *db_lock* to imports sharing *db*; only database work
+        runs under it, so other channels keep fetching meanwhile.
+        """
+        if oldest is None:
+            oldest = datetime.utcnow() - timedelta(days=days_back)
+        db_lock = db_lock or asyncio.Lock()
 
         stats = {
-            "total_messages": len(messages),
+            "total_messages": 0,
             "standups_imported": 0,
             "work_logs_imported": 0,
             "blockers_imported": 0,
             "skipped": 0,
         }
 
-        # Get user mappings
+        async with aclosing(
+            self.iter_channel_history(integration, channel_id, oldest=oldest)
+        ) as pages:
+            async for messages in pages:
+                stats["total_messages"] += len(messages)
+
+                mappings = integration.user_mappings or {}
+                unmapped = {
+                    msg["user"]
+                    for msg in messages
+                    if msg.get("user") and not msg.get("bot_id") and not msg.get("subtype")
+                    and msg["user"] not in mappings and msg["user"] not in self._unmatched_users
+                }
+                profiles = await self.get_users_info(integration, list(unmapped)) if unmapped else {}
+
+                async with db_lock:
+                    try:
+                        if unmapped:
+                            await self._map_users_by_email(integration, unmapped, profiles, db)
+                        page_stats = await self._import_page(
+                            integration, channel_id, messages, db, team_id, sprint_id
+                        )
+                        await db.commit()
+                    except Exception:
+                        await db.rollback()
+                        # Rollback expires the integration, which other channels still use
+                        await db.refresh(integration)
+                        raise
+
+                for key, value in page_stats.items():
+                    stats[key] += value
+
+        return stats
+
+    async def _map_users_by_email(
+        self,
+        integration: SlackIntegration,
+        user_ids: set[str],
+        profiles: dict[str, dict],
+        db: AsyncSession,
+    ) -> None:
+        """Map unmapped message authors to developers by their Slack email."""
+        from aexy.models.developer import Developer
+
+        emails = {
+            user_id: (profiles[user_id].get("profile") or {}).get("email", "").lower()
+            for user_id in user_ids
+            if user_id in profiles and not profiles[user_id].get("is_bot")
+        }
+        emails = {user_id: email for user_id, email in emails.items() if email}
+
+        developers: dict[str, str] = {}
+        if emails:
+            result = await db.execute(
+                select(func.lower(Developer.email), Developer.id).where(
+                    func.lower(Developer.email).in_(set(emails.values()))
+                )
+            )
+            developers = dict(result.all())
+
+        mappings = dict(integration.user_mappings or {})
+        for user_id in user_ids:
+            developer_id = developers.get(emails.get(user_id, ""))
+            if developer_id:
+                mappings[user_id] = developer_id
+            else:
+                self._unmatched_users.add(user_id)
+
+        if len(mappings) != len(integration.user_mappings or {}):
+            integration.user_mappings = mappings
+
+    async def _import_page(
+        self,
+        integration: SlackIntegration,
+        channel_id: str,
+        messages: list[dict],
+        db: AsyncSession,
+        team_id: str | None,
+        sprint_id: str | None,
+    ) -> dict:
+        """Parse one page of messages and insert their tracking records."""
+        stats = {
+            "standups_imported": 0,
+            "work_logs_imported": 0,
+            "blockers_imported": 0,
+            "skipped": 0,
+        }
         user_mappings = integration.user_mappings or {}
+        workspace_id = integration.workspace_id or integration.organization_id
 
+        candidates = []
         for msg in messages:
-            # Skip bot messages and system messages
-            if msg.get("bot_id") or msg.get("subtype"):
+            # Skip bot messages, system messages and authors we can't map
+            developer_id = user_mappings.get(msg.get("user"))
+            if msg.get("bot_id") or msg.get("subtype") or not msg.get("ts") or not developer_id:
                 stats["skipped"] += 1
                 continue
+            candidates.append((msg, developer_id))
 
-            user_id = msg.get("user")
-            if not user_id:
-                stats["skipped"] += 1
-                continue
+        # Check which messages we already imported
+        existing = await self._imported_message_ts(
+            db, channel_id, [msg["ts"] for msg, _ in candidates]
+        )
 
-            # Map Slack user to developer
-            developer_id = user_mappings.get(user_id)
-            if not developer_id:
+        standups: list[dict] = []
+        blockers: list[dict] = []
+        work_logs: list[dict] = []
+        for msg, developer_id in candidates:
+            ts = msg["ts"]
+            if ts in existing:
                 stats["skipped"] += 1
                 continue
 
             text = msg.get("text", "")
-            ts = msg.get("ts", "")
-            message_time = datetime.fromtimestamp(float(ts)) if ts else datetime.utcnow()
+            message_time = datetime.fromtimestamp(float(ts), tz=timezone.utc)
+            source = {
+                "source": TrackingSource.SLACK_CHANNEL.value,
+                "slack_message_ts": ts,
+                "slack_channel_id": channel_id,
+            }
 
             # Parse the message
             parsed = self.parser.parse_message(text)
 
-            # Check if we already imported this message
-            existing = await self._message_exists(db, channel_id, ts)
-            if existing:
-                stats["skipped"] += 1
-                continue
-
-            # Create tracking records based on parsed content
-            if parsed.standup_content:
-                standup = DeveloperStandup(
-                    developer_id=developer_id,
-                    team_id=team_id,
-                    sprint_id=sprint_id,
-                    workspace_id=integration.organization_id,
-                    standup_date=message_time.date(),
-                    yesterday_summary=parsed.standup_content.yesterday,
-                    today_plan=parsed.standup_content.today,
-                    blockers_summary=parsed.standup_content.blockers,
-                    source=TrackingSource.SLACK_CHANNEL,
-                    slack_message_ts=ts,
-                    slack_channel_id=channel_id,
-                )
-                db.add(standup)
-                stats["standups_imported"] += 1
-
-            if parsed.blocker_mentions:
+            # Standups and blockers belong to a team
+            if parsed.standup_content and team_id:
+                standups.append({
+                    "id": str(uuid4()),
+                    "developer_id": developer_id,
+                    "team_id": team_id,
+                    "sprint_id": sprint_id,
+                    "workspace_id": workspace_id,
+                    "standup_date": message_time.date(),
+                    "yesterday_summary": parsed.standup_content.yesterday,
+                    "today_plan": parsed.standup_content.today,
+                    "blockers_summary": parsed.standup_content.blockers,
+                    **source,
+                })
+
+            if team_id:
                 for blocker in parsed.blocker_mentions:
-                    blocker_record = Blocker(
-                        developer_id=developer_id,
-                        team_id=team_id,
-                        sprint_id=sprint_id,
-                        description=blocker.description,
-                        severity=BlockerSeverity.MEDIUM,
-                        category=BlockerCategory.TECHNICAL,
-                        status="active",
-                        source=TrackingSource.SLACK_CHANNEL,
-                        slack_message_ts=ts,
-                        slack_channel_id=channel_id,
-                    )
-                    db.add(blocker_record)
-                    stats["blockers_imported"] += 1
+                    blockers.append({
+                        "id": str(uuid4()),
+                        "developer_id": developer_id,
+                        "team_id": team_id,
+                        "sprint_id": sprint_id,
+                        "workspace_id": workspace_id,
+                        "description": blocker.description,
+                        "severity": BlockerSeverity.MEDIUM.value,
+                        "category": BlockerCategory.TECHNICAL.value,
+                        "status": "active",
+                        **source,
+                    })
 
             # Create work log for task references
-            if parsed.task_references:
-                for task_ref in parsed.task_references:
-                    work_log = WorkLog(
-                        developer_id=developer_id,
-                        task_id=None,  # Would need to resolve task_ref.task_key to actual ID
-                        sprint_id=sprint_id,
-                        notes=f"[{task_ref.task_key}] {task_ref.context or text[:200]}",
-                        log_type=WorkLogType.NOTE,
-                        source=TrackingSource.SLACK_CHANNEL,
-                        slack_message_ts=ts,
-                        slack_channel_id=channel_id,
-                        logged_at=message_time,
-                    )
-                    db.add(work_log)
-                    stats["work_logs_imported"] += 1
+            for task_ref in parsed.task_references:
+                work_logs.append({
+                    "id": str(uuid4()),
+                    "developer_id": developer_id,
+                    "task_id": None,  # Would need to resolve the reference to an actual ID
+                    "sprint_id": sprint_id,
+                    "workspace_id": workspace_id,
+                    "notes": f"[{task_ref.ref_string}] {text[:200]}",
+                    "log_type": WorkLogType.NOTE.value,
+                    "external_task_ref": task_ref.ref_string[:100],
+                    "logged_at": message_time,
+                    **source,
+                })
+
+        if standups:
+            # One standup per developer per day; later ones in the history are dropped
+            result = await db.execute(
+                pg_insert(DeveloperStandup)
+                .values(standups)
+                .on_conflict_do_nothing(constraint="uq_developer_standup_date")
+                .returning(DeveloperStandup.id)
+            )
+            stats["standups_imported"] = len(result.all())
+        if blockers:
+            await db.execute(pg_insert(Blocker).values(blockers))
+            stats["blockers_imported"] = len(blockers)
+        if work_logs:
+            await db.execute(pg_insert(WorkLog).values(work_logs))
+            stats["work_logs_imported"] = len(work_logs)
 
-        await db.commit()
         return stats
 
-    async def _message_exists(
+    async def _imported_message_ts(
         self,
         db: AsyncSession,
         channel_id: str,
-        message_ts: str,
-    ) -> bool:
-        """Check if a message has already been imported."""
-        # Check standups
-        result = await db.execute(
-            select(DeveloperStandup).where(
-                and_(
-                    DeveloperStandup.slack_channel_id == channel_id,
-                    DeveloperStandup.slack_message_ts == message_ts,
-                )
-            )
-        )
-        if result.scalar_one_or_none():
-            return True
-
-        # Check work logs
-        result = await db.execute(
-            select(WorkLog).where(
-                and_(
-                    WorkLog.slack_channel_id == channel_id,
-                    WorkLog.slack_message_ts == message_ts,
-                )
-            )
-        )
-        if result.scalar_one_or_none():
-            return True
-
-        # Check blockers
-        result = await db.execute(
-            select(Blocker).where(
-                and_(
-                    Blocker.slack_channel_id == channel_id,
-                    Blocker.slack_message_ts == message_ts,
-                )
+        message_ts: list[str],
+    ) -> set[str]:
+        """Return which of *message_ts* have already been imported from the channel."""
+        if not message_ts:
+            return set()
+
+        result = await db.execute(union(*(
+            select(model.slack_message_ts).where(
+                model.slack_channel_id == channel_id,
+                model.slack_message_ts.in_(message_ts),
             )
-        )
-        if result.scalar_one_or_none():
-            return True
-
-        return False
+            for model in (DeveloperStandup, WorkLog, Blocker)
+        )))
+        return set(result.scalars().all())
 
     async def get_last_sync_timestamp(
         self,
@@ -391,18 +623,11 @@ class SlackHistorySyncService:
             # First sync - get last 7 days
             oldest = datetime.utcnow() - timedelta(days=7)
 
-        messages = await self.fetch_channel_history(
-            integration, channel_id, oldest=oldest
-        )
-
-        if not messages:
-            return {"synced": 0, "message": "No new messages"}
-
         return await self.import_channel_history(
             integration, channel_id, db,
-            days_back=0,  # We already filtered by oldest
             team_id=team_id,
             sprint_id=sprint_id,
+            oldest=oldest,
         )
 
     async def full_import(
@@ -414,7 +639,12 @@ class SlackHistorySyncService:
         team_id: str | None = None,
         sprint_id: str | None = None,
     ) -> dict:
-        """Full import from multiple channels."""
+        """Full import from multiple channels.
+
+        Channels are imported concurrently (``slack_import_channel_concurrency``
+        at a time); their Slack calls share one rate limiter and their
+        database work takes turns on *db*.
+        """
         if not channel_ids:
             # Get all configured channels
             result = await db.execute(
@@ -440,23 +670,35 @@ class SlackHistorySyncService:
             "errors": [],
         }
 
-        for channel_id in channel_ids:
-            try:
-                stats = await self.import_channel_history(
-                    integration, channel_id, db,
-                    days_back=days_back,
-                    team_id=team_id,
-                    sprint_id=sprint_id,
-                )
-                total_stats["channels_processed"] += 1
-                total_stats["total_messages"] += stats["total_messages"]
-                total_stats["standups_imported"] += stats["standups_imported"]
-                total_stats["work_logs_imported"] += stats["work_logs_imported"]
-                total_stats["blockers_imported"] += stats["blockers_imported"]
-                total_stats["skipped"] += stats["skipped"]
-            except Exception as e:
-                logger.error(f"Error importing channel {channel_id}: {e}")
-                total_stats["errors"].append({"channel": channel_id, "error": str(e)})
+        semaphore = asyncio.Semaphore(max(1, get_settings().slack_import_channel_concurrency))
+        db_lock = asyncio.Lock()
+
+        async def import_channel(channel_id: str) -> dict | Exception:
+            async with semaphore:
+                try:
+                    return await self.import_channel_history(
+                        integration, channel_id, db,
+                        days_back=days_back,
+                        team_id=team_id,
+                        sprint_id=sprint_id,
+                        db_lock=db_lock,
+                    )
+                except Exception as e:
+                    logger.error(f"Error importing channel {channel_id}: {e}")
+                    return e
+
+        results = await asyncio.gather(*(import_channel(c) for c in channel_ids))
+
+        for channel_id, stats in zip(channel_ids, results):
+            if isinstance(stats, Exception):
+                total_stats["errors"].append({"channel": channel_id, "error": str(stats)})
+                continue
+            total_stats["channels_processed"] += 1
+            total_stats["total_messages"] += stats["total_messages"]
+            total_stats["standups_imported"] += stats["standups_imported"]
+            total_stats["work_logs_imported"] += stats["work_logs_imported"]
+            total_stats["blockers_imported"] += stats["blockers_imported"]
+            total_stats["skipped"] += stats["skipped"]
 
         return total_stats
 
@@ -522,7 +764,7 @@ class SlackHistorySyncService:
         members = []
         cursor = None
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             while True:
                 params = {"limit": 200}
                 if cursor:
@@ -13,6 +13,7 @@ from sqlalchemy import select, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from aexy.core.config import settings
+from aexy.core.http_clients import get_http_transport
 from aexy.models.developer import Developer
 from aexy.models.integrations import SlackIntegration, SlackNotificationLog
 from aexy.schemas.integrations import (
@@ -77,7 +78,7 @@ class SlackIntegrationService:
         db: AsyncSession,
     ) -> SlackIntegrationResponse:
         """Complete OAuth flow and store integration."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_http_transport()) as client:
             response = await client.post(
                 f"{self.SLACK_API_BASE}/oauth.v2.access",
                 data={
@@ -135,7 +136,7 @@ class SlackIntegrationService:
 
         # Revoke the token
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 await client.post(
                     f"{self.SLACK_API_BASE}/auth.revoke",
                     headers={"Authorization": f"Bearer {integration.bot_token}"},
@@ -238,7 +239,7 @@ class SlackIntegrationService:
             payload["thread_ts"] = message.thread_ts
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=get_http_transport()) as client:
                 response = await client.post(
                     f"{self.SLACK_API_BASE}/chat.postMessage",
                     headers={"Authorization": f"Bearer {integration.bot_token}"},
@@ -8,6 +8,11 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """Compile keywords into one pattern matching any of them as a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
 class TaskRefType(str, Enum):
     """Types of task references."""
 
@@ -63,7 +68,11 @@ class ParsedMessage:
 
 
 class SlackMessageParser:
-    """Parses Slack messages for task references, standups, and blockers."""
+    """Parses Slack messages for task references, standups, and blockers.
+
+    Patterns and keyword lists are compiled once at import; keyword lists
+    become a single alternation so "contains any of" is one scan.
+    """
 
     # Standup detection patterns
     STANDUP_PATTERNS = [
@@ -89,6 +98,7 @@ class SlackMessageParser:
         "what i did",
         "what i'm doing",
     ]
+    STANDUP_TRIGGER_PATTERN = _keyword_pattern(STANDUP_TRIGGERS)
 
     # Blocker keywords and phrases
     BLOCKER_KEYWORDS = [
@@ -108,6 +118,7 @@ class SlackMessageParser:
         "held up",
         "on hold",
     ]
+    BLOCKER_KEYWORD_PATTERN = _keyword_pattern(BLOCKER_KEYWORDS)
 
     # Severity indicators
     SEVERITY_HIGH_KEYWORDS = [
@@ -119,6 +130,7 @@ class SlackMessageParser:
         "can't proceed",
         "completely blocked",
     ]
+    SEVERITY_HIGH_PATTERN = _keyword_pattern(SEVERITY_HIGH_KEYWORDS)
     SEVERITY_LOW_KEYWORDS = [
         "minor",
         "small",
@@ -126,6 +138,7 @@ class SlackMessageParser:
         "when possible",
         "nice to have",
     ]
+    SEVERITY_LOW_PATTERN = _keyword_pattern(SEVERITY_LOW_KEYWORDS)
 
     # Task reference patterns
     TASK_PATTERNS = [
@@ -138,10 +151,37 @@ class SlackMessageParser:
         # Generic task mentions: task #123, task:123, task 123
         (TaskRefType.GENERIC, re.compile(r"task[\s:#]+(\d+)", re.IGNORECASE)),
     ]
+    # Every task pattern needs one of these; text without any skips the scans
+    TASK_HINT_PATTERN = re.compile(r"#\d|[a-z]-\d|task", re.IGNORECASE)
+    # Character a pattern's match must contain, checked before scanning
+    TASK_PATTERN_REQUIRES = {
+        TaskRefType.GITHUB_ISSUE: "#",
+        TaskRefType.JIRA: "-",
+        TaskRefType.LINEAR: "-",
+    }
+
+    # Slack formatting removed before parsing
+    USER_MENTION_PATTERN = re.compile(r"<@(\w+)(?:\|([^>]+))?>")
+    CHANNEL_MENTION_PATTERN = re.compile(r"<#(\w+)\|([^>]+)>")
+    URL_PATTERN = re.compile(r"<(https?://[^|>]+)(?:\|([^>]+))?>")
+    CODE_BLOCK_PATTERN = re.compile(r"```[\s\S]*?```")
+    INLINE_CODE_PATTERN = re.compile(r"`[^`]+`")
+
+    # Standup line prefixes and separators
+    STANDUP_SEPARATOR_PATTERN = re.compile(r"\s*\|\s*")
+    YESTERDAY_PREFIX_PATTERN = re.compile(r"^(yesterday|done|completed)[\s:]*", re.IGNORECASE)
+    TODAY_PREFIX_PATTERN = re.compile(r"^(today|plan|doing)[\s:]*", re.IGNORECASE)
+    BLOCKER_PREFIX_PATTERN = re.compile(r"^(blocker|blocked)[\s:]*", re.IGNORECASE)
+
+    # Action item lines
+    BULLET_PATTERN = re.compile(r"^[\s]*[-*•]\s*(.+)$", re.MULTILINE)
+    NUMBERED_PATTERN = re.compile(r"^[\s]*\d+[.)]\s*(.+)$", re.MULTILINE)
 
     # Progress indicators for classification
     PROGRESS_KEYWORDS = ["completed", "finished", "done", "merged", "deployed", "fixed"]
     QUESTION_KEYWORDS = ["?", "how", "what", "where", "when", "why", "can someone", "does anyone"]
+    PROGRESS_PATTERN = _keyword_pattern(PROGRESS_KEYWORDS)
+    QUESTION_PATTERN = _keyword_pattern(QUESTION_KEYWORDS)
 
     def parse_message(self, text: str) -> ParsedMessage:
         """Parse a message for task refs, standup content, and blockers."""
@@ -169,7 +209,7 @@ class SlackMessageParser:
 
         # Classify if not already classified
         if not result.classification:
-            result.classification = self._classify_message(text)
+            result.classification = self._classify_message(text, result.task_references)
             result.confidence = 0.7  # Lower confidence for general classification
 
         # Detect sentiment
@@ -179,18 +219,20 @@ class SlackMessageParser:
 
     def _clean_slack_text(self, text: str) -> str:
         """Clean Slack-specific formatting from text."""
-        # Remove user mentions but keep the username
-        text = re.sub(r"<@(\w+)(?:\|([^>]+))?>", r"@\2" if r"\2" else r"@\1", text)
+        if "<" in text:
+            # Remove user mentions but keep the username
+            text = self.USER_MENTION_PATTERN.sub(r"@\2" if r"\2" else r"@\1", text)
 
-        # Remove channel mentions
-        text = re.sub(r"<#(\w+)\|([^>]+)>", r"#\2", text)
+            # Remove channel mentions
+            text = self.CHANNEL_MENTION_PATTERN.sub(r"#\2", text)
 
-        # Remove URL formatting
-        text = re.sub(r"<(https?://[^|>]+)(?:\|([^>]+))?>", r"\2" if r"\2" else r"\1", text)
+            # Remove URL formatting
+            text = self.URL_PATTERN.sub(r"\2" if r"\2" else r"\1", text)
 
-        # Remove code blocks for parsing (keep for display)
-        text = re.sub(r"```[\s\S]*?```", "[code block]", text)
-        text = re.sub(r"`[^`]+`", "[code]", text)
+        if "`" in text:
+            # Remove code blocks for parsing (keep for display)
+            text = self.CODE_BLOCK_PATTERN.sub("[code block]", text)
+            text = self.INLINE_CODE_PATTERN.sub("[code]", text)
 
         return text.strip()
 
@@ -199,7 +241,13 @@ class SlackMessageParser:
         references = []
         seen = set()
 
+        if not self.TASK_HINT_PATTERN.search(text):
+            return references
+
         for ref_type, pattern in self.TASK_PATTERNS:
+            required = self.TASK_PATTERN_REQUIRES.get(ref_type)
+            if required and required not in text:
+                continue
             for match in pattern.finditer(text):
                 ref_string = match.group(0)
                 if ref_string in seen:
@@ -235,7 +283,7 @@ class SlackMessageParser:
         text_lower = text.lower()
 
         # Check for standup triggers
-        has_trigger = any(trigger in text_lower for trigger in self.STANDUP_TRIGGERS)
+        has_trigger = self.STANDUP_TRIGGER_PATTERN.search(text_lower) is not None
 
         # Check for structured standup format: yesterday: X | today: Y | blockers: Z
         if "|" in text and ("yesterday" in text_lower or "today" in text_lower):
@@ -256,7 +304,7 @@ class SlackMessageParser:
 
     def _parse_structured_standup(self, text: str) -> StandupContent | None:
         """Parse structured standup: yesterday: X | today: Y | blockers: Z"""
-        parts = re.split(r"\s*\|\s*", text)
+        parts = self.STANDUP_SEPARATOR_PATTERN.split(text)
         yesterday = ""
         today = ""
         blockers = None
@@ -338,11 +386,11 @@ class SlackMessageParser:
             for line in substantive_lines:
                 line_lower = line.lower()
                 if any(kw in line_lower for kw in ["yesterday", "done", "completed"]):
-                    yesterday = re.sub(r"^(yesterday|done|completed)[\s:]*", "", line, flags=re.IGNORECASE).strip()
+                    yesterday = self.YESTERDAY_PREFIX_PATTERN.sub("", line).strip()
                 elif any(kw in line_lower for kw in ["today", "plan", "doing"]):
-                    today = re.sub(r"^(today|plan|doing)[\s:]*", "", line, flags=re.IGNORECASE).strip()
+                    today = self.TODAY_PREFIX_PATTERN.sub("", line).strip()
                 elif any(kw in line_lower for kw in ["blocker", "blocked"]):
-                    blockers = re.sub(r"^(blocker|blocked)[\s:]*", "", line, flags=re.IGNORECASE).strip()
+                    blockers = self.BLOCKER_PREFIX_PATTERN.sub("", line).strip()
 
             if yesterday and today:
                 return StandupContent(
@@ -358,6 +406,8 @@ class SlackMessageParser:
         """Detect blocker mentions in text."""
         blockers = []
         text_lower = text.lower()
+        if not self.BLOCKER_KEYWORD_PATTERN.search(text_lower):
+            return blockers
 
         # Check for blocker keywords
         for keyword in self.BLOCKER_KEYWORDS:
@@ -380,9 +430,10 @@ class SlackMessageParser:
 
                 # Determine severity
                 severity = "medium"
-                if any(kw in description.lower() for kw in self.SEVERITY_HIGH_KEYWORDS):
+                description_lower = description.lower()
+                if self.SEVERITY_HIGH_PATTERN.search(description_lower):
                     severity = "high"
-                elif any(kw in description.lower() for kw in self.SEVERITY_LOW_KEYWORDS):
+                elif self.SEVERITY_LOW_PATTERN.search(description_lower):
                     severity = "low"
 
                 # Check for task reference in the description
@@ -400,20 +451,27 @@ class SlackMessageParser:
 
         return blockers
 
-    def _classify_message(self, text: str) -> str:
-        """Classify message type based on content."""
+    def _classify_message(
+        self, text: str, task_references: list[TaskReference] | None = None
+    ) -> str:
+        """Classify message type based on content.
+
+        Pass *task_references* when they have already been extracted.
+        """
         text_lower = text.lower()
 
         # Check for questions
-        if any(kw in text_lower for kw in self.QUESTION_KEYWORDS):
+        if self.QUESTION_PATTERN.search(text_lower):
             return "question"
 
         # Check for progress updates
-        if any(kw in text_lower for kw in self.PROGRESS_KEYWORDS):
+        if self.PROGRESS_PATTERN.search(text_lower):
             return "update"
 
         # Check for task references
-        if self.extract_task_references(text):
+        if task_references is None:
+            task_references = self.extract_task_references(text)
+        if task_references:
             return "task_mention"
 
         return "general"
@@ -449,10 +507,7 @@ class SlackMessageParser:
         items = []
 
         # Look for bullet points or numbered items
-        bullet_pattern = re.compile(r"^[\s]*[-*•]\s*(.+)$", re.MULTILINE)
-        numbered_pattern = re.compile(r"^[\s]*\d+[.)]\s*(.+)$", re.MULTILINE)
-
-        for pattern in [bullet_pattern, numbered_pattern]:
+        for pattern in [self.BULLET_PATTERN, self.NUMBERED_PATTERN]:
             for match in pattern.finditer(text):
                 item = match.group(1).strip()
                 if len(item) > 5:  # Filter out very short items
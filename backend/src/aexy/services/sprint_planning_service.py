@@ -1,6 +1,7 @@
 """Sprint planning service for AI-powered task assignment and optimization."""
 
 import logging
+import math
 from typing import Any
 from dataclasses import dataclass
 
@@ -12,6 +13,7 @@ from aexy.models.sprint import Sprint, SprintTask
 from aexy.models.team import TeamMember
 from aexy.models.developer import Developer
 from aexy.llm.gateway import LLMGateway
+from aexy.services.assignment_solver import solve_assignment
 from aexy.services.task_matcher import TaskMatcher, TaskMatchRequest, RankedCandidate
 from aexy.services.whatif_analyzer import WhatIfAnalyzer, WhatIfScenario
 
@@ -73,6 +75,10 @@ class SprintPlanningService:
     HOURS_PER_POINT = 4
     # Default capacity per developer per sprint (2-week sprint)
     DEFAULT_DEVELOPER_CAPACITY_HOURS = 60
+    # Optimization caps each member at this multiple of the average task count
+    MAX_LOAD_FACTOR = 1.25
+    # Score bonus for leaving a task with its current assignee when optimizing
+    KEEP_ASSIGNEE_BONUS = 0.25
 
     def __init__(self, db: AsyncSession, llm_gateway: LLMGateway | None = None):
         """Initialize the sprint planning service.
@@ -337,41 +343,46 @@ class SprintPlanningService:
         team_members: list[Developer],
         current_workload: dict[str, int],
     ) -> list[dict]:
-        """Generate proposals to optimize task distribution."""
-        proposals = []
+        """Generate proposals to optimize task distribution.
+
+        Assigned tasks are redistributed with the assignment solver. Each
+        member takes at most MAX_LOAD_FACTOR times the average task count,
+        tasks are scored by skill match on their labels, and keeping the
+        current assignee earns KEEP_ASSIGNEE_BONUS, so tasks only move when
+        balance or a clearly better fit calls for it.
+        """
+        assigned = [t for t in tasks if t.assignee_id]
+        if not assigned or not team_members:
+            return []
+
+        capacity = max(1, math.ceil(len(assigned) / len(team_members) * self.MAX_LOAD_FACTOR))
+        member_ids = [str(m.id) for m in team_members]
 
-        # Find overloaded members
-        avg_workload = sum(current_workload.values()) / len(team_members) if team_members else 0
-        overloaded = [
-            dev_id for dev_id, count in current_workload.items()
-            if count > avg_workload * 1.5
+        tasks_data = [
+            {"id": str(t.id), "signals": {"required_skills": t.labels or []}}
+            for t in assigned
         ]
-        underloaded = [
-            str(m.id) for m in team_members
-            if current_workload.get(str(m.id), 0) < avg_workload * 0.5
+        scores = [
+            [
+                overall + (self.KEEP_ASSIGNEE_BONUS if member_id == task.assignee_id else 0.0)
+                for (overall, _, _), member_id in zip(row, member_ids)
+            ]
+            for task, row in zip(assigned, self.whatif_analyzer.match_matrix(tasks_data, team_members))
         ]
+        solution = solve_assignment(scores, [capacity] * len(member_ids))
 
-        if not overloaded or not underloaded:
-            return []
-
-        # Try to move tasks from overloaded to underloaded
-        for dev_id in overloaded:
-            dev_tasks = [t for t in tasks if t.assignee_id == dev_id]
-            for task in dev_tasks[:2]:  # Move up to 2 tasks
-                if underloaded:
-                    target = underloaded[0]
-                    proposals.append({
-                        "task_id": str(task.id),
-                        "task_title": task.title,
-                        "current_developer_id": dev_id,
-                        "new_developer_id": target,
-                        "reason": "Workload rebalancing",
-                    })
-                    # Update tracking
-                    current_workload[dev_id] = current_workload.get(dev_id, 0) - 1
-                    current_workload[target] = current_workload.get(target, 0) + 1
-                    if current_workload.get(target, 0) >= avg_workload:
-                        underloaded.remove(target)
+        proposals = []
+        for task, member in zip(assigned, solution):
+            if member is None or member_ids[member] == task.assignee_id:
+                continue
+            overloaded = current_workload.get(task.assignee_id, 0) > capacity
+            proposals.append({
+                "task_id": str(task.id),
+                "task_title": task.title,
+                "current_developer_id": task.assignee_id,
+                "new_developer_id": member_ids[member],
+                "reason": "Workload rebalancing" if overloaded else "Better skill match",
+            })
 
         return proposals
 
@@ -7,6 +7,8 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.models.developer import Developer
+from aexy.models.epic import Epic
 from aexy.models.sprint import Sprint, SprintTask, TaskActivity
 from aexy.services.task_sources.base import TaskItem, TaskSourceConfig, TaskStatus
 from aexy.services.task_sources.github_issues import GitHubIssuesSource
@@ -14,6 +16,20 @@ from aexy.services.task_sources.jira import JiraSource
 from aexy.services.task_sources.linear import LinearSource
 from aexy.services.automation_service import dispatch_automation_event
 
+# Columns of the sprint task export tables, in file order
+SPRINT_SUMMARY_EXPORT_COLUMNS = ["status", "tasks", "story_points"]
+SPRINT_TASK_EXPORT_COLUMNS = [
+    "id",
+    "title",
+    "status",
+    "priority",
+    "story_points",
+    "assignee",
+    "epic",
+    "labels",
+    "created_at",
+    "updated_at",
+]
 
 class SprintTaskService:
     """Service for managing tasks within sprints."""
@@ -171,6 +187,73 @@ class SprintTaskService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def iter_sprint_export_tables(
+        self,
+        sprint_id: str,
+        batch_size: int = 500,
+    ):
+        """Yield a sprint's task export as ExportTable sections.
+
+        Task rows are read through a server-side cursor in batches of
+        `batch_size`, with assignee and epic names joined in the query.
+        """
+        from aexy.services.export_service import ExportTable
+
+        summary_stmt = (
+            select(
+                SprintTask.status,
+                func.count(),
+                func.coalesce(func.sum(SprintTask.story_points), 0),
+            )
+            .where(SprintTask.sprint_id == sprint_id)
+            .group_by(SprintTask.status)
+            .order_by(SprintTask.status)
+        )
+        result = await self.db.execute(summary_stmt)
+        summary = [list(row) for row in result.all()]
+        yield ExportTable(
+            title="Summary",
+            headers=SPRINT_SUMMARY_EXPORT_COLUMNS,
+            rows=summary,
+        )
+
+        task_stmt = (
+            select(
+                SprintTask.id,
+                SprintTask.title,
+                SprintTask.status,
+                SprintTask.priority,
+                SprintTask.story_points,
+                Developer.name,
+                Epic.title,
+                SprintTask.labels,
+                SprintTask.created_at,
+                SprintTask.updated_at,
+            )
+            .outerjoin(Developer, Developer.id == SprintTask.assignee_id)
+            .outerjoin(Epic, Epic.id == SprintTask.epic_id)
+            .where(SprintTask.sprint_id == sprint_id)
+            .order_by(SprintTask.priority.desc(), SprintTask.created_at)
+        )
+
+        async def rows():
+            result = await self.db.stream(task_stmt.execution_options(yield_per=batch_size))
+            async for row in result:
+                *fields, labels, created_at, updated_at = row
+                yield [
+                    *fields,
+                    ", ".join(labels or []),
+                    created_at.isoformat() if created_at else None,
+                    updated_at.isoformat() if updated_at else None,
+                ]
+
+        yield ExportTable(
+            title="Tasks",
+            headers=SPRINT_TASK_EXPORT_COLUMNS,
+            rows=rows(),
+            total_rows=sum(count for _, count, _ in summary),
+        )
+
     async def get_tasks_by_assignee(
         self,
         assignee_id: str,
@@ -10,11 +10,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from aexy.cache.github_etag_cache import get_github_etag_cache
 from aexy.core.config import get_settings
 from aexy.core.database import async_session_maker
 from aexy.models.activity import CodeReview, Commit, PullRequest
 from aexy.models.developer import Developer, GitHubConnection
 from aexy.models.repository import DeveloperRepository, Repository
+from aexy.services.code_ownership_service import CodeOwnershipService
+from aexy.services.collaboration_network import CollaborationNetworkAnalyzer
+from aexy.services.github_graphql import GitHubGraphQLFetcher
+from aexy.services.github_rate_limiter import get_rate_limiter
 from aexy.services.github_service import GitHubAPIError, GitHubAuthError, GitHubService
 
 logger = logging.getLogger(__name__)
@@ -23,6 +28,19 @@ settings = get_settings()
 # Sync mode types
 SyncMode = Literal["async", "temporal"]
 SyncType = Literal["full", "incremental"]
+FetchMode = Literal["rest", "graphql"]
+
+# Commit detail requests in flight per repository sync
+COMMIT_DETAIL_CONCURRENCY = 8
+
+# Map common extensions to languages
+EXT_TO_LANGUAGE = {
+    "py": "Python", "js": "JavaScript", "ts": "TypeScript",
+    "tsx": "TypeScript", "jsx": "JavaScript", "java": "Java",
+    "go": "Go", "rs": "Rust", "rb": "Ruby", "php": "PHP",
+    "cs": "C#", "cpp": "C++", "c": "C", "swift": "Swift",
+    "kt": "Kotlin", "scala": "Scala", "vue": "Vue",
+}
 
 
 class SyncService:
@@ -117,12 +135,19 @@ class SyncService:
         developer_id: str,
         repository_id: str,
         heartbeat_fn: Any = None,
+        sync_type: SyncType = "incremental",
+        fetch_mode: FetchMode | None = None,
     ) -> dict[str, Any]:
         """Sync a repository's commits, PRs, and reviews.
 
         This is the public entry point used by the Temporal activity.
-        Fetches the access token and runs the full sync within self.db session.
+        Fetches the access token and runs the sync within self.db session.
+        Incremental syncs list commits from the stored cursor
+        (last_commit_date) instead of the beginning of history. PRs and
+        reviews are fetched over REST or GraphQL per `fetch_mode`, defaulting
+        to settings.github_sync_fetch_mode.
         """
+        fetch_mode = fetch_mode or settings.github_sync_fetch_mode
         # Get developer repo
         stmt = (
             select(DeveloperRepository)
@@ -165,25 +190,41 @@ class SyncService:
         self._dev_cache_by_github_id: dict[int, str] = {}
         self._dev_cache_by_email: dict[str, str] = {}
 
+        since = None
+        if sync_type == "incremental" and dev_repo.incremental_sync_enabled:
+            since = dev_repo.last_commit_date
+
         try:
-            async with GitHubService(access_token=connection.access_token) as gh:
-                commits_synced = await self._sync_commits_with_session(
-                    self.db, gh, owner, repo_name, developer_id, repository_id, repo_language
+            async with GitHubService(
+                access_token=connection.access_token,
+                etag_cache=get_github_etag_cache(),
+                rate_limiter=get_rate_limiter(),
+            ) as gh:
+                commits_synced, newest_commit = await self._sync_commits_with_session(
+                    self.db, gh, owner, repo_name, developer_id, repository_id,
+                    repo_language, since=since,
                 )
 
+                await self._backfill_ownership(gh, owner, repo_name, heartbeat_fn)
+
                 if heartbeat_fn:
                     heartbeat_fn(f"Synced {commits_synced} commits, fetching PRs...")
 
-                prs_synced = await self._sync_pull_requests_with_session(
-                    self.db, gh, owner, repo_name, developer_id, repository_id
-                )
+                if fetch_mode == "graphql":
+                    prs_synced, reviews_synced = await self._sync_pull_requests_graphql(
+                        self.db, gh, owner, repo_name, developer_id
+                    )
+                else:
+                    prs_synced = await self._sync_pull_requests_with_session(
+                        self.db, gh, owner, repo_name, developer_id, repository_id
+                    )
 
-                if heartbeat_fn:
-                    heartbeat_fn(f"Synced {prs_synced} PRs, fetching reviews...")
+                    if heartbeat_fn:
+                        heartbeat_fn(f"Synced {prs_synced} PRs, fetching reviews...")
 
-                reviews_synced = await self._sync_reviews_with_session(
-                    self.db, gh, owner, repo_name, developer_id, repository_id
-                )
+                    reviews_synced = await self._sync_reviews_with_session(
+                        self.db, gh, owner, repo_name, developer_id, repository_id
+                    )
 
             # Update status
             dev_repo.sync_status = "synced"
@@ -192,6 +233,12 @@ class SyncService:
             dev_repo.prs_synced = prs_synced
             dev_repo.reviews_synced = reviews_synced
             dev_repo.updated_at = datetime.now(timezone.utc)
+            if newest_commit and (
+                dev_repo.last_commit_date is None
+                or newest_commit["date"] >= dev_repo.last_commit_date
+            ):
+                dev_repo.last_commit_sha = newest_commit["sha"]
+                dev_repo.last_commit_date = newest_commit["date"]
             await self.db.flush()
 
             logger.info(
@@ -249,6 +296,7 @@ class SyncService:
                 await service.sync_repository(
                     developer_id=developer_id,
                     repository_id=repository_id,
+                    sync_type=sync_type,
                 )
                 await db.commit()
             except Exception as e:
@@ -378,6 +426,42 @@ class SyncService:
         # 3. Fallback to connecting developer (no login available)
         return fallback_developer_id
 
+    async def _backfill_ownership(
+        self,
+        gh: GitHubService,
+        owner: str,
+        repo: str,
+        heartbeat_fn: Any = None,
+    ) -> int:
+        """Fold commits synced before ownership tracking into the ownership matrix.
+
+        Each sync backfills a bounded number of commits, committed in
+        batches. A failed fetch loses only the current batch; the next sync
+        resumes after the last committed one.
+        """
+        ownership = CodeOwnershipService(self.db)
+        full_name = f"{owner}/{repo}"
+        if not await ownership.needs_backfill(full_name):
+            return 0
+
+        if heartbeat_fn:
+            heartbeat_fn("Backfilling code ownership...")
+
+        semaphore = asyncio.Semaphore(COMMIT_DETAIL_CONCURRENCY)
+
+        async def fetch_paths(sha: str) -> list[str]:
+            async with semaphore:
+                details = await gh.get_commit_details(owner, repo, sha)
+            return [f.get("filename", "") for f in details.get("files", [])]
+
+        try:
+            return await ownership.backfill(full_name, fetch_paths)
+        except GitHubAPIError as e:
+            # Earlier batches are committed; the next sync resumes from the cursor
+            await self.db.rollback()
+            logger.warning(f"Ownership backfill for {full_name} stopped, will resume: {e}")
+            return 0
+
     async def _sync_commits_with_session(
         self,
         db: AsyncSession,
@@ -387,102 +471,275 @@ class SyncService:
         developer_id: str,
         repository_id: str,
         repo_language: str | None = None,
-    ) -> int:
-        """Sync commits from repository (all contributors)."""
+        since: datetime | None = None,
+    ) -> tuple[int, dict | None]:
+        """Sync commits from repository (all contributors).
+
+        Each page is checked against existing SHAs with a single IN query, and
+        details for the new commits are fetched concurrently (bounded by
+        COMMIT_DETAIL_CONCURRENCY). With `since`, only commits after the
+        stored cursor are listed.
+
+        Returns (commits_synced, newest_commit) where newest_commit is the
+        {"sha", "date"} cursor to persist for the next incremental sync. It
+        is None unless every page was listed, so a failed walk never moves
+        the cursor past commits it didn't store.
+        """
         synced = 0
         page = 1
         seen_shas: set[str] = set()
+        ownership_updates: list[tuple[str | None, list[str]]] = []
+        newest: dict | None = None
+        semaphore = asyncio.Semaphore(COMMIT_DETAIL_CONCURRENCY)
+
+        async def fetch_details(sha: str) -> dict:
+            async with semaphore:
+                try:
+                    return await gh.get_commit_details(owner, repo, sha)
+                except GitHubAPIError:
+                    return {}
 
         while True:
             try:
                 commits = await gh.get_commits(
-                    owner, repo, per_page=100, page=page
+                    owner, repo, per_page=100, page=page, since=since
                 )
-            except GitHubAPIError:
-                break
+            except GitHubAPIError as e:
+                # Pages already stored stay; without a cursor the next sync
+                # walks this range again and skips them by SHA
+                logger.warning(
+                    f"Listing commits for {owner}/{repo} failed on page {page}: {e}; "
+                    f"not advancing the sync cursor"
+                )
+                return synced, None
 
             if not commits:
                 break
 
+            page_commits = []
             for commit_data in commits:
                 sha = commit_data["sha"]
                 if sha in seen_shas:
                     continue
                 seen_shas.add(sha)
+                page_commits.append(commit_data)
 
-                # Check if commit already exists (no_autoflush to prevent
-                # flushing pending inserts which can cause IntegrityError)
+                committed_at = datetime.fromisoformat(
+                    commit_data["commit"]["committer"]["date"].replace("Z", "+00:00")
+                )
+                if newest is None or committed_at > newest["date"]:
+                    newest = {"sha": sha, "date": committed_at}
+
+            # One existence check per page (no_autoflush to prevent flushing
+            # pending inserts which can cause IntegrityError)
+            existing: set[str] = set()
+            if page_commits:
                 with db.no_autoflush:
-                    stmt = select(Commit).where(Commit.sha == sha)
+                    stmt = select(Commit.sha).where(
+                        Commit.sha.in_([c["sha"] for c in page_commits])
+                    )
                     result = await db.execute(stmt)
-                    existing = result.scalar_one_or_none()
+                    existing = set(result.scalars().all())
+            new_commits = [c for c in page_commits if c["sha"] not in existing]
 
-                if not existing:
-                    # Resolve which developer this commit belongs to
-                    resolved_dev_id, github_login, author_email = (
-                        await self._resolve_developer_for_commit(db, commit_data, developer_id)
-                    )
+            all_details = await asyncio.gather(
+                *(fetch_details(c["sha"]) for c in new_commits)
+            )
 
-                    # Get commit details for stats
-                    try:
-                        details = await gh.get_commit_details(owner, repo, commit_data["sha"])
-                        stats = details.get("stats", {})
-                        files = details.get("files", [])
-                    except GitHubAPIError:
-                        stats = {}
-                        files = []
-
-                    # Extract file types from filenames
-                    file_types = set()
-                    detected_languages = set()
-                    if repo_language:
-                        detected_languages.add(repo_language)
-
-                    for file in files:
-                        filename = file.get("filename", "")
-                        if "." in filename:
-                            ext = filename.rsplit(".", 1)[-1].lower()
-                            file_types.add(ext)
-                            # Map common extensions to languages
-                            ext_to_lang = {
-                                "py": "Python", "js": "JavaScript", "ts": "TypeScript",
-                                "tsx": "TypeScript", "jsx": "JavaScript", "java": "Java",
-                                "go": "Go", "rs": "Rust", "rb": "Ruby", "php": "PHP",
-                                "cs": "C#", "cpp": "C++", "c": "C", "swift": "Swift",
-                                "kt": "Kotlin", "scala": "Scala", "vue": "Vue",
-                            }
-                            if ext in ext_to_lang:
-                                detected_languages.add(ext_to_lang[ext])
-
-                    commit = Commit(
-                        id=str(uuid4()),
-                        developer_id=resolved_dev_id,
-                        repository=f"{owner}/{repo}",
-                        sha=commit_data["sha"],
-                        message=commit_data["commit"]["message"][:500] if commit_data["commit"]["message"] else "",
-                        additions=stats.get("additions", 0),
-                        deletions=stats.get("deletions", 0),
-                        files_changed=len(files),
-                        languages=list(detected_languages) if detected_languages else None,
-                        file_types=list(file_types) if file_types else None,
-                        author_github_login=github_login,
-                        author_email=author_email,
-                        committed_at=datetime.fromisoformat(
-                            commit_data["commit"]["committer"]["date"].replace("Z", "+00:00")
-                        ),
-                    )
-                    db.add(commit)
-                    synced += 1
+            for commit_data, details in zip(new_commits, all_details):
+                # Resolve which developer this commit belongs to
+                resolved_dev_id, github_login, author_email = (
+                    await self._resolve_developer_for_commit(db, commit_data, developer_id)
+                )
+
+                stats = details.get("stats", {})
+                files = details.get("files", [])
+
+                # Extract file types from filenames
+                file_types = set()
+                detected_languages = set()
+                if repo_language:
+                    detected_languages.add(repo_language)
+
+                for file in files:
+                    filename = file.get("filename", "")
+                    if "." in filename:
+                        ext = filename.rsplit(".", 1)[-1].lower()
+                        file_types.add(ext)
+                        if ext in EXT_TO_LANGUAGE:
+                            detected_languages.add(EXT_TO_LANGUAGE[ext])
+
+                commit = Commit(
+                    id=str(uuid4()),
+                    developer_id=resolved_dev_id,
+                    repository=f"{owner}/{repo}",
+                    sha=commit_data["sha"],
+                    message=commit_data["commit"]["message"][:500] if commit_data["commit"]["message"] else "",
+                    additions=stats.get("additions", 0),
+                    deletions=stats.get("deletions", 0),
+                    files_changed=len(files),
+                    languages=list(detected_languages) if detected_languages else None,
+                    file_types=list(file_types) if file_types else None,
+                    author_github_login=github_login,
+                    author_email=author_email,
+                    committed_at=datetime.fromisoformat(
+                        commit_data["commit"]["committer"]["date"].replace("Z", "+00:00")
+                    ),
+                )
+                db.add(commit)
+                synced += 1
+                ownership_updates.append(
+                    (resolved_dev_id, [f.get("filename", "") for f in files])
+                )
+
+            # Ownership joins the page's transaction so it never drifts
+            # from the stored commits
+            await CodeOwnershipService(db).record_commits(f"{owner}/{repo}", ownership_updates)
+            ownership_updates = []
+
+            # Commit each page
+            await db.commit()
 
             if len(commits) < 100:
                 break
             page += 1
 
-            # Batch commit every 100 records
-            if synced % 100 == 0:
-                await db.commit()
+        return synced, newest
+
+    async def _apply_pull_request_page(
+        self,
+        db: AsyncSession,
+        owner: str,
+        repo: str,
+        prs: list[dict],
+        developer_id: str,
+    ) -> int:
+        """Insert new and update existing PRs from one page of REST-shaped data.
+
+        Returns the number of PRs created.
+        """
+        synced = 0
+
+        # One existence check per page (no_autoflush to prevent flushing
+        # pending inserts which can cause IntegrityError)
+        with db.no_autoflush:
+            stmt = select(PullRequest).where(
+                PullRequest.github_id.in_([pr_data["id"] for pr_data in prs]),
+            )
+            result = await db.execute(stmt)
+            existing_by_id = {pr.github_id: pr for pr in result.scalars().all()}
+
+        for pr_data in prs:
+            existing = existing_by_id.get(pr_data["id"])
+
+            # GitHub API returns "closed" for merged PRs — normalize to "merged"
+            pr_state = "merged" if pr_data.get("merged_at") else pr_data["state"]
+
+            if not existing:
+                # Resolve which developer this PR belongs to
+                resolved_dev_id = await self._resolve_developer_for_pr(
+                    db, pr_data.get("user", {}), developer_id
+                )
+
+                pr = PullRequest(
+                    id=str(uuid4()),
+                    developer_id=resolved_dev_id,
+                    repository=f"{owner}/{repo}",
+                    github_id=pr_data["id"],
+                    number=pr_data["number"],
+                    title=pr_data["title"][:500] if pr_data["title"] else "",
+                    state=pr_state,
+                    additions=pr_data.get("additions", 0),
+                    deletions=pr_data.get("deletions", 0),
+                    files_changed=pr_data.get("changed_files", 0),
+                    commits_count=pr_data.get("commits", 0),
+                    comments_count=pr_data.get("comments", 0) + pr_data.get("review_comments", 0),
+                    created_at_github=datetime.fromisoformat(
+                        pr_data["created_at"].replace("Z", "+00:00")
+                    ),
+                    merged_at=datetime.fromisoformat(
+                        pr_data["merged_at"].replace("Z", "+00:00")
+                    ) if pr_data.get("merged_at") else None,
+                    closed_at=datetime.fromisoformat(
+                        pr_data["closed_at"].replace("Z", "+00:00")
+                    ) if pr_data.get("closed_at") else None,
+                )
+                db.add(pr)
+                existing_by_id[pr.github_id] = pr
+                synced += 1
+            else:
+                # Update existing PR state and timestamps
+                existing.state = pr_state
+                existing.merged_at = datetime.fromisoformat(
+                    pr_data["merged_at"].replace("Z", "+00:00")
+                ) if pr_data.get("merged_at") else existing.merged_at
+                existing.closed_at = datetime.fromisoformat(
+                    pr_data["closed_at"].replace("Z", "+00:00")
+                ) if pr_data.get("closed_at") else existing.closed_at
 
-        await db.commit()
+        return synced
+
+    async def _apply_review_page(
+        self,
+        db: AsyncSession,
+        owner: str,
+        repo: str,
+        pr_reviews: list[tuple[dict, list[dict]]],
+        developer_id: str,
+    ) -> int:
+        """Insert new reviews for a page of (pr_data, reviews) pairs.
+
+        Records collaboration interactions for the new reviews in the same
+        transaction, so a page's reviews and edges are committed together.
+        Returns the number of reviews created.
+        """
+        synced = 0
+        interactions: list[tuple[str | None, str | None, datetime | None]] = []
+        review_ids = [r["id"] for _, reviews in pr_reviews for r in reviews]
+        if not review_ids:
+            return 0
+
+        with db.no_autoflush:
+            stmt = select(CodeReview.github_id).where(CodeReview.github_id.in_(review_ids))
+            result = await db.execute(stmt)
+            existing_ids = set(result.scalars().all())
+
+        for pr_data, reviews in pr_reviews:
+            new_reviews = [r for r in reviews if r["id"] not in existing_ids]
+            if not new_reviews:
+                continue
+
+            pr_author_id = await self._resolve_developer_for_pr(
+                db, pr_data.get("user", {}), developer_id
+            )
+
+            for review_data in new_reviews:
+                existing_ids.add(review_data["id"])
+
+                # Resolve which developer this review belongs to
+                resolved_dev_id = await self._resolve_developer_for_pr(
+                    db, review_data.get("user", {}), developer_id
+                )
+
+                review = CodeReview(
+                    id=str(uuid4()),
+                    developer_id=resolved_dev_id,
+                    repository=f"{owner}/{repo}",
+                    github_id=review_data["id"],
+                    pull_request_github_id=pr_data["id"],
+                    state=review_data["state"],
+                    body=review_data.get("body", "")[:1000] if review_data.get("body") else None,
+                    submitted_at=datetime.fromisoformat(
+                        review_data["submitted_at"].replace("Z", "+00:00")
+                    ) if review_data.get("submitted_at") else None,
+                )
+                db.add(review)
+                synced += 1
+                interactions.append(
+                    (resolved_dev_id, pr_author_id, review.submitted_at)
+                )
+
+        await CollaborationNetworkAnalyzer(db).record_review_interactions(interactions)
         return synced
 
     async def _sync_pull_requests_with_session(
@@ -507,65 +764,13 @@ class SyncService:
             if not prs:
                 break
 
-            for pr_data in prs:
-                # Check if PR already exists
-                with db.no_autoflush:
-                    stmt = select(PullRequest).where(
-                        PullRequest.github_id == pr_data["id"],
-                    )
-                    result = await db.execute(stmt)
-                    existing = result.scalar_one_or_none()
-
-                # GitHub API returns "closed" for merged PRs — normalize to "merged"
-                pr_state = "merged" if pr_data.get("merged_at") else pr_data["state"]
-
-                if not existing:
-                    # Resolve which developer this PR belongs to
-                    resolved_dev_id = await self._resolve_developer_for_pr(
-                        db, pr_data.get("user", {}), developer_id
-                    )
-
-                    pr = PullRequest(
-                        id=str(uuid4()),
-                        developer_id=resolved_dev_id,
-                        repository=f"{owner}/{repo}",
-                        github_id=pr_data["id"],
-                        number=pr_data["number"],
-                        title=pr_data["title"][:500] if pr_data["title"] else "",
-                        state=pr_state,
-                        additions=pr_data.get("additions", 0),
-                        deletions=pr_data.get("deletions", 0),
-                        files_changed=pr_data.get("changed_files", 0),
-                        commits_count=pr_data.get("commits", 0),
-                        comments_count=pr_data.get("comments", 0) + pr_data.get("review_comments", 0),
-                        created_at_github=datetime.fromisoformat(
-                            pr_data["created_at"].replace("Z", "+00:00")
-                        ),
-                        merged_at=datetime.fromisoformat(
-                            pr_data["merged_at"].replace("Z", "+00:00")
-                        ) if pr_data.get("merged_at") else None,
-                        closed_at=datetime.fromisoformat(
-                            pr_data["closed_at"].replace("Z", "+00:00")
-                        ) if pr_data.get("closed_at") else None,
-                    )
-                    db.add(pr)
-                    synced += 1
-                else:
-                    # Update existing PR state and timestamps
-                    existing.state = pr_state
-                    existing.merged_at = datetime.fromisoformat(
-                        pr_data["merged_at"].replace("Z", "+00:00")
-                    ) if pr_data.get("merged_at") else existing.merged_at
-                    existing.closed_at = datetime.fromisoformat(
-                        pr_data["closed_at"].replace("Z", "+00:00")
-                    ) if pr_data.get("closed_at") else existing.closed_at
+            synced += await self._apply_pull_request_page(db, owner, repo, prs, developer_id)
 
             if len(prs) < 100:
                 break
             page += 1
 
-            if synced % 100 == 0:
-                await db.commit()
+            await db.commit()
 
         await db.commit()
         return synced
@@ -593,52 +798,68 @@ class SyncService:
             if not prs:
                 break
 
+            pr_reviews = []
             for pr_data in prs:
                 try:
                     reviews = await gh.get_pull_request_reviews(owner, repo, pr_data["number"])
                 except GitHubAPIError:
                     continue
+                pr_reviews.append((pr_data, reviews))
 
-                for review_data in reviews:
-                    # Check if review already exists
-                    with db.no_autoflush:
-                        stmt = select(CodeReview).where(
-                            CodeReview.github_id == review_data["id"],
-                        )
-                        result = await db.execute(stmt)
-                        existing = result.scalar_one_or_none()
-
-                    if not existing:
-                        # Resolve which developer this review belongs to
-                        resolved_dev_id = await self._resolve_developer_for_pr(
-                            db, review_data.get("user", {}), developer_id
-                        )
-
-                        review = CodeReview(
-                            id=str(uuid4()),
-                            developer_id=resolved_dev_id,
-                            repository=f"{owner}/{repo}",
-                            github_id=review_data["id"],
-                            pull_request_github_id=pr_data["id"],
-                            state=review_data["state"],
-                            body=review_data.get("body", "")[:1000] if review_data.get("body") else None,
-                            submitted_at=datetime.fromisoformat(
-                                review_data["submitted_at"].replace("Z", "+00:00")
-                            ) if review_data.get("submitted_at") else None,
-                        )
-                        db.add(review)
-                        synced += 1
+            synced += await self._apply_review_page(db, owner, repo, pr_reviews, developer_id)
 
             if len(prs) < 100:
                 break
             page += 1
 
-            if synced % 50 == 0:
-                await db.commit()
+            await db.commit()
 
         await db.commit()
         return synced
 
+    async def _sync_pull_requests_graphql(
+        self,
+        db: AsyncSession,
+        gh: GitHubService,
+        owner: str,
+        repo: str,
+        developer_id: str,
+    ) -> tuple[int, int]:
+        """Sync PRs and their reviews in one pass over GraphQL pages.
+
+        PRs with more reviews than fit in the page fall back to the REST
+        reviews endpoint. Returns (prs_synced, reviews_synced).
+        """
+        fetcher = GitHubGraphQLFetcher(gh)
+        prs_synced = 0
+        reviews_synced = 0
+
+        async for prs in fetcher.iter_pull_requests(owner, repo):
+            prs_synced += await self._apply_pull_request_page(db, owner, repo, prs, developer_id)
+
+            pr_reviews = []
+            for pr_data in prs:
+                reviews = pr_data["reviews"]
+                if not pr_data["reviews_complete"]:
+                    try:
+                        reviews = await gh.get_pull_request_reviews(owner, repo, pr_data["number"])
+                    except GitHubAPIError:
+                        pass
+                pr_reviews.append((pr_data, reviews))
+
+            reviews_synced += await self._apply_review_page(
+                db, owner, repo, pr_reviews, developer_id
+            )
+            await db.commit()
+
+        await db.commit()
+
+        logger.info(
+            f"GraphQL PR sync for {owner}/{repo}: {fetcher.usage.requests} requests, "
+            f"{fetcher.usage.cost} rate limit points"
+        )
+        return prs_synced, reviews_synced
+
     async def register_webhook(
         self,
         developer_id: str,
@@ -6,8 +6,11 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from aexy.core.config import get_settings
 from aexy.llm.base import MatchScore, TaskSignals
 from aexy.llm.gateway import LLMGateway
+from aexy.services.assignment_solver import solve_assignment
+from aexy.services.candidate_retrieval import SkillIndex
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,12 @@ class TaskMatchResult(BaseModel):
 
 
 class TaskMatcher:
-    """Service for matching developers to tasks using LLM intelligence."""
+    """Service for matching developers to tasks using LLM intelligence.
+
+    Matching runs in two stages: every developer is scored locally from
+    their skill fingerprint, and only the best ``shortlist_size`` are sent
+    to the LLM, together in a single prompt.
+    """
 
     # Weights for different matching dimensions
     MATCH_WEIGHTS = {
@@ -53,13 +61,16 @@ class TaskMatcher:
         "team_dynamics": 0.10,
     }
 
-    def __init__(self, llm_gateway: LLMGateway) -> None:
+    def __init__(self, llm_gateway: LLMGateway, shortlist_size: int | None = None) -> None:
         """Initialize the task matcher.
 
         Args:
             llm_gateway: The LLM gateway for analysis.
+            shortlist_size: Developers scored by the LLM per task. Defaults to
+                the TASK_MATCH_SHORTLIST_SIZE setting.
         """
         self.llm = llm_gateway
+        self.shortlist_size = shortlist_size or get_settings().llm.task_match_shortlist_size
 
     async def extract_task_signals(
         self,
@@ -97,8 +108,11 @@ class TaskMatcher:
         Returns:
             Match score.
         """
-        # Prepare developer skills for matching
-        skills = {
+        return await self.llm.score_match(task_signals, self._developer_skills(developer))
+
+    def _developer_skills(self, developer: dict[str, Any]) -> dict[str, Any]:
+        """Prepare developer skills for LLM matching."""
+        return {
             "developer_id": str(developer.get("id", "")),
             "languages": developer.get("skill_fingerprint", {}).get("languages", []),
             "frameworks": developer.get("skill_fingerprint", {}).get("frameworks", []),
@@ -106,7 +120,65 @@ class TaskMatcher:
             "recent_activity": self._summarize_recent_activity(developer),
         }
 
-        return await self.llm.score_match(task_signals, skills)
+    def build_index(self, developers: list[dict[str, Any]]) -> SkillIndex:
+        """Index developers once to match several tasks against them.
+
+        Args:
+            developers: List of available developers.
+
+        Returns:
+            Skill index to pass to match_task.
+        """
+        return SkillIndex(developers)
+
+    async def score_shortlist(
+        self,
+        task_signals: TaskSignals,
+        shortlist: list[tuple[dict[str, Any], float]],
+    ) -> list[tuple[dict[str, Any], MatchScore]]:
+        """Score shortlisted developers with one LLM call.
+
+        Developers the LLM does not score, or all of them if the call
+        fails, keep their local skill score. Skill scores are on a different
+        scale than LLM scores, so those developers rank after the ones the
+        LLM scored.
+
+        Args:
+            task_signals: Extracted task signals.
+            shortlist: Developers with their local scores.
+
+        Returns:
+            Developers with their match scores, best first.
+        """
+        try:
+            llm_scores = await self.llm.score_matches(
+                task_signals, [self._developer_skills(dev) for dev, _ in shortlist]
+            )
+        except Exception as e:
+            logger.warning(f"Multi-candidate scoring failed, using skill scores: {e}")
+            llm_scores = []
+
+        by_id = {score.developer_id: score for score in llm_scores}
+        scored = []
+        fallback = []
+        for developer, local_score in shortlist:
+            developer_id = str(developer.get("id", ""))
+            if developer_id in by_id:
+                scored.append((developer, by_id[developer_id]))
+            else:
+                fallback.append((developer, MatchScore(
+                    developer_id=developer_id,
+                    overall_score=local_score,
+                    skill_match=local_score,
+                    experience_match=local_score,
+                    growth_opportunity=0.0,
+                    reasoning="Scored from skill profile",
+                )))
+
+        def by_score(item: tuple[dict[str, Any], MatchScore]) -> float:
+            return item[1].overall_score
+
+        return sorted(scored, key=by_score, reverse=True) + sorted(fallback, key=by_score, reverse=True)
 
     def _summarize_recent_activity(self, developer: dict[str, Any]) -> str:
         """Summarize developer's recent activity.
@@ -140,41 +212,35 @@ class TaskMatcher:
         self,
         request: TaskMatchRequest,
         developers: list[dict[str, Any]],
+        index: SkillIndex | None = None,
     ) -> TaskMatchResult:
         """Match a task to the best developers.
 
         Args:
             request: The task to match.
             developers: List of available developers.
+            index: Prebuilt index of the same developers, to reuse across tasks.
 
         Returns:
-            Match result with ranked candidates.
+            Match result with the shortlisted candidates ranked.
         """
         # Extract task signals
         task_signals = await self.extract_task_signals(request)
 
-        # Score all developers
-        candidates: list[RankedCandidate] = []
-        for developer in developers:
-            try:
-                score = await self.score_developer(task_signals, developer)
-                candidates.append(
-                    RankedCandidate(
-                        developer_id=str(developer.get("id", "")),
-                        developer_name=developer.get("name"),
-                        match_score=score,
-                        rank=0,  # Will be set after sorting
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Failed to score developer {developer.get('id')}: {e}")
-
-        # Sort by overall score
-        candidates.sort(key=lambda c: c.match_score.overall_score, reverse=True)
-
-        # Set ranks
-        for i, candidate in enumerate(candidates):
-            candidate.rank = i + 1
+        # Shortlist locally, then score the shortlist with the LLM
+        index = index or self.build_index(developers)
+        shortlist = index.top_k(task_signals, self.shortlist_size)
+        ranked = await self.score_shortlist(task_signals, shortlist)
+
+        candidates: list[RankedCandidate] = [
+            RankedCandidate(
+                developer_id=str(developer.get("id", "")),
+                developer_name=developer.get("name"),
+                match_score=score,
+                rank=i + 1,
+            )
+            for i, (developer, score) in enumerate(ranked)
+        ]
 
         # Generate recommendations and warnings
         recommendations, warnings = self._generate_insights(task_signals, candidates)
@@ -264,10 +330,11 @@ class TaskMatcher:
             Dict mapping task title to match result.
         """
         results = {}
+        index = self.build_index(developers)
 
         for task in tasks:
             try:
-                result = await self.match_task(task, developers)
+                result = await self.match_task(task, developers, index=index)
                 results[task.title] = result
             except Exception as e:
                 logger.error(f"Failed to match task '{task.title}': {e}")
@@ -282,8 +349,9 @@ class TaskMatcher:
     ) -> dict[str, str]:
         """Find optimal task-developer assignments.
 
-        Uses a greedy algorithm to assign tasks to developers,
-        respecting constraints like workload limits.
+        Maximizes the total match score over all tasks, respecting
+        constraints like workload limits. Each task can only go to a
+        developer from its shortlist.
 
         Args:
             tasks: List of tasks to assign.
@@ -296,36 +364,25 @@ class TaskMatcher:
         constraints = constraints or {}
         max_tasks_per_dev = constraints.get("max_tasks_per_developer", 3)
 
-        # Track assignments
-        assignments: dict[str, str] = {}
-        developer_load: dict[str, int] = {str(d.get("id", "")): 0 for d in developers}
-
         # Match all tasks first
         all_matches = await self.bulk_match(tasks, developers)
 
-        # Sort tasks by priority/complexity (harder tasks first)
-        sorted_tasks = sorted(
-            tasks,
-            key=lambda t: (
-                1 if all_matches.get(t.title, TaskMatchResult(
-                    task_signals=TaskSignals(),
-                    candidates=[],
-                )).task_signals.complexity == "high" else 2
-            ),
-        )
-
-        # Greedy assignment
-        for task in sorted_tasks:
-            match_result = all_matches.get(task.title)
-            if not match_result or not match_result.candidates:
-                continue
-
-            # Find best available developer
-            for candidate in match_result.candidates:
-                dev_id = candidate.developer_id
-                if developer_load.get(dev_id, 0) < max_tasks_per_dev:
-                    assignments[task.title] = dev_id
-                    developer_load[dev_id] = developer_load.get(dev_id, 0) + 1
-                    break
-
-        return assignments
+        # Score matrix over matched tasks; developers off a task's shortlist can't take it
+        dev_ids = [str(d.get("id", "")) for d in developers]
+        column = {dev_id: j for j, dev_id in enumerate(dev_ids)}
+        matched = [task for task in tasks if all_matches.get(task.title)]
+        scores: list[list[float | None]] = []
+        for task in matched:
+            row: list[float | None] = [None] * len(dev_ids)
+            for candidate in all_matches[task.title].candidates:
+                if candidate.developer_id in column:
+                    row[column[candidate.developer_id]] = candidate.match_score.overall_score
+            scores.append(row)
+
+        solution = solve_assignment(scores, [max_tasks_per_dev] * len(dev_ids))
+
+        return {
+            task.title: dev_ids[dev]
+            for task, dev in zip(matched, solution)
+            if dev is not None
+        }
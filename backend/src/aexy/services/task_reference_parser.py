@@ -112,6 +112,12 @@ class TaskReferenceParser:
         re.IGNORECASE
     )
 
+    # Every pattern above needs one of these; text without any is skipped
+    CANDIDATE_PATTERN = re.compile(
+        r"#\d|[a-z0-9]-\d|task",
+        re.IGNORECASE
+    )
+
     def parse(self, text: str) -> list[TaskReference]:
         """Parse text and extract all task references.
 
@@ -121,24 +127,34 @@ class TaskReferenceParser:
         Returns:
             List of TaskReference objects for each reference found
         """
-        if not text:
+        if not text or not self.CANDIDATE_PATTERN.search(text):
             return []
 
         references: list[TaskReference] = []
         seen_identifiers: set[str] = set()
 
+        # Issue patterns need a "#", key patterns a "-"; skip scans that can't match
+        has_issue = "#" in text
+        has_key = "-" in text
+
         # Check closing patterns first (they take precedence)
-        references.extend(self._parse_closing_github(text, seen_identifiers))
-        references.extend(self._parse_closing_project(text, seen_identifiers))
+        if has_issue:
+            references.extend(self._parse_closing_github(text, seen_identifiers))
+        if has_key:
+            references.extend(self._parse_closing_project(text, seen_identifiers))
 
         # Check reference patterns
-        references.extend(self._parse_reference_github(text, seen_identifiers))
-        references.extend(self._parse_reference_project(text, seen_identifiers))
+        if has_issue:
+            references.extend(self._parse_reference_github(text, seen_identifiers))
+        if has_key:
+            references.extend(self._parse_reference_project(text, seen_identifiers))
 
         # Check standalone patterns (default to refs type)
-        references.extend(self._parse_standalone_github(text, seen_identifiers))
-        references.extend(self._parse_standalone_project(text, seen_identifiers))
-        references.extend(self._parse_bracketed_keys(text, seen_identifiers))
+        if has_issue:
+            references.extend(self._parse_standalone_github(text, seen_identifiers))
+        if has_key:
+            references.extend(self._parse_standalone_project(text, seen_identifiers))
+            references.extend(self._parse_bracketed_keys(text, seen_identifiers))
         references.extend(self._parse_task_prefix(text, seen_identifiers))
 
         return references
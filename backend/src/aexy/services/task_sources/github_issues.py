@@ -5,6 +5,7 @@ from datetime import datetime
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.services.task_sources.base import (
     TaskItem,
     TaskSource,
@@ -32,6 +33,7 @@ class GitHubIssuesSource(TaskSource):
             raise ValueError("GitHub Issues requires owner and repo in config")
 
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=self.API_BASE,
             headers={
                 "Accept": "application/vnd.github+json",
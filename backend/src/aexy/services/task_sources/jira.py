@@ -6,6 +6,7 @@ from datetime import datetime
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.services.task_sources.base import (
     TaskItem,
     TaskPriority,
@@ -39,6 +40,7 @@ class JiraSource(TaskSource):
         auth_bytes = base64.b64encode(auth_string.encode()).decode()
 
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             base_url=config.api_url.rstrip("/"),
             headers={
                 "Authorization": f"Basic {auth_bytes}",
@@ -5,6 +5,7 @@ from datetime import datetime
 
 import httpx
 
+from aexy.core.http_clients import get_http_transport
 from aexy.services.task_sources.base import (
     TaskItem,
     TaskPriority,
@@ -33,6 +34,7 @@ class LinearSource(TaskSource):
             raise ValueError("Linear requires api_key")
 
         self._client = httpx.AsyncClient(
+            transport=get_http_transport(),
             headers={
                 "Authorization": config.api_key,
                 "Content-Type": "application/json",
@@ -6,6 +6,7 @@ from typing import Any
 
 from aexy.llm.base import MatchScore, TaskSignals
 from aexy.models.developer import Developer
+from aexy.services.assignment_solver import solve_assignment
 
 logger = logging.getLogger(__name__)
 
@@ -260,10 +261,13 @@ class WhatIfAnalyzer:
     ) -> WhatIfScenario:
         """Generate an optimized assignment scenario.
 
+        Finds the assignment with the highest total match score that keeps
+        every developer within max_per_dev, counting their current workload.
+
         Args:
             tasks: Tasks to assign.
             developers: Available developers.
-            constraints: Optional constraints (max_per_dev, required_assignments, etc.)
+            constraints: Optional constraints (max_per_dev, current_workloads, min_score)
 
         Returns:
             Optimized WhatIfScenario.
@@ -272,34 +276,17 @@ class WhatIfAnalyzer:
         max_per_dev = constraints.get("max_per_dev", self.OVERLOADED_THRESHOLD)
         current_workloads = constraints.get("current_workloads", {})
 
-        # Calculate all match scores
-        match_scores: list[tuple[str, str, float, float, float]] = []  # task_id, dev_id, score, skill, growth
-
-        for task in tasks:
-            task_id = task.get("id") or task.get("task_id")
-            for developer in developers:
-                dev_id = str(developer.id)
-                score, skill, growth = self._calculate_match(task, developer)
-                match_scores.append((task_id, dev_id, score, skill, growth))
-
-        # Sort by score descending
-        match_scores.sort(key=lambda x: x[2], reverse=True)
-
-        # Greedy assignment with constraints
-        assignments = []
-        assigned_tasks: set[str] = set()
-        dev_task_counts: dict[str, int] = {str(d.id): current_workloads.get(str(d.id), 0) for d in developers}
-
-        for task_id, dev_id, score, skill, growth in match_scores:
-            if task_id in assigned_tasks:
-                continue
-
-            if dev_task_counts.get(dev_id, 0) >= max_per_dev:
-                continue
+        scores = [[score for score, _, _ in row] for row in self.match_matrix(tasks, developers)]
+        capacities = [
+            max_per_dev - current_workloads.get(str(d.id), 0) for d in developers
+        ]
+        solution = solve_assignment(scores, capacities, constraints.get("min_score", 0.0))
 
-            assignments.append({"task_id": task_id, "developer_id": dev_id})
-            assigned_tasks.add(task_id)
-            dev_task_counts[dev_id] = dev_task_counts.get(dev_id, 0) + 1
+        assignments = [
+            {"task_id": task.get("id") or task.get("task_id"), "developer_id": str(developers[dev].id)}
+            for task, dev in zip(tasks, solution)
+            if dev is not None
+        ]
 
         return self.create_scenario(
             scenario_name="Optimized Assignment",
@@ -309,6 +296,26 @@ class WhatIfAnalyzer:
             current_workloads=current_workloads,
         )
 
+    def match_matrix(
+        self,
+        tasks: list[dict[str, Any]],
+        developers: list[Developer],
+    ) -> list[list[tuple[float, float, float]]]:
+        """Calculate match scores for every task and developer.
+
+        Task requirements and developer skills are extracted once each,
+        rather than once per pair.
+
+        Returns:
+            One row per task of (overall_score, skill_match, growth_opportunity)
+            per developer.
+        """
+        skills = [self._developer_skills(d) for d in developers]
+        return [
+            [self._score_match(requirements, dev_skills) for dev_skills in skills]
+            for requirements in map(self._task_requirements, tasks)
+        ]
+
     def _calculate_match(
         self,
         task: dict[str, Any],
@@ -319,9 +326,15 @@ class WhatIfAnalyzer:
         Returns:
             Tuple of (overall_score, skill_match, growth_opportunity).
         """
+        return self._score_match(self._task_requirements(task), self._developer_skills(developer))
+
+    @staticmethod
+    def _developer_skills(
+        developer: Developer,
+    ) -> tuple[dict[str, float], dict[str, float], dict[str, float]]:
+        """Extract (languages, frameworks, domains) proficiency maps."""
         fingerprint = developer.skill_fingerprint or {}
 
-        # Extract developer skills
         dev_languages = {
             s.get("name", "").lower(): s.get("proficiency_score", 0)
             for s in (fingerprint.get("languages") or [])
@@ -334,12 +347,25 @@ class WhatIfAnalyzer:
             s.get("name", "").lower(): s.get("confidence_score", 0)
             for s in (fingerprint.get("domains") or [])
         }
+        return dev_languages, dev_frameworks, dev_domains
 
-        # Get task requirements
+    @staticmethod
+    def _task_requirements(task: dict[str, Any]) -> tuple[list[str], list[str], str]:
+        """Extract (required_skills, preferred_skills, domain) from a task."""
         task_signals = task.get("signals") or task.get("task_signals") or {}
         required_skills = [s.lower() for s in (task_signals.get("required_skills") or [])]
         preferred_skills = [s.lower() for s in (task_signals.get("preferred_skills") or [])]
         domain = (task_signals.get("domain") or "").lower()
+        return required_skills, preferred_skills, domain
+
+    @staticmethod
+    def _score_match(
+        requirements: tuple[list[str], list[str], str],
+        skills: tuple[dict[str, float], dict[str, float], dict[str, float]],
+    ) -> tuple[float, float, float]:
+        """Score extracted task requirements against extracted developer skills."""
+        required_skills, preferred_skills, domain = requirements
+        dev_languages, dev_frameworks, dev_domains = skills
 
         # Calculate skill match
         skill_matches = 0
@@ -13,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from aexy.core.http_clients import get_http_transport
 from aexy.models.crm import (
     CRMRecord,
     CRMActivity,
@@ -1031,7 +1032,7 @@ class WorkflowActionHandler:
         try:
             import json
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
                 if method in ["POST", "PUT", "PATCH"]:
                     response = await client.request(
                         method=method,
@@ -0,0 +1,175 @@
+"""In-memory index of a workspace's task keys and Slack user mappings.
+
+Slack channel monitoring resolves every task reference and author in every
+message. Instead of a query per reference, it looks them up in a
+per-workspace index held in process memory. The index is rebuilt when the
+workspace's tasks or the integration's user mappings change.
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aexy.models.developer import Developer
+from aexy.models.sprint import Sprint, SprintTask
+
+logger = logging.getLogger(__name__)
+
+# How long an index is trusted before checking whether tasks changed
+REFRESH_CHECK_INTERVAL = 5.0
+
+_ISSUE_NUMBER_REF = re.compile(r"(?:#|^task[\s:#-]*)(\d+)$", re.IGNORECASE)
+
+
+def task_key(reference: str) -> str:
+    """Normalise a task reference or task source ID for index lookups.
+
+    Issue-number references (``#123``, ``org/repo#123``, ``task 123``)
+    become the number; keys such as ``proj-123`` are upper-cased.
+    """
+    reference = reference.strip()
+    match = _ISSUE_NUMBER_REF.search(reference)
+    return match.group(1) if match else reference.upper()
+
+
+@dataclass
+class WorkspaceReferenceIndex:
+    """Task keys and Slack user mappings of one workspace."""
+
+    workspace_id: str
+    # Task key -> [(task_id, sprint_id)], most recently created first
+    tasks_by_key: dict[str, list[tuple[str, str | None]]] = field(default_factory=dict)
+    # Slack user ID -> developer ID, for mappings to existing developers
+    developers: dict[str, str] = field(default_factory=dict)
+    task_version: tuple = ()
+    mapping_version: int = 0
+    checked_at: float = 0.0
+
+    def find_task(self, reference: str, sprint_id: str | None = None) -> str | None:
+        """Return the ID of the task a reference points to, if any.
+
+        A task in *sprint_id* wins; otherwise the newest task with the key.
+        """
+        candidates = self.tasks_by_key.get(task_key(reference))
+        if not candidates:
+            return None
+        if sprint_id:
+            for task_id, task_sprint_id in candidates:
+                if task_sprint_id == sprint_id:
+                    return task_id
+        return candidates[0][0]
+
+    def developer_for(self, slack_user_id: str | None) -> str | None:
+        """Return the developer mapped to a Slack user, if any."""
+        return self.developers.get(slack_user_id) if slack_user_id else None
+
+
+class WorkspaceReferenceIndexStore:
+    """Builds and caches :class:`WorkspaceReferenceIndex` per workspace.
+
+    Indexes are reused for ``check_interval`` seconds. After that, one
+    aggregate query (task count and latest update) tells whether the
+    workspace's tasks changed; only then are tasks reloaded. A change in
+    the integration's user mappings reloads just the developers.
+    """
+
+    def __init__(self, check_interval: float = REFRESH_CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self._indexes: dict[str, WorkspaceReferenceIndex] = {}
+
+    def invalidate(self, workspace_id: str | None = None) -> None:
+        """Drop the index of one workspace, or of all workspaces."""
+        if workspace_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(workspace_id, None)
+
+    async def get(
+        self,
+        workspace_id: str,
+        db: AsyncSession,
+        user_mappings: dict[str, str] | None = None,
+    ) -> WorkspaceReferenceIndex:
+        """Return a current index for the workspace."""
+        user_mappings = user_mappings or {}
+        mapping_version = hash(frozenset(user_mappings.items()))
+        now = time.monotonic()
+
+        index = self._indexes.get(workspace_id)
+        if index is None or now - index.checked_at >= self.check_interval:
+            task_version = await self._task_version(workspace_id, db)
+            if index is None or index.task_version != task_version:
+                index = WorkspaceReferenceIndex(
+                    workspace_id=workspace_id,
+                    tasks_by_key=await self._load_tasks(workspace_id, db),
+                    task_version=task_version,
+                    mapping_version=-1,
+                )
+                self._indexes[workspace_id] = index
+            index.checked_at = now
+
+        if index.mapping_version != mapping_version:
+            index.developers = await self._load_developers(user_mappings, db)
+            index.mapping_version = mapping_version
+
+        return index
+
+    @staticmethod
+    def _workspace_tasks(workspace_id: str, *columns):
+        return (
+            select(*columns)
+            .select_from(SprintTask)
+            .outerjoin(Sprint, SprintTask.sprint_id == Sprint.id)
+            .where(or_(SprintTask.workspace_id == workspace_id, Sprint.workspace_id == workspace_id))
+        )
+
+    async def _task_version(self, workspace_id: str, db: AsyncSession) -> tuple:
+        result = await db.execute(self._workspace_tasks(
+            workspace_id, func.count(SprintTask.id), func.max(SprintTask.updated_at)
+        ))
+        return tuple(result.one())
+
+    async def _load_tasks(
+        self, workspace_id: str, db: AsyncSession
+    ) -> dict[str, list[tuple[str, str | None]]]:
+        result = await db.execute(
+            self._workspace_tasks(
+                workspace_id, SprintTask.id, SprintTask.source_id, SprintTask.sprint_id
+            ).order_by(SprintTask.created_at.desc())
+        )
+        tasks_by_key: dict[str, list[tuple[str, str | None]]] = {}
+        for task_id, source_id, sprint_id in result.all():
+            if source_id:
+                tasks_by_key.setdefault(task_key(source_id), []).append((task_id, sprint_id))
+        logger.debug(f"Indexed {len(tasks_by_key)} task keys for workspace {workspace_id}")
+        return tasks_by_key
+
+    async def _load_developers(
+        self, user_mappings: dict[str, str], db: AsyncSession
+    ) -> dict[str, str]:
+        if not user_mappings:
+            return {}
+        result = await db.execute(
+            select(Developer.id).where(Developer.id.in_(set(user_mappings.values())))
+        )
+        existing = set(result.scalars().all())
+        return {
+            slack_user_id: developer_id
+            for slack_user_id, developer_id in user_mappings.items()
+            if developer_id in existing
+        }
+
+
+_store: WorkspaceReferenceIndexStore | None = None
+
+
+def get_reference_index_store() -> WorkspaceReferenceIndexStore:
+    """Return the process-wide :class:`WorkspaceReferenceIndexStore`."""
+    global _store
+    if _store is None:
+        _store = WorkspaceReferenceIndexStore()
+    return _store
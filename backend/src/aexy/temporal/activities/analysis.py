@@ -49,7 +49,10 @@ class BatchReportUsageInput:
 
 @dataclass
 class BatchProfileSyncInput:
-    pass
+    shard_index: int = 0
+    shard_count: int = 1
+    concurrency: int = 4
+    full: bool = False
 
 
 @dataclass
@@ -194,16 +197,20 @@ async def batch_report_usage(input: BatchReportUsageInput) -> dict[str, Any]:
 
 @activity.defn
 async def batch_profile_sync(input: BatchProfileSyncInput) -> dict[str, Any]:
-    """Batch sync all developer profiles."""
-    logger.info("Starting batch profile sync")
-
-    from aexy.services.developer_analysis_service import DeveloperAnalysisService
-
-    async with async_session_maker() as db:
-        service = DeveloperAnalysisService(db)
-        result = await service.batch_profile_sync()
-        await db.commit()
-        return result
+    """Sync one shard of all developer profiles."""
+    logger.info(f"Starting batch profile sync (shard {input.shard_index + 1}/{input.shard_count})")
+    activity.heartbeat("Starting profile sync")
+
+    from aexy.services.profile_sync import ProfileSyncService
+
+    report = await ProfileSyncService().sync_profiles(
+        shard_index=input.shard_index,
+        shard_count=input.shard_count,
+        concurrency=input.concurrency,
+        full=input.full,
+        heartbeat=activity.heartbeat,
+    )
+    return report.to_dict()
 
 
 @activity.defn
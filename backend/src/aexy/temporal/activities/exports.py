@@ -0,0 +1,36 @@
+"""Temporal activities for export jobs.
+
+Export endpoints only create the ExportJob; the file is written here, so
+large exports stream from the database outside the request handler.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from temporalio import activity
+
+from aexy.core.database import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProcessExportJobInput:
+    job_id: str
+
+
+@activity.defn
+async def process_export_job(input: ProcessExportJobInput) -> dict[str, Any]:
+    """Write the file for a pending export job."""
+    logger.info(f"Processing export job {input.job_id}")
+
+    from aexy.services.export_service import ExportService
+
+    async with async_session_maker() as db:
+        job = await ExportService().run_export_job(input.job_id, db)
+
+    if not job:
+        logger.warning(f"Export job {input.job_id} not found")
+        return {"job_id": input.job_id, "status": "not_found"}
+    return {"job_id": job.id, "status": job.status, "rows": job.rows_processed}
@@ -52,6 +52,7 @@ async def sync_gmail(input: SyncGmailInput) -> dict[str, Any]:
             workspace_id=input.workspace_id,
             integration_id=input.integration_id,
             max_messages=input.max_messages,
+            heartbeat_fn=activity.heartbeat,
         )
         return result
     except GmailAuthError:
@@ -218,6 +218,7 @@ async def deliver_webhook(input: DeliverWebhookInput) -> dict[str, Any]:
     from datetime import datetime, timezone
     from uuid import uuid4
     import httpx
+    from aexy.core.http_clients import get_http_transport
     from sqlalchemy import select
     from aexy.models.crm import CRMWebhook, CRMWebhookDelivery
 
@@ -263,7 +264,7 @@ async def deliver_webhook(input: DeliverWebhookInput) -> dict[str, Any]:
 
         started_at = datetime.now(timezone.utc)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=get_http_transport(), timeout=30.0) as client:
                 response = await client.post(webhook.url, json=input.payload, headers=headers)
 
             completed_at = datetime.now(timezone.utc)
@@ -54,13 +54,18 @@ class SendReminderNotificationInput:
     notification_type: str
 
 
+@dataclass
+class ReconcileReminderCountersInput:
+    pass
+
+
 @activity.defn
-async def generate_reminder_instances(input: GenerateReminderInstancesInput) -> None:
+async def generate_reminder_instances(input: GenerateReminderInstancesInput) -> dict[str, Any]:
     """Generate reminder instances for due reminders. Runs daily."""
     logger.info("Generating reminder instances")
     from aexy.processing.reminder_tasks import _generate_reminder_instances_async
 
-    await _generate_reminder_instances_async()
+    return await _generate_reminder_instances_async()
 
 
 @activity.defn
@@ -124,3 +129,12 @@ async def send_reminder_notification(input: SendReminderNotificationInput) -> No
     from aexy.processing.reminder_tasks import _send_reminder_notification_async
 
     await _send_reminder_notification_async(input.instance_id, input.notification_type)
+
+
+@activity.defn
+async def reconcile_reminder_counters(input: ReconcileReminderCountersInput) -> dict[str, Any]:
+    """Rebuild reminder dashboard counters from instances. Runs every 6 hours."""
+    logger.info("Reconciling reminder dashboard counters")
+    from aexy.processing.reminder_tasks import _reconcile_reminder_counters_async
+
+    return await _reconcile_reminder_counters_async()
@@ -30,6 +30,7 @@ class SyncRepositoryInput:
     repository_id: str
     developer_id: str
     installation_id: int | None = None
+    fetch_mode: str | None = None  # "rest" or "graphql"; defaults to settings
 
 
 @dataclass
@@ -56,6 +57,7 @@ async def sync_repository(input: SyncRepositoryInput) -> dict[str, Any]:
                 developer_id=input.developer_id,
                 repository_id=input.repository_id,
                 heartbeat_fn=activity.heartbeat,
+                fetch_mode=input.fetch_mode,
             )
             await db.commit()
             return result
@@ -157,6 +157,7 @@ async def send_uptime_notification(input: SendUptimeNotificationInput) -> dict[s
     logger.info(f"Sending {input.notification_type} notification for incident {input.incident_id}")
 
     import httpx
+    from aexy.core.http_clients import get_http_transport
     from aexy.services.uptime_service import UptimeService
     from aexy.services.slack_helpers import (
         NOTIFICATION_CHANNEL_SLACK,
@@ -195,7 +196,7 @@ async def send_uptime_notification(input: SendUptimeNotificationInput) -> dict[s
                         db, str(monitor.workspace_id)
                     )
                     if integration and integration.bot_token:
-                        async with httpx.AsyncClient(timeout=30) as client:
+                        async with httpx.AsyncClient(transport=get_http_transport(), timeout=30) as client:
                             await client.post(
                                 "https://slack.com/api/chat.postMessage",
                                 headers={
@@ -209,7 +210,7 @@ async def send_uptime_notification(input: SendUptimeNotificationInput) -> dict[s
                             )
 
             if NOTIFICATION_CHANNEL_WEBHOOK in channels and monitor.webhook_url:
-                async with httpx.AsyncClient(timeout=30) as client:
+                async with httpx.AsyncClient(transport=get_http_transport(), timeout=30) as client:
                     await client.post(
                         monitor.webhook_url,
                         json={
@@ -92,6 +92,9 @@ ACTIVITY_CONFIG: dict[str, dict[str, Any]] = {
 
     # Insights
     "auto_generate_snapshots": {"retry": STANDARD_RETRY, "timeout": timedelta(hours=1)},
+
+    # Exports
+    "process_export_job": {"retry": STANDARD_RETRY, "timeout": timedelta(hours=1)},
 }
 
 DEFAULT_CONFIG = {"retry": STANDARD_RETRY, "timeout": timedelta(minutes=5)}
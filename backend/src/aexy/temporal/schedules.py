@@ -285,6 +285,14 @@ SCHEDULES: list[dict] = [
         "interval": timedelta(weeks=1),
         "queue": TaskQueue.OPERATIONS,
     },
+    {
+        "id": "reconcile-reminder-counters",
+        "activity": "reconcile_reminder_counters",
+        "input_module": "aexy.temporal.activities.reminders",
+        "input_class": "ReconcileReminderCountersInput",
+        "interval": timedelta(hours=6),
+        "queue": TaskQueue.OPERATIONS,
+    },
 
     # === Google Sync ===
     {
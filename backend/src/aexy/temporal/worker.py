@@ -20,6 +20,8 @@ from temporalio.worker.workflow_sandbox import (
 )
 
 from aexy.core.config import get_settings
+from aexy.core.database import configure_process_role, dispose_engines
+from aexy.core.http_clients import close_http_clients
 from aexy.temporal.task_queues import TaskQueue
 
 logger = logging.getLogger(__name__)
@@ -119,6 +121,7 @@ def get_all_activities() -> list:
         generate_reminder_instances,
         process_auto_assignment,
         process_escalations,
+        reconcile_reminder_counters,
         send_daily_digest,
         send_reminder_notification,
         send_weekly_slack_summary,
@@ -129,6 +132,7 @@ def get_all_activities() -> list:
         calculate_isp_metrics,
         process_unprocessed_events,
     )
+    from aexy.temporal.activities.exports import process_export_job
     from aexy.temporal.activities.insights import auto_generate_snapshots
     from aexy.temporal.activities.sync import check_repo_auto_sync, sync_commits, sync_repository
     from aexy.temporal.activities.tracking import (
@@ -255,6 +259,8 @@ def get_all_activities() -> list:
         cleanup_old_executions,
         # Insights
         auto_generate_snapshots,
+        # Exports
+        process_export_job,
         # Reminders (Compliance)
         generate_reminder_instances,
         process_escalations,
@@ -264,6 +270,7 @@ def get_all_activities() -> list:
         process_auto_assignment,
         send_weekly_slack_summary,
         send_reminder_notification,
+        reconcile_reminder_counters,
     ]
 
 
@@ -332,11 +339,16 @@ async def run_worker(queues: list[str] | None = None) -> None:
         )
         workers.append(worker)
 
-    if len(workers) == 1:
-        await workers[0].run()
-    else:
-        # Run all workers concurrently
-        await asyncio.gather(*(w.run() for w in workers))
+    try:
+        if len(workers) == 1:
+            await workers[0].run()
+        else:
+            # Run all workers concurrently
+            await asyncio.gather(*(w.run() for w in workers))
+    finally:
+        # Activities share pooled HTTP and database connections; close them once on stop
+        await close_http_clients()
+        await dispose_engines()
 
 
 def main() -> None:
@@ -352,6 +364,9 @@ def main() -> None:
 
     queues = args.queues.split(",") if args.queues else None
 
+    # Workers hold fewer connections each than API processes
+    configure_process_role("worker")
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -1,5 +1,6 @@
 """Analysis workflows for batch processing."""
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import timedelta
@@ -13,27 +14,52 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class BatchProfileSyncInput:
-    pass
+    shard_count: int = 4
+    concurrency: int = 4
+    full: bool = False
 
 
 @workflow.defn
 class BatchProfileSyncWorkflow:
     """Workflow for nightly batch profile sync.
 
-    Orchestrates syncing and analyzing all developer profiles.
+    Splits all developers into shards and syncs each shard in its own
+    activity, so shards run in parallel across workers and a failed shard
+    is retried on its own.
     """
 
     @workflow.run
     async def run(self, input: BatchProfileSyncInput) -> dict[str, Any]:
         from aexy.temporal.activities.analysis import BatchProfileSyncInput as ActivityInput
 
-        return await workflow.execute_activity(
-            "batch_profile_sync",
-            ActivityInput(),
-            start_to_close_timeout=timedelta(hours=2),
-            heartbeat_timeout=timedelta(minutes=5),
-            retry_policy=RetryPolicy(
-                initial_interval=timedelta(seconds=60),
-                maximum_attempts=3,
-            ),
+        shard_count = max(input.shard_count, 1)
+        results = await asyncio.gather(*(
+            workflow.execute_activity(
+                "batch_profile_sync",
+                ActivityInput(
+                    shard_index=shard_index,
+                    shard_count=shard_count,
+                    concurrency=input.concurrency,
+                    full=input.full,
+                ),
+                start_to_close_timeout=timedelta(hours=2),
+                heartbeat_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=60),
+                    maximum_attempts=3,
+                ),
+            )
+            for shard_index in range(shard_count)
+        ))
+
+        slowest = sorted(
+            (timing for result in results for timing in result["slowest"]),
+            key=lambda t: t["seconds"],
+            reverse=True,
         )
+        return {
+            "shards": shard_count,
+            "synced": sum(r["synced"] for r in results),
+            "failed": sum(r["failed"] for r in results),
+            "slowest": slowest[:10],
+        }
@@ -0,0 +1,325 @@
+"""In-memory stand-in for an AsyncSession, for unit tests of batched queries.
+
+Reads are answered by table, not by call order: register rows (or a
+callable taking the statement) with ``session.on("commits", ...)`` and
+every SELECT reading from that table gets them. Writes are kept per table,
+whether they come from ``add``/``add_all`` or from INSERT statements, so
+tests assert on the rows that were written rather than on how many
+statements ran.
+
+INSERT ... ON CONFLICT is emulated against the rows already in a table,
+with the conflict target given as columns or as a unique constraint name:
+DO NOTHING skips conflicting rows and DO UPDATE evaluates its SET clause
+(columns, ``excluded.*``, literals, arithmetic and coalesce/nullif/
+greatest/least/now). RETURNING yields the rows actually written. DELETE
+removes stored rows when filtered by ``column.in_(...)``. Every statement
+is compiled for the PostgreSQL dialect on execute, so invalid SQL fails
+the test.
+
+``fail_flush`` makes a flush raise. As with a real session, that leaves
+the session unusable until it is rolled back, unless the failure happened
+inside ``begin_nested()``, whose savepoint discards the block's writes.
+"""
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql.dml import OnConflictDoUpdate
+from sqlalchemy.exc import PendingRollbackError
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.dml import Delete, Insert
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BindParameter,
+    Cast,
+    ColumnClause,
+    Grouping,
+    Null,
+)
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.schema import Table, UniqueConstraint
+from sqlalchemy.sql.selectable import CompoundSelect, Join, Select, Subquery
+
+Rows = Iterable[Any] | Callable[[Any], Iterable[Any]]
+
+_FUNCTIONS: dict[str, Callable[[list[Any]], Any]] = {
+    "coalesce": lambda args: next((a for a in args if a is not None), None),
+    "nullif": lambda args: None if args[0] == args[1] else args[0],
+    "greatest": lambda args: max(a for a in args if a is not None),
+    "least": lambda args: min(a for a in args if a is not None),
+    "now": lambda args: datetime.now(UTC),
+}
+
+
+def compile_pg(statement: Any) -> str:
+    """Render a statement as PostgreSQL SQL."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def table_name(statement: Any) -> str | None:
+    """Name of the table a statement reads from or writes to."""
+    if isinstance(statement, CompoundSelect):
+        return table_name(statement.selects[0])
+    if isinstance(getattr(statement, "table", None), Table):
+        return statement.table.name
+    if isinstance(statement, Select):
+        froms = statement.get_final_froms()
+        return table_name(froms[0]) if froms else None
+    if isinstance(statement, Join):
+        return table_name(statement.left)
+    if isinstance(statement, Subquery):
+        return table_name(statement.element)
+    if isinstance(statement, Table):
+        return statement.name
+    return None
+
+
+def _scalar(row: Any) -> Any:
+    return row[0] if isinstance(row, tuple) else row
+
+
+class FakeResult:
+    """The parts of a SQLAlchemy Result the services use."""
+
+    def __init__(self, rows: Iterable[Any] = (), rowcount: int | None = None):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows) if rowcount is None else rowcount
+
+    def all(self) -> list[Any]:
+        return list(self._rows)
+
+    def first(self) -> Any:
+        return self._rows[0] if self._rows else None
+
+    def one(self) -> Any:
+        if len(self._rows) != 1:
+            raise AssertionError(f"Expected one row, got {len(self._rows)}")
+        return self._rows[0]
+
+    def scalar(self) -> Any:
+        return _scalar(self._rows[0]) if self._rows else None
+
+    def scalar_one(self) -> Any:
+        return _scalar(self.one())
+
+    def scalar_one_or_none(self) -> Any:
+        return _scalar(self._rows[0]) if self._rows else None
+
+    def scalars(self) -> "FakeResult":
+        return FakeResult([_scalar(row) for row in self._rows])
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class FakeSession:
+    """AsyncSession stand-in holding rows per table."""
+
+    def __init__(self, **tables: list[dict]):
+        self.tables: dict[str, list[dict]] = defaultdict(list)
+        for name, rows in tables.items():
+            self.tables[name] = [dict(row) for row in rows]
+        self.handlers: dict[str, Rows] = {}
+        self.added: list[Any] = []
+        self.statements: list[Any] = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_commit: Exception | None = None
+        # Given the objects added since the last flush, returns an error to raise
+        self.fail_flush: Callable[[list[Any]], Exception | None] | None = None
+        self.needs_rollback = False
+        self._flushed = 0
+
+    def on(self, table: Any, rows: Rows) -> "FakeSession":
+        """Answer SELECTs from `table` (a name or model) with `rows`.
+
+        `rows` may be a callable taking the statement, for tables read in
+        more than one shape or whose contents change during a test.
+        """
+        self.handlers[getattr(table, "__tablename__", table)] = rows
+        return self
+
+    def rows(self, table: Any) -> list[dict]:
+        """Rows written to `table`: INSERTed ones plus added ORM objects."""
+        name = getattr(table, "__tablename__", table)
+        added = [
+            {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+            for obj in self.added
+            if getattr(obj, "__tablename__", None) == name
+        ]
+        return self.tables.get(name, []) + added
+
+    def queries(self, table: Any) -> list[Any]:
+        """Statements executed against `table`."""
+        name = getattr(table, "__tablename__", table)
+        return [s for s in self.statements if table_name(s) == name]
+
+    async def execute(self, statement: Any, params: Any = None) -> FakeResult:
+        self._check_active()
+        compile_pg(statement)
+        self.statements.append(statement)
+        if isinstance(statement, Insert) and statement.select is None:
+            return self._insert(statement)
+        if isinstance(statement, Delete):
+            return self._delete(statement)
+
+        handler = self.handlers.get(table_name(statement), ())
+        rows = handler(statement) if callable(handler) else handler
+        return FakeResult(rows)
+
+    async def scalar(self, statement: Any) -> Any:
+        return (await self.execute(statement)).scalar()
+
+    async def scalars(self, statement: Any) -> FakeResult:
+        return (await self.execute(statement)).scalars()
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    def add_all(self, objects: Iterable[Any]) -> None:
+        self.added.extend(objects)
+
+    async def flush(self) -> None:
+        self._check_active()
+        error = self.fail_flush(self.added[self._flushed:]) if self.fail_flush else None
+        if error is not None:
+            self.needs_rollback = True
+            raise error
+        self._flushed = len(self.added)
+
+    async def commit(self) -> None:
+        self._check_active()
+        if self.fail_commit:
+            raise self.fail_commit
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.needs_rollback = False
+        self.rollbacks += 1
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        """SAVEPOINT: an error inside discards only the block's writes."""
+        self._check_active()
+        added = len(self.added)
+        tables = {name: [dict(row) for row in rows] for name, rows in self.tables.items()}
+        try:
+            yield self
+        except BaseException:
+            del self.added[added:]
+            self._flushed = min(self._flushed, added)
+            self.tables = defaultdict(list, tables)
+            self.needs_rollback = False
+            raise
+
+    def _check_active(self) -> None:
+        if self.needs_rollback:
+            raise PendingRollbackError("This Session's transaction has been rolled back")
+
+    async def refresh(self, obj: Any) -> None:
+        pass
+
+    @property
+    @contextmanager
+    def no_autoflush(self):
+        yield self
+
+    def _insert(self, statement: Insert) -> FakeResult:
+        if statement._multi_values:
+            values = statement._multi_values[0]
+        else:
+            values = [statement._values]
+        new_rows = [
+            {
+                getattr(column, "key", column): (
+                    value.value if isinstance(value, BindParameter) else value
+                )
+                for column, value in row.items()
+            }
+            for row in values
+        ]
+
+        store = self.tables[statement.table.name]
+        conflict = statement._post_values_clause
+        keys = _conflict_keys(statement.table, conflict) if conflict is not None else []
+
+        written = []
+        for new in new_rows:
+            existing = next(
+                (row for row in store if keys and all(row.get(k) == new.get(k) for k in keys)),
+                None,
+            )
+            if existing is None:
+                store.append(new)
+                written.append(new)
+            elif isinstance(conflict, OnConflictDoUpdate):
+                updates = conflict.update_values_to_set
+                items = updates.items() if isinstance(updates, dict) else updates
+                changes = {
+                    getattr(column, "key", column): _evaluate(expr, existing, new)
+                    for column, expr in items
+                }
+                existing.update(changes)
+                written.append(existing)
+
+        returning = [getattr(col, "key", None) for col in statement._returning]
+        return FakeResult(
+            [tuple(row.get(key) for key in returning) for row in written] if returning else [],
+            rowcount=len(written),
+        )
+
+    def _delete(self, statement: Delete) -> FakeResult:
+        where = statement.whereclause
+        if not (
+            isinstance(where, BinaryExpression)
+            and where.operator is operators.in_op
+            and isinstance(where.right, BindParameter)
+        ):
+            raise NotImplementedError(f"FakeSession can't delete by {where!r}")
+        key, values = where.left.key, set(where.right.value)
+        store = self.tables[statement.table.name]
+        kept = [row for row in store if row.get(key) not in values]
+        deleted = len(store) - len(kept)
+        store[:] = kept
+        return FakeResult(rowcount=deleted)
+
+
+def _conflict_keys(table: Table, conflict: Any) -> list[str]:
+    """Columns an ON CONFLICT clause matches rows on."""
+    if conflict.inferred_target_elements:
+        return [getattr(key, "key", key) for key in conflict.inferred_target_elements]
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint) and constraint.name == conflict.constraint_target:
+            return [column.key for column in constraint.columns]
+    return []
+
+
+def _evaluate(expr: Any, existing: dict, new: dict) -> Any:
+    """Evaluate an ON CONFLICT DO UPDATE SET expression."""
+    if isinstance(expr, ColumnClause):
+        table = getattr(expr, "table", None)
+        source = new if getattr(table, "name", None) == "excluded" else existing
+        return source.get(expr.key)
+    if isinstance(expr, BindParameter):
+        return expr.value
+    if isinstance(expr, Null):
+        return None
+    if isinstance(expr, (Grouping, Cast)):
+        return _evaluate(expr.clause if isinstance(expr, Cast) else expr.element, existing, new)
+    if isinstance(expr, BinaryExpression):
+        left = _evaluate(expr.left, existing, new)
+        right = _evaluate(expr.right, existing, new)
+        if expr.operator in (operators.add, operators.sub, operators.mul):
+            return expr.operator(left or 0, right or 0)
+        return expr.operator(left, right)
+    if isinstance(expr, FunctionElement) and expr.name.lower() in _FUNCTIONS:
+        args = [_evaluate(arg, existing, new) for arg in expr.clauses.clauses]
+        return _FUNCTIONS[expr.name.lower()](args)
+    if not hasattr(expr, "__clause_element__") and not hasattr(expr, "compile"):
+        return expr
+    raise NotImplementedError(f"FakeSession can't evaluate {expr!r}")
@@ -0,0 +1,158 @@
+"""Stand-in GitHub API serving REST and GraphQL from an in-memory dataset.
+
+Mount it on an httpx client with ``httpx.MockTransport(fake.handler)``.
+Every request is counted by kind, and an optional per-request latency
+simulates network round trips for benchmarks.
+"""
+
+import asyncio
+import json
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+_PULLS = re.compile(r"^/repos/[^/]+/[^/]+/pulls$")
+_REVIEWS = re.compile(r"^/repos/[^/]+/[^/]+/pulls/(\d+)/reviews$")
+
+
+class FakeGitHub:
+    """In-memory repository with `num_prs` pull requests.
+
+    PR n has `n % (max_reviews + 1)` reviews, so review counts vary and some
+    PRs exceed small GraphQL review pages.
+    """
+
+    def __init__(
+        self,
+        num_prs: int = 120,
+        max_reviews: int = 3,
+        latency: float = 0.0,
+        rate_limit_remaining: int = 5000,
+    ) -> None:
+        self.latency = latency
+        self.rate_limit_remaining = rate_limit_remaining
+        self.requests: Counter[str] = Counter()
+        self.graphql_page_sizes: list[int] = []
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        self.pulls = []
+        self.reviews: dict[int, list[dict]] = {}
+        for n in range(1, num_prs + 1):
+            created = base + timedelta(hours=n)
+            merged = created + timedelta(hours=5) if n % 2 == 0 else None
+            self.pulls.append({
+                "id": 10_000 + n,
+                "number": n,
+                "title": f"PR {n}",
+                "state": "closed" if merged else "open",
+                "created_at": _iso(created),
+                "updated_at": _iso(created + timedelta(hours=6)),
+                "merged_at": _iso(merged) if merged else None,
+                "closed_at": _iso(merged) if merged else None,
+                "additions": n * 3,
+                "deletions": n,
+                "changed_files": 1 + n % 4,
+                "commits": 1 + n % 3,
+                "comments": n % 2,
+                "user": {"id": 500 + n % 7, "login": f"user{n % 7}"},
+            })
+            self.reviews[n] = [
+                {
+                    "id": 90_000 + n * 10 + i,
+                    "state": "APPROVED" if i == 0 else "COMMENTED",
+                    "body": f"review {i}",
+                    "submitted_at": _iso(created + timedelta(hours=1 + i)),
+                    "user": {"id": 600 + i, "login": f"reviewer{i}"},
+                }
+                for i in range(n % (max_reviews + 1))
+            ]
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        path = request.url.path
+        if request.method == "POST" and path.endswith("/graphql"):
+            self.requests["graphql"] += 1
+            return self._graphql(json.loads(request.content))
+
+        if _PULLS.match(path):
+            self.requests["rest_pulls"] += 1
+            params = request.url.params
+            per_page = int(params.get("per_page", 30))
+            page = int(params.get("page", 1))
+            start = (page - 1) * per_page
+            return httpx.Response(200, json=self.pulls[start:start + per_page])
+
+        match = _REVIEWS.match(path)
+        if match:
+            self.requests["rest_reviews"] += 1
+            return httpx.Response(200, json=self.reviews.get(int(match.group(1)), []))
+
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    def _graphql(self, body: dict) -> httpx.Response:
+        variables = body.get("variables") or {}
+        first = variables["first"]
+        reviews_first = variables["reviewsFirst"]
+        start = int(variables.get("after") or 0)
+        page = self.pulls[start:start + first]
+        self.graphql_page_sizes.append(first)
+
+        cost = 1
+        self.rate_limit_remaining -= cost
+        end = start + len(page)
+        data = {
+            "rateLimit": {
+                "limit": 5000,
+                "cost": cost,
+                "remaining": self.rate_limit_remaining,
+                "resetAt": _iso(datetime.now(timezone.utc) + timedelta(hours=1)),
+            },
+            "repository": {
+                "pullRequests": {
+                    "pageInfo": {"hasNextPage": end < len(self.pulls), "endCursor": str(end)},
+                    "nodes": [self._pull_node(pr, reviews_first) for pr in page],
+                },
+            },
+        }
+        return httpx.Response(200, json={"data": data})
+
+    def _pull_node(self, pr: dict, reviews_first: int) -> dict:
+        reviews = self.reviews[pr["number"]]
+        return {
+            "databaseId": pr["id"],
+            "number": pr["number"],
+            "title": pr["title"],
+            "state": "MERGED" if pr["merged_at"] else "OPEN",
+            "createdAt": pr["created_at"],
+            "updatedAt": pr["updated_at"],
+            "mergedAt": pr["merged_at"],
+            "closedAt": pr["closed_at"],
+            "additions": pr["additions"],
+            "deletions": pr["deletions"],
+            "changedFiles": pr["changed_files"],
+            "commits": {"totalCount": pr["commits"]},
+            "comments": {"totalCount": pr["comments"]},
+            "author": {"login": pr["user"]["login"], "databaseId": pr["user"]["id"]},
+            "reviews": {
+                "totalCount": len(reviews),
+                "nodes": [
+                    {
+                        "databaseId": r["id"],
+                        "state": r["state"],
+                        "body": r["body"],
+                        "submittedAt": r["submitted_at"],
+                        "author": {"login": r["user"]["login"], "databaseId": r["user"]["id"]},
+                        "comments": {"totalCount": 1},
+                    }
+                    for r in reviews[:reviews_first]
+                ],
+            },
+        }
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
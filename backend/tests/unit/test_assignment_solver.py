@@ -0,0 +1,108 @@
+"""Tests for the capacitated assignment solver."""
+
+import itertools
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.services.assignment_solver import solve_assignment, total_score
+from aexy.services.whatif_analyzer import WhatIfAnalyzer
+
+
+def brute_force(scores, capacities, min_score=0.0) -> float:
+    """Best total score by trying every assignment."""
+    best = 0.0
+    unassigned = len(capacities)
+    for combo in itertools.product(range(len(capacities) + 1), repeat=len(scores)):
+        load = [0] * len(capacities)
+        total = 0.0
+        for task, dev in enumerate(combo):
+            if dev == unassigned:
+                continue
+            score = scores[task][dev]
+            if score is None or score < min_score:
+                break
+            load[dev] += 1
+            if load[dev] > capacities[dev]:
+                break
+            total += score
+        else:
+            best = max(best, total)
+    return best
+
+
+class TestSolveAssignment:
+    """Test optimality and constraints of the solver."""
+
+    def test_beats_greedy_under_capacity(self):
+        """Greedy gives dev 0 task 0 and strands task 1; optimal swaps."""
+        scores = [
+            [0.9, 0.8],
+            [0.85, 0.1],
+        ]
+
+        assert solve_assignment(scores, [1, 1]) == [1, 0]
+
+    def test_respects_capacity(self):
+        """No developer should take more than their capacity."""
+        scores = [[0.9, 0.2]] * 5
+
+        result = solve_assignment(scores, [2, 2])
+
+        assert result.count(0) == 2
+        assert result.count(1) == 2
+        assert result.count(None) == 1
+
+    def test_disallowed_and_low_scores_stay_unassigned(self):
+        """None entries and scores under min_score should never be assigned."""
+        scores = [
+            [None, 0.1],
+            [None, None],
+        ]
+
+        assert solve_assignment(scores, [1, 1], min_score=0.5) == [None, None]
+        assert solve_assignment(scores, [1, 1]) == [1, None]
+
+    def test_empty_inputs(self):
+        """Should handle no tasks and no developers."""
+        assert solve_assignment([], [1, 2]) == []
+        assert solve_assignment([[], []], []) == [None, None]
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_matches_brute_force(self, seed):
+        """Should find the best total score on small random problems."""
+        rng = random.Random(seed)
+        tasks, devs = rng.randint(1, 6), rng.randint(1, 4)
+        scores = [
+            [None if rng.random() < 0.15 else round(rng.random(), 2) for _ in range(devs)]
+            for _ in range(tasks)
+        ]
+        capacities = [rng.randint(0, 3) for _ in range(devs)]
+
+        result = solve_assignment(scores, capacities, min_score=0.2)
+
+        assert total_score(scores, result) == pytest.approx(brute_force(scores, capacities, 0.2))
+
+
+class TestWhatIfOptimize:
+    """Test the what-if analyzer's optimized scenario."""
+
+    def test_optimize_assignments_counts_current_workload(self):
+        """Developers at their limit should get nothing new."""
+        python = {"languages": [{"name": "Python", "proficiency_score": 90}]}
+        developers = [
+            SimpleNamespace(id="busy", name="Busy", skill_fingerprint=python),
+            SimpleNamespace(id="free", name="Free", skill_fingerprint=python),
+        ]
+        tasks = [
+            {"id": f"t{i}", "title": f"Task {i}", "signals": {"required_skills": ["python"]}}
+            for i in range(3)
+        ]
+
+        scenario = WhatIfAnalyzer().optimize_assignments(
+            tasks, developers, {"max_per_dev": 2, "current_workloads": {"busy": 2}}
+        )
+
+        assert [a.developer_id for a in scenario.assignments] == ["free", "free"]
+        assert scenario.team_impact.unassigned_tasks == 1
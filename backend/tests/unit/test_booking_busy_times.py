@@ -0,0 +1,162 @@
+"""Tests for concurrent multi-host busy time lookups in booking availability."""
+
+import asyncio
+import time as time_module
+from datetime import date, datetime, time, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.booking import (
+    AvailabilityOverride,
+    CalendarConnection,
+    EventType,
+    UserAvailability,
+)
+from aexy.services.booking.availability_service import AvailabilityService
+from aexy.services.booking.calendar_sync_service import CalendarSyncService, HostBusyTimes
+from tests.fakes.db import FakeSession
+
+
+def connection(user_id: str):
+    return SimpleNamespace(user_id=user_id, provider="google", calendar_id=f"{user_id}@cal")
+
+
+class TestGetBusyTimesForHosts:
+    """Test the concurrent calendar fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_hosts_fetched_concurrently_within_limit(self, monkeypatch):
+        """Hosts should overlap, but never more than the concurrency limit."""
+        hosts = [f"host-{i}" for i in range(6)]
+        service = CalendarSyncService(
+            FakeSession().on(CalendarConnection, [connection(h) for h in hosts])
+        )
+        in_flight = 0
+        peak = 0
+        moments = []
+
+        async def slow_fetch(connections, start_dt, end_dt, refreshed):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            moments.append(time_module.perf_counter())
+            await asyncio.sleep(0.05)
+            moments.append(time_module.perf_counter())
+            in_flight -= 1
+            return [{"start": start_dt, "end": end_dt}]
+
+        monkeypatch.setattr(service, "_fetch_connections_busy", slow_fetch)
+
+        result = await service.get_busy_times_for_hosts(
+            hosts, date(2026, 5, 4), date(2026, 5, 4), max_concurrency=3, timeout=1
+        )
+        elapsed = max(moments) - min(moments)
+
+        assert list(result) == hosts
+        assert peak == 3
+        assert elapsed < 0.25  # two waves of 50ms, not six
+        assert all(h.status == "ok" and len(h.busy) == 1 for h in result.values())
+        assert all(h.duration_ms >= 40 for h in result.values())
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_hosts_give_partial_results(self, monkeypatch):
+        """A timeout or error on one host should not fail the others."""
+        service = CalendarSyncService(
+            FakeSession().on(
+                CalendarConnection, [connection("ok"), connection("slow"), connection("broken")]
+            )
+        )
+
+        async def fetch(connections, start_dt, end_dt, refreshed):
+            user_id = connections[0].user_id
+            if user_id == "slow":
+                await asyncio.sleep(1)
+            if user_id == "broken":
+                raise RuntimeError("401")
+            return [{"start": start_dt, "end": end_dt}]
+
+        monkeypatch.setattr(service, "_fetch_connections_busy", fetch)
+
+        result = await service.get_busy_times_for_hosts(
+            ["ok", "slow", "broken", "no-calendar"],
+            date(2026, 5, 4), date(2026, 5, 4), timeout=0.05,
+        )
+
+        assert {h: r.status for h, r in result.items()} == {
+            "ok": "ok", "slow": "timeout", "broken": "error", "no-calendar": "ok",
+        }
+        assert result["slow"].busy == [] and result["broken"].busy == []
+        assert len(result["ok"].busy) == 1
+
+
+class FakeCalendarService:
+    """Calendar service returning fixed per-host results."""
+
+    def __init__(self, hosts: dict[str, HostBusyTimes]):
+        self.hosts = hosts
+        self.calls = []
+
+    async def get_busy_times_for_hosts(self, user_ids, start_date, end_date):
+        self.calls.append(list(user_ids))
+        return {user_id: self.hosts[user_id] for user_id in user_ids}
+
+
+class TestAvailabilityService:
+    """Test slot calculation over prefetched host data."""
+
+    @pytest.mark.asyncio
+    async def test_day_availability_batches_users(self):
+        """Windows for all users are loaded together; overrides win."""
+        overrides = [
+            SimpleNamespace(user_id="b", is_available=False, start_time=None, end_time=None),
+            SimpleNamespace(user_id="c", is_available=True, start_time=time(13), end_time=time(14)),
+        ]
+        regular = [
+            SimpleNamespace(user_id="a", start_time=time(9), end_time=time(12)),
+            SimpleNamespace(user_id="b", start_time=time(9), end_time=time(17)),
+            SimpleNamespace(user_id="c", start_time=time(9), end_time=time(17)),
+        ]
+        session = FakeSession().on(AvailabilityOverride, overrides).on(UserAvailability, regular)
+
+        windows = await AvailabilityService(session)._get_day_availability(
+            ["a", "b", "c"], "ws", 0, date(2026, 5, 4)
+        )
+
+        assert [(w["user_id"], w["start_time"]) for w in windows] == [
+            ("a", time(9)),
+            ("c", time(13)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_slots_report_partial_host_timings(self):
+        """Slots should use reachable calendars and report the unreachable host."""
+        target = date.today() + timedelta(days=3)
+        busy_start = datetime.combine(target, time(9), tzinfo=timezone.utc)
+        event_type = SimpleNamespace(
+            id="evt", workspace_id="ws", owner_id="a", is_team_event=True,
+            min_notice_hours=0, max_future_days=30, duration_minutes=30,
+            buffer_before=0, buffer_after=0,
+        )
+        session = (
+            FakeSession()
+            .on(EventType, [event_type])
+            .on(UserAvailability, [
+                SimpleNamespace(user_id="a", start_time=time(9), end_time=time(10)),
+                SimpleNamespace(user_id="b", start_time=time(9), end_time=time(10)),
+            ])
+        )
+        calendar = FakeCalendarService({
+            "a": HostBusyTimes("a", busy=[{"start": busy_start, "end": busy_start + timedelta(minutes=30)}], duration_ms=12),
+            "b": HostBusyTimes("b", status="timeout", duration_ms=5000),
+        })
+
+        result = await AvailabilityService(session).get_available_slots_result(
+            "evt", target, "UTC", calendar, user_ids=["a", "b"]
+        )
+
+        assert calendar.calls == [["a", "b"]]
+        assert result.partial is True
+        assert [(h.host_id, h.status) for h in result.host_timings] == [("a", "ok"), ("b", "timeout")]
+        nine = datetime.combine(target, time(9), tzinfo=timezone.utc)
+        assert any(s["start_time"] == nine and not s["available"] for s in result.slots)
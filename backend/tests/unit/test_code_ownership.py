@@ -0,0 +1,224 @@
+"""Unit tests for the code ownership matrix."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.code_ownership import RepositoryOwnershipMatrix
+from aexy.services.code_ownership_service import (
+    CodeOwnershipService,
+    OwnershipMatrix,
+    directory_of,
+)
+from tests.fakes.db import FakeSession, compile_pg
+
+
+def _matrix() -> OwnershipMatrix:
+    matrix = OwnershipMatrix(repository="acme/mono")
+    for _ in range(4):
+        matrix.add_commit("alice", ["billing/api.py", "billing/models.py"])
+    matrix.add_commit("bob", ["billing/api.py"])
+    matrix.add_commit("bob", ["search/index.py", "README.md"])
+    matrix.add_commit("carol", ["search/index.py"])
+    return matrix
+
+
+class TestDirectoryOf:
+    def test_nested_path(self):
+        assert directory_of("a/b/c/file.py", depth=2) == "a/b"
+
+    def test_root_file(self):
+        assert directory_of("README.md") == "."
+
+
+class TestOwnershipMatrix:
+    def test_add_commit_counts_each_path_once(self):
+        matrix = OwnershipMatrix(repository="r")
+        matrix.add_commit("alice", ["a.py", "a.py", ""])
+        assert matrix.paths == ["a.py"]
+        assert matrix.rows == [{0: 1}]
+
+    def test_round_trip_through_cells(self):
+        matrix = _matrix()
+        record = SimpleNamespace(
+            repository=matrix.repository,
+            paths=matrix.paths,
+            developer_ids=matrix.developer_ids,
+            cells=matrix.to_cells(),
+        )
+        restored = OwnershipMatrix.from_record(record)
+        assert restored.rows == matrix.rows
+        restored.add_commit("alice", ["billing/api.py"])
+        api_row = restored.rows[restored.paths.index("billing/api.py")]
+        assert api_row[restored.developer_ids.index("alice")] == 5
+
+    def test_file_bus_factor(self):
+        result = _matrix().bus_factors("file", threshold=0.8)
+        assert result["billing/api.py"]["bus_factor"] == 1
+        assert result["billing/api.py"]["top_owners"][0]["developer_id"] == "alice"
+        assert result["search/index.py"]["bus_factor"] == 2
+
+    def test_directory_rollup(self):
+        result = _matrix().bus_factors("directory")
+        assert set(result) == {"billing", "search", "."}
+        assert result["billing"]["total_touches"] == 9
+
+    def test_developer_subset_masks_columns(self):
+        result = _matrix().bus_factors("directory", developer_ids=["bob", "carol"])
+        assert result["billing"]["total_touches"] == 1
+        assert result["billing"]["top_owners"][0]["developer_id"] == "bob"
+
+    def test_knowledge_silos(self):
+        silos = _matrix().knowledge_silos("directory", min_share=0.8, min_touches=3)
+        assert [s["path"] for s in silos] == ["billing"]
+        assert silos[0]["owner_id"] == "alice"
+
+    def test_rotation_exposure(self):
+        result = _matrix().rotation_exposure(["alice"], level="directory")
+        assert result["orphaned_paths"] == []
+        assert [p["path"] for p in result["at_risk_paths"]] == ["billing"]
+
+        result = _matrix().rotation_exposure(["bob"], level="file")
+        assert [p["path"] for p in result["orphaned_paths"]] == ["README.md"]
+
+
+def _session(**tables) -> FakeSession:
+    """Session whose matrix SELECTs return ORM rows for the stored matrices."""
+    session = FakeSession(**tables)
+    records: dict[str, RepositoryOwnershipMatrix] = {}
+
+    def matrices(statement):
+        for row in session.tables["repository_ownership_matrices"]:
+            if row["repository"] not in records:
+                records[row["repository"]] = RepositoryOwnershipMatrix(
+                    created_at=datetime(2026, 1, 1, tzinfo=timezone.utc), backfilled_at=None, **row
+                )
+        if len(statement.selected_columns) == 1:  # needs_backfill
+            return [(r.backfilled_at,) for r in records.values()]
+        return list(records.values())
+
+    session.on(RepositoryOwnershipMatrix, matrices)
+    return session
+
+
+class TestRecordCommits:
+    @pytest.mark.asyncio
+    async def test_batch_is_applied_to_one_row(self):
+        """A push's commits land in one matrix row, created with ON CONFLICT."""
+        session = _session()
+        service = CodeOwnershipService(session)
+
+        await service.record_commits("acme/api", [
+            ("alice", ["a.py", "b.py"]),
+            ("bob", ["a.py"]),
+            (None, ["c.py"]),
+        ])
+        await service.record_commits("acme/api", [("alice", ["a.py"])])
+
+        [row] = session.rows(RepositoryOwnershipMatrix)
+        record = (await service.get_matrix("acme/api"))
+        assert row["repository"] == "acme/api"
+        assert record.rows[record.paths.index("a.py")] == {0: 2, 1: 1}
+        upsert = compile_pg(session.queries(RepositoryOwnershipMatrix)[0])
+        assert "ON CONFLICT (repository) DO NOTHING" in upsert
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_record_touches_nothing(self):
+        session = _session()
+        await CodeOwnershipService(session).record_commits("acme/api", [("alice", [])])
+        assert session.statements == []
+
+
+def _history(commits):
+    """Answer commit history SELECTs, honouring the backfill cursor and limit."""
+
+    def answer(statement):
+        params = statement.compile().params
+        cursor = next((v for k, v in params.items() if k.startswith("id_")), None)
+        rows = [c for c in commits if cursor is None or c[0] > cursor]
+        return rows[:statement._limit]
+
+    return answer
+
+
+class TestBackfill:
+    @pytest.mark.asyncio
+    async def test_folds_history_once(self):
+        """Commits stored before tracking started are folded in exactly once."""
+        session = _session()
+        session.on("commits", _history([("c1", "sha1", "alice"), ("c2", "sha2", "bob"), ("c3", "sha3", "alice")]))
+        files = {"sha1": ["a.py"], "sha2": ["a.py", "b.py"], "sha3": []}
+        fetched = []
+
+        async def fetch_paths(sha):
+            fetched.append(sha)
+            return files[sha]
+
+        service = CodeOwnershipService(session)
+        assert await service.needs_backfill("acme/api")
+
+        assert await service.backfill("acme/api", fetch_paths) == 2
+        assert sorted(fetched) == ["sha1", "sha2", "sha3"]
+        matrix = await service.get_matrix("acme/api")
+        assert matrix.rows[matrix.paths.index("a.py")] == {0: 1, 1: 1}
+        assert not await service.needs_backfill("acme/api")
+
+        # A finished backfill fetches nothing
+        assert await service.backfill("acme/api", fetch_paths) == 0
+        assert len(fetched) == 3
+        matrix = await service.get_matrix("acme/api")
+        assert matrix.rows[matrix.paths.index("a.py")] == {0: 1, 1: 1}
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_keeps_committed_batches(self):
+        """A failed fetch loses only its batch; the next run resumes after the cursor."""
+        session = _session()
+        session.on("commits", _history([("c1", "sha1", "alice"), ("c2", "sha2", "bob"), ("c3", "sha3", "bob")]))
+        failing = {"sha3"}
+        fetched = []
+
+        async def fetch_paths(sha):
+            fetched.append(sha)
+            if sha in failing:
+                raise RuntimeError("rate limited")
+            return ["a.py"]
+
+        service = CodeOwnershipService(session)
+        with pytest.raises(RuntimeError):
+            await service.backfill("acme/api", fetch_paths, batch_size=2)
+
+        assert await service.needs_backfill("acme/api")
+        matrix = await service.get_matrix("acme/api")
+        assert matrix.rows[matrix.paths.index("a.py")] == {0: 1, 1: 1}
+
+        failing.clear()
+        fetched.clear()
+        assert await service.backfill("acme/api", fetch_paths, batch_size=2) == 1
+        assert fetched == ["sha3"]
+        matrix = await service.get_matrix("acme/api")
+        assert matrix.rows[matrix.paths.index("a.py")] == {0: 1, 1: 2}
+        assert not await service.needs_backfill("acme/api")
+
+    @pytest.mark.asyncio
+    async def test_each_run_is_capped(self):
+        """A run stops after max_commits; later runs continue where it stopped."""
+        session = _session()
+        session.on("commits", _history([(f"c{n}", f"sha{n}", "alice") for n in range(1, 6)]))
+        fetched = []
+
+        async def fetch_paths(sha):
+            fetched.append(sha)
+            return ["a.py"]
+
+        service = CodeOwnershipService(session)
+
+        assert await service.backfill("acme/api", fetch_paths, batch_size=2, max_commits=3) == 3
+        assert fetched == ["sha1", "sha2", "sha3"]
+        assert await service.needs_backfill("acme/api")
+
+        assert await service.backfill("acme/api", fetch_paths, batch_size=2, max_commits=3) == 2
+        assert fetched[3:] == ["sha4", "sha5"]
+        assert not await service.needs_backfill("acme/api")
+        matrix = await service.get_matrix("acme/api")
+        assert matrix.rows[matrix.paths.index("a.py")] == {0: 5}
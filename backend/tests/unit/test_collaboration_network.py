@@ -0,0 +1,40 @@
+"""Unit tests for collaboration edge bucketing and read-time decay."""
+
+from datetime import date, datetime, timezone
+
+from aexy.services.collaboration_network import (
+    EDGE_HALF_LIFE_DAYS,
+    CollaborationNetworkAnalyzer,
+    _EdgeTotals,
+    decay_factor,
+    week_bucket,
+)
+
+
+class TestEdgeBuckets:
+    def test_week_bucket_is_monday(self):
+        sunday = datetime(2024, 3, 17, 23, 0, tzinfo=timezone.utc)
+        assert week_bucket(sunday) == date(2024, 3, 11)
+
+    def test_decay_halves_each_half_life(self):
+        now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        assert decay_factor(now.date(), now) == 1.0
+        old = date.fromordinal(now.date().toordinal() - EDGE_HALF_LIFE_DAYS)
+        assert abs(decay_factor(old, now) - 0.5) < 1e-9
+
+    def test_collaborator_counts_split_given_and_received(self):
+        directed = {
+            ("alice", "bob"): _EdgeTotals(reviews=3),
+            ("bob", "alice"): _EdgeTotals(reviews=1),
+            ("carol", "alice"): _EdgeTotals(reviews=2),
+        }
+        counts = CollaborationNetworkAnalyzer._collaborator_counts(directed)
+        assert counts["alice"]["bob"] == {"reviews_given": 3, "reviews_received": 1}
+        assert counts["alice"]["carol"] == {"reviews_given": 0, "reviews_received": 2}
+        assert counts["carol"]["alice"]["reviews_given"] == 2
+
+    def test_strength_grows_with_decayed_interactions(self):
+        analyzer = CollaborationNetworkAnalyzer(db=None)
+        assert analyzer._calculate_strength(0, 0) == 0
+        assert analyzer._calculate_strength(2.0, 0) < analyzer._calculate_strength(20.0, 0)
+        assert analyzer._calculate_strength(1000.0, 0) == 1.0
@@ -0,0 +1,246 @@
+"""Tests for batched contact enrichment of synced emails."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from aexy.models.crm import CRMObject, CRMRecord, CRMRecordRelation
+from aexy.models.google_integration import SyncedEmailRecordLink
+from aexy.services.contact_enrichment_service import ContactEnrichmentQueue
+from tests.fakes.db import FakeSession
+
+
+def crm_records(companies=(), people=()):
+    """Answer CRMRecord selects: people by email, everything else as companies."""
+
+    def answer(statement):
+        params = statement.compile().params.values()
+        return people if "email" in params else companies
+
+    return answer
+
+
+def make_session(companies=(), people=(), links=()):
+    return (
+        FakeSession()
+        .on(CRMObject, make_objects())
+        .on(CRMRecord, crm_records(companies, people))
+        .on(SyncedEmailRecordLink, links)
+    )
+
+
+class FakeCache:
+    def __init__(self, cached=None):
+        self.cached = cached or {}
+        self.stored = {}
+
+    async def get_many(self, workspace_id, domains):
+        return {d: self.cached[d] for d in domains if d in self.cached}
+
+    async def set_many(self, workspace_id, record_ids, ttl):
+        self.stored.update(record_ids)
+
+
+def make_email(email_id, from_email, from_name=None, body=None, day=1):
+    return SimpleNamespace(
+        id=email_id,
+        from_email=from_email,
+        from_name=from_name,
+        body_text=body,
+        gmail_date=datetime(2026, 5, day, tzinfo=timezone.utc),
+    )
+
+
+def make_objects():
+    return [
+        SimpleNamespace(slug="person", id="obj-person", record_count=0),
+        SimpleNamespace(slug="company", id="obj-company", record_count=0),
+    ]
+
+
+class TestFlush:
+    """Test one enrichment batch."""
+
+    @pytest.mark.asyncio
+    async def test_dedupes_senders_and_domains(self):
+        """Each sender and each company domain should be handled once."""
+        emails = [
+            make_email("e1", "ann@acme.com", "Ann Lee"),
+            make_email("e2", "ANN@acme.com"),
+            make_email("e3", "bob@acme.com", "Bob"),
+            make_email("e4", "carol@gmail.com", "Carol"),
+            make_email("e5", "me@acme.com"),
+        ]
+        session = make_session()
+        objects = session.handlers["crm_objects"]
+        cache = FakeCache()
+        queue = ContactEnrichmentQueue(
+            session, "ws-1", batch_size=10, own_email="ME@acme.com", cache=cache
+        )
+        for email in emails:
+            queue.enqueue(email)
+
+        result = await queue.flush()
+
+        assert (result.unique_senders, result.unique_domains) == (3, 1)
+        companies = [r for r in session.rows(CRMRecord) if r["object_id"] == "obj-company"]
+        people = [r for r in session.rows(CRMRecord) if r["object_id"] == "obj-person"]
+        assert [c["values"]["domain"] for c in companies] == ["acme.com"]
+        assert sorted(p["values"]["email"] for p in people) == ["ann@acme.com", "bob@acme.com", "carol@gmail.com"]
+        relations = session.rows(CRMRecordRelation)
+        assert {r["target_record_id"] for r in relations} == {companies[0]["id"]}
+        assert len(relations) == 2
+        assert sorted(link["email_id"] for link in session.rows(SyncedEmailRecordLink)) == ["e1", "e2", "e3", "e4"]
+        assert objects[0].record_count == 3 and objects[1].record_count == 1
+        assert cache.stored == {"acme.com": companies[0]["id"]}
+        assert queue.pending == []
+
+    @pytest.mark.asyncio
+    async def test_cached_company_and_existing_person_are_reused(self):
+        """Cache hits skip the domain query; known people are only linked."""
+        company = SimpleNamespace(id="co-1", values={"domain": "acme.com"})
+        person = SimpleNamespace(id="p-1", values={"email": "Ann@Acme.com"})
+        session = make_session(companies=[company], people=[person], links=[("e1", "p-1")])
+        queue = ContactEnrichmentQueue(session, "ws-1", cache=FakeCache({"acme.com": "co-1"}))
+        queue.enqueue(make_email("e1", "ann@acme.com"))
+        queue.enqueue(make_email("e2", "ann@acme.com"))
+
+        result = await queue.flush()
+
+        assert result.company_cache_hits == 1
+        assert result.contacts_created == 0 and result.companies_created == 0
+        assert [(e.id, p.id, c.id) for e, p, c in result.enriched] == [("e1", "p-1", "co-1"), ("e2", "p-1", "co-1")]
+        assert session.rows(CRMRecord) == [] and session.rows(CRMRecordRelation) == []
+        assert [link["email_id"] for link in session.rows(SyncedEmailRecordLink)] == ["e2"]
+        # The cached company is loaded by id, without a domain/website match
+        assert not any("%acme.com%" in q.compile().params.values() for q in session.queries(CRMRecord))
+
+    def test_enqueue_reports_full_batch(self):
+        """The queue should ask to be flushed once it reaches its batch size."""
+        queue = ContactEnrichmentQueue(FakeSession(), "ws-1", batch_size=2, cache=FakeCache())
+
+        assert queue.enqueue(make_email("e1", "a@x.io")) is False
+        assert queue.enqueue(make_email("e2", None)) is False
+        assert queue.enqueue(make_email("e3", "b@x.io")) is True
+        assert [e.id for e in queue.pending] == ["e1", "e3"]
+
+
+class TestFlushFailures:
+    """Test that a failed batch doesn't lose its emails."""
+
+    @staticmethod
+    def failing_links(bad_email_id):
+        def answer(statement):
+            if bad_email_id in str(statement.compile().params):
+                raise RuntimeError("link lookup failed")
+            return []
+
+        return answer
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_emails_queued(self):
+        session = make_session().on(SyncedEmailRecordLink, self.failing_links("e2"))
+        queue = ContactEnrichmentQueue(session, "ws-1", cache=FakeCache())
+        queue.enqueue(make_email("e1", "ann@acme.com"))
+        queue.enqueue(make_email("e2", "bob@beta.io"))
+
+        with pytest.raises(RuntimeError):
+            await queue.flush()
+
+        assert [e.id for e in queue.pending] == ["e1", "e2"]
+        assert [o.record_count for o in session.handlers["crm_objects"]] == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_per_sender_fallback_drops_only_the_failing_sender(self):
+        session = make_session().on(SyncedEmailRecordLink, self.failing_links("e2"))
+        queue = ContactEnrichmentQueue(session, "ws-1", cache=FakeCache())
+        for email in [
+            make_email("e1", "ann@acme.com"),
+            make_email("e2", "bob@beta.io"),
+            make_email("e3", "ann@acme.com"),
+        ]:
+            queue.enqueue(email)
+
+        result = await queue.flush_per_sender()
+
+        assert result.emails_processed == 3 and result.errors == 1
+        assert [e.id for e, _, _ in result.enriched] == ["e1", "e3"]
+        assert sorted(link["email_id"] for link in session.rows(SyncedEmailRecordLink)) == ["e1", "e3"]
+        assert queue.pending == []
+
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_flush_rolls_back_only_that_batch(self):
+        """A flush error rolls back to the batch's savepoint; later senders are still written."""
+        session = make_session()
+
+        def duplicate_bob(added):
+            if any((getattr(obj, "values", None) or {}).get("email") == "bob@beta.io" for obj in added):
+                return IntegrityError("INSERT INTO crm_records", {}, Exception("duplicate key"))
+            return None
+
+        session.fail_flush = duplicate_bob
+        queue = ContactEnrichmentQueue(session, "ws-1", cache=FakeCache())
+        for email in [
+            make_email("e1", "bob@beta.io"),
+            make_email("e2", "ann@acme.com"),
+            make_email("e3", "carol@gmail.com"),
+        ]:
+            queue.enqueue(email)
+
+        with pytest.raises(IntegrityError):
+            await queue.flush()
+        assert session.rows(CRMRecord) == [] and not session.needs_rollback
+
+        result = await queue.flush_per_sender()
+
+        assert result.errors == 1
+        people = [r["values"]["email"] for r in session.rows(CRMRecord) if r["object_id"] == "obj-person"]
+        assert people == ["ann@acme.com", "carol@gmail.com"]
+        assert sorted(link["email_id"] for link in session.rows(SyncedEmailRecordLink)) == ["e2", "e3"]
+        await session.commit()
+        assert session.commits == 1
+
+
+class TestSignatureLookups:
+    """Test concurrent provider lookups."""
+
+    @pytest.mark.asyncio
+    async def test_one_lookup_per_sender_under_concurrency_limit(self):
+        """Signatures should be fetched once per sender, at most N at a time."""
+        in_flight = 0
+        peak = 0
+        bodies = []
+
+        async def extract(body):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            bodies.append(body)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"extracted": True, "contact_info": {"company": "Acme Inc", "job_title": "CTO"}}
+
+        service = SimpleNamespace(extract_signature_info=extract)
+        session = make_session()
+        queue = ContactEnrichmentQueue(
+            session, "ws-1", max_concurrency=2, rate_per_second=0,
+            extract_signatures=True, cache=FakeCache(), service=service,
+        )
+        queue.enqueue(make_email("e1", "ann@acme.com", body="old", day=1))
+        queue.enqueue(make_email("e2", "ann@acme.com", body="new", day=2))
+        for i in range(4):
+            queue.enqueue(make_email(f"x{i}", f"dev{i}@acme.com", body=f"body {i}"))
+
+        result = await queue.flush()
+
+        assert result.provider_lookups == 5 and len(bodies) == 5
+        assert "new" in bodies and "old" not in bodies
+        assert peak == 2
+        company = next(r for r in session.rows(CRMRecord) if r["object_id"] == "obj-company")
+        assert company["values"]["name"] == "Acme Inc"
+        person = next(r for r in session.rows(CRMRecord) if r["values"].get("email") == "ann@acme.com")
+        assert person["values"]["job_title"] == "CTO"
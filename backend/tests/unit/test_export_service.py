@@ -12,6 +12,7 @@ import pytest
 import json
 import os
 from datetime import datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from aexy.services.export_service import ExportService
@@ -459,3 +460,194 @@ class TestExportValidation:
 
         is_valid = service._validate_request(request)
         assert is_valid is False
+
+
+class TestStreamingExport:
+    """Tests for the streaming table writers."""
+
+    class _RecordingSession:
+        def __init__(self, calls):
+            self.calls = calls
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, stmt):
+            self.calls.append(stmt.compile().params)
+
+        async def commit(self):
+            pass
+
+    @pytest.fixture
+    def progress_calls(self):
+        return []
+
+    @pytest.fixture
+    def service(self, tmp_path, progress_calls):
+        return ExportService(
+            export_dir=tmp_path,
+            session_factory=lambda: self._RecordingSession(progress_calls),
+        )
+
+    @staticmethod
+    async def _rows(n):
+        for i in range(n):
+            yield [i, f"row-{i}"]
+
+    @pytest.mark.asyncio
+    async def test_stream_csv_gzip(self, service, progress_calls):
+        import gzip
+        from types import SimpleNamespace
+        from aexy.services.export_service import ExportTable, PROGRESS_INTERVAL
+
+        tables = [
+            ExportTable("First", ["id", "name"], self._rows(PROGRESS_INTERVAL + 5), PROGRESS_INTERVAL + 5),
+            ExportTable("Second", ["id", "name"], [[1, "x"]]),
+        ]
+        path = await service._stream_csv(SimpleNamespace(id="job-1"), tables, compress=True)
+
+        assert path.endswith(".csv.gz")
+        with gzip.open(path, "rt") as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "id,name"
+        assert "Second" in lines
+        assert lines[-1] == "1,x"
+
+        assert progress_calls[0]["rows_processed"] == PROGRESS_INTERVAL
+        assert progress_calls[0]["rows_total"] == PROGRESS_INTERVAL + 5
+        assert progress_calls[-1]["rows_processed"] == PROGRESS_INTERVAL + 6
+        assert progress_calls[-1]["rows_total"] == PROGRESS_INTERVAL + 6
+
+    @pytest.mark.asyncio
+    async def test_stream_json_is_valid(self, service):
+        from types import SimpleNamespace
+        from aexy.services.export_service import ExportTable
+
+        tables = [ExportTable("Items", ["id", "name"], self._rows(3))]
+        path = await service._stream_json(SimpleNamespace(id="job-2", export_type="developer_profile"), tables)
+
+        with open(path) as f:
+            data = json.load(f)
+        assert data["tables"][0]["rows"][2] == {"id": 2, "name": "row-2"}
+
+
+class TestExportJobs:
+    """Tests for queued export jobs and result-dict tables."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        from tests.fakes.db import FakeSession
+
+        class ProgressSession(FakeSession):
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return ExportService(export_dir=tmp_path, session_factory=ProgressSession)
+
+    @staticmethod
+    def _job(export_type, config, format="csv"):
+        from aexy.models.analytics import ExportJob
+
+        return ExportJob(
+            id="job-1",
+            requested_by="dev-1",
+            export_type=export_type,
+            format=format,
+            config=config,
+            status="pending",
+        )
+
+    def test_data_tables(self):
+        from aexy.services.export_service import DEVELOPER_EXPORT_COLUMNS, data_tables
+
+        report = list(data_tables({"widgets": {
+            "w1": {"title": "Commits", "data": [{"day": "mon", "count": 3}]},
+            "w2": {"title": "Broken", "error": "timeout"},
+        }}))
+        assert [(t.title, t.headers) for t in report] == [
+            ("Commits", ["day", "count"]), ("Broken", ["Error"]),
+        ]
+        assert list(report[0].rows) == [["mon", 3]]
+
+        (developers,) = data_tables({"developers": [{"id": "d1", "top_skills": ["Go", "SQL"]}]})
+        assert developers.headers == DEVELOPER_EXPORT_COLUMNS
+        assert list(developers.rows) == [["d1", None, None, None, "Go, SQL", None]]
+
+        (generic,) = data_tables({"summary": {"total": 2}, "ids": [1, 2]})
+        assert list(generic.rows) == [["summary.total", 2], ["ids", "[1, 2]"]]
+
+    def test_developer_export_columns_match_rows(self):
+        from aexy.models.developer_insights import DeveloperMetricsSnapshot, InsightAlertHistory
+        from aexy.services.developer_insights_service import (
+            ALERT_EXPORT_COLUMNS,
+            SNAPSHOT_EXPORT_COLUMNS,
+            DeveloperInsightsService,
+        )
+
+        snapshot = DeveloperInsightsService._snapshot_export_row(DeveloperMetricsSnapshot())
+        alert = DeveloperInsightsService._alert_export_row(InsightAlertHistory())
+        assert set(snapshot) == set(SNAPSHOT_EXPORT_COLUMNS)
+        assert set(alert) == set(ALERT_EXPORT_COLUMNS)
+
+    @pytest.mark.asyncio
+    async def test_submit_queues_job_for_worker(self, service, monkeypatch):
+        from aexy.schemas.analytics import ExportFormat, ExportType
+        from aexy.temporal import dispatch as dispatch_module
+        from tests.fakes.db import FakeSession
+
+        dispatched = []
+
+        async def dispatch(name, input, task_queue=None, workflow_id=None):
+            dispatched.append((name, input.job_id, workflow_id))
+            return workflow_id
+
+        monkeypatch.setattr(dispatch_module, "dispatch", dispatch)
+        db = FakeSession()
+
+        job = await service.export_report("report-1", ExportFormat.CSV, db, "dev-1")
+
+        assert job.status == "pending" and job.config == {"report_id": "report-1"}
+        assert db.rows("export_jobs")[0]["export_type"] == ExportType.REPORT.value
+        assert dispatched == [("process_export_job", job.id, f"export-{job.id}")]
+
+    @pytest.mark.asyncio
+    async def test_run_export_job_streams_producer_tables(self, service, monkeypatch):
+        from aexy.services.developer_insights_service import DeveloperInsightsService
+        from aexy.services.export_service import ExportTable
+        from tests.fakes.db import FakeSession
+
+        async def tables(self, developer_id, workspace_id):
+            yield ExportTable("Snapshots", ["id", "developer"], [["s1", developer_id]])
+
+        monkeypatch.setattr(DeveloperInsightsService, "iter_developer_export_tables", tables)
+        job = self._job("developer_profile", {"developer_id": "dev-9", "workspace_id": "ws-1"})
+        db = FakeSession().on("export_jobs", [job])
+
+        result = await service.run_export_job(job.id, db)
+
+        assert result.status == "completed"
+        lines = Path(result.file_path).read_text().splitlines()
+        assert lines == ["id,developer", "s1,dev-9"]
+
+        # A retried activity leaves the completed job alone
+        assert await service.run_export_job(job.id, db) is job
+        assert db.commits == 2
+
+    @pytest.mark.asyncio
+    async def test_run_export_job_unsupported_type_fails(self, service):
+        from tests.fakes.db import FakeSession
+
+        job = self._job("project_backlog", {})
+        db = FakeSession().on("export_jobs", [job])
+
+        result = await service.run_export_job(job.id, db)
+
+        assert result.status == "failed"
+        assert result.error_message == "Unsupported export type: project_backlog"
+        assert not result.file_path
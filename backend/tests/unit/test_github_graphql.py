@@ -0,0 +1,95 @@
+"""Unit tests for the GitHub GraphQL batch fetcher against a stand-in server."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from aexy.services.github_graphql import GitHubGraphQLFetcher
+from aexy.services.github_service import GitHubGraphQLError, GitHubService
+from tests.fakes.github import FakeGitHub
+
+
+def _service(fake: FakeGitHub) -> GitHubService:
+    service = GitHubService(access_token="test_token")
+    service._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(fake.handler),
+        base_url="https://api.github.com",
+    )
+    return service
+
+
+async def _collect(fetcher: GitHubGraphQLFetcher) -> list[dict]:
+    prs = []
+    async for page in fetcher.iter_pull_requests("acme", "app"):
+        prs.extend(page)
+    return prs
+
+
+class TestGraphQLFetcher:
+    """Test paging and normalization of pull requests with nested reviews."""
+
+    @pytest.mark.asyncio
+    async def test_pages_and_normalizes_to_rest_shape(self):
+        """Should fetch every PR in pages and match the REST payload fields."""
+        fake = FakeGitHub(num_prs=120, max_reviews=3)
+        fetcher = GitHubGraphQLFetcher(_service(fake), page_size=50)
+
+        prs = await _collect(fetcher)
+
+        assert [pr["number"] for pr in prs] == list(range(1, 121))
+        assert fake.requests["graphql"] == 3
+        assert fetcher.usage.requests == 3
+        assert fetcher.usage.cost == 3
+
+        rest = fake.pulls[1]  # PR 2 is merged and has 2 reviews
+        pr = prs[1]
+        for key in ("id", "number", "title", "state", "merged_at", "additions", "deletions"):
+            assert pr[key] == rest[key]
+        assert pr["user"] == {"id": rest["user"]["id"], "login": rest["user"]["login"]}
+        assert [r["id"] for r in pr["reviews"]] == [r["id"] for r in fake.reviews[2]]
+        assert pr["reviews_complete"] is True
+
+    @pytest.mark.asyncio
+    async def test_flags_truncated_reviews(self):
+        """Should mark PRs with more reviews than fit in the page."""
+        fake = FakeGitHub(num_prs=4, max_reviews=3)
+        fetcher = GitHubGraphQLFetcher(_service(fake), reviews_per_pr=2)
+
+        prs = await _collect(fetcher)
+
+        assert [pr["reviews_complete"] for pr in prs] == [True, True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_halves_page_size_on_retryable_error(self):
+        """Should retry the same page with a smaller size after a timeout."""
+        fake = FakeGitHub(num_prs=30)
+        service = _service(fake)
+        real_graphql = service.graphql
+        calls = []
+
+        async def flaky(query, variables):
+            calls.append(variables["first"])
+            if len(calls) == 1:
+                raise GitHubGraphQLError("timeout", retryable=True)
+            return await real_graphql(query, variables)
+
+        service.graphql = flaky
+        fetcher = GitHubGraphQLFetcher(service, page_size=40)
+
+        prs = await _collect(fetcher)
+
+        assert len(prs) == 30
+        assert calls == [40, 20, 20]
+
+    @pytest.mark.asyncio
+    async def test_waits_when_budget_is_low(self):
+        """Should sleep until reset when the next page would dip into the reserve."""
+        fake = FakeGitHub(num_prs=10, rate_limit_remaining=50)
+        fetcher = GitHubGraphQLFetcher(_service(fake), cost_reserve=100)
+
+        with patch("aexy.services.github_graphql.asyncio.sleep", new=AsyncMock()) as sleep:
+            await _collect(fetcher)
+
+        sleep.assert_awaited_once()
+        assert 0 < sleep.await_args[0][0] <= 3600
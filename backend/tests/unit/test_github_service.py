@@ -1,5 +1,6 @@
 """Unit tests for GitHubService - TDD approach with mocking."""
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -335,3 +336,59 @@ class TestGetPRReviews:
 
         assert len(result) == 2
         assert result[0]["state"] == "APPROVED"
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of list endpoints."""
+
+    class _MemoryETagCache:
+        def __init__(self):
+            self.store = {}
+
+        def make_key(self, access_token, path, params):
+            return (path, tuple(sorted((params or {}).items())))
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, etag, body):
+            self.store[key] = {"etag": etag, "body": body}
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_body(self):
+        """Should send If-None-Match and return the cached body on 304."""
+        first = MagicMock()
+        first.status_code = 200
+        first.headers = {"etag": 'W/"abc"'}
+        first.json.return_value = [{"sha": "abc123"}]
+
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+
+        service = GitHubService(access_token="test_token", etag_cache=self._MemoryETagCache())
+        service._client = MagicMock()
+        service._client.get = AsyncMock(side_effect=[first, not_modified])
+
+        assert await service.get_commits("owner", "repo") == [{"sha": "abc123"}]
+        assert await service.get_commits("owner", "repo") == [{"sha": "abc123"}]
+
+        second_headers = service._client.get.call_args_list[1][1]["headers"]
+        assert second_headers == {"If-None-Match": 'W/"abc"'}
+        not_modified.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_commits_since_param(self):
+        """Should format the since cursor as a UTC ISO-8601 timestamp."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = []
+
+        service = GitHubService(access_token="test_token")
+        service._client = MagicMock()
+        service._client.get = AsyncMock(return_value=mock_response)
+
+        await service.get_commits("owner", "repo", since=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc))
+
+        call_kwargs = service._client.get.call_args[1]
+        assert call_kwargs["params"]["since"] == "2024-05-01T12:30:00Z"
@@ -0,0 +1,233 @@
+"""Tests for batched Gmail sync and set-based email linking."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.crm import CRMRecord
+from aexy.models.google_integration import SyncedEmail, SyncedEmailRecordLink
+from aexy.services import gmail_sync_service
+from aexy.services.gmail_sync_service import (
+    GmailAuthError,
+    GmailSyncService,
+    build_batch_body,
+    history_message_ids,
+    parse_batch_response,
+)
+from tests.fakes.db import FakeSession, compile_pg
+
+
+def make_integration():
+    return SimpleNamespace(
+        id="int-1",
+        workspace_id="ws-1",
+        google_email="me@acme.com",
+        access_token="token",
+        token_expiry=datetime.now(timezone.utc) + timedelta(hours=1),
+        gmail_settings={},
+    )
+
+
+def metadata_message(message_id, sender="Ann <ann@acme.com>"):
+    return {
+        "id": message_id,
+        "threadId": f"t-{message_id}",
+        "labelIds": ["INBOX", "UNREAD"],
+        "snippet": "hello",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": sender},
+                {"name": "Subject", "value": f"Subject {message_id}"},
+                {"name": "Content-Type", "value": "multipart/mixed; boundary=x"},
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    async def sleep(_):
+        return None
+
+    monkeypatch.setattr(gmail_sync_service.asyncio, "sleep", sleep)
+
+
+class TestBatchFormat:
+    """Test the multipart batch request and response format."""
+
+    def test_build_and_parse_round_trip(self):
+        """Response parts should map back to request indexes by Content-ID."""
+        body = build_batch_body(["/a", "/b"], "b1")
+        assert body.count("--b1\r\n") == 2 and body.endswith("--b1--\r\n")
+        assert "Content-ID: <item1>\r\n\r\nGET /b\r\n" in body
+
+        response = (
+            "--resp\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item1>\r\n\r\n"
+            "HTTP/1.1 429 Too Many Requests\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            '{"error": {"code": 429}}\r\n'
+            "--resp\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            '{"id": "m0"}\r\n'
+            "--resp--\r\n"
+        )
+
+        parsed = parse_batch_response('multipart/mixed; boundary="resp"', response)
+
+        assert parsed == {0: (200, {"id": "m0"}), 1: (429, {"error": {"code": 429}})}
+
+    def test_history_message_ids_are_unique(self):
+        history = [
+            {"messagesAdded": [{"message": {"id": "a"}}, {"message": {"id": "b"}}]},
+            {"labelsAdded": []},
+            {"messagesAdded": [{"message": {"id": "a"}}]},
+        ]
+        assert history_message_ids(history) == ["a", "b"]
+
+
+class TestFetchMessages:
+    """Test batched message fetches."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_retries_rate_limited_parts(self, monkeypatch, no_backoff):
+        """Batches hold at most 100 messages; 429 parts are retried."""
+        service = GmailSyncService(FakeSession())
+        calls = []
+
+        async def batch_get(access_token, paths):
+            calls.append(len(paths))
+            ids = [p.split("/")[-1].split("?")[0] for p in paths]
+            if len(calls) == 1:
+                return [(429, None) if i == "m3" else (200, {"id": i}) for i in ids]
+            return [(200, {"id": i}) for i in ids]
+
+        monkeypatch.setattr(service, "_batch_get", batch_get)
+
+        messages = await service.fetch_messages(
+            make_integration(), [f"m{i}" for i in range(150)]
+        )
+
+        assert sorted(calls[:2], reverse=True) == [100, 50]
+        assert calls[2:] == [1]
+        assert len(messages) == 150 and messages["m3"] == {"id": "m3"}
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_in_a_part_raises(self, monkeypatch):
+        service = GmailSyncService(FakeSession())
+
+        async def batch_get(access_token, paths):
+            return [(401, None)] * len(paths)
+
+        monkeypatch.setattr(service, "_batch_get", batch_get)
+
+        with pytest.raises(GmailAuthError):
+            await service.fetch_messages(make_integration(), ["m1"])
+
+
+class TestSyncMessages:
+    """Test storing a page of messages."""
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_and_writes_metadata_once(self, monkeypatch):
+        """Known IDs are not fetched; new emails are stored without bodies."""
+        session = FakeSession().on(SyncedEmail, ["m1"])
+        service = GmailSyncService(session)
+        fetched = []
+
+        async def fetch_messages(integration, ids, format="metadata"):
+            fetched.append((list(ids), format))
+            return {i: metadata_message(i) for i in ids}
+
+        monkeypatch.setattr(service, "fetch_messages", fetch_messages)
+
+        stored = await service.sync_messages(make_integration(), ["m1", "m2", "m3", "m2"])
+
+        assert stored == 3
+        assert fetched == [(["m2", "m3"], "metadata")]
+        emails = session.rows(SyncedEmail)
+        assert [e["gmail_id"] for e in emails] == ["m2", "m3"]
+        assert emails[0]["from_email"] == "ann@acme.com" and emails[0]["body_fetched_at"] is None
+        assert emails[0]["has_attachments"] is True and emails[0]["is_read"] is False
+        assert [e.gmail_id for e in service._enrichment_queue.pending] == ["m2", "m3"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_bodies_only_fetches_missing(self, monkeypatch):
+        session = FakeSession()
+        service = GmailSyncService(session)
+        done = SimpleNamespace(gmail_id="m1", body_fetched_at=datetime.now(timezone.utc))
+        pending = SimpleNamespace(gmail_id="m2", body_fetched_at=None)
+
+        async def fetch_messages(integration, ids, format="metadata"):
+            assert (ids, format) == (["m2"], "full")
+            return {"m2": {"payload": {"mimeType": "text/plain", "body": {"data": "aGk="}}}}
+
+        monkeypatch.setattr(service, "fetch_messages", fetch_messages)
+
+        assert await service.fetch_bodies(make_integration(), [done, pending]) == 1
+        assert pending.body_text == "hi" and pending.body_fetched_at is not None
+
+
+class TestIterMessagePages:
+    """Test paging through the mailbox."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_listed_while_current_is_processed(self, monkeypatch):
+        service = GmailSyncService(FakeSession())
+        pages = {
+            None: {"messages": [{"id": "a"}, {"id": "b"}], "nextPageToken": "p2"},
+            "p2": {"messages": [{"id": "c"}, {"id": "d"}], "nextPageToken": "p3"},
+        }
+        requested = []
+
+        async def request(integration, method, endpoint, access_token=None, params=None):
+            requested.append(params.get("pageToken"))
+            return pages[params.get("pageToken")]
+
+        monkeypatch.setattr(service, "_make_gmail_request", request)
+
+        seen = []
+        async for ids, token in service.iter_message_pages(make_integration(), None, 3):
+            await asyncio.sleep(0)
+            seen.append((ids, token, list(requested)))
+
+        assert seen == [
+            (["a", "b"], "p2", [None, "p2"]),
+            (["c"], "p3", [None, "p2"]),
+        ]
+
+
+class TestLinkEmailsToRecords:
+    """Test set-based linking of emails to CRM records."""
+
+    @pytest.mark.asyncio
+    async def test_links_by_address_skipping_existing_links(self):
+        """Senders and recipients are matched case-insensitively to records."""
+        emails = [
+            ("e1", "Ann@Acme.com", [{"email": "bob@acme.com"}]),
+            ("e2", "carol@x.io", [{"email": "ann@acme.com"}]),
+        ]
+        matches = [("r-ann", "ann@acme.com"), ("r-bob", "bob@acme.com")]
+        session = (
+            FakeSession()
+            .on(SyncedEmail, emails)
+            .on(CRMRecord, matches)
+            .on(SyncedEmailRecordLink, [("e1", "r-bob")])
+        )
+
+        result = await GmailSyncService(session).link_emails_to_records("ws-1")
+
+        assert result == {"links_created": 2}
+        links = session.rows(SyncedEmailRecordLink)
+        assert [(l["email_id"], l["record_id"], l["link_type"]) for l in links] == [
+            ("e1", "r-ann", "from"),
+            ("e2", "r-ann", "to"),
+        ]
+        sql = compile_pg(session.queries(CRMRecord)[0])
+        assert "jsonb_each_text" in sql and "lower" in sql
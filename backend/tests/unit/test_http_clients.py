@@ -0,0 +1,143 @@
+"""Unit tests for the shared HTTP connection pool registry."""
+
+import httpx
+import pytest
+
+from aexy.core.http_clients import HTTPClientRegistry, upstream_origin
+
+
+class _RecordingPool(httpx.AsyncBaseTransport):
+    """Stand-in pool that fires a trace event like httpcore does on acquire."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        trace = request.extensions.get("trace")
+        if trace is not None:
+            await trace("http11.send_request_headers.started", {})
+        return httpx.Response(self.status_code, json={"ok": True})
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _registry(pools: dict) -> HTTPClientRegistry:
+    def factory(key):
+        pools[key] = _RecordingPool(status_code=503 if "flaky" in key[0] else 200)
+        return pools[key]
+
+    return HTTPClientRegistry(transport_factory=factory)
+
+
+class TestHTTPClientRegistry:
+    """Test pool sharing, lifecycle and per-upstream metrics."""
+
+    def test_upstream_origin_fills_default_port(self):
+        """Should key upstreams by scheme, host and port."""
+        assert upstream_origin(httpx.URL("https://api.github.com/user")) == "https://api.github.com:443"
+        assert upstream_origin(httpx.URL("http://localhost:8001/x")) == "http://localhost:8001"
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool_per_upstream(self):
+        """Short-lived clients should reuse pools and not close them on exit."""
+        pools: dict = {}
+        registry = _registry(pools)
+
+        for _ in range(3):
+            async with httpx.AsyncClient(transport=registry.transport()) as client:
+                await client.get("https://api.github.com/user")
+                await client.get("https://slack.com/api/auth.test")
+
+        assert len(pools) == 2
+        github = pools[("https://api.github.com:443", True, False)]
+        assert len(github.requests) == 3
+        assert not github.closed
+
+        await registry.aclose()
+        assert all(pool.closed for pool in pools.values())
+
+    @pytest.mark.asyncio
+    async def test_tls_settings_get_separate_pools(self):
+        """Should not share connections between verified and unverified TLS."""
+        pools: dict = {}
+        registry = _registry(pools)
+
+        async with httpx.AsyncClient(transport=registry.transport()) as client:
+            await client.get("https://internal.example.com/")
+        async with httpx.AsyncClient(transport=registry.transport(verify=False)) as client:
+            await client.get("https://internal.example.com/")
+
+        assert set(pools) == {
+            ("https://internal.example.com:443", True, False),
+            ("https://internal.example.com:443", False, False),
+        }
+
+    @pytest.mark.asyncio
+    async def test_records_latency_pool_wait_and_errors(self):
+        """Should expose per-upstream request counts, latency and pool wait."""
+        registry = _registry({})
+
+        async with httpx.AsyncClient(transport=registry.transport()) as client:
+            await client.get("https://api.github.com/user")
+            await client.get("https://api.github.com/user/emails")
+            await client.get("https://flaky.example.com/")
+
+        stats = registry.stats()
+        github = stats["https://api.github.com:443"]
+        assert github["requests"] == 2
+        assert github["errors"] == 0
+        assert github["latency_max_ms"] >= github["pool_wait_max_ms"] >= 0
+        assert stats["https://flaky.example.com:443"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_preserves_caller_trace_extension(self):
+        """Should still forward trace events to a caller-supplied callback."""
+        registry = _registry({})
+        events = []
+
+        async def trace(name, info):
+            events.append(name)
+
+        async with httpx.AsyncClient(transport=registry.transport()) as client:
+            await client.get("https://api.github.com/user", extensions={"trace": trace})
+
+        assert events == ["http11.send_request_headers.started"]
+
+    def test_pools_from_a_previous_event_loop_are_closed(self):
+        """A new event loop should close the old loop's pools before replacing them."""
+        import asyncio
+
+        pools: dict = {}
+        registry = _registry(pools)
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=registry.transport()) as client:
+                await client.get("https://api.github.com/user")
+            return pools[("https://api.github.com:443", True, False)]
+
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+        assert first is not second
+        assert first.closed and not second.closed
+
+    def test_run_async_closes_pools_before_closing_its_loop(self, monkeypatch):
+        """Sync task wrappers should not leave pools bound to a closed loop."""
+        from aexy.core import http_clients
+        from aexy.processing.tasks import run_async
+
+        pools: dict = {}
+        registry = _registry(pools)
+        monkeypatch.setattr(http_clients, "_registry", registry)
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=http_clients.get_http_transport()) as client:
+                await client.get("https://api.github.com/user")
+
+        run_async(fetch())
+
+        assert [pool.closed for pool in pools.values()] == [True]
@@ -504,3 +504,188 @@ class TestSkillExtraction:
         )
 
         assert len(skills) >= 2
+
+
+class TestBulkExtraction:
+    """Test the batched extraction used by bulk ingest."""
+
+    def test_bulk_languages_match_single(self):
+        """Bulk language extraction should agree with per-commit extraction."""
+        service = IngestionService()
+
+        file_lists = [
+            ["src/main.py", "web/app.tsx", "README.md"],
+            [],
+            ["lib.rs", "src/main.py", "Makefile", "x.cs", "y.c"],
+        ]
+        bulk = service.extract_languages_bulk(file_lists)
+
+        for files, languages in zip(file_lists, bulk):
+            assert sorted(languages) == sorted(service.extract_languages(files))
+
+    def test_bulk_skills_match_single(self):
+        """Bulk skill extraction should agree with per-PR extraction."""
+        service = IngestionService()
+
+        texts = [
+            "Add Stripe payment integration",
+            "",
+            "Implement OAuth2 authentication with JWT tokens",
+            "GraphQL endpoint backed by Postgres, deployed with Docker",
+            "Fix typo",
+        ]
+        bulk = service.extract_skills_bulk(texts)
+
+        for text, skills in zip(texts, bulk):
+            assert sorted(skills) == sorted(service.extract_skills_from_pr(text, None))
+
+    def test_ingest_stats_rate(self):
+        """Stats should report rows per second."""
+        from aexy.services.ingestion_service import IngestStats
+
+        stats = IngestStats(kind="commits", rows=500, written=450, seconds=2.0)
+        assert stats.rows_per_second == 250
+        assert stats.to_dict()["rows_per_second"] == 250.0
+        assert IngestStats(kind="commits").rows_per_second == 0.0
+
+
+class TestBulkUpserts:
+    """Test the bulk INSERT ... ON CONFLICT statements against PostgreSQL SQL."""
+
+    @pytest.fixture
+    def recorded(self, monkeypatch):
+        """Ownership and collaboration updates made by the bulk methods."""
+        from aexy.services import ingestion_service
+
+        calls = {"ownership": [], "interactions": []}
+
+        class Ownership:
+            def __init__(self, db):
+                pass
+
+            async def record_commits(self, repository, updates):
+                calls["ownership"].extend(updates)
+
+        class Collaboration:
+            def __init__(self, db):
+                pass
+
+            async def record_review_interactions(self, interactions):
+                calls["interactions"].extend(interactions)
+
+        monkeypatch.setattr(ingestion_service, "CodeOwnershipService", Ownership)
+        monkeypatch.setattr(ingestion_service, "CollaborationNetworkAnalyzer", Collaboration)
+        return calls
+
+    @staticmethod
+    def _push_commit(sha, email, added):
+        return {
+            "id": sha,
+            "message": f"commit {sha}",
+            "author": {"name": email.split("@")[0], "email": email},
+            "timestamp": "2024-01-15T10:00:00Z",
+            "added": added,
+            "modified": [],
+            "removed": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_commits_skip_existing_shas(self, recorded):
+        from tests.fakes.db import FakeSession, compile_pg
+
+        db = FakeSession(commits=[{"sha": "old", "repository": "acme/api"}])
+        db.on(Developer, [("known@example.com", "dev-known")])
+        commits = [
+            self._push_commit("old", "known@example.com", ["a.py"]),
+            self._push_commit("new", "known@example.com", ["b.py"]),
+            self._push_commit("ghost", "ghost@example.com", ["c.go"]),
+        ]
+
+        stats = await IngestionService().ingest_commits_bulk("acme/api", commits, db)
+
+        assert (stats.rows, stats.written) == (3, 2)
+        assert [r["sha"] for r in db.rows(Commit)] == ["old", "new", "ghost"]
+        placeholder = db.rows(Developer)[0]
+        assert placeholder["email"] == "ghost@example.com"
+        assert db.rows(Commit)[2]["developer_id"] == placeholder["id"]
+        assert db.rows(Commit)[1]["languages"] == ["Python"]
+        # Only newly inserted commits feed the ownership matrix
+        assert recorded["ownership"] == [
+            ("dev-known", ["b.py"]), (placeholder["id"], ["c.go"]),
+        ]
+
+        insert_sql = compile_pg(db.queries(Commit)[0])
+        assert "ON CONFLICT (sha) DO NOTHING RETURNING commits.sha" in insert_sql
+
+    @pytest.mark.asyncio
+    async def test_pull_requests_upsert(self, recorded):
+        from tests.fakes.db import FakeSession, compile_pg
+
+        db = FakeSession(pull_requests=[{
+            "github_id": 1, "title": "Original title", "state": "open",
+            "developer_id": "dev-author", "additions": 1,
+        }])
+        db.on("github_connections", [(77, "dev-other")])
+        prs = [
+            {"id": 1, "number": 1, "title": "", "state": "closed", "additions": 40,
+             "user": {"id": 77}, "merged_at": "2024-01-16T10:00:00Z"},
+            {"id": 2, "number": 2, "title": "Add Stripe checkout", "state": "open",
+             "user": {"id": 77}, "created_at": "2024-01-15T10:00:00Z"},
+        ]
+
+        stats = await IngestionService().ingest_pull_requests_bulk("acme/api", prs, db)
+
+        assert stats.written == 2
+        updated, created = db.rows(PullRequest)
+        # Empty titles and already linked authors are kept; the rest is updated
+        assert updated["title"] == "Original title"
+        assert updated["developer_id"] == "dev-author"
+        assert (updated["state"], updated["additions"]) == ("closed", 40)
+        assert updated["merged_at"] == datetime(2024, 1, 16, 10, tzinfo=timezone.utc)
+        assert created["developer_id"] == "dev-other"
+        assert "payment" in created["detected_skills"]
+
+        upsert_sql = compile_pg(db.queries(PullRequest)[0])
+        assert "ON CONFLICT (github_id) DO UPDATE SET" in upsert_sql
+        assert "coalesce(nullif(excluded.title" in upsert_sql
+
+    @pytest.mark.asyncio
+    async def test_reviews_skip_existing(self, recorded):
+        from tests.fakes.db import FakeSession, compile_pg
+
+        db = FakeSession(code_reviews=[{"github_id": 10}])
+        db.on("github_connections", [(77, "dev-reviewer")])
+        db.on(PullRequest, [(5, "dev-author")])
+        reviews = [
+            ({"id": 10, "state": "APPROVED", "user": {"id": 77}}, 5),
+            ({"id": 11, "state": "COMMENTED", "user": {"id": 77},
+              "submitted_at": "2024-01-15T10:00:00Z"}, 5),
+        ]
+
+        stats = await IngestionService().ingest_reviews_bulk("acme/api", reviews, db)
+
+        assert stats.written == 1
+        assert [r["github_id"] for r in db.rows(CodeReview)] == [10, 11]
+        assert recorded["interactions"] == [
+            ("dev-reviewer", "dev-author", datetime(2024, 1, 15, 10, tzinfo=timezone.utc)),
+        ]
+        assert "ON CONFLICT (github_id) DO NOTHING" in compile_pg(db.queries(CodeReview)[0])
+
+    @pytest.mark.asyncio
+    async def test_push_webhook_commits_use_bulk_insert(self, recorded):
+        from tests.fakes.db import FakeSession
+
+        db = FakeSession()
+        db.on(Commit, lambda stmt: [Commit(**row) for row in db.tables["commits"]])
+        commits = [
+            self._push_commit("c1", "a@example.com", ["a.py"]),
+            self._push_commit("c2", "a@example.com", ["b.py"]),
+        ]
+
+        records = await IngestionService().ingest_commits(
+            "acme/api", commits, sender=None, db=db
+        )
+
+        assert [r.sha for r in records] == ["c1", "c2"]
+        inserts = [s for s in db.queries(Commit) if s.is_insert]
+        assert len(inserts) == 1 and len(recorded["ownership"]) == 2
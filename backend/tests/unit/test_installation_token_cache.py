@@ -0,0 +1,121 @@
+"""Tests for the GitHub App installation token cache."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aexy.cache.installation_token_cache import InstallationTokenCache
+
+
+class _FakeRedis:
+    """Minimal async Redis supporting the calls the cache makes."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes | str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class _Minter:
+    def __init__(self, lifetime: timedelta = timedelta(hours=1), delay: float = 0.0) -> None:
+        self.calls = 0
+        self.lifetime = lifetime
+        self.delay = delay
+
+    async def __call__(self) -> tuple[str, datetime]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"token-{self.calls}", datetime.now(timezone.utc) + self.lifetime
+
+
+class TestInstallationTokenCache:
+    """Tests for caching, early refresh and single-flight minting."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_token_until_refresh_margin(self):
+        """Should mint once and serve later calls from memory."""
+        cache = InstallationTokenCache(None)
+        mint = _Minter()
+
+        first = await cache.get_or_refresh(1, mint)
+        second = await cache.get_or_refresh(1, mint)
+
+        assert first == second
+        assert mint.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_refreshes_early_before_expiry(self):
+        """Should mint a new token once inside the refresh margin."""
+        cache = InstallationTokenCache(None, refresh_margin=timedelta(minutes=5))
+        mint = _Minter(lifetime=timedelta(minutes=4))
+
+        await cache.get_or_refresh(1, mint)
+        token, _ = await cache.get_or_refresh(1, mint)
+
+        assert token == "token-2"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_mint(self):
+        """Should mint once for many concurrent callers."""
+        cache = InstallationTokenCache(_FakeRedis())
+        mint = _Minter(delay=0.01)
+
+        results = await asyncio.gather(*(cache.get_or_refresh(7, mint) for _ in range(20)))
+
+        assert mint.calls == 1
+        assert len({token for token, _ in results}) == 1
+
+    @pytest.mark.asyncio
+    async def test_shares_tokens_across_processes_via_redis(self):
+        """A second process should read the token from Redis, encrypted at rest."""
+        redis = _FakeRedis()
+        mint = _Minter()
+
+        token, _ = await InstallationTokenCache(redis).get_or_refresh(3, mint)
+        other = await InstallationTokenCache(redis).get_or_refresh(3, mint)
+
+        assert other[0] == token
+        assert mint.calls == 1
+        stored = redis.data[InstallationTokenCache.make_key(3)]
+        assert token.encode() not in stored
+
+    @pytest.mark.asyncio
+    async def test_failed_mint_propagates_and_is_retried(self):
+        """Should surface mint errors and not cache them."""
+        cache = InstallationTokenCache(None)
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_refresh(1, failing)
+
+        token, _ = await cache.get_or_refresh(1, _Minter())
+        assert token == "token-1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_new_token(self):
+        """Should mint again after invalidation."""
+        cache = InstallationTokenCache(_FakeRedis())
+        mint = _Minter()
+
+        await cache.get_or_refresh(1, mint)
+        await cache.invalidate(1)
+        token, _ = await cache.get_or_refresh(1, mint)
+
+        assert token == "token-2"
@@ -0,0 +1,173 @@
+"""Tests for proctoring event ingestion and counter-based trust scores."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from aexy.models.assessment import ProctoringEventSeverity
+from aexy.services.proctoring_service import (
+    ProctoringService,
+    calculate_deductions,
+    trust_score_from_counts,
+)
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.value)
+
+
+class FakeSession:
+    """Session stand-in holding one attempt and recording writes."""
+
+    def __init__(self, attempt, critical_events=None):
+        self.attempt = attempt
+        self.critical_events = critical_events or []
+        self.added = []
+        self.commits = 0
+        self.queries = []
+
+    def add_all(self, objects):
+        self.added.extend(objects)
+
+    async def execute(self, query):
+        self.queries.append(str(query))
+        if "FROM proctoring_events" in str(query):
+            return FakeResult(self.critical_events)
+        return FakeResult(self.attempt)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def make_attempt(**counts):
+    return SimpleNamespace(
+        id="attempt-1",
+        proctoring_event_counts=counts,
+        critical_event_count=0,
+        trust_score=None,
+    )
+
+
+@pytest.fixture
+def service_for():
+    def build(session):
+        with patch("aexy.services.proctoring_service.get_llm_gateway", return_value=None):
+            return ProctoringService(session)
+
+    return build
+
+
+class TestTrustScoreFromCounts:
+    """Test trust score arithmetic on event counts."""
+
+    def test_deductions_are_capped_per_type(self):
+        """Repeated events should stop deducting at the per-type cap."""
+        assert calculate_deductions({"tab_switch": 10, "devtools_open": 1}) == {
+            "tab_switch": 25,
+            "devtools_open": 20,
+        }
+        assert trust_score_from_counts({"tab_switch": 10, "devtools_open": 1}) == 55
+
+    def test_score_never_negative(self):
+        """Many critical events should bottom out at zero."""
+        assert trust_score_from_counts({"multiple_faces": 20}) == 0
+        assert trust_score_from_counts({}) == 100
+
+
+class TestLogEvents:
+    """Test batch ingestion and counter deltas."""
+
+    @pytest.mark.asyncio
+    async def test_batch_updates_counters_in_one_commit(self, service_for):
+        """A batch should add counts to the attempt and commit once."""
+        attempt = make_attempt(tab_switch=2)
+        session = FakeSession(attempt)
+
+        events, trust_score = await service_for(session).log_events(
+            "attempt-1",
+            [
+                {"event_type": "tab_switch"},
+                {"event_type": "devtools_open", "data": {"x": 1}},
+                {"event_type": "tab_switch"},
+            ],
+        )
+
+        assert len(events) == 3 and session.added == events
+        assert session.commits == 1
+        assert attempt.proctoring_event_counts == {"tab_switch": 4, "devtools_open": 1}
+        assert attempt.critical_event_count == 1
+        assert trust_score == attempt.trust_score == 100 - 20 - 20
+        # The attempt row is locked while counters change
+        assert "FOR UPDATE" in session.queries[0]
+
+    @pytest.mark.asyncio
+    async def test_client_timestamps_are_kept_but_not_in_future(self, service_for):
+        """Buffered events keep their time; future times are clamped to now."""
+        session = FakeSession(make_attempt())
+        earlier = datetime.now(timezone.utc) - timedelta(seconds=30)
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        events, _ = await service_for(session).log_events(
+            "attempt-1",
+            [
+                {"event_type": "window_blur", "timestamp": earlier},
+                {"event_type": "window_blur", "timestamp": future},
+            ],
+        )
+
+        assert events[0].timestamp == earlier
+        assert events[1].timestamp <= datetime.now(timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_log_event_delegates_to_batch(self, service_for):
+        """The single-event API should go through the same counters."""
+        attempt = make_attempt()
+        session = FakeSession(attempt)
+
+        event = await service_for(session).log_event("attempt-1", "fullscreen_exit")
+
+        assert event.severity == ProctoringEventSeverity.CRITICAL
+        assert attempt.proctoring_event_counts == {"fullscreen_exit": 1}
+        assert attempt.trust_score == 90
+
+
+class TestCounterReads:
+    """Test reads served from the counters."""
+
+    @pytest.mark.asyncio
+    async def test_check_violations_uses_counters(self, service_for):
+        """Only critical events should be loaded, and only if there are any."""
+        attempt = make_attempt(tab_switch=3, multiple_faces=3)
+        attempt.critical_event_count = 3
+        critical = [
+            SimpleNamespace(event_type="multiple_faces", severity="critical", timestamp=None)
+            for _ in range(3)
+        ]
+        session = FakeSession(attempt, critical_events=critical)
+
+        result = await service_for(session).check_violations("attempt-1")
+
+        assert result["trust_score"] == 100 - 15 - 45
+        assert result["total_event_count"] == 6
+        assert result["critical_event_count"] == 3
+        assert result["recommended_action"] == "flag_for_review"
+        assert len(result["violations"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_clean_attempt_skips_event_query(self, service_for):
+        """No critical events means no event query at all."""
+        session = FakeSession(make_attempt())
+
+        result = await service_for(session).check_violations("attempt-1")
+
+        assert result["is_flagged"] is False
+        assert not any("FROM proctoring_events" in q for q in session.queries)
@@ -1,12 +1,23 @@
 """Unit tests for Profile Sync Service - TDD approach."""
 
+import asyncio
+import copy
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 
 from aexy.models.activity import Commit, PullRequest, CodeReview
 from aexy.models.developer import Developer, GitHubConnection
-from aexy.services.profile_sync import ProfileSyncService
+from aexy.services.profile_sync import (
+    ProfileSyncService,
+    ProfileSyncTiming,
+    PullRequestStats,
+    compact_commit_aggregates,
+    empty_commit_aggregates,
+    fold_commits,
+    shard_developer_ids,
+)
 
 
 class TestProfileSyncBasic:
@@ -521,3 +532,145 @@ class TestFullProfileSync:
 
         # Verify growth trajectory
         assert "skills_acquired_6m" in result.growth_trajectory
+
+
+def _commit_row(days_ago: float, languages: list[str], message: str = "", file_types=None, now=None):
+    now = now or datetime.now(timezone.utc)
+    return SimpleNamespace(
+        languages=languages,
+        file_types=file_types or [],
+        additions=10,
+        message=message,
+        committed_at=now - timedelta(days=days_ago),
+    )
+
+
+class TestIncrementalAggregates:
+    """Test folding commit counters without a database."""
+
+    def test_folding_in_parts_matches_folding_at_once(self):
+        """Incremental folds should produce the same counters as a full fold."""
+        now = datetime.now(timezone.utc)
+        rows = [
+            _commit_row(1, ["Python"], "Add FastAPI endpoint", ["py"], now),
+            _commit_row(40, ["TypeScript"], "React component", ["tsx"], now),
+            _commit_row(400, ["Ruby"], "rails migration", ["rb"], now),
+            _commit_row(3, ["Python", "SQL"], "schema change", ["sql"], now),
+        ]
+
+        full = empty_commit_aggregates()
+        fold_commits(full, rows)
+
+        incremental = empty_commit_aggregates()
+        fold_commits(incremental, rows[:2])
+        incremental = copy.deepcopy(incremental)
+        fold_commits(incremental, rows[2:])
+
+        assert incremental == full
+        assert full["commits"] == 4
+        assert full["languages"]["Python"] == {"commits": 2, "lines": 20, "aged": 0}
+        assert full["frameworks"]["FastAPI"] == 1
+        assert full["domains"]["Database"] == 3
+
+    def test_compaction_preserves_profile(self):
+        """Collapsing day buckets older than a year should not change the profile."""
+        now = datetime.now(timezone.utc)
+        aggregates = empty_commit_aggregates()
+        fold_commits(aggregates, [
+            _commit_row(500, ["Ruby"], now=now),
+            _commit_row(5, ["Python"], now=now),
+            _commit_row(250, ["Go"], now=now),
+        ])
+        service = ProfileSyncService()
+        before = service._calculate_growth_trajectory(aggregates, now)
+        languages_before = service._aggregate_languages(aggregates, now)
+
+        compact_commit_aggregates(aggregates, now)
+
+        assert "Ruby" not in aggregates["language_days"]
+        assert aggregates["languages"]["Ruby"]["aged"] == 1
+        assert service._calculate_growth_trajectory(aggregates, now) == before
+        assert service._aggregate_languages(aggregates, now) == languages_before
+        assert before["skills_acquired_6m"] == ["Python"]
+        assert before["skills_declining"] == ["Ruby"]
+
+    def test_language_trend_from_day_buckets(self):
+        """Should mark languages with only old commits as declining."""
+        now = datetime.now(timezone.utc)
+        aggregates = empty_commit_aggregates()
+        fold_commits(aggregates, [_commit_row(i, ["Python"], now=now) for i in range(5)])
+        fold_commits(aggregates, [_commit_row(180 + i, ["Ruby"], now=now) for i in range(5)])
+
+        languages = ProfileSyncService()._aggregate_languages(aggregates, now)
+        trends = {lang["name"]: lang["trend"] for lang in languages}
+
+        assert trends == {"Python": "growing", "Ruby": "declining"}
+
+    def test_work_patterns_from_sql_stats(self):
+        """Should derive PR size and collaboration style from aggregate stats."""
+        aggregates = empty_commit_aggregates()
+        stats = PullRequestStats(count=4, sized_count=2, size_total=1200)
+
+        patterns = ProfileSyncService()._analyze_work_patterns(aggregates, stats, review_count=9)
+
+        assert patterns["average_pr_size"] == 600
+        assert patterns["preferred_complexity"] == "complex"
+        assert patterns["collaboration_style"] == "collaborative"
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def commit(self):
+        pass
+
+
+class TestBatchProfileSync:
+    """Test the sharded, bounded-concurrency batch runner."""
+
+    def test_shards_partition_developers(self):
+        """Shards should cover every developer exactly once."""
+        ids = [f"dev-{i:02d}" for i in range(10)]
+        shards = [shard_developer_ids(ids, i, 3) for i in range(3)]
+
+        assert sorted(sum(shards, [])) == ids
+        assert shard_developer_ids(list(reversed(ids)), 0, 3) == shards[0]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_timings(self):
+        """Should cap concurrent syncs, record timings and isolate failures."""
+        service = ProfileSyncService()
+        running = 0
+        peak = 0
+
+        async def fake_sync(developer_id, db, full):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if developer_id == "dev-3":
+                raise RuntimeError("boom")
+            return None, ProfileSyncTiming(developer_id, 0.01, "incremental", 5)
+
+        service._sync = fake_sync
+        beats = []
+
+        report = await service.sync_profiles(
+            [f"dev-{i}" for i in range(10)],
+            concurrency=3,
+            session_factory=_FakeSession,
+            heartbeat=beats.append,
+        )
+
+        assert peak == 3
+        assert report.synced == 9
+        assert report.failed == 1
+        assert len(report.timings) == 10
+        assert len(beats) == 10
+        assert report.to_dict()["slowest"]
+
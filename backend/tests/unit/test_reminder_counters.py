@@ -0,0 +1,216 @@
+"""Tests for materialized reminder dashboard counters."""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.reminder import Reminder, ReminderInstance, ReminderStatsCounter
+from aexy.services.reminder_service import (
+    WORKSPACE_SCOPE,
+    ReminderService,
+    _month_key,
+    _week_key,
+)
+from tests.fakes.db import FakeSession, compile_pg
+
+
+def make_reminder(**extra):
+    return SimpleNamespace(
+        workspace_id="ws-1",
+        category="security",
+        priority="critical",
+        domain=extra.get("domain"),
+    )
+
+
+def make_instance(status, owner_id="dev-1", **extra):
+    return SimpleNamespace(
+        status=status,
+        assigned_owner_id=owner_id,
+        completed_at=extra.get("completed_at"),
+        due_date=extra.get("due_date"),
+    )
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Collect the counter deltas a service would write."""
+    counts = Counter()
+
+    async def capture(self, deltas, replace=False):
+        counts.update(deltas)
+
+    monkeypatch.setattr(ReminderService, "_upsert_counters", capture)
+    return counts
+
+
+class TestRecordTransitions:
+    """Test counter deltas for instance status changes."""
+
+    @pytest.mark.asyncio
+    async def test_new_instance_counts_in_workspace_and_owner(self, captured):
+        """A created instance should count once per scope and dimension."""
+        await ReminderService(FakeSession()).record_transitions(
+            [(make_reminder(domain="soc2"), make_instance("pending"), None)]
+        )
+
+        for scope in (WORKSPACE_SCOPE, "dev-1"):
+            assert captured[("ws-1", scope, "status:pending")] == 1
+            assert captured[("ws-1", scope, "category:security:pending")] == 1
+            assert captured[("ws-1", scope, "priority:critical:pending")] == 1
+            assert captured[("ws-1", scope, "domain:soc2:pending")] == 1
+
+    @pytest.mark.asyncio
+    async def test_completion_moves_status_and_buckets_period(self, captured):
+        """Completing should move the count and add week/month completions."""
+        completed_at = datetime(2026, 10, 14, 15, tzinfo=timezone.utc)
+        instance = make_instance("completed", completed_at=completed_at)
+
+        await ReminderService(FakeSession()).record_transitions(
+            [(make_reminder(), instance, "overdue")]
+        )
+
+        assert captured[("ws-1", WORKSPACE_SCOPE, "status:overdue")] == -1
+        assert captured[("ws-1", WORKSPACE_SCOPE, "status:completed")] == 1
+        assert captured[("ws-1", "dev-1", "completed:week:2026-10-12")] == 1
+        assert captured[("ws-1", "dev-1", "completed:month:2026-10")] == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_is_ignored(self, captured):
+        """Non-transitions should not touch any counter."""
+        await ReminderService(FakeSession()).record_transitions(
+            [(make_reminder(), make_instance("notified"), "notified")]
+        )
+
+        assert not captured
+
+    @pytest.mark.asyncio
+    async def test_upsert_adds_to_existing_rows(self):
+        """Deltas should be applied atomically with ON CONFLICT."""
+        session = FakeSession(reminder_stats_counters=[
+            {"id": "c1", "workspace_id": "ws-1", "scope": WORKSPACE_SCOPE, "key": "status:pending", "value": 3},
+        ])
+
+        await ReminderService(session)._upsert_counters(
+            Counter({
+                ("ws-1", WORKSPACE_SCOPE, "status:pending"): 2,
+                ("ws-1", "dev-1", "status:pending"): 0,
+                ("ws-1", "dev-1", "status:overdue"): 1,
+            })
+        )
+
+        rows = session.rows(ReminderStatsCounter)
+        assert [(r["scope"], r["key"], r["value"]) for r in rows] == [
+            (WORKSPACE_SCOPE, "status:pending", 5),
+            ("dev-1", "status:overdue", 1),
+        ]
+        sql = compile_pg(session.queries(ReminderStatsCounter)[0])
+        assert "reminder_stats_counters.value + excluded.value" in sql
+
+
+class TestReconcileCounters:
+    """Test rebuilding counters from instances."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_in_place_under_row_locks(self):
+        """Counts are overwritten, zeroed rows deleted and past buckets kept."""
+        now = datetime.now(timezone.utc)
+        old_month = "completed:month:2020-01"
+        session = FakeSession(reminder_stats_counters=[
+            {"id": "c1", "workspace_id": "ws-1", "scope": WORKSPACE_SCOPE, "key": "status:pending", "value": 9},
+            {"id": "c2", "workspace_id": "ws-1", "scope": "dev-2", "key": "status:pending", "value": 4},
+            {"id": "c3", "workspace_id": "ws-1", "scope": WORKSPACE_SCOPE, "key": old_month, "value": 7},
+        ])
+
+        def counters(statement):
+            return [
+                (row["id"], row["scope"], row["key"])
+                for row in session.tables["reminder_stats_counters"]
+                if not row["key"].startswith("completed:")
+            ]
+
+        def instances(statement):
+            if len(statement.selected_columns) == 6:
+                return [("dev-1", "pending", "security", "high", None, 2)]
+            return [("dev-1", 1, 1)]
+
+        session.on(ReminderStatsCounter, counters).on(ReminderInstance, instances)
+
+        written = await ReminderService(session).reconcile_counters("ws-1")
+
+        values = {(r["scope"], r["key"]): r["value"] for r in session.rows(ReminderStatsCounter)}
+        assert values[(WORKSPACE_SCOPE, "status:pending")] == 2
+        assert values[("dev-1", "category:security:pending")] == 2
+        assert values[("dev-1", _week_key(now))] == 1 and values[(WORKSPACE_SCOPE, _month_key(now))] == 1
+        assert ("dev-2", "status:pending") not in values
+        assert values[(WORKSPACE_SCOPE, old_month)] == 7
+        assert written == len(values) - 1
+        # The counters are locked before the instances are counted
+        lock = session.statements[0]
+        assert session.queries(ReminderStatsCounter)[0] is lock
+        assert "FOR UPDATE" in compile_pg(lock)
+
+
+class TestDashboardReads:
+    """Test dashboards served from the counters."""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_stats_from_counter_rows(self):
+        """Stats should be assembled from one counter query."""
+        now = datetime.now(timezone.utc)
+        counters = [
+            ("status:pending", 3),
+            ("status:acknowledged", 2),
+            ("status:overdue", 4),
+            ("status:escalated", 1),
+            ("category:security:pending", 3),
+            ("category:security:overdue", 4),
+            ("category:hr:completed", 5),
+            ("domain:soc2:escalated", 1),
+            ("priority:critical:overdue", 2),
+            ("priority:critical:escalated", 1),
+            ("priority:high:overdue", 2),
+            (_week_key(now), 5),
+            (_month_key(now), 9),
+        ]
+        session = (
+            FakeSession()
+            .on(Reminder, [("active", 4), ("archived", 1)])
+            .on(ReminderStatsCounter, counters)
+        )
+
+        stats = await ReminderService(session).get_dashboard_stats("ws-1")
+
+        assert stats.total_reminders == 5 and stats.active_reminders == 4
+        assert stats.total_pending_instances == 5
+        assert stats.total_overdue_instances == 5
+        assert stats.completed_this_week == 5 and stats.completed_this_month == 9
+        assert stats.critical_overdue == 3 and stats.high_overdue == 2
+        assert [(c.category, c.total, c.pending, c.completed, c.overdue) for c in stats.by_category] == [
+            ("hr", 5, 0, 5, 0),
+            ("security", 7, 3, 0, 4),
+        ]
+        assert [(c.category, c.overdue) for c in stats.by_domain] == [("soc2", 1)]
+
+    @pytest.mark.asyncio
+    async def test_my_reminders_partitions_one_query(self):
+        """Open instances should be loaded once and split in memory."""
+        now = datetime.now(timezone.utc)
+        mine_overdue = make_instance("overdue", due_date=now - timedelta(days=2))
+        mine_later = make_instance("pending", due_date=now + timedelta(days=30))
+        team = make_instance("pending", owner_id=None, due_date=now + timedelta(hours=1))
+        session = (
+            FakeSession()
+            .on(ReminderInstance, [mine_overdue, team, mine_later])
+            .on(ReminderStatsCounter, [("status:overdue", 1), ("status:pending", 1)])
+        )
+
+        data = await ReminderService(session).get_my_reminders("ws-1", "dev-1")
+
+        assert data["assigned_to_me"] == [mine_overdue, mine_later]
+        assert data["my_team_reminders"] == [team]
+        assert data["overdue"] == [mine_overdue]
+        assert data["due_today"] == [] and data["due_this_week"] == []
+        assert data["counts"]["open"] == 1 and data["counts"]["overdue"] == 1
@@ -0,0 +1,206 @@
+"""Tests for reminder recurrence arithmetic and bulk instance generation."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from aexy.models.reminder import ReminderFrequency, ReminderStatus
+from aexy.services.reminder_service import (
+    FIXED_PERIODS,
+    MONTH_PERIODS,
+    ReminderService,
+    _add_months,
+    _compiled_cron,
+)
+
+
+def step_forward(frequency: str, start: datetime, now: datetime) -> datetime:
+    """Reference: walk one period at a time until past now."""
+    k = 1
+    while True:
+        if frequency in FIXED_PERIODS:
+            candidate = start + k * FIXED_PERIODS[frequency]
+        else:
+            candidate = _add_months(start, k * MONTH_PERIODS[frequency])
+        if candidate > now:
+            return candidate
+        k += 1
+
+
+@pytest.fixture
+def service():
+    return ReminderService(db=None)
+
+
+class TestNextOccurrence:
+    """Test closed-form next occurrence calculation."""
+
+    @pytest.mark.parametrize("frequency", [*FIXED_PERIODS, *MONTH_PERIODS])
+    def test_matches_stepping(self, service, frequency):
+        """Closed form should agree with period-by-period stepping."""
+        rng = random.Random(frequency)
+        zones = [timezone.utc, ZoneInfo("America/New_York"), ZoneInfo("Asia/Kolkata")]
+        for _ in range(50):
+            start = datetime(2018, 1, 1, 9, tzinfo=rng.choice(zones)) + timedelta(
+                days=rng.randint(0, 1500), hours=rng.randint(0, 23)
+            )
+            now = start + timedelta(days=rng.randint(0, 1500), minutes=rng.randint(0, 1440))
+
+            result = service._calculate_next_occurrence(frequency, start, after=now)
+
+            assert result == step_forward(frequency, start, now)
+            assert result > now
+
+    def test_old_daily_reminder_is_constant_time(self, service):
+        """A decades-old daily reminder should land on the right day."""
+        start = datetime(1990, 3, 1, 9, tzinfo=timezone.utc)
+        now = datetime(2026, 5, 10, 12, tzinfo=timezone.utc)
+
+        result = service._calculate_next_occurrence(
+            ReminderFrequency.DAILY.value, start, after=now
+        )
+
+        assert result == datetime(2026, 5, 11, 9, tzinfo=timezone.utc)
+
+    def test_month_end_is_clamped_not_drifted(self, service):
+        """A reminder on the 31st should stay on month end every month."""
+        start = datetime(2024, 1, 31, 9, tzinfo=timezone.utc)
+        monthly = ReminderFrequency.MONTHLY.value
+
+        assert service._calculate_next_occurrence(
+            monthly, start, after=datetime(2024, 2, 1, tzinfo=timezone.utc)
+        ) == datetime(2024, 2, 29, 9, tzinfo=timezone.utc)
+        assert service._calculate_next_occurrence(
+            monthly, start, after=datetime(2024, 3, 1, tzinfo=timezone.utc)
+        ) == datetime(2024, 3, 31, 9, tzinfo=timezone.utc)
+
+    def test_daily_keeps_local_time_across_dst(self, service):
+        """Daily reminders should stay at the same wall-clock time."""
+        tz = ZoneInfo("Europe/Berlin")
+        start = datetime(2024, 3, 1, 9, tzinfo=tz)
+
+        result = service._calculate_next_occurrence(
+            ReminderFrequency.DAILY.value, start, after=datetime(2024, 4, 2, 12, tzinfo=timezone.utc)
+        )
+
+        assert result == datetime(2024, 4, 3, 9, tzinfo=tz)
+
+    def test_cron_reuses_compiled_expression(self, service):
+        """Repeated cron lookups should parse the expression once."""
+        _compiled_cron.cache_clear()
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        for day in (3, 10):
+            result = service._calculate_next_occurrence(
+                ReminderFrequency.CUSTOM.value,
+                start,
+                cron_expression="0 9 * * 1",
+                after=datetime(2024, 6, day, 12, tzinfo=timezone.utc),
+            )
+            assert result == datetime(2024, 6, day + 7, 9, tzinfo=timezone.utc)
+
+        assert _compiled_cron.cache_info().misses == 1
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class FakeSession:
+    """Session stand-in recording writes."""
+
+    def __init__(self, reminders):
+        self.reminders = reminders
+        self.added = []
+        self.flushes = 0
+        self.updates = []
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.updates.append(params)
+            return None
+        return FakeResult(self.reminders)
+
+    def add_all(self, objects):
+        self.added.append(list(objects))
+
+    async def flush(self):
+        self.flushes += 1
+
+
+def make_reminder(reminder_id: str, frequency: str, next_occurrence: datetime):
+    return SimpleNamespace(
+        id=reminder_id,
+        workspace_id="ws-1",
+        category="security",
+        priority="high",
+        domain=None,
+        frequency=frequency,
+        start_date=datetime(2024, 1, 1, 9, tzinfo=timezone.utc),
+        cron_expression=None,
+        timezone="UTC",
+        next_occurrence=next_occurrence,
+        end_date=None,
+        status=ReminderStatus.ACTIVE.value,
+        assignment_strategy="fixed",
+        default_owner_id="owner-1",
+        default_team_id=None,
+    )
+
+
+class TestMaterializeDueInstances:
+    """Test the bulk instance-generation tick."""
+
+    @pytest.mark.asyncio
+    async def test_one_insert_and_one_update(self, monkeypatch):
+        """All due reminders should be written in one flush and one update."""
+        due = datetime(2024, 6, 3, 9, tzinfo=timezone.utc)
+        reminders = [
+            make_reminder("daily", ReminderFrequency.DAILY.value, due),
+            make_reminder("once", ReminderFrequency.ONCE.value, due),
+        ]
+        session = FakeSession(reminders)
+        monkeypatch.setattr(
+            "aexy.services.reminder_service.set_committed_value",
+            lambda obj, key, value: setattr(obj, key, value),
+        )
+
+        tick = await ReminderService(session).materialize_due_instances(
+            now=datetime(2024, 6, 3, 10, tzinfo=timezone.utc)
+        )
+
+        assert tick.due_count == 2 and len(tick.created) == 2
+        assert len(session.added) == 1 and len(session.added[0]) == 2
+        assert session.flushes == 1
+        assert len(session.updates) == 1
+        assert [i.due_date for _, i in tick.created] == [due, due]
+        assert [i.assigned_owner_id for _, i in tick.created] == ["owner-1", "owner-1"]
+        assert reminders[0].next_occurrence == datetime(2024, 6, 4, 9, tzinfo=timezone.utc)
+        assert reminders[1].status == ReminderStatus.ARCHIVED.value
+        assert tick.total_ms >= tick.write_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_failed_assignment_is_left_due(self, monkeypatch):
+        """A reminder that cannot be assigned should not be advanced."""
+        due = datetime(2024, 6, 3, 9, tzinfo=timezone.utc)
+        reminder = make_reminder("r1", ReminderFrequency.DAILY.value, due)
+        session = FakeSession([reminder])
+        service = ReminderService(session)
+
+        async def broken(reminder):
+            raise RuntimeError("no team")
+
+        monkeypatch.setattr(service, "_resolve_assignment", broken)
+
+        tick = await service.materialize_due_instances()
+
+        assert tick.failed_reminder_ids == ["r1"]
+        assert tick.created == [] and session.updates == []
+        assert reminder.next_occurrence == due
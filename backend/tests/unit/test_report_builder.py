@@ -506,3 +506,90 @@ class TestReportValidation:
 
         is_valid = service._validate_schedule(schedule)
         assert is_valid is False
+
+
+class TestWidgetCaching:
+    """Unit tests for widget result sharing and cache keys."""
+
+    class _FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class _MemoryCache:
+        def __init__(self):
+            self.store = {}
+
+        async def get(self, key):
+            return self.store.get(key)
+
+        async def set(self, key, data, ttl=None):
+            self.store[key] = data
+
+    @pytest.fixture
+    def service(self):
+        service = ReportBuilderService(
+            analytics_service=MagicMock(),
+            widget_cache=self._MemoryCache(),
+            session_factory=self._FakeSession,
+        )
+        service.get_widget_data = AsyncMock(return_value={"value": 1})
+        return service
+
+    @staticmethod
+    def _widget(widget_id, **config):
+        return WidgetConfig(
+            id=widget_id,
+            type="line_chart",
+            title=f"Widget {widget_id}",
+            metric="commits",
+            config=config,
+        )
+
+    def test_cache_key_ignores_presentation_and_key_order(self):
+        from aexy.cache.widget_cache import WidgetCache
+
+        start, end = datetime(2024, 1, 1, 9, 7), datetime(2024, 1, 31, 9, 14)
+        a = WidgetCache.make_key("ws", "line_chart", "commits", {"days": 30, "group_by": "week"}, ["b", "a"], start, end)
+        b = WidgetCache.make_key("ws", "line_chart", "commits", {"group_by": "week", "days": 30}, ["a", "b"], start, end)
+        c = WidgetCache.make_key("other", "line_chart", "commits", {"days": 30, "group_by": "week"}, ["a", "b"], start, end)
+        assert a == b
+        assert a != c
+
+    @pytest.mark.asyncio
+    async def test_identical_widgets_evaluated_once(self, service):
+        import asyncio
+
+        widgets = [self._widget("w1", days=30), self._widget("w2", days=30), self._widget("w3", days=7)]
+        results = await asyncio.gather(
+            *(service._evaluate_widget("ws", w, ["dev-1"], None) for w in widgets)
+        )
+        assert results == [{"value": 1}] * 3
+        assert service.get_widget_data.await_count == 2
+
+        # Later evaluations in the same bucket come from the cache
+        await service._evaluate_widget("ws", self._widget("w4", days=30), ["dev-1"], None)
+        assert service.get_widget_data.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_widget(self, service):
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_widget_data(*args, **kwargs):
+            await release.wait()
+            return {"value": 2}
+
+        service.get_widget_data = AsyncMock(side_effect=slow_widget_data)
+        first = asyncio.create_task(service._evaluate_widget("ws", self._widget("w1"), None, None))
+        second = asyncio.create_task(service._evaluate_widget("ws", self._widget("w2"), None, None))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == {"value": 2}
+        assert first.cancelled()
+        assert service.get_widget_data.await_count == 1
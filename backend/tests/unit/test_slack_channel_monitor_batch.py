@@ -0,0 +1,248 @@
+"""Tests for batched Slack channel monitoring and the workspace reference index."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.developer import Developer
+from aexy.models.sprint import SprintTask
+from aexy.models.tracking import (
+    Blocker,
+    DeveloperStandup,
+    SlackChannelConfig,
+    TrackingSource,
+    WorkLog,
+)
+from aexy.services.slack_channel_monitor import SlackChannelMonitorService
+from aexy.services.slack_message_parser import SlackMessageParser
+from aexy.services.task_reference_parser import TaskReferenceParser
+from aexy.services.workspace_reference_index import (
+    WorkspaceReferenceIndex,
+    WorkspaceReferenceIndexStore,
+    task_key,
+)
+from tests.fakes.db import FakeSession
+
+
+class FakeIndexStore:
+    def __init__(self, index):
+        self.index = index
+        self.calls = []
+
+    async def get(self, workspace_id, db, user_mappings=None):
+        self.calls.append(workspace_id)
+        return self.index
+
+
+def make_integration():
+    return SimpleNamespace(
+        id="int-1",
+        workspace_id="ws-1",
+        organization_id="org-1",
+        user_mappings={"U1": "dev-1", "U2": "dev-2"},
+    )
+
+
+def make_config(**kwargs):
+    defaults = dict(
+        team_id="team-1",
+        auto_parse_standups=True,
+        auto_parse_blockers=True,
+        auto_parse_task_refs=True,
+    )
+    return SimpleNamespace(**{**defaults, **kwargs})
+
+
+def make_index():
+    return WorkspaceReferenceIndex(
+        workspace_id="ws-1",
+        tasks_by_key={
+            "PROJ-12": [("task-new", "sprint-2"), ("task-old", "sprint-1")],
+            "42": [("task-42", "sprint-1")],
+        },
+        developers={"U1": "dev-1", "U2": "dev-2"},
+    )
+
+
+class TestTaskKey:
+    """Test normalising task references."""
+
+    def test_issue_numbers_and_keys(self):
+        assert task_key("#42") == task_key("acme/api#42") == task_key("task 42") == "42"
+        assert task_key(" proj-12 ") == "PROJ-12"
+
+    def test_find_task_prefers_sprint_then_newest(self):
+        index = make_index()
+
+        assert index.find_task("proj-12", "sprint-1") == "task-old"
+        assert index.find_task("PROJ-12", "sprint-9") == "task-new"
+        assert index.find_task("acme/api#42") == "task-42"
+        assert index.find_task("PROJ-99") is None
+        assert index.developer_for("U2") == "dev-2" and index.developer_for(None) is None
+
+
+class TestWorkspaceReferenceIndexStore:
+    """Test building and refreshing cached indexes."""
+
+    @pytest.mark.asyncio
+    async def test_reused_within_interval_and_rebuilt_on_change(self, monkeypatch):
+        """Tasks reload only when the fingerprint changes; mappings reload on change."""
+        clock = [100.0]
+        monkeypatch.setattr(
+            "aexy.services.workspace_reference_index.time.monotonic", lambda: clock[0]
+        )
+        store = WorkspaceReferenceIndexStore(check_interval=5)
+        stamp = datetime(2026, 1, 1)
+        state = {"version": (1, stamp), "tasks": [("t1", "PROJ-1", "s1")]}
+        loads = []
+
+        def sprint_tasks(statement):
+            if len(statement.selected_columns) == 2:
+                loads.append("version")
+                return [state["version"]]
+            loads.append("tasks")
+            return state["tasks"]
+
+        def developers(statement):
+            loads.append("developers")
+            return ["dev-1", "dev-2"]
+
+        session = FakeSession().on(SprintTask, sprint_tasks).on(Developer, developers)
+        mappings = {"U1": "dev-1", "U9": "dev-gone"}
+
+        index = await store.get("ws-1", session, mappings)
+        assert index.find_task("proj-1") == "t1" and index.developers == {"U1": "dev-1"}
+        assert loads == ["version", "tasks", "developers"]
+
+        # Within the interval nothing is checked
+        clock[0] += 1
+        assert await store.get("ws-1", session, mappings) is index
+        assert loads == ["version", "tasks", "developers"]
+
+        # After it, an unchanged fingerprint keeps the index
+        clock[0] += 5
+        assert await store.get("ws-1", session, mappings) is index
+        assert loads[3:] == ["version"]
+
+        # A changed fingerprint reloads the tasks
+        state["version"] = (2, stamp)
+        state["tasks"] = [("t2", "#7", "s1"), ("t1", "PROJ-1", "s1")]
+        clock[0] += 5
+        index = await store.get("ws-1", session, mappings)
+        assert index.find_task("#7") == "t2"
+        assert loads[4:] == ["version", "tasks", "developers"]
+
+        # New mappings reload only the developers
+        index = await store.get("ws-1", session, {"U1": "dev-1", "U2": "dev-2"})
+        assert index.developers == {"U1": "dev-1", "U2": "dev-2"}
+        assert loads[7:] == ["developers"]
+
+
+class TestProcessChannelMessages:
+    """Test processing a batch of monitored channel messages."""
+
+    @pytest.mark.asyncio
+    async def test_batch_resolves_once_and_commits_once(self, monkeypatch):
+        """Team context and the reference index are resolved once for the batch."""
+        existing = DeveloperStandup(
+            developer_id="dev-2", source=TrackingSource.SLACK_COMMAND.value
+        )
+        session = (
+            FakeSession()
+            .on(SlackChannelConfig, [make_config()])
+            .on(DeveloperStandup, [existing])
+            .on(Blocker, [("dev-1", "I'm blocked by the staging deploy again since Monday")])
+        )
+        store = FakeIndexStore(make_index())
+        service = SlackChannelMonitorService(index_store=store)
+        context_calls = []
+
+        async def context(developer_id, team_id, db):
+            context_calls.append(developer_id)
+            return "team-1", "ws-1", "sprint-1"
+
+        monkeypatch.setattr(service, "get_developer_team_and_sprint", context)
+        messages = [
+            {"ts": "1.1", "user": "U1", "text": "Pushed the fix for PROJ-12, should be done today"},
+            {"ts": "1.2", "user": "U2", "text": "Yesterday: PROJ-12 | Today: #42 and reviews"},
+            {"ts": "1.3", "user": "U1", "text": "I'm blocked by the staging deploy again"},
+            {"ts": "1.4", "user": "U1", "bot_id": "B1", "text": "PROJ-12 deployed by the bot"},
+            {"ts": "1.5", "user": "U9", "text": "PROJ-12 from an unmapped user"},
+        ]
+
+        results = await service.process_channel_messages(
+            "C1", messages, make_integration(), session
+        )
+
+        assert [r["processed"] for r in results] == [True, True, True, False, False]
+        assert context_calls == ["dev-1"]
+        assert session.commits == 1
+        assert store.calls == ["ws-1"]
+
+        # Command standups are not overwritten
+        assert results[1]["standup_created"] is False
+        assert session.rows(DeveloperStandup) == []
+
+        # Duplicate of an active blocker is skipped
+        assert results[2]["blockers_created"] == 0
+        assert session.rows(Blocker) == []
+
+        work_logs = session.rows(WorkLog)
+        assert [(w["slack_message_ts"], w["task_id"], w["external_task_ref"]) for w in work_logs] == [
+            ("1.1", "task-old", None),
+            ("1.2", "task-42", None),
+            ("1.2", "task-old", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_message_creates_standup(self, monkeypatch):
+        session = FakeSession().on(SlackChannelConfig, [make_config(auto_parse_task_refs=False)])
+        service = SlackChannelMonitorService(index_store=FakeIndexStore(make_index()))
+
+        async def context(developer_id, team_id, db):
+            return "team-1", "ws-1", None
+
+        monkeypatch.setattr(service, "get_developer_team_and_sprint", context)
+
+        result = await service.process_channel_message(
+            "C1",
+            {"ts": "2.1", "user": "U1", "text": "Yesterday: reviews\nToday: PROJ-77\nBlockers: none"},
+            make_integration(),
+            session,
+        )
+
+        assert result["processed"] and result["standup_created"]
+        standups = session.rows(DeveloperStandup)
+        assert [(s["developer_id"], s["slack_message_ts"]) for s in standups] == [("dev-1", "2.1")]
+        assert session.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_channel(self):
+        session = FakeSession()
+        service = SlackChannelMonitorService(index_store=FakeIndexStore(make_index()))
+
+        results = await service.process_channel_messages(
+            "C1", [{"user": "U1", "text": "PROJ-12 is done now"}] * 2, make_integration(), session
+        )
+
+        assert all(r["errors"] == ["Channel not configured for monitoring"] for r in results)
+
+
+class TestParserFastPaths:
+    """Test that prefilters don't change parser results."""
+
+    def test_messages_without_candidates(self):
+        parser = SlackMessageParser()
+        parsed = parser.parse_message("thanks, see you at lunch")
+
+        assert parsed.task_references == [] and parsed.blocker_mentions == []
+        assert TaskReferenceParser().parse("thanks, see you at lunch") == []
+
+    def test_references_still_found(self):
+        parser = SlackMessageParser()
+        refs = parser.extract_task_references("fixed acme/api#12 and PROJ-3, see task 9")
+
+        assert {r.ref_string for r in refs} >= {"acme/api#12", "PROJ-3"}
+        assert parser._clean_slack_text("<@U1|ann> see `x`") != "<@U1|ann> see `x`"
+        assert parser._clean_slack_text("plain text") == "plain text"
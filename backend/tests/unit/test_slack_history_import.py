@@ -0,0 +1,234 @@
+"""Tests for concurrent, batched Slack history imports."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from aexy.models.developer import Developer
+from aexy.models.tracking import Blocker, DeveloperStandup, WorkLog
+from aexy.services import slack_history_sync
+from aexy.services.slack_history_sync import SlackHistorySyncService, SlackRateLimiter
+from tests.fakes.db import FakeSession, compile_pg
+
+
+class FakeUserCache:
+    def __init__(self, cached=None):
+        self.cached = cached or {}
+        self.stored = {}
+
+    async def get_many(self, team_id, user_ids):
+        return {u: self.cached[u] for u in user_ids if u in self.cached}
+
+    async def set_many(self, team_id, users, ttl):
+        self.stored.update(users)
+
+
+def make_integration(mappings=None):
+    return SimpleNamespace(
+        id="int-1",
+        team_id="T1",
+        bot_token="xoxb",
+        workspace_id="ws-1",
+        organization_id="org-1",
+        user_mappings=mappings or {},
+    )
+
+
+def make_service(**kwargs):
+    return SlackHistorySyncService(
+        rate_limiter=SlackRateLimiter({}), user_cache=kwargs.pop("user_cache", FakeUserCache()), **kwargs
+    )
+
+
+class TestImportPage:
+    """Test importing one page of channel history."""
+
+    @pytest.mark.asyncio
+    async def test_skips_known_messages_and_inserts_the_rest(self):
+        """Known, bot and unmapped messages are skipped; the rest are inserted in bulk."""
+        messages = [
+            {"ts": "1.1", "user": "U1", "text": "Working on PROJ-12 and PROJ-13"},
+            {"ts": "1.2", "user": "U1", "text": "Already imported PROJ-1"},
+            {"ts": "1.3", "user": "U2", "text": "I'm blocked by the staging deploy"},
+            {"ts": "1.4", "user": "U1", "bot_id": "B1", "text": "PROJ-2"},
+            {"ts": "1.5", "user": "U9", "text": "PROJ-3"},
+        ]
+        session = FakeSession().on(DeveloperStandup, ["1.2"])
+        service = make_service()
+
+        stats = await service._import_page(
+            make_integration({"U1": "dev-1", "U2": "dev-2"}), "C1", messages, session, "team-1", None
+        )
+
+        assert stats["skipped"] == 3
+        assert stats["work_logs_imported"] == 2
+        assert stats["blockers_imported"] >= 1
+        work_logs = session.rows(WorkLog)
+        assert [(w["slack_message_ts"], w["external_task_ref"]) for w in work_logs] == [
+            ("1.1", "PROJ-12"),
+            ("1.1", "PROJ-13"),
+        ]
+        blockers = session.rows(Blocker)
+        assert {(b["slack_message_ts"], b["developer_id"]) for b in blockers} == {("1.3", "dev-2")}
+        assert session.rows(DeveloperStandup) == []
+        # Imported messages are found with one query across the three tables
+        assert len(session.queries(DeveloperStandup)) == 1
+        assert compile_pg(session.queries(DeveloperStandup)[0]).count("UNION") == 2
+
+    @pytest.mark.asyncio
+    async def test_page_without_candidates_runs_no_queries(self):
+        session = FakeSession()
+
+        stats = await make_service()._import_page(
+            make_integration(), "C1", [{"ts": "1.1", "user": "U1", "text": "hi"}], session, None, None
+        )
+
+        assert stats["skipped"] == 1 and session.statements == []
+
+
+class TestGetUsersInfo:
+    """Test bulk user profile resolution."""
+
+    @pytest.mark.asyncio
+    async def test_cache_then_concurrent_fetch_then_memory(self, monkeypatch):
+        """Cached users aren't fetched; fetched ones are cached; repeats are free."""
+        cache = FakeUserCache({"U1": {"id": "U1", "profile": {"email": "a@x.io"}}})
+        service = make_service(user_cache=cache)
+        in_flight = 0
+        peak = 0
+        fetched = []
+
+        async def call(client, integration, http_method, method, **kwargs):
+            nonlocal in_flight, peak
+            user_id = kwargs["params"]["user"]
+            fetched.append(user_id)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if user_id == "U3":
+                return {"ok": False, "error": "user_not_found"}
+            return {"ok": True, "user": {"id": user_id, "profile": {"email": f"{user_id}@x.io"}}}
+
+        monkeypatch.setattr(service, "_call", call)
+        integration = make_integration()
+
+        users = await service.get_users_info(integration, ["U1", "U2", "U3", "U2"])
+        again = await service.get_users_info(integration, ["U1", "U2", "U3"])
+
+        assert sorted(fetched) == ["U2", "U3"] and peak == 2
+        assert sorted(users) == sorted(again) == ["U1", "U2"]
+        assert list(cache.stored) == ["U2"]
+        assert users["U2"]["profile"]["email"] == "U2@x.io"
+
+    @pytest.mark.asyncio
+    async def test_unmapped_authors_mapped_by_email(self):
+        service = make_service()
+        integration = make_integration({"U1": "dev-1"})
+        session = FakeSession().on(Developer, [("b@x.io", "dev-2")])
+        profiles = {
+            "U2": {"profile": {"email": "B@x.io"}},
+            "U3": {"profile": {"email": "c@x.io"}},
+        }
+
+        await service._map_users_by_email(integration, {"U2", "U3", "U4"}, profiles, session)
+
+        assert integration.user_mappings == {"U1": "dev-1", "U2": "dev-2"}
+        assert service._unmatched_users == {"U3", "U4"}
+
+
+class TestImportChannelHistory:
+    """Test paging through a channel."""
+
+    @pytest.mark.asyncio
+    async def test_commits_each_page_and_sums_stats(self, monkeypatch):
+        service = make_service()
+        session = FakeSession()
+
+        async def pages(integration, channel_id, oldest=None, latest=None):
+            yield [{"ts": "2.0", "user": "U1", "text": "x"}]
+            yield [{"ts": "1.0", "subtype": "channel_join"}, {"ts": "0.5", "user": "U1"}]
+
+        async def import_page(integration, channel_id, messages, db, team_id, sprint_id):
+            return {"standups_imported": 0, "work_logs_imported": len(messages),
+                    "blockers_imported": 0, "skipped": 0}
+
+        monkeypatch.setattr(service, "iter_channel_history", pages)
+        monkeypatch.setattr(service, "_import_page", import_page)
+
+        stats = await service.import_channel_history(
+            make_integration({"U1": "dev-1"}), "C1", session
+        )
+
+        assert stats["total_messages"] == 3 and stats["work_logs_imported"] == 3
+        assert session.commits == 2
+
+
+class TestFullImport:
+    """Test importing many channels."""
+
+    @pytest.mark.asyncio
+    async def test_channels_run_concurrently_within_limit(self, monkeypatch):
+        """Channels overlap up to the limit and one failure doesn't stop the rest."""
+        monkeypatch.setattr(
+            slack_history_sync, "get_settings",
+            lambda: SimpleNamespace(slack_import_channel_concurrency=2),
+        )
+        service = make_service()
+        in_flight = 0
+        peak = 0
+        locks = set()
+
+        async def import_channel(integration, channel_id, db, **kwargs):
+            nonlocal in_flight, peak
+            locks.add(id(kwargs["db_lock"]))
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            if channel_id == "C3":
+                raise RuntimeError("channel_not_found")
+            return {"total_messages": 10, "standups_imported": 1, "work_logs_imported": 2,
+                    "blockers_imported": 0, "skipped": 7}
+
+        monkeypatch.setattr(service, "import_channel_history", import_channel)
+
+        stats = await service.full_import(
+            make_integration(), FakeSession(), channel_ids=["C1", "C2", "C3", "C4", "C5"]
+        )
+
+        assert peak == 2 and len(locks) == 1
+        assert stats["channels_processed"] == 4 and stats["total_messages"] == 40
+        assert stats["errors"] == [{"channel": "C3", "error": "channel_not_found"}]
+
+
+class TestRateLimiter:
+    """Test pacing Slack calls."""
+
+    @pytest.mark.asyncio
+    async def test_calls_to_a_method_are_spaced(self):
+        limiter = SlackRateLimiter({3: 1200})  # one call per 50ms
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.wait("conversations.history") for _ in range(3)))
+        await limiter.wait("users.list")  # no tier configured
+
+        assert time.monotonic() - started >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_429_is_retried_after_backoff(self):
+        service = make_service()
+        responses = [
+            SimpleNamespace(status_code=429, headers={"Retry-After": "0"}),
+            SimpleNamespace(status_code=200, headers={}, json=lambda: {"ok": True}),
+        ]
+
+        class Client:
+            async def request(self, *args, **kwargs):
+                return responses.pop(0)
+
+        data = await service._call(Client(), make_integration(), "GET", "users.info")
+
+        assert data == {"ok": True} and responses == []
@@ -0,0 +1,145 @@
+"""Tests for paging through repository commits and reviews during a sync."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aexy.models.activity import CodeReview, Commit
+from aexy.models.collaboration import CollaborationEdgeBucket
+from aexy.services import sync_service
+from aexy.services.github_service import GitHubAPIError
+from aexy.services.sync_service import SyncService
+from tests.fakes.db import FakeSession
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def make_commit(n: int) -> dict:
+    """Commit n; higher numbers are newer, as GitHub lists them first."""
+    date = (START + timedelta(minutes=n)).isoformat().replace("+00:00", "Z")
+    return {
+        "sha": f"{n:040d}",
+        "commit": {"message": f"commit {n}", "committer": {"date": date}},
+        "author": {"id": 1, "login": "alice"},
+    }
+
+
+class FakeGitHub:
+    """Serves `total` commits newest first, 100 per page."""
+
+    def __init__(self, total: int, fail_page: int | None = None):
+        self.commits = [make_commit(n) for n in range(total, 0, -1)]
+        self.fail_page = fail_page
+
+    async def get_commits(self, owner, repo, per_page=100, page=1, since=None):
+        if page == self.fail_page:
+            raise GitHubAPIError("Failed to get commits: 502")
+        return self.commits[(page - 1) * per_page:page * per_page]
+
+    async def get_commit_details(self, owner, repo, sha):
+        return {"stats": {"additions": 1, "deletions": 0}, "files": [{"filename": f"src/{sha[-2:]}.py"}]}
+
+
+class OwnershipRecorder:
+    """Records each ownership update with the commits stored at that point."""
+
+    calls: list[tuple[int, int, int]] = []
+
+    def __init__(self, db):
+        self.db = db
+
+    async def record_commits(self, repository, commits):
+        OwnershipRecorder.calls.append(
+            (len(self.db.rows(Commit)), self.db.commits, len(commits))
+        )
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(sync_service, "CodeOwnershipService", OwnershipRecorder)
+    OwnershipRecorder.calls = []
+    service = SyncService(FakeSession())
+
+    async def resolve(db, commit_data, developer_id):
+        return developer_id, "alice", None
+
+    monkeypatch.setattr(service, "_resolve_developer_for_commit", resolve)
+    return service
+
+
+class TestSyncCommits:
+    """Test _sync_commits_with_session."""
+
+    @pytest.mark.asyncio
+    async def test_ownership_recorded_with_each_page(self, service):
+        """Each page's ownership update is committed together with its commits."""
+        synced, newest = await service._sync_commits_with_session(
+            service.db, FakeGitHub(150), "acme", "api", "dev-1", "repo-1"
+        )
+
+        assert synced == 150 and len(service.db.rows(Commit)) == 150
+        assert newest["sha"] == f"{150:040d}"
+        # (commits stored, transactions committed, updates) at each call
+        assert OwnershipRecorder.calls == [(100, 0, 100), (150, 1, 50)]
+        assert service.db.commits == 2
+
+    @pytest.mark.asyncio
+    async def test_page_failure_returns_no_cursor(self, service):
+        """Stored pages stay, but the cursor only moves after a complete walk."""
+        synced, newest = await service._sync_commits_with_session(
+            service.db, FakeGitHub(250, fail_page=2), "acme", "api", "dev-1", "repo-1"
+        )
+
+        assert synced == 100 and len(service.db.rows(Commit)) == 100
+        assert newest is None
+        assert service.db.commits == 1
+
+
+class FakeReviewGitHub:
+    """Serves `total` PRs, each with one review by another developer."""
+
+    def __init__(self, total: int):
+        self.prs = [{"id": n, "number": n, "user": {"login": "alice"}} for n in range(1, total + 1)]
+
+    async def get_pull_requests(self, owner, repo, state="all", per_page=100, page=1):
+        return self.prs[(page - 1) * per_page:page * per_page]
+
+    async def get_pull_request_reviews(self, owner, repo, number):
+        return [{
+            "id": 1000 + number,
+            "state": "APPROVED",
+            "user": {"login": "bob"},
+            "submitted_at": (START + timedelta(days=number)).isoformat(),
+        }]
+
+
+class TestSyncReviews:
+    """Test _sync_reviews_with_session."""
+
+    @pytest.mark.asyncio
+    async def test_edges_committed_with_each_page(self, service, monkeypatch):
+        """A page's collaboration edges are written before the page is committed."""
+        db = service.db
+
+        async def resolve(db, user_data, developer_id):
+            return f"dev-{user_data['login']}"
+
+        monkeypatch.setattr(service, "_resolve_developer_for_pr", resolve)
+        snapshots = []
+        commit = db.commit
+
+        async def recording_commit():
+            edges = db.rows(CollaborationEdgeBucket)
+            snapshots.append((len(db.rows(CodeReview)), sum(e["review_count"] for e in edges)))
+            await commit()
+
+        monkeypatch.setattr(db, "commit", recording_commit)
+
+        synced = await service._sync_reviews_with_session(
+            db, FakeReviewGitHub(150), "acme", "api", "dev-1", "repo-1"
+        )
+
+        assert synced == 150
+        # (reviews stored, reviews counted in edges) at each commit
+        assert snapshots[0] == (100, 100)
+        assert snapshots[-1] == (150, 150)
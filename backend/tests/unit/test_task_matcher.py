@@ -0,0 +1,212 @@
+"""Tests for two-stage task matching."""
+
+import json
+from typing import Any
+
+import pytest
+
+from aexy.llm.base import MatchScore, TaskSignals
+from aexy.llm.gateway import LLMGateway
+from aexy.services.candidate_retrieval import SkillIndex, normalize_skill
+from aexy.services.task_matcher import TaskMatcher, TaskMatchRequest
+
+
+def make_developer(dev_id: str, languages: dict[str, float], **extra: Any) -> dict[str, Any]:
+    return {
+        "id": dev_id,
+        "name": f"Dev {dev_id}",
+        "skill_fingerprint": {
+            "languages": [
+                {"name": name, "proficiency_score": score, "trend": extra.get("trend", "stable")}
+                for name, score in languages.items()
+            ],
+            "frameworks": extra.get("frameworks", []),
+            "domains": extra.get("domains", []),
+        },
+        "growth_trajectory": extra.get("growth_trajectory", {}),
+    }
+
+
+class RecordingGateway:
+    """Gateway stand-in that counts LLM calls."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.score_match_calls = 0
+        self.score_matches_calls: list[list[str]] = []
+
+    async def extract_task_signals(self, task_json: str) -> TaskSignals:
+        return TaskSignals(required_skills=["Python"], preferred_skills=["FastAPI"], domain="backend")
+
+    async def score_match(self, task_signals, skills):
+        self.score_match_calls += 1
+        raise AssertionError("per-developer scoring should not be used")
+
+    async def score_matches(self, task_signals, developers_skills):
+        ids = [s["developer_id"] for s in developers_skills]
+        self.score_matches_calls.append(ids)
+        if self.fail:
+            raise RuntimeError("provider down")
+
+        # Score only the first candidate, to check the fallback for the rest
+        return [MatchScore(
+            developer_id=ids[0],
+            overall_score=90,
+            skill_match=90,
+            experience_match=85,
+            growth_opportunity=40,
+        )]
+
+
+class TestSkillIndex:
+    """Tests for local candidate retrieval."""
+
+    def test_normalize_skill(self):
+        """Spelling variants should map to the same term."""
+        assert normalize_skill("Node.js") == normalize_skill("node js") == "nodejs"
+        assert normalize_skill("C++") == "c++"
+
+    def test_scores_weight_required_skills_and_proficiency(self):
+        """Developers covering required skills with higher proficiency rank first."""
+        developers = [
+            make_developer("go", {"Go": 95}),
+            make_developer("py-junior", {"Python": 40}),
+            make_developer("py-senior", {"Python": 90}, frameworks=[
+                {"name": "FastAPI", "category": "web", "proficiency_score": 80},
+            ]),
+        ]
+        signals = TaskSignals(required_skills=["python"], preferred_skills=["fastapi"])
+
+        top = SkillIndex(developers).top_k(signals, 2)
+
+        assert [dev["id"] for dev, _ in top] == ["py-senior", "py-junior"]
+        assert top[0][1] > top[1][1] > 0
+
+    def test_recent_and_growing_skills_score_higher(self):
+        """Trend and recently acquired skills should boost the score."""
+        developers = [
+            make_developer("declining", {"Rust": 60}, trend="declining"),
+            make_developer("growing", {"Rust": 60}, trend="growing"),
+            make_developer("learning", {}, growth_trajectory={"skills_acquired_6m": ["Rust"]}),
+        ]
+
+        scores = SkillIndex(developers).scores(TaskSignals(required_skills=["Rust"]))
+
+        assert scores[1] > scores[0]
+        assert scores[2] > 0
+
+    def test_task_without_signals_scores_zero(self):
+        """An empty task should not favour anyone."""
+        index = SkillIndex([make_developer("a", {"Python": 90})])
+
+        assert index.scores(TaskSignals()) == [0.0]
+
+
+class TestTaskMatcher:
+    """Tests for the two-stage matcher."""
+
+    @pytest.mark.asyncio
+    async def test_only_shortlist_goes_to_llm_in_one_call(self):
+        """The LLM should see only the top-k developers, in a single call."""
+        developers = [make_developer(str(i), {"Python": i}) for i in range(1, 81)]
+        gateway = RecordingGateway()
+        matcher = TaskMatcher(gateway, shortlist_size=5)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        assert gateway.score_match_calls == 0
+        assert gateway.score_matches_calls == [["80", "79", "78", "77", "76"]]
+        assert [c.developer_id for c in result.candidates][:1] == ["80"]
+        assert [c.rank for c in result.candidates] == [1, 2, 3, 4, 5]
+        # Candidates the LLM skipped keep their skill score
+        assert result.candidates[1].match_score.reasoning == "Scored from skill profile"
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_falls_back_to_skill_scores(self):
+        """A failed multi-candidate call should still rank the shortlist."""
+        developers = [make_developer("a", {"Python": 50}), make_developer("b", {"Python": 90})]
+        matcher = TaskMatcher(RecordingGateway(fail=True), shortlist_size=10)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        assert [c.developer_id for c in result.candidates] == ["b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_llm_scored_candidates_rank_before_fallbacks(self):
+        """Skill scores shouldn't outrank a low LLM score; they're on another scale."""
+        developers = [make_developer("a", {"Python": 95}), make_developer("b", {"Python": 90})]
+        gateway = RecordingGateway()
+
+        async def score_matches(task_signals, developers_skills):
+            return [MatchScore(
+                developer_id="b", overall_score=5, skill_match=5,
+                experience_match=5, growth_opportunity=0,
+            )]
+
+        gateway.score_matches = score_matches
+        matcher = TaskMatcher(gateway, shortlist_size=10)
+
+        result = await matcher.match_task(
+            TaskMatchRequest(title="API", description="Build an API"), developers
+        )
+
+        assert [(c.developer_id, c.rank) for c in result.candidates] == [("b", 1), ("a", 2)]
+        assert result.candidates[1].match_score.overall_score > 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_match_makes_one_scoring_call_per_task(self):
+        """Bulk matching should cost one scoring call per task."""
+        developers = [make_developer(str(i), {"Python": i}) for i in range(1, 81)]
+        gateway = RecordingGateway()
+        tasks = [TaskMatchRequest(title=f"Task {i}", description="") for i in range(20)]
+
+        results = await TaskMatcher(gateway, shortlist_size=8).bulk_match(tasks, developers)
+
+        assert len(results) == 20
+        assert len(gateway.score_matches_calls) == 20
+        assert all(len(ids) == 8 for ids in gateway.score_matches_calls)
+
+
+class TestGatewayScoreMatches:
+    """Tests for multi-candidate scoring in the gateway."""
+
+    @pytest.mark.asyncio
+    async def test_parses_scores_in_candidate_order(self, monkeypatch):
+        """Scores should come back in the order candidates were given."""
+        response = {
+            "scores": [
+                {"developer_id": "b", "overall_score": 70, "skill_match": 70,
+                 "experience_match": 60, "growth_opportunity": 50},
+                {"developer_id": "a", "overall_score": 80, "skill_match": 85,
+                 "experience_match": 75, "growth_opportunity": 30},
+                {"developer_id": "c", "overall_score": "bad"},
+            ]
+        }
+        prompts: list[str] = []
+
+        class Provider:
+            provider_name = "mock"
+
+            async def _call_api(self, system_prompt, user_prompt):
+                prompts.append(user_prompt)
+                return f"```json\n{json.dumps(response)}\n```", 100, 60, 40
+
+        async def allow(*args, **kwargs):
+            return None
+
+        gateway = LLMGateway(Provider())
+        monkeypatch.setattr(gateway, "_check_rate_limit", allow)
+        monkeypatch.setattr(gateway, "_record_rate_limit_usage", allow)
+
+        scores = await gateway.score_matches(
+            TaskSignals(required_skills=["Python"]),
+            [{"developer_id": "a"}, {"developer_id": "b"}, {"developer_id": "c"}],
+        )
+
+        assert [s.developer_id for s in scores] == ["a", "b"]
+        assert len(prompts) == 1
+        assert "Developer a" in prompts[0] and "Developer c" in prompts[0]
@@ -19,6 +19,10 @@ import * as faceapi from "face-api.js";
 import { MAX_VIOLATION_COUNT } from "@/constants";
 import { useChunkedRecording } from "@/hooks/useChunkedRecording";
 
+// Buffered proctoring events are sent when this many are queued, or on this interval
+const PROCTORING_BATCH_SIZE = 20;
+const PROCTORING_FLUSH_INTERVAL_MS = 5000;
+
 // Types
 interface AssessmentInfo {
   assessment_id: string;
@@ -365,24 +369,83 @@ export default function AssessmentTakePage() {
     }
   };
 
-  // Log proctoring event
-  const logProctoringEvent = useCallback(
-    async (eventType: string, data?: any) => {
-      if (!assessmentInfo?.proctoring_enabled) return;
+  // Proctoring events are buffered and sent in batches
+  const proctoringQueueRef = useRef<{ event_type: string; data?: any; timestamp: string }[]>([]);
+
+  const proctoringFlushRef = useRef<Promise<void> | null>(null);
+
+  const sendProctoringEvents = useCallback(async () => {
+    // keepalive requests have a small body limit, so send one batch at a time
+    while (proctoringQueueRef.current.length > 0) {
+      const events = proctoringQueueRef.current.splice(0, PROCTORING_BATCH_SIZE);
 
+      let status: number | null = null;
       try {
-        await fetch(`${API_BASE}/take/${apiToken}/proctoring/event`, {
+        const response = await fetch(`${API_BASE}/take/${apiToken}/proctoring/events`, {
           method: "POST",
           headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ event_type: eventType, data }),
+          body: JSON.stringify({ events }),
+          keepalive: true,
         });
+        if (response.ok) continue;
+        status = response.status;
       } catch (e) {
-        console.warn("Failed to log proctoring event");
+        // Network error; requeued below
+      }
+
+      if (status === null || status === 429 || status >= 500) {
+        // Transient failure: keep the events, in order, for the next flush
+        proctoringQueueRef.current = [...events, ...proctoringQueueRef.current];
+        console.warn("Failed to log proctoring events; will retry");
+        return;
+      }
+      // Other 4xx responses won't succeed on retry (e.g. the attempt is over)
+      console.warn(`Dropped ${events.length} proctoring events: HTTP ${status}`);
+    }
+  }, [apiToken]);
+
+  // Flushes run one after another, so awaiting a flush also waits for any
+  // batch another flush already has in flight
+  const flushProctoringEvents = useCallback(() => {
+    const flush = (proctoringFlushRef.current ?? Promise.resolve()).then(sendProctoringEvents);
+    proctoringFlushRef.current = flush;
+    flush.finally(() => {
+      if (proctoringFlushRef.current === flush) proctoringFlushRef.current = null;
+    });
+    return flush;
+  }, [sendProctoringEvents]);
+
+  // Log proctoring event
+  const logProctoringEvent = useCallback(
+    (eventType: string, data?: any) => {
+      if (!assessmentInfo?.proctoring_enabled) return;
+
+      proctoringQueueRef.current.push({
+        event_type: eventType,
+        data,
+        timestamp: new Date().toISOString(),
+      });
+      if (proctoringQueueRef.current.length >= PROCTORING_BATCH_SIZE) {
+        flushProctoringEvents();
       }
     },
-    [apiToken, assessmentInfo?.proctoring_enabled]
+    [assessmentInfo?.proctoring_enabled, flushProctoringEvents]
   );
 
+  // Send buffered proctoring events periodically and when the page is left
+  useEffect(() => {
+    const interval = setInterval(flushProctoringEvents, PROCTORING_FLUSH_INTERVAL_MS);
+    window.addEventListener("beforeunload", flushProctoringEvents);
+    window.addEventListener("pagehide", flushProctoringEvents);
+
+    return () => {
+      clearInterval(interval);
+      window.removeEventListener("beforeunload", flushProctoringEvents);
+      window.removeEventListener("pagehide", flushProctoringEvents);
+      flushProctoringEvents();
+    };
+  }, [flushProctoringEvents]);
+
   // Complete handler ref for auto-submit
   const completeHandlerRef = useRef<(() => Promise<void>) | null>(null);
 
@@ -578,6 +641,9 @@ export default function AssessmentTakePage() {
         console.log("All recordings uploaded successfully");
       }
 
+      // Make sure buffered proctoring events count towards the summary
+      await flushProctoringEvents();
+
       const response = await fetch(`${API_BASE}/take/${apiToken}/complete`, {
         method: "POST",
       });
@@ -621,7 +687,7 @@ export default function AssessmentTakePage() {
       setIsSubmitting(false);
       // Keep isSubmittingRef true to prevent any further attempts
     }
-  }, [answers, apiToken, webcamStream, screenStream, faceDetectionInterval, webcamRecording, screenRecording]);
+  }, [answers, apiToken, webcamStream, screenStream, faceDetectionInterval, webcamRecording, screenRecording, flushProctoringEvents]);
 
   // Store complete handler in ref
   useEffect(() => {
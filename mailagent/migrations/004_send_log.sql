@@ -0,0 +1,20 @@
+-- Send Log Migration
+-- Records every message sent through SendService. Outbound sends have no
+-- inbox, so they are not stored in mailagent_messages.
+
+CREATE TABLE IF NOT EXISTS mailagent_send_log (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    provider_id UUID REFERENCES mailagent_providers(id) ON DELETE SET NULL,
+    domain_id UUID REFERENCES mailagent_domains(id) ON DELETE SET NULL,
+    message_id VARCHAR(500),
+    from_address VARCHAR(255) NOT NULL,
+    to_addresses JSONB NOT NULL DEFAULT '[]',
+    subject TEXT,
+    status VARCHAR(20) NOT NULL DEFAULT 'sent',
+    provider_message_id VARCHAR(500),
+    sent_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_send_log_provider ON mailagent_send_log(provider_id, sent_at DESC);
+CREATE INDEX IF NOT EXISTS idx_send_log_domain ON mailagent_send_log(domain_id, sent_at DESC);
@@ -0,0 +1,128 @@
+"""Benchmark SES sending against a local SES stand-in.
+
+Starts an HTTP server that answers SendRawEmail (SES v1) and SendBulkEmail
+(SES v2) after a fixed delay, then sends the same batch three ways:
+
+  blocking  one SendRawEmail at a time, as the provider used to on the event loop
+  executor  concurrent SendRawEmail calls on the SES thread pool
+  bulk      SESProvider.send_batch, which groups same-content messages
+
+Usage:
+    PYTHONPATH=src python scripts/benchmark_ses.py --messages 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from uuid import uuid4
+
+from mailagent.providers.base import EmailAddress, EmailMessage, ProviderConfig, ProviderType
+from mailagent.providers.ses import SESProvider
+
+
+def make_handler(latency: float) -> type[BaseHTTPRequestHandler]:
+    class SESStandIn(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._respond("application/json", json.dumps({"SendingEnabled": True}))
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+
+            if self.path.startswith("/v2/email/outbound-bulk-emails"):
+                entries = json.loads(body)["BulkEmailEntries"]
+                results = [
+                    {"Status": "SUCCESS", "MessageId": str(uuid4())} for _ in entries
+                ]
+                self._respond("application/json", json.dumps({"BulkEmailEntryResults": results}))
+                return
+
+            self._respond(
+                "text/xml",
+                '<SendRawEmailResponse xmlns="http://ses.amazonaws.com/doc/2010-12-01/">'
+                f"<SendRawEmailResult><MessageId>{uuid4()}</MessageId></SendRawEmailResult>"
+                f"<ResponseMetadata><RequestId>{uuid4()}</RequestId></ResponseMetadata>"
+                "</SendRawEmailResponse>",
+            )
+
+        def _respond(self, content_type: str, payload: str) -> None:
+            data = payload.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return SESStandIn
+
+
+def make_messages(count: int) -> list[EmailMessage]:
+    return [
+        EmailMessage(
+            from_address=EmailAddress(address="sender@example.com", name="Sender"),
+            to_addresses=[EmailAddress(address=f"user{i}@example.com")],
+            subject="Weekly digest",
+            body_text="Here is what happened this week.",
+            body_html="<p>Here is what happened this week.</p>",
+        )
+        for i in range(count)
+    ]
+
+
+async def run(messages: int, latency: float) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    provider = SESProvider(
+        ProviderConfig(
+            id=uuid4(),
+            name="ses-bench",
+            provider_type=ProviderType.SES,
+            credentials={
+                "access_key_id": "bench",
+                "secret_access_key": "bench",
+                "endpoint_url": f"http://127.0.0.1:{server.server_port}",
+            },
+        )
+    )
+    batch = make_messages(messages)
+
+    async def blocking():
+        for message in batch:
+            provider._send_raw_email(message)
+
+    async def executor():
+        await asyncio.gather(*(provider.send(message) for message in batch))
+
+    async def bulk():
+        results = await provider.send_batch(batch)
+        assert all(r.success for r in results)
+
+    print(f"{messages} messages, {latency * 1000:.0f} ms stand-in latency")
+    for name, mode in (("blocking", blocking), ("executor", executor), ("bulk", bulk)):
+        started = time.perf_counter()
+        await mode()
+        elapsed = time.perf_counter() - started
+        print(f"  {name:<9} {elapsed:7.2f} s  {messages / elapsed:8.1f} msg/s")
+
+    server.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.latency))
+
+
+if __name__ == "__main__":
+    main()
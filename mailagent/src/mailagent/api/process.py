@@ -46,35 +46,31 @@ class ProcessResult(BaseModel):
     message: Optional[str] = None
 
 
-@router.post("/incoming", response_model=ProcessResult)
-async def process_incoming_email(
-    email: IncomingEmail,
-):
-    """Process an incoming email through the agent system.
+class IncomingEmailBatch(BaseModel):
+    """Batch of incoming emails, in arrival order."""
+    emails: list[IncomingEmail]
+    concurrency: int = 10
 
-    This endpoint receives incoming emails (typically from a mail server
-    or email forwarding service) and routes them through the appropriate
-    AI agents for processing.
-    """
-    orchestrator = get_orchestrator()
 
-    result = await orchestrator.process_incoming_email(
-        inbox_id=email.inbox_id,
-        message_data={
-            "from_address": email.from_address,
-            "from_name": email.from_name,
-            "to_addresses": email.to_addresses,
-            "cc_addresses": email.cc_addresses,
-            "subject": email.subject,
-            "body_text": email.body_text,
-            "body_html": email.body_html,
-            "message_id": email.message_id,
-            "in_reply_to": email.in_reply_to,
-            "references": email.references,
-            "headers": email.headers,
-        },
-    )
+def _message_data(email: IncomingEmail) -> dict:
+    """Convert an incoming email to orchestrator message data."""
+    return {
+        "from_address": email.from_address,
+        "from_name": email.from_name,
+        "to_addresses": email.to_addresses,
+        "cc_addresses": email.cc_addresses,
+        "subject": email.subject,
+        "body_text": email.body_text,
+        "body_html": email.body_html,
+        "message_id": email.message_id,
+        "in_reply_to": email.in_reply_to,
+        "references": email.references,
+        "headers": email.headers,
+    }
 
+
+def _to_process_result(result: dict) -> ProcessResult:
+    """Convert an orchestrator result to the API response."""
     return ProcessResult(
         status=result.get("status", "unknown"),
         message_id=str(result.get("message_id")) if result.get("message_id") else None,
@@ -92,6 +88,52 @@ async def process_incoming_email(
     )
 
 
+@router.post("/incoming", response_model=ProcessResult)
+async def process_incoming_email(
+    email: IncomingEmail,
+):
+    """Process an incoming email through the agent system.
+
+    This endpoint receives incoming emails (typically from a mail server
+    or email forwarding service) and routes them through the appropriate
+    AI agents for processing.
+    """
+    orchestrator = get_orchestrator()
+
+    result = await orchestrator.process_incoming_email(
+        inbox_id=email.inbox_id,
+        message_data=_message_data(email),
+    )
+
+    return _to_process_result(result)
+
+
+@router.post("/incoming/batch", response_model=list[ProcessResult])
+async def process_incoming_batch(
+    batch: IncomingEmailBatch,
+):
+    """Process a batch of incoming emails.
+
+    Emails in different threads are processed concurrently; emails in the
+    same thread are processed in the order given. Results are returned in
+    request order.
+    """
+    if len(batch.emails) > 500:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Maximum 500 emails per batch",
+        )
+
+    orchestrator = get_orchestrator()
+
+    results = await orchestrator.process_incoming_batch(
+        [(email.inbox_id, _message_data(email)) for email in batch.emails],
+        concurrency=min(batch.concurrency, 50),  # Cap concurrency
+    )
+
+    return [_to_process_result(result) for result in results]
+
+
 @router.post("/reprocess/{message_id}", response_model=ProcessResult)
 async def reprocess_message(
     message_id: UUID,
@@ -29,6 +29,10 @@ class Settings(BaseSettings):
     aws_access_key_id: str | None = None
     aws_secret_access_key: str | None = None
     aws_region: str = "us-east-1"
+    # Worker threads (and pooled HTTPS connections) for blocking SES calls
+    ses_max_concurrency: int = 10
+    # Send identical-content batches with SESv2 SendBulkEmail
+    ses_bulk_enabled: bool = True
 
     # SMTP fallback
     smtp_host: str | None = None
@@ -42,6 +46,11 @@ class Settings(BaseSettings):
     default_requests_per_minute: int = 60
     default_requests_per_day: int = 10000
 
+    # Agent orchestrator thread-context cache
+    thread_context_cache_size: int = 10000  # threads (and contacts, inboxes) kept per process
+    thread_context_messages: int = 10  # history messages handed to agents
+    thread_context_ttl_seconds: int = 300  # bounds staleness from other replicas' writes
+
     # Domain warming
     default_warming_schedule: str = "moderate"  # conservative, moderate, aggressive
 
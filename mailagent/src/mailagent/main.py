@@ -21,6 +21,7 @@ from mailagent.config import get_settings
 from mailagent.database import engine
 from mailagent.models import Base
 from mailagent.redis_client import close_redis
+from mailagent.services.send_service import close_send_service
 
 
 @asynccontextmanager
@@ -37,6 +38,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await close_send_service()
     await close_redis()
     await engine.dispose()
 
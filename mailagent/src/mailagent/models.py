@@ -234,6 +234,32 @@ class Message(Base):
     )
 
 
+class SendRecord(Base):
+    """Log of messages sent through SendService, one row per successful send."""
+
+    __tablename__ = "mailagent_send_log"
+
+    id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    provider_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("mailagent_providers.id", ondelete="SET NULL"), nullable=True
+    )
+    domain_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("mailagent_domains.id", ondelete="SET NULL"), nullable=True
+    )
+    message_id: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    from_address: Mapped[str] = mapped_column(String(255), nullable=False)
+    to_addresses: Mapped[list] = mapped_column(JSON, nullable=False, default=list)
+    subject: Mapped[str | None] = mapped_column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="sent")
+    provider_message_id: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    sent_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+
 class AgentDecision(Base):
     """Agent decision log for tracking and approval workflow."""
 
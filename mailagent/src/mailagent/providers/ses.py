@@ -1,13 +1,20 @@
 """Amazon SES email provider."""
 
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Optional
 
+from mailagent.config import get_settings
 from mailagent.providers.base import (
     EmailProvider,
     ProviderType,
@@ -17,41 +24,70 @@ from mailagent.providers.base import (
 )
 
 
+# SendBulkEmail accepts at most 50 destinations per call
+BULK_CHUNK_SIZE = 50
+
+# boto3 is synchronous; its calls run on one bounded pool shared by every
+# SES provider in the process, sized to match each client's connection pool.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().ses_max_concurrency,
+            thread_name_prefix="ses",
+        )
+    return _executor
+
+
 class SESProvider(EmailProvider):
-    """Amazon SES email provider."""
+    """Amazon SES email provider.
+
+    boto3 calls are made on a bounded thread pool so they never block the
+    event loop, and the clients keep a connection pool of the same size so
+    concurrent sends reuse TLS connections.
+    """
 
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
-
-        self._client = boto3.client(
-            'ses',
-            aws_access_key_id=self._get_credential('access_key_id'),
-            aws_secret_access_key=self._get_credential('secret_access_key'),
-            region_name=self._get_credential('region', required=False) or 'us-east-1',
-        )
+        settings = get_settings()
+
+        self._bulk_enabled = settings.ses_bulk_enabled
+        self._client_kwargs = {
+            'aws_access_key_id': self._get_credential('access_key_id'),
+            'aws_secret_access_key': self._get_credential('secret_access_key'),
+            'region_name': self._get_credential('region', required=False) or 'us-east-1',
+            'endpoint_url': self._get_credential('endpoint_url', required=False),
+            'config': Config(
+                max_pool_connections=settings.ses_max_concurrency,
+                retries={'mode': 'standard'},
+            ),
+        }
+        self._client = boto3.client('ses', **self._client_kwargs)
+        self._v2_client = None
 
     @property
     def provider_type(self) -> ProviderType:
         return ProviderType.SES
 
+    @property
+    def v2_client(self) -> Any:
+        """SESv2 client, used for bulk sends and account checks."""
+        if self._v2_client is None:
+            self._v2_client = boto3.client('sesv2', **self._client_kwargs)
+        return self._v2_client
+
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking boto3 call on the SES executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
     async def send(self, message: EmailMessage) -> SendResult:
         """Send email via SES."""
         try:
-            # Build MIME message
-            mime_message = self._build_mime_message(message)
-
-            # Get all recipients
-            destinations = [addr.address for addr in message.to_addresses]
-            destinations += [addr.address for addr in message.cc_addresses]
-            destinations += [addr.address for addr in message.bcc_addresses]
-
-            # Send raw email
-            response = self._client.send_raw_email(
-                Source=message.from_address.formatted(),
-                Destinations=destinations,
-                RawMessage={'Data': mime_message.as_string()},
-                Tags=[{'Name': tag, 'Value': 'true'} for tag in message.tags[:10]],
-            )
+            response = await self._run(self._send_raw_email, message)
 
             return SendResult(
                 success=True,
@@ -77,10 +113,26 @@ class SESProvider(EmailProvider):
                 error=str(e),
             )
 
+    def _send_raw_email(self, message: EmailMessage) -> dict:
+        """Build the MIME message and send it. Runs on the executor."""
+        mime_message = self._build_mime_message(message)
+
+        # Get all recipients
+        destinations = [addr.address for addr in message.to_addresses]
+        destinations += [addr.address for addr in message.cc_addresses]
+        destinations += [addr.address for addr in message.bcc_addresses]
+
+        return self._client.send_raw_email(
+            Source=message.from_address.formatted(),
+            Destinations=destinations,
+            RawMessage={'Data': mime_message.as_string()},
+            Tags=[{'Name': tag, 'Value': 'true'} for tag in message.tags[:10]],
+        )
+
     async def verify_credentials(self) -> bool:
         """Verify SES credentials by getting account info."""
         try:
-            self._client.get_account()
+            await self._run(self.v2_client.get_account)
             return True
         except Exception:
             return False
@@ -141,11 +193,131 @@ class SESProvider(EmailProvider):
 
         return msg
 
+    @staticmethod
+    def _bulk_key(message: EmailMessage) -> Optional[tuple]:
+        """Grouping key for messages that can share one SendBulkEmail call.
+
+        Only messages that differ solely in their To recipients qualify.
+        Returns None for messages that need a raw send: CC/BCC, attachments,
+        threading headers, or content containing template syntax.
+        """
+        if (
+            message.cc_addresses
+            or message.bcc_addresses
+            or message.attachments
+            or message.in_reply_to
+            or message.references
+        ):
+            return None
+        content = (message.subject, message.body_text or '', message.body_html or '')
+        if any('{{' in part for part in content):
+            return None
+        return (
+            message.from_address.formatted(),
+            message.reply_to.formatted() if message.reply_to else None,
+            *content,
+            tuple(sorted(message.headers.items())),
+            tuple(message.tags[:10]),
+        )
+
     async def send_batch(self, messages: list[EmailMessage]) -> list[SendResult]:
-        """Send batch of emails via SES."""
-        # SES doesn't have a true batch API for different messages,
-        # so we send sequentially but could parallelize with asyncio
-        import asyncio
+        """Send batch of emails via SES.
+
+        Messages with identical content go out through SendBulkEmail, 50
+        destinations per call. Everything else is sent concurrently with
+        SendRawEmail, bounded by the SES executor.
+        """
+        results: list[Optional[SendResult]] = [None] * len(messages)
+
+        groups: dict[tuple, list[int]] = {}
+        raw_indexes: list[int] = []
+        for i, message in enumerate(messages):
+            key = self._bulk_key(message) if self._bulk_enabled else None
+            if key is None:
+                raw_indexes.append(i)
+            else:
+                groups.setdefault(key, []).append(i)
+
+        for indexes in list(groups.values()):
+            # A bulk call for a single message saves nothing
+            if len(indexes) == 1:
+                raw_indexes.extend(indexes)
+                continue
+            for start in range(0, len(indexes), BULK_CHUNK_SIZE):
+                chunk = indexes[start:start + BULK_CHUNK_SIZE]
+                chunk_results = await self._send_bulk([messages[i] for i in chunk])
+                for i, result in zip(chunk, chunk_results):
+                    results[i] = result
+
+        raw_results = await asyncio.gather(*(self.send(messages[i]) for i in raw_indexes))
+        for i, result in zip(raw_indexes, raw_results):
+            results[i] = result
+
+        return results
+
+    async def _send_bulk(self, messages: list[EmailMessage]) -> list[SendResult]:
+        """Send same-content messages with one SendBulkEmail call."""
+        first = messages[0]
+        content: dict[str, Any] = {'Subject': first.subject}
+        if first.body_text:
+            content['Text'] = first.body_text
+        if first.body_html:
+            content['Html'] = first.body_html
+
+        template: dict[str, Any] = {'TemplateContent': content, 'TemplateData': '{}'}
+        if first.headers:
+            template['Headers'] = [
+                {'Name': name, 'Value': value} for name, value in first.headers.items()
+            ]
+
+        request: dict[str, Any] = {
+            'FromEmailAddress': first.from_address.formatted(),
+            'DefaultContent': {'Template': template},
+            'BulkEmailEntries': [
+                {
+                    'Destination': {
+                        'ToAddresses': [addr.formatted() for addr in message.to_addresses],
+                    },
+                    'ReplacementEmailContent': {
+                        'ReplacementTemplate': {'ReplacementTemplateData': json.dumps({})},
+                    },
+                }
+                for message in messages
+            ],
+        }
+        if first.reply_to:
+            request['ReplyToAddresses'] = [first.reply_to.formatted()]
+        if first.tags:
+            request['DefaultEmailTags'] = [
+                {'Name': tag, 'Value': 'true'} for tag in first.tags[:10]
+            ]
 
-        tasks = [self.send(msg) for msg in messages]
-        return await asyncio.gather(*tasks)
+        try:
+            response = await self._run(self.v2_client.send_bulk_email, **request)
+        except ClientError as e:
+            error = f"{e.response['Error']['Code']}: {e.response['Error']['Message']}"
+            return [SendResult(success=False, provider='ses', error=error) for _ in messages]
+        except Exception as e:
+            return [SendResult(success=False, provider='ses', error=str(e)) for _ in messages]
+
+        results = []
+        for entry in response.get('BulkEmailEntryResults', []):
+            if entry.get('Status') == 'SUCCESS':
+                results.append(SendResult(
+                    success=True,
+                    message_id=entry.get('MessageId'),
+                    provider='ses',
+                    provider_message_id=entry.get('MessageId'),
+                ))
+            else:
+                results.append(SendResult(
+                    success=False,
+                    provider='ses',
+                    error=f"{entry.get('Status')}: {entry.get('Error')}",
+                ))
+        # Entries missing from the response are treated as failed
+        while len(results) < len(messages):
+            results.append(SendResult(
+                success=False, provider='ses', error="No result returned for bulk entry",
+            ))
+        return results
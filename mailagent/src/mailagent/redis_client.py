@@ -99,3 +99,124 @@ class RateLimiter:
             "remaining": max(0, limit - current_count),
             "reset_at": int(now + window_seconds),
         }
+
+
+# Refills and takes from every bucket in KEYS atomically. ARGV holds
+# capacity and refill rate (tokens/second) per bucket, then now, the number
+# of tokens requested and whether a partial grant is acceptable. Returns the
+# number of tokens granted, which is the same for every bucket. A negative
+# request returns tokens (capped at capacity).
+TOKEN_BUCKET_SCRIPT = """
+local n = #KEYS
+local now = tonumber(ARGV[2 * n + 1])
+local requested = tonumber(ARGV[2 * n + 2])
+local partial = tonumber(ARGV[2 * n + 3])
+local tokens = {}
+local granted = requested
+
+for i = 1, n do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local current = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    current = math.min(capacity, current + math.max(0, now - ts) * rate)
+    tokens[i] = current
+    if requested > 0 then
+        granted = math.min(granted, math.floor(current))
+    end
+end
+
+if requested > 0 and granted < requested and partial == 0 then
+    granted = 0
+end
+
+for i = 1, n do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local rate = tonumber(ARGV[2 * i])
+    local current = math.min(capacity, tokens[i] - granted)
+    redis.call('HSET', KEYS[i], 'tokens', current, 'ts', now)
+    redis.call('EXPIRE', KEYS[i], math.ceil(capacity / rate) + 60)
+end
+
+return granted
+"""
+
+
+class TokenBucketLimiter:
+    """Token-bucket rate limiter shared through Redis.
+
+    Each limit is a bucket holding up to ``capacity`` tokens that refills
+    continuously over ``period_seconds``. A caller takes tokens from all of
+    its buckets in one atomic script, so replicas share one budget. Without
+    Redis, or if a call fails, buckets are kept in process memory instead.
+    """
+
+    def __init__(self, client: redis.Redis | None):
+        self.client = client
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT) if client else None
+        self._local: dict[str, tuple[float, float]] = {}
+
+    async def acquire(
+        self,
+        buckets: list[tuple[str, int, int]],
+        tokens: int = 1,
+        partial: bool = False,
+    ) -> int:
+        """
+        Take tokens from every bucket.
+
+        Args:
+            buckets: ``(key, capacity, period_seconds)`` for each limit
+            tokens: Number of tokens wanted
+            partial: Grant fewer tokens than requested if that is all there is
+
+        Returns:
+            Number of tokens granted (0 when throttled)
+        """
+        if not buckets or tokens <= 0:
+            return tokens
+        return await self._run(buckets, tokens, partial)
+
+    async def release(self, buckets: list[tuple[str, int, int]], tokens: int) -> None:
+        """Return unused tokens, e.g. after a send failed."""
+        if buckets and tokens > 0:
+            await self._run(buckets, -tokens, True)
+
+    async def _run(self, buckets: list[tuple[str, int, int]], tokens: int, partial: bool) -> int:
+        import time
+
+        now = time.time()
+        if self._script is not None:
+            args: list = []
+            for _, capacity, period in buckets:
+                args += [capacity, capacity / period]
+            args += [now, tokens, int(partial)]
+            try:
+                return int(await self._script(keys=[key for key, _, _ in buckets], args=args))
+            except Exception:
+                pass
+        return self._run_local(buckets, tokens, partial, now)
+
+    def _run_local(
+        self,
+        buckets: list[tuple[str, int, int]],
+        tokens: int,
+        partial: bool,
+        now: float,
+    ) -> int:
+        current = {}
+        granted = tokens
+        for key, capacity, period in buckets:
+            level, ts = self._local.get(key, (capacity, now))
+            level = min(capacity, level + max(0.0, now - ts) * capacity / period)
+            current[key] = level
+            if tokens > 0:
+                granted = min(granted, int(level))
+
+        if tokens > 0 and granted < tokens and not partial:
+            granted = 0
+
+        for key, capacity, _ in buckets:
+            self._local[key] = (min(capacity, current[key] - granted), now)
+        return granted
@@ -3,8 +3,14 @@
 from mailagent.services.admin_service import AdminService
 from mailagent.services.domain_service import DomainService
 from mailagent.services.onboarding_service import OnboardingService
-from mailagent.services.send_service import SendService, get_send_service
+from mailagent.services.send_service import (
+    SendRecordBuffer,
+    SendService,
+    close_send_service,
+    get_send_service,
+)
 from mailagent.services.orchestrator import AgentOrchestrator, get_orchestrator
+from mailagent.services.thread_context import ThreadContextCache
 from mailagent.services.invocation_service import InvocationService, get_invocation_service
 
 __all__ = [
@@ -13,8 +19,11 @@ __all__ = [
     "OnboardingService",
     "SendService",
     "get_send_service",
+    "close_send_service",
+    "SendRecordBuffer",
     "AgentOrchestrator",
     "get_orchestrator",
+    "ThreadContextCache",
     "InvocationService",
     "get_invocation_service",
 ]
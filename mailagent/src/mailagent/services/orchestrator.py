@@ -19,14 +19,21 @@ from mailagent.agents import (
     create_agent_from_db,
 )
 from mailagent.services.send_service import get_send_service
+from mailagent.services.thread_context import ThreadContextCache
 from mailagent.providers.base import EmailMessage, EmailAddress
 
 
 class AgentOrchestrator:
-    """Orchestrates email processing across multiple agents."""
+    """Orchestrates email processing across multiple agents.
 
-    def __init__(self):
+    Thread history, contact counts, inbox emails and Message-ID to thread
+    lookups are served from a ThreadContextCache that is kept current as
+    messages are stored, so follow-ups in busy threads skip those queries.
+    """
+
+    def __init__(self, context_cache: Optional[ThreadContextCache] = None):
         self._processing_lock = asyncio.Lock()
+        self.context_cache = context_cache if context_cache is not None else ThreadContextCache()
 
     async def process_incoming_email(
         self,
@@ -44,7 +51,7 @@ class AgentOrchestrator:
         """
         async with async_session_factory() as session:
             # Store the incoming message
-            message_id = await self._store_message(session, inbox_id, message_data)
+            message_id, thread_id = await self._store_message(session, inbox_id, message_data)
 
             # Get agents for this inbox
             agents = await get_agents_for_inbox(inbox_id)
@@ -57,7 +64,9 @@ class AgentOrchestrator:
                 }
 
             # Build context
-            context = await self._build_context(session, inbox_id, message_id, message_data)
+            context = await self._build_context(
+                session, inbox_id, message_id, message_data, thread_id
+            )
 
             # Process through agents (in priority order)
             for agent in agents:
@@ -85,13 +94,46 @@ class AgentOrchestrator:
                 "message": "No agent could handle this email",
             }
 
+    async def process_incoming_batch(
+        self,
+        emails: list[tuple[UUID, dict]],
+        concurrency: int = 10,
+    ) -> list[dict]:
+        """Process a batch of incoming emails concurrently.
+
+        Emails linked by Message-ID, In-Reply-To or References belong to the
+        same thread and are processed one after another in batch order;
+        separate threads run concurrently, at most ``concurrency`` at once.
+
+        Args:
+            emails: ``(inbox_id, message_data)`` pairs in arrival order
+            concurrency: Maximum threads processed at once
+
+        Returns:
+            Processing results in the same order as ``emails``
+        """
+        results: list[Optional[dict]] = [None] * len(emails)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_thread(indexes: list[int]) -> None:
+            async with semaphore:
+                for i in indexes:
+                    inbox_id, message_data = emails[i]
+                    try:
+                        results[i] = await self.process_incoming_email(inbox_id, message_data)
+                    except Exception as e:
+                        results[i] = {"status": "error", "message": str(e)}
+
+        await asyncio.gather(*(process_thread(group) for group in thread_groups(emails)))
+        return results
+
     async def _store_message(
         self,
         session,
         inbox_id: UUID,
         message_data: dict,
-    ) -> UUID:
-        """Store incoming message in database."""
+    ) -> tuple[UUID, Optional[UUID]]:
+        """Store incoming message in database. Returns message and thread ids."""
         message_id = uuid4()
 
         # Check for existing thread
@@ -137,7 +179,26 @@ class AgentOrchestrator:
         )
         await session.commit()
 
-        return message_id
+        cache = self.context_cache
+        cache.remember_refs(
+            inbox_id, [message_data.get('message_id'), message_data.get('in_reply_to')], thread_id
+        )
+        cache.add_message(thread_id, MessageData(
+            id=message_id,
+            from_address=message_data.get('from_address', ''),
+            from_name=message_data.get('from_name'),
+            to_addresses=message_data.get('to_addresses', []),
+            subject=message_data.get('subject'),
+            body_text=message_data.get('body_text'),
+            body_html=message_data.get('body_html'),
+            received_at=datetime.now(timezone.utc),
+            thread_id=thread_id,
+            message_id=message_data.get('message_id'),
+        ))
+        if message_data.get('from_address'):
+            cache.increment_contact(message_data['from_address'])
+
+        return message_id, thread_id
 
     async def _find_or_create_thread(
         self,
@@ -152,6 +213,10 @@ class AgentOrchestrator:
         # Try to find thread by in_reply_to or references
         if in_reply_to or references:
             all_refs = [in_reply_to] + references if in_reply_to else references
+            thread_id = self.context_cache.get_thread_for_refs(inbox_id, all_refs)
+            if thread_id:
+                return thread_id
+
             result = await session.execute(
                 text("""
                     SELECT DISTINCT thread_id FROM mailagent_messages
@@ -164,6 +229,7 @@ class AgentOrchestrator:
             )
             row = result.fetchone()
             if row:
+                self.context_cache.remember_refs(inbox_id, all_refs, row.thread_id)
                 return row.thread_id
 
         # Create new thread
@@ -181,6 +247,9 @@ class AgentOrchestrator:
             },
         )
 
+        # A new thread has no history yet, so its cache entry is complete
+        self.context_cache.set_thread_messages(thread_id, [])
+
         return thread_id
 
     async def _build_context(
@@ -189,54 +258,43 @@ class AgentOrchestrator:
         inbox_id: UUID,
         message_id: UUID,
         message_data: dict,
+        thread_id: Optional[UUID] = None,
     ) -> AgentContext:
         """Build context for agent processing."""
+        cache = self.context_cache
+
         # Get thread history
         thread_messages = []
         if message_data.get('in_reply_to'):
-            result = await session.execute(
-                text("""
-                    SELECT id, from_address, from_name, to_addresses, subject,
-                           body_text, body_html, received_at, sent_at, thread_id, message_id
-                    FROM mailagent_messages
-                    WHERE inbox_id = :inbox_id
-                      AND thread_id = (
-                          SELECT thread_id FROM mailagent_messages
-                          WHERE id = :message_id
-                      )
-                      AND id != :message_id
-                    ORDER BY COALESCE(received_at, sent_at) DESC
-                    LIMIT 10
-                """),
-                {"inbox_id": inbox_id, "message_id": message_id},
-            )
-            rows = result.fetchall()
-            thread_messages = [
-                MessageData(
-                    id=row.id,
-                    from_address=row.from_address,
-                    from_name=row.from_name,
-                    to_addresses=row.to_addresses or [],
-                    subject=row.subject,
-                    body_text=row.body_text,
-                    body_html=row.body_html,
-                    received_at=row.received_at or row.sent_at,
-                    thread_id=row.thread_id,
-                    message_id=row.message_id,
+            if thread_id is None:
+                result = await session.execute(
+                    text("SELECT thread_id FROM mailagent_messages WHERE id = :message_id"),
+                    {"message_id": message_id},
                 )
-                for row in rows
-            ]
+                row = result.fetchone()
+                thread_id = row.thread_id if row else None
+
+            if thread_id is not None:
+                thread_messages = cache.get_thread_messages(thread_id, exclude_id=message_id)
+                if thread_messages is None:
+                    thread_messages = await self._load_thread_messages(
+                        session, inbox_id, thread_id, message_id
+                    )
 
         # Get contact info
         contact = await self._get_contact_info(session, message_data.get('from_address'))
 
         # Get inbox email
-        result = await session.execute(
-            text("SELECT email FROM mailagent_inboxes WHERE id = :inbox_id"),
-            {"inbox_id": inbox_id},
-        )
-        inbox_row = result.fetchone()
-        inbox_email = inbox_row.email if inbox_row else ""
+        inbox_email = cache.get_inbox_email(inbox_id)
+        if inbox_email is None:
+            result = await session.execute(
+                text("SELECT email FROM mailagent_inboxes WHERE id = :inbox_id"),
+                {"inbox_id": inbox_id},
+            )
+            inbox_row = result.fetchone()
+            inbox_email = inbox_row.email if inbox_row else ""
+            if inbox_row:
+                cache.set_inbox_email(inbox_id, inbox_email)
 
         return AgentContext(
             message=MessageData(
@@ -248,6 +306,7 @@ class AgentOrchestrator:
                 body_text=message_data.get('body_text'),
                 body_html=message_data.get('body_html'),
                 received_at=datetime.now(timezone.utc),
+                thread_id=thread_id,
                 message_id=message_data.get('message_id'),
             ),
             thread_messages=thread_messages,
@@ -255,11 +314,54 @@ class AgentOrchestrator:
             agent_config={"inbox_email": inbox_email},
         )
 
+    async def _load_thread_messages(
+        self,
+        session,
+        inbox_id: UUID,
+        thread_id: UUID,
+        message_id: UUID,
+    ) -> list[MessageData]:
+        """Load recent thread history, newest first, and cache it."""
+        cache = self.context_cache
+        result = await session.execute(
+            text("""
+                SELECT id, from_address, from_name, to_addresses, subject,
+                       body_text, body_html, received_at, sent_at, thread_id, message_id
+                FROM mailagent_messages
+                WHERE inbox_id = :inbox_id
+                  AND thread_id = :thread_id
+                ORDER BY COALESCE(received_at, sent_at) DESC
+                LIMIT :limit
+            """),
+            {"inbox_id": inbox_id, "thread_id": thread_id, "limit": cache.max_messages + 1},
+        )
+        messages = [
+            MessageData(
+                id=row.id,
+                from_address=row.from_address,
+                from_name=row.from_name,
+                to_addresses=row.to_addresses or [],
+                subject=row.subject,
+                body_text=row.body_text,
+                body_html=row.body_html,
+                received_at=row.received_at or row.sent_at,
+                thread_id=row.thread_id,
+                message_id=row.message_id,
+            )
+            for row in result.fetchall()
+        ]
+        cache.set_thread_messages(thread_id, messages)
+        return [m for m in messages if m.id != message_id][:cache.max_messages]
+
     async def _get_contact_info(self, session, email: str) -> Optional[ContactData]:
         """Get contact information from previous interactions."""
         if not email:
             return None
 
+        count = self.context_cache.get_contact_count(email)
+        if count is not None:
+            return ContactData(email=email, previous_interactions=count)
+
         # Count previous interactions
         result = await session.execute(
             text("""
@@ -270,10 +372,12 @@ class AgentOrchestrator:
             {"email": email},
         )
         row = result.fetchone()
+        count = row.count if row else 0
+        self.context_cache.set_contact_count(email, count)
 
         return ContactData(
             email=email,
-            previous_interactions=row.count if row else 0,
+            previous_interactions=count,
         )
 
     async def _process_with_agent(
@@ -400,20 +504,23 @@ class AgentOrchestrator:
 
             # Store outbound message
             if result.success:
+                outbound_id = uuid4()
                 await session.execute(
                     text("""
                         INSERT INTO mailagent_messages (
-                            inbox_id, thread_id, message_id, in_reply_to,
+                            id, inbox_id, thread_id, message_id, in_reply_to,
                             from_address, to_addresses, subject, body_text, body_html,
                             direction, status, sent_at, provider_message_id
                         ) VALUES (
-                            :inbox_id, (SELECT thread_id FROM mailagent_messages WHERE id = :original_id),
+                            :id, :inbox_id,
+                            (SELECT thread_id FROM mailagent_messages WHERE id = :original_id),
                             :message_id, :in_reply_to,
                             :from_address, :to_addresses, :subject, :body_text, :body_html,
                             'outbound', 'sent', NOW(), :provider_message_id
                         )
                     """),
                     {
+                        "id": outbound_id,
                         "inbox_id": agent.config.inbox_id,
                         "original_id": context.message.id,
                         "message_id": result.message_id,
@@ -428,6 +535,25 @@ class AgentOrchestrator:
                 )
                 await session.commit()
 
+                thread_id = context.message.thread_id
+                if thread_id is not None:
+                    self.context_cache.add_message(thread_id, MessageData(
+                        id=outbound_id,
+                        from_address=agent.config.inbox_email,
+                        from_name=agent.config.name,
+                        to_addresses=[{"email": context.message.from_address}],
+                        subject=message.subject,
+                        body_text=decision.draft_response,
+                        body_html=message.body_html,
+                        received_at=datetime.now(timezone.utc),
+                        thread_id=thread_id,
+                        message_id=result.message_id,
+                    ))
+                    self.context_cache.remember_refs(
+                        agent.config.inbox_id, [result.message_id], thread_id
+                    )
+                self.context_cache.increment_contact(agent.config.inbox_email)
+
             return {
                 "success": result.success,
                 "message_id": result.message_id,
@@ -494,7 +620,7 @@ class AgentOrchestrator:
             # Get message details
             result = await session.execute(
                 text("""
-                    SELECT id, inbox_id, from_address, from_name, to_addresses,
+                    SELECT id, inbox_id, thread_id, from_address, from_name, to_addresses,
                            subject, body_text, body_html, message_id as msg_id,
                            in_reply_to, "references"
                     FROM mailagent_messages
@@ -520,7 +646,9 @@ class AgentOrchestrator:
             }
 
             # Build context
-            context = await self._build_context(session, row.inbox_id, message_id, message_data)
+            context = await self._build_context(
+                session, row.inbox_id, message_id, message_data, row.thread_id
+            )
 
             if agent_id:
                 # Process with specific agent
@@ -541,6 +669,42 @@ class AgentOrchestrator:
                 return {"status": "unhandled", "message": "No agent could handle this email"}
 
 
+def thread_groups(emails: list[tuple[UUID, dict]]) -> list[list[int]]:
+    """Group batch indexes of emails that belong to the same thread.
+
+    Two emails share a thread when they are linked, directly or through
+    other emails in the batch, by a Message-ID, In-Reply-To or References
+    value in the same inbox. Each group keeps batch order.
+    """
+    parent = list(range(len(emails)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owners: dict[tuple[UUID, str], int] = {}
+    for i, (inbox_id, message_data) in enumerate(emails):
+        refs = [
+            message_data.get('message_id'),
+            message_data.get('in_reply_to'),
+            *(message_data.get('references') or []),
+        ]
+        for ref in refs:
+            if not ref:
+                continue
+            owner = owners.setdefault((inbox_id, ref), i)
+            root_a, root_b = find(owner), find(i)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(emails)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
 # Global instance
 _orchestrator: Optional[AgentOrchestrator] = None
 
@@ -1,22 +1,133 @@
 """Unified email sending service with failover and rate limiting."""
 
 import asyncio
-from datetime import datetime, timedelta
+import logging
+from datetime import timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
-from mailagent.providers.base import EmailMessage, SendResult, ProviderConfig
+from sqlalchemy import insert, text
+
+from mailagent.providers.base import EmailMessage, EmailProvider, SendResult, ProviderConfig
 from mailagent.providers.factory import get_email_provider
 from mailagent.database import async_session_factory
-from sqlalchemy import text
+from mailagent.models import SendRecord
+from mailagent.redis_client import TokenBucketLimiter, get_redis
+
+logger = logging.getLogger(__name__)
+
+class SendRecordBuffer:
+    """Buffers send records and writes them to mailagent_send_log as multi-row inserts.
+
+    Records are flushed once ``batch_size`` are waiting or ``flush_interval``
+    seconds after the first one arrived, whichever comes first. Rows from a
+    failed flush are kept for the next attempt, up to ``max_pending``.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_pending: int = 10000,
+    ):
+        self._session_factory = session_factory or async_session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._rows: list[dict] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._failed_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    async def add(
+        self,
+        message: EmailMessage,
+        result: SendResult,
+        provider_id: UUID,
+        domain_id: Optional[UUID],
+    ) -> None:
+        """Queue a record of a successful send."""
+        self._rows.append({
+            "id": uuid4(),
+            "provider_id": provider_id,
+            "domain_id": domain_id,
+            "message_id": result.message_id,
+            "from_address": message.from_address.address,
+            "to_addresses": [a.address for a in message.to_addresses],
+            "subject": message.subject,
+            "status": "sent",
+            "provider_message_id": result.provider_message_id,
+            "sent_at": result.timestamp.replace(tzinfo=timezone.utc),
+        })
+
+        if len(self._rows) >= self.batch_size and not self._backing_off():
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    def _backing_off(self) -> bool:
+        """After a failed flush, wait for the timer instead of retrying per send."""
+        if self._failed_at is None:
+            return False
+        return asyncio.get_running_loop().time() - self._failed_at < self.flush_interval
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write all buffered records. Returns the number of rows written."""
+        async with self._lock:
+            rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+
+            try:
+                async with self._session_factory() as session:
+                    for start in range(0, len(rows), self.batch_size):
+                        await session.execute(
+                            insert(SendRecord).values(rows[start:start + self.batch_size])
+                        )
+                    await session.commit()
+                self._failed_at = None
+                return len(rows)
+            except Exception as e:
+                # Keep the rows for the next flush unless the backlog is too large
+                combined = rows + self._rows
+                dropped = max(0, len(combined) - self.max_pending)
+                self._rows = combined[dropped:]
+                self._failed_at = asyncio.get_running_loop().time()
+                logger.error(f"Failed to record {len(rows)} sends ({dropped} dropped): {e}")
+                return 0
+
+    async def close(self) -> None:
+        """Cancel the pending timer and flush what is left."""
+        if self._timer is not None and not self._timer.done():
+            self._timer.cancel()
+        await self.flush()
 
 
 class SendService:
-    """Unified service for sending emails with provider failover and rate limiting."""
+    """Unified service for sending emails with provider failover and rate limiting.
+
+    Provider limits are token buckets in Redis, shared by every replica, so
+    the per-minute and per-day quotas hold cluster-wide. A token is taken
+    before each send and returned if the send fails.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        limiter: Optional[TokenBucketLimiter] = None,
+        records: Optional[SendRecordBuffer] = None,
+    ):
         self._providers: dict[UUID, any] = {}
-        self._rate_limits: dict[UUID, dict] = {}
+        self._rate_limits: dict[UUID, list[tuple[str, int, int]]] = {}
+        self._limiter = limiter if limiter is not None else TokenBucketLimiter(None)
+        self._records = records if records is not None else SendRecordBuffer()
 
     async def load_providers(self) -> None:
         """Load all active providers from database."""
@@ -43,15 +154,21 @@ class SendService:
                     rate_limit_per_minute=row.rate_limit_per_minute,
                     rate_limit_per_day=row.rate_limit_per_day,
                 )
-                self._providers[row.id] = get_email_provider(config)
-                self._rate_limits[row.id] = {
-                    "minute_count": 0,
-                    "minute_reset": datetime.utcnow() + timedelta(minutes=1),
-                    "day_count": 0,
-                    "day_reset": datetime.utcnow() + timedelta(days=1),
-                    "per_minute": row.rate_limit_per_minute,
-                    "per_day": row.rate_limit_per_day,
-                }
+                self.add_provider(config, get_email_provider(config))
+
+    def add_provider(self, config: ProviderConfig, provider: EmailProvider) -> None:
+        """Register a provider and its rate-limit buckets."""
+        self._providers[config.id] = provider
+        buckets = []
+        if config.rate_limit_per_minute:
+            buckets.append(
+                (f"mailagent:ratelimit:provider:{config.id}:minute", config.rate_limit_per_minute, 60)
+            )
+        if config.rate_limit_per_day:
+            buckets.append(
+                (f"mailagent:ratelimit:provider:{config.id}:day", config.rate_limit_per_day, 86400)
+            )
+        self._rate_limits[config.id] = buckets
 
     async def send(
         self,
@@ -74,28 +191,26 @@ class SendService:
 
         last_error = None
         for pid, provider in providers_to_try:
-            # Check rate limits
-            if not self._check_rate_limit(pid):
+            # Take a token; a throttled provider is skipped
+            if not await self._acquire(pid):
+                last_error = last_error or "rate limited"
                 continue
 
             try:
                 result = await provider.send(message)
+            except Exception as e:
+                result = None
+                last_error = str(e)
 
-                if result.success:
-                    # Update rate limit counters
-                    self._increment_rate_limit(pid)
-
-                    # Record the send in database
-                    await self._record_send(message, result, pid, domain_id)
-
-                    return result
+            if result is not None and result.success:
+                # Record the send in database
+                await self._records.add(message, result, pid, domain_id)
+                return result
 
+            await self._release(pid)
+            if result is not None:
                 last_error = result.error
 
-            except Exception as e:
-                last_error = str(e)
-                continue
-
         # All providers failed
         return SendResult(
             success=False,
@@ -108,25 +223,85 @@ class SendService:
         messages: list[EmailMessage],
         provider_id: Optional[UUID] = None,
         concurrency: int = 10,
+        domain_id: Optional[UUID] = None,
     ) -> list[SendResult]:
         """Send multiple emails with concurrency control.
 
+        Providers are tried in priority order. Each takes as many messages as
+        it has tokens for, using its native batch mode when it has one; what
+        is throttled or fails moves on to the next provider.
+
         Args:
             messages: List of emails to send
             provider_id: Specific provider to use (optional)
             concurrency: Maximum concurrent sends
+            domain_id: Domain to use for warming tracking (optional)
 
         Returns:
             List of SendResults
         """
+        results: list[Optional[SendResult]] = [None] * len(messages)
+        errors: dict[int, str] = {}
+        pending = list(range(len(messages)))
         semaphore = asyncio.Semaphore(concurrency)
 
-        async def send_with_semaphore(msg: EmailMessage) -> SendResult:
+        for pid, provider in self._get_providers_to_try(provider_id):
+            if not pending:
+                break
+
+            granted = await self._acquire(pid, len(pending), partial=True)
+            if not granted:
+                continue
+            batch, rest = pending[:granted], pending[granted:]
+
+            batch_results = await self._send_with_provider(
+                provider, [messages[i] for i in batch], semaphore
+            )
+
+            failed = []
+            for i, result in zip(batch, batch_results):
+                if result.success:
+                    await self._records.add(messages[i], result, pid, domain_id)
+                    results[i] = result
+                else:
+                    errors[i] = result.error
+                    failed.append(i)
+
+            await self._release(pid, len(failed))
+            pending = failed + rest
+
+        for i in pending:
+            results[i] = SendResult(
+                success=False,
+                provider="none",
+                error=f"All providers failed. Last error: {errors.get(i, 'rate limited')}",
+            )
+        return results
+
+    async def _send_with_provider(
+        self,
+        provider: EmailProvider,
+        messages: list[EmailMessage],
+        semaphore: asyncio.Semaphore,
+    ) -> list[SendResult]:
+        """Send messages through one provider, never raising."""
+        provider_name = provider.provider_type.value
+
+        if type(provider).send_batch is not EmailProvider.send_batch:
+            try:
+                return await provider.send_batch(messages)
+            except Exception as e:
+                return [SendResult(success=False, provider=provider_name, error=str(e))
+                        for _ in messages]
+
+        async def send_one(message: EmailMessage) -> SendResult:
             async with semaphore:
-                return await self.send(msg, provider_id)
+                try:
+                    return await provider.send(message)
+                except Exception as e:
+                    return SendResult(success=False, provider=provider_name, error=str(e))
 
-        tasks = [send_with_semaphore(msg) for msg in messages]
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*(send_one(m) for m in messages))
 
     def _get_providers_to_try(
         self, provider_id: Optional[UUID]
@@ -138,74 +313,23 @@ class SendService:
         # Return all providers sorted by priority (already loaded in order)
         return list(self._providers.items())
 
-    def _check_rate_limit(self, provider_id: UUID) -> bool:
-        """Check if provider is within rate limits."""
-        limits = self._rate_limits.get(provider_id)
-        if not limits:
-            return True
-
-        now = datetime.utcnow()
-
-        # Reset minute counter if needed
-        if now >= limits["minute_reset"]:
-            limits["minute_count"] = 0
-            limits["minute_reset"] = now + timedelta(minutes=1)
-
-        # Reset day counter if needed
-        if now >= limits["day_reset"]:
-            limits["day_count"] = 0
-            limits["day_reset"] = now + timedelta(days=1)
+    async def _acquire(self, provider_id: UUID, count: int = 1, partial: bool = False) -> int:
+        """Take send tokens for a provider. Returns how many were granted."""
+        return await self._limiter.acquire(
+            self._rate_limits.get(provider_id, []), count, partial=partial
+        )
 
-        # Check minute limit
-        if limits["per_minute"] and limits["minute_count"] >= limits["per_minute"]:
-            return False
+    async def _release(self, provider_id: UUID, count: int = 1) -> None:
+        """Return tokens for sends that did not go out."""
+        await self._limiter.release(self._rate_limits.get(provider_id, []), count)
 
-        # Check day limit
-        if limits["per_day"] and limits["day_count"] >= limits["per_day"]:
-            return False
+    async def flush_records(self) -> int:
+        """Write buffered send records now."""
+        return await self._records.flush()
 
-        return True
-
-    def _increment_rate_limit(self, provider_id: UUID) -> None:
-        """Increment rate limit counters."""
-        limits = self._rate_limits.get(provider_id)
-        if limits:
-            limits["minute_count"] += 1
-            limits["day_count"] += 1
-
-    async def _record_send(
-        self,
-        message: EmailMessage,
-        result: SendResult,
-        provider_id: UUID,
-        domain_id: Optional[UUID],
-    ) -> None:
-        """Record send in database for tracking."""
-        async with async_session_factory() as session:
-            await session.execute(
-                text("""
-                    INSERT INTO mailagent_messages (
-                        id, provider_id, domain_id, message_id,
-                        from_address, to_addresses, subject,
-                        status, provider_message_id, sent_at
-                    ) VALUES (
-                        :id, :provider_id, :domain_id, :message_id,
-                        :from_address, :to_addresses, :subject,
-                        'sent', :provider_message_id, NOW()
-                    )
-                """),
-                {
-                    "id": uuid4(),
-                    "provider_id": provider_id,
-                    "domain_id": domain_id,
-                    "message_id": result.message_id,
-                    "from_address": message.from_address.address,
-                    "to_addresses": [a.address for a in message.to_addresses],
-                    "subject": message.subject,
-                    "provider_message_id": result.provider_message_id,
-                },
-            )
-            await session.commit()
+    async def close(self) -> None:
+        """Flush outstanding send records."""
+        await self._records.close()
 
 
 # Global instance
@@ -216,6 +340,14 @@ async def get_send_service() -> SendService:
     """Get or create the send service singleton."""
     global _send_service
     if _send_service is None:
-        _send_service = SendService()
+        _send_service = SendService(limiter=TokenBucketLimiter(await get_redis()))
         await _send_service.load_providers()
     return _send_service
+
+
+async def close_send_service() -> None:
+    """Flush and drop the send service singleton."""
+    global _send_service
+    if _send_service is not None:
+        await _send_service.close()
+        _send_service = None
@@ -0,0 +1,163 @@
+"""In-process cache of the context the orchestrator builds for each email."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from uuid import UUID
+
+from mailagent.agents import MessageData
+from mailagent.config import get_settings
+
+
+class _TTLCache:
+    """Small LRU mapping whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Any) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def replace(self, key: Any, value: Any) -> None:
+        """Update a live entry in place, keeping its expiry."""
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data[key] = (entry[0], value)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class ThreadContextCache:
+    """Caches thread history, contact counts, inbox emails and thread lookups.
+
+    Thread entries hold the newest ``max_messages + 1`` messages, newest
+    first, so the message being processed can be left out and a full
+    history still remains. Entries are updated as the orchestrator stores
+    messages, and only once they are complete; otherwise they are filled
+    from the database on the next miss. Writes from other replicas are
+    picked up when entries expire.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_messages: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        settings = get_settings()
+        max_size = max_size or settings.thread_context_cache_size
+        ttl_seconds = ttl_seconds or settings.thread_context_ttl_seconds
+
+        self.max_messages = max_messages or settings.thread_context_messages
+        self._threads = _TTLCache(max_size, ttl_seconds)
+        self._refs = _TTLCache(max_size * 4, ttl_seconds)
+        self._contacts = _TTLCache(max_size, ttl_seconds)
+        self._inboxes = _TTLCache(max_size, ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, value: Any) -> Any:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    # Thread history
+
+    def get_thread_messages(
+        self, thread_id: UUID, exclude_id: Optional[UUID] = None
+    ) -> Optional[list[MessageData]]:
+        """Return cached history newest first, without ``exclude_id``."""
+        messages = self._count(self._threads.get(thread_id))
+        if messages is None:
+            return None
+        return [m for m in messages if m.id != exclude_id][:self.max_messages]
+
+    def set_thread_messages(self, thread_id: UUID, messages: list[MessageData]) -> None:
+        """Store the complete recent history of a thread, newest first."""
+        self._threads.set(thread_id, list(messages[:self.max_messages + 1]))
+
+    def add_message(self, thread_id: UUID, message: MessageData) -> None:
+        """Prepend a newly stored message to a cached thread."""
+        messages = self._threads.get(thread_id)
+        if messages is not None:
+            self._threads.replace(thread_id, [message, *messages][:self.max_messages + 1])
+
+    # Thread lookup by Message-ID
+
+    def get_thread_for_refs(self, inbox_id: UUID, refs: list[str]) -> Optional[UUID]:
+        """Return the thread of any known Message-ID in ``refs``."""
+        for ref in refs:
+            thread_id = self._refs.get((inbox_id, ref))
+            if thread_id is not None:
+                self.hits += 1
+                return thread_id
+        self.misses += 1
+        return None
+
+    def remember_refs(self, inbox_id: UUID, refs: list[Optional[str]], thread_id: UUID) -> None:
+        for ref in refs:
+            if ref:
+                self._refs.set((inbox_id, ref), thread_id)
+
+    # Contacts and inboxes
+
+    def get_contact_count(self, email: str) -> Optional[int]:
+        return self._count(self._contacts.get(email))
+
+    def set_contact_count(self, email: str, count: int) -> None:
+        self._contacts.set(email, count)
+
+    def increment_contact(self, email: str) -> None:
+        count = self._contacts.get(email)
+        if count is not None:
+            self._contacts.replace(email, count + 1)
+
+    def get_inbox_email(self, inbox_id: UUID) -> Optional[str]:
+        return self._count(self._inboxes.get(inbox_id))
+
+    def set_inbox_email(self, inbox_id: UUID, email: str) -> None:
+        self._inboxes.set(inbox_id, email)
+
+    def invalidate_thread(self, thread_id: UUID) -> None:
+        self._threads.pop(thread_id)
+
+    def clear(self) -> None:
+        for cache in (self._threads, self._refs, self._contacts, self._inboxes):
+            cache.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "threads": len(self._threads),
+            "refs": len(self._refs),
+            "contacts": len(self._contacts),
+            "inboxes": len(self._inboxes),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,185 @@
+"""Tests for the agent orchestrator's context cache and batch processing."""
+
+import asyncio
+import time
+from uuid import uuid4
+
+from mailagent.agents import MessageData
+from mailagent.services.orchestrator import AgentOrchestrator, thread_groups
+from mailagent.services.thread_context import ThreadContextCache
+
+
+def make_message(n: int, thread_id=None) -> MessageData:
+    return MessageData(
+        id=uuid4(),
+        from_address=f"user{n}@example.com",
+        to_addresses=[],
+        body_text=f"message {n}",
+        thread_id=thread_id,
+    )
+
+
+class CountingSession:
+    """Session that fails the test if the orchestrator queries it."""
+
+    def __init__(self):
+        self.queries = 0
+
+    async def execute(self, *args, **kwargs):
+        self.queries += 1
+        raise AssertionError("unexpected query")
+
+
+class TestThreadContextCache:
+    """Tests for ThreadContextCache."""
+
+    def test_keeps_newest_messages_and_excludes_current(self):
+        cache = ThreadContextCache(max_size=10, max_messages=3, ttl_seconds=60)
+        thread_id = uuid4()
+        cache.set_thread_messages(thread_id, [])
+
+        messages = [make_message(n, thread_id) for n in range(5)]
+        for message in messages:
+            cache.add_message(thread_id, message)
+
+        history = cache.get_thread_messages(thread_id, exclude_id=messages[-1].id)
+
+        assert [m.body_text for m in history] == ["message 3", "message 2", "message 1"]
+
+    def test_add_message_ignores_uncached_threads(self):
+        cache = ThreadContextCache(max_size=10, max_messages=3, ttl_seconds=60)
+        thread_id = uuid4()
+
+        cache.add_message(thread_id, make_message(1, thread_id))
+
+        assert cache.get_thread_messages(thread_id) is None
+
+    def test_entries_expire(self):
+        cache = ThreadContextCache(max_size=10, max_messages=3, ttl_seconds=0.001)
+        inbox_id = uuid4()
+        cache.set_inbox_email(inbox_id, "support@example.com")
+        time.sleep(0.01)
+
+        assert cache.get_inbox_email(inbox_id) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = ThreadContextCache(max_size=2, max_messages=3, ttl_seconds=60)
+        cache.set_contact_count("a@example.com", 1)
+        cache.set_contact_count("b@example.com", 1)
+        cache.get_contact_count("a@example.com")
+        cache.set_contact_count("c@example.com", 1)
+
+        assert cache.get_contact_count("b@example.com") is None
+        assert cache.get_contact_count("a@example.com") == 1
+
+    def test_contact_counts_increment(self):
+        cache = ThreadContextCache(max_size=10, max_messages=3, ttl_seconds=60)
+        cache.set_contact_count("a@example.com", 2)
+        cache.increment_contact("a@example.com")
+        cache.increment_contact("unknown@example.com")
+
+        assert cache.get_contact_count("a@example.com") == 3
+        assert cache.get_contact_count("unknown@example.com") is None
+
+    def test_thread_lookup_by_refs_is_per_inbox(self):
+        cache = ThreadContextCache(max_size=10, max_messages=3, ttl_seconds=60)
+        inbox_id, thread_id = uuid4(), uuid4()
+        cache.remember_refs(inbox_id, ["<a@x>", None], thread_id)
+
+        assert cache.get_thread_for_refs(inbox_id, ["<b@x>", "<a@x>"]) == thread_id
+        assert cache.get_thread_for_refs(uuid4(), ["<a@x>"]) is None
+
+
+class TestBuildContext:
+    """Tests that cached context skips database queries."""
+
+    async def test_build_context_served_from_cache(self):
+        orchestrator = AgentOrchestrator(ThreadContextCache(10, 10, 60))
+        cache = orchestrator.context_cache
+        inbox_id, thread_id, message_id = uuid4(), uuid4(), uuid4()
+        cache.set_thread_messages(thread_id, [make_message(1, thread_id)])
+        cache.set_contact_count("user@example.com", 4)
+        cache.set_inbox_email(inbox_id, "support@example.com")
+        session = CountingSession()
+
+        context = await orchestrator._build_context(
+            session,
+            inbox_id,
+            message_id,
+            {"from_address": "user@example.com", "in_reply_to": "<a@x>", "to_addresses": []},
+            thread_id,
+        )
+
+        assert session.queries == 0
+        assert [m.body_text for m in context.thread_messages] == ["message 1"]
+        assert context.contact.previous_interactions == 4
+        assert context.agent_config["inbox_email"] == "support@example.com"
+
+    async def test_find_thread_served_from_cache(self):
+        orchestrator = AgentOrchestrator(ThreadContextCache(10, 10, 60))
+        inbox_id, thread_id = uuid4(), uuid4()
+        orchestrator.context_cache.remember_refs(inbox_id, ["<root@x>"], thread_id)
+
+        found = await orchestrator._find_or_create_thread(
+            CountingSession(), inbox_id, "<root@x>", [], "Re: hi", "user@example.com"
+        )
+
+        assert found == thread_id
+
+
+class TestBatchProcessing:
+    """Tests for concurrent batch processing with per-thread ordering."""
+
+    def test_thread_groups_follow_reply_chains(self):
+        inbox = uuid4()
+        emails = [
+            (inbox, {"message_id": "<1>"}),
+            (inbox, {"message_id": "<2>"}),
+            (inbox, {"message_id": "<3>", "in_reply_to": "<1>"}),
+            (inbox, {"message_id": "<4>", "references": ["<1>", "<3>"]}),
+            (uuid4(), {"message_id": "<5>", "in_reply_to": "<1>"}),
+            (inbox, {}),
+        ]
+
+        assert sorted(thread_groups(emails)) == [[0, 2, 3], [1], [4], [5]]
+
+    async def test_batch_is_concurrent_across_threads_and_ordered_within(self):
+        events: list[str] = []
+
+        class RecordingOrchestrator(AgentOrchestrator):
+            async def process_incoming_email(self, inbox_id, message_data):
+                events.append(f"start {message_data['message_id']}")
+                await asyncio.sleep(0.05)
+                events.append(f"end {message_data['message_id']}")
+                return {"status": "processed", "message": message_data["message_id"]}
+
+        inbox = uuid4()
+        emails = [
+            (inbox, {"message_id": "a1"}),
+            (inbox, {"message_id": "b1"}),
+            (inbox, {"message_id": "a2", "in_reply_to": "a1"}),
+        ]
+
+        results = await RecordingOrchestrator(ThreadContextCache(10, 10, 60)).process_incoming_batch(
+            emails
+        )
+
+        assert [r["message"] for r in results] == ["a1", "b1", "a2"]
+        # Both threads start before either finishes
+        assert events[:2] == ["start a1", "start b1"]
+        # The reply only starts after the message it answers is done
+        assert events.index("start a2") > events.index("end a1")
+
+    async def test_batch_reports_errors_per_email(self):
+        class FailingOrchestrator(AgentOrchestrator):
+            async def process_incoming_email(self, inbox_id, message_data):
+                if message_data.get("fail"):
+                    raise RuntimeError("boom")
+                return {"status": "processed"}
+
+        results = await FailingOrchestrator(ThreadContextCache(10, 10, 60)).process_incoming_batch(
+            [(uuid4(), {"fail": True}), (uuid4(), {})]
+        )
+
+        assert results[0] == {"status": "error", "message": "boom"}
+        assert results[1]["status"] == "processed"
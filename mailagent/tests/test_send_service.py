@@ -0,0 +1,235 @@
+"""Tests for SendService rate limiting, failover and send recording."""
+
+import re
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from mailagent.models import SendRecord
+from mailagent.providers.base import (
+    EmailAddress,
+    EmailMessage,
+    EmailProvider,
+    ProviderConfig,
+    ProviderType,
+    SendResult,
+)
+from mailagent.redis_client import TokenBucketLimiter
+from mailagent.services.send_service import SendRecordBuffer, SendService
+
+
+class FakeProvider(EmailProvider):
+    """Provider that records sends and can be made to fail."""
+
+    def __init__(self, config: ProviderConfig, fail: bool = False):
+        super().__init__(config)
+        self.fail = fail
+        self.sent: list[EmailMessage] = []
+
+    @property
+    def provider_type(self) -> ProviderType:
+        return ProviderType.SMTP
+
+    async def send(self, message: EmailMessage) -> SendResult:
+        if self.fail:
+            return SendResult(success=False, provider=self.config.name, error="down")
+        self.sent.append(message)
+        return SendResult(
+            success=True,
+            provider=self.config.name,
+            message_id=f"{self.config.name}-{len(self.sent)}",
+        )
+
+    async def verify_credentials(self) -> bool:
+        return True
+
+
+class FakeSession:
+    def __init__(self, log: list):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self.log.append(statement)
+
+    async def commit(self):
+        pass
+
+
+def make_config(name: str, per_minute: int | None = None) -> ProviderConfig:
+    return ProviderConfig(
+        id=uuid4(),
+        name=name,
+        provider_type=ProviderType.SMTP,
+        credentials={},
+        rate_limit_per_minute=per_minute,
+    )
+
+
+def make_message(n: int = 0) -> EmailMessage:
+    return EmailMessage(
+        from_address=EmailAddress(address="sender@example.com"),
+        to_addresses=[EmailAddress(address=f"user{n}@example.com")],
+        subject="Hello",
+        body_text="Hi",
+    )
+
+
+@pytest.fixture
+def statements() -> list:
+    return []
+
+
+@pytest.fixture
+def service(statements) -> SendService:
+    records = SendRecordBuffer(session_factory=lambda: FakeSession(statements), batch_size=50)
+    return SendService(limiter=TokenBucketLimiter(None), records=records)
+
+
+class TestTokenBucketLimiter:
+    """Tests for the in-memory fallback of the token bucket."""
+
+    async def test_grants_up_to_capacity(self):
+        limiter = TokenBucketLimiter(None)
+        buckets = [("k", 3, 60)]
+
+        assert [await limiter.acquire(buckets) for _ in range(4)] == [1, 1, 1, 0]
+
+    async def test_partial_grant_and_release(self):
+        limiter = TokenBucketLimiter(None)
+        buckets = [("k", 5, 60)]
+
+        assert await limiter.acquire(buckets, 8) == 0
+        assert await limiter.acquire(buckets, 8, partial=True) == 5
+        await limiter.release(buckets, 2)
+        assert await limiter.acquire(buckets, 8, partial=True) == 2
+
+    async def test_tightest_bucket_wins(self):
+        limiter = TokenBucketLimiter(None)
+        buckets = [("minute", 10, 60), ("day", 2, 86400)]
+
+        assert await limiter.acquire(buckets, 5, partial=True) == 2
+
+    async def test_refills_over_time(self):
+        limiter = TokenBucketLimiter(None)
+        buckets = [("k", 60, 60)]
+        await limiter.acquire(buckets, 60)
+
+        level, ts = limiter._local["k"]
+        limiter._local["k"] = (level, ts - 2)
+
+        assert await limiter.acquire(buckets, 10, partial=True) == 2
+
+
+class TestSendService:
+    """Tests for failover and batch splitting across providers."""
+
+    async def test_send_fails_over_when_throttled(self, service):
+        first = FakeProvider(make_config("first", per_minute=1))
+        second = FakeProvider(make_config("second"))
+        service.add_provider(first.config, first)
+        service.add_provider(second.config, second)
+
+        results = [await service.send(make_message(i)) for i in range(3)]
+
+        assert [r.provider for r in results] == ["first", "second", "second"]
+
+    async def test_failed_send_returns_token(self, service):
+        broken = FakeProvider(make_config("broken", per_minute=1), fail=True)
+        service.add_provider(broken.config, broken)
+
+        await service.send(make_message())
+        broken.fail = False
+        result = await service.send(make_message())
+
+        assert result.success
+
+    async def test_send_batch_splits_by_capacity(self, service):
+        first = FakeProvider(make_config("first", per_minute=3))
+        second = FakeProvider(make_config("second"))
+        service.add_provider(first.config, first)
+        service.add_provider(second.config, second)
+
+        results = await service.send_batch([make_message(i) for i in range(5)])
+
+        assert [r.provider for r in results] == ["first"] * 3 + ["second"] * 2
+
+    async def test_send_batch_reports_throttled_messages(self, service):
+        only = FakeProvider(make_config("only", per_minute=2))
+        service.add_provider(only.config, only)
+
+        results = await service.send_batch([make_message(i) for i in range(3)])
+
+        assert [r.success for r in results] == [True, True, False]
+        assert "rate limited" in results[2].error
+
+    async def test_send_batch_fails_over_failed_messages(self, service):
+        broken = FakeProvider(make_config("broken"), fail=True)
+        backup = FakeProvider(make_config("backup"))
+        service.add_provider(broken.config, broken)
+        service.add_provider(backup.config, backup)
+
+        results = await service.send_batch([make_message(i) for i in range(4)])
+
+        assert all(r.success and r.provider == "backup" for r in results)
+
+
+class TestSendRecordBuffer:
+    """Tests for buffered multi-row send records."""
+
+    async def test_flushes_multi_row_insert_at_batch_size(self, service, statements):
+        provider = FakeProvider(make_config("p"))
+        service.add_provider(provider.config, provider)
+
+        await service.send_batch([make_message(i) for i in range(120)])
+
+        assert len(statements) == 2
+        assert len(service._records) == 20
+
+        await service.close()
+        assert len(statements) == 3
+        assert len(service._records) == 0
+
+    async def test_failed_flush_keeps_rows(self):
+        class BrokenSession(FakeSession):
+            async def execute(self, statement):
+                raise RuntimeError("db down")
+
+        records = SendRecordBuffer(session_factory=lambda: BrokenSession([]), batch_size=10)
+        result = SendResult(success=True, provider="p", message_id="m")
+        for _ in range(3):
+            await records.add(make_message(), result, uuid4(), None)
+
+        assert await records.flush() == 0
+        assert len(records) == 3
+        await records.close()
+
+    async def test_insert_matches_send_log_table(self, service, statements):
+        """The insert only targets columns of the migrated table and fills its required ones."""
+        schema = (Path(__file__).parents[1] / "migrations" / "004_send_log.sql").read_text()
+        body = re.search(r"CREATE TABLE IF NOT EXISTS mailagent_send_log \((.*?)\n\);", schema, re.S)
+        definitions = [line.strip() for line in body.group(1).splitlines() if line.strip()]
+        columns = {line.split()[0] for line in definitions}
+        required = {
+            line.split()[0] for line in definitions if "NOT NULL" in line and "DEFAULT" not in line
+        }
+        assert columns == set(SendRecord.__table__.columns.keys())
+
+        provider = FakeProvider(make_config("p"))
+        service.add_provider(provider.config, provider)
+        await service.send(make_message())
+        await service.flush_records()
+
+        [statement] = statements
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        target = re.match(r"INSERT INTO (\w+) \((.*?)\) VALUES", sql)
+        inserted = {name.strip() for name in target.group(2).split(",")}
+        assert target.group(1) == "mailagent_send_log"
+        assert required <= inserted <= columns
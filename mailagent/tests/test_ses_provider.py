@@ -0,0 +1,147 @@
+"""Tests for the SES provider."""
+
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from mailagent.providers.base import (
+    EmailAddress,
+    EmailMessage,
+    ProviderConfig,
+    ProviderType,
+)
+from mailagent.providers.ses import SESProvider
+
+
+class FakeSESClient:
+    """Stands in for the boto3 ses and sesv2 clients."""
+
+    def __init__(self, latency: float = 0.0, failing: set[str] | None = None):
+        self.latency = latency
+        self.failing = failing or set()
+        self.raw_calls: list[dict] = []
+        self.bulk_calls: list[dict] = []
+        self.threads: set[str] = set()
+
+    def send_raw_email(self, **kwargs):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.latency)
+        self.raw_calls.append(kwargs)
+        return {"MessageId": f"raw-{len(self.raw_calls)}"}
+
+    def send_bulk_email(self, **kwargs):
+        self.bulk_calls.append(kwargs)
+        results = []
+        for n, entry in enumerate(kwargs["BulkEmailEntries"]):
+            if entry["Destination"]["ToAddresses"][0] in self.failing:
+                results.append({"Status": "MESSAGE_REJECTED", "Error": "Rejected"})
+            else:
+                results.append({"Status": "SUCCESS", "MessageId": f"bulk-{n}"})
+        return {"BulkEmailEntryResults": results}
+
+    def get_account(self):
+        return {"SendingEnabled": True}
+
+
+@pytest.fixture
+def provider() -> SESProvider:
+    config = ProviderConfig(
+        id=uuid4(),
+        name="ses",
+        provider_type=ProviderType.SES,
+        credentials={"access_key_id": "test", "secret_access_key": "test"},
+    )
+    provider = SESProvider(config)
+    provider._client = FakeSESClient()
+    provider._v2_client = provider._client
+    return provider
+
+
+def make_message(to: str, subject: str = "Hello", **kwargs) -> EmailMessage:
+    return EmailMessage(
+        from_address=EmailAddress(address="sender@example.com"),
+        to_addresses=[EmailAddress(address=to)],
+        subject=subject,
+        body_text="Hi there",
+        **kwargs,
+    )
+
+
+class TestSESProvider:
+    """Tests for SESProvider."""
+
+    async def test_send_runs_off_the_event_loop(self, provider):
+        """Concurrent sends should overlap instead of blocking the loop."""
+        provider._client.latency = 0.2
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(provider.send(make_message(f"user{i}@example.com")) for i in range(5))
+        )
+        elapsed = time.perf_counter() - started
+
+        assert all(r.success for r in results)
+        assert elapsed < 0.6
+        assert threading.current_thread().name not in provider._client.threads
+
+    async def test_verify_credentials(self, provider):
+        """Should check the account with the v2 client."""
+        assert await provider.verify_credentials() is True
+
+    async def test_send_batch_uses_bulk_for_identical_content(self, provider):
+        """Same-content messages should share one SendBulkEmail call."""
+        messages = [make_message(f"user{i}@example.com") for i in range(3)]
+
+        results = await provider.send_batch(messages)
+
+        assert [r.success for r in results] == [True, True, True]
+        assert len(provider._client.bulk_calls) == 1
+        assert provider._client.raw_calls == []
+        call = provider._client.bulk_calls[0]
+        assert call["DefaultContent"]["Template"]["TemplateContent"]["Subject"] == "Hello"
+        assert len(call["BulkEmailEntries"]) == 3
+
+    async def test_send_batch_chunks_bulk_calls(self, provider):
+        """Bulk calls should carry at most 50 destinations."""
+        messages = [make_message(f"user{i}@example.com") for i in range(120)]
+
+        results = await provider.send_batch(messages)
+
+        assert len(results) == 120
+        assert [len(c["BulkEmailEntries"]) for c in provider._client.bulk_calls] == [50, 50, 20]
+
+    async def test_send_batch_mixed_messages_keep_order(self, provider):
+        """Unique or incompatible messages should fall back to raw sends."""
+        messages = [
+            make_message("a@example.com"),
+            make_message("b@example.com", subject="Different"),
+            make_message("c@example.com"),
+            make_message("d@example.com", cc_addresses=[EmailAddress(address="cc@example.com")]),
+        ]
+
+        results = await provider.send_batch(messages)
+
+        assert [r.provider_message_id[:4] for r in results] == ["bulk", "raw-", "bulk", "raw-"]
+        assert len(provider._client.raw_calls) == 2
+
+    async def test_send_batch_maps_bulk_entry_failures(self, provider):
+        """Per-entry failures should surface on the matching result."""
+        provider._client.failing = {"b@example.com"}
+        messages = [make_message(f"{name}@example.com") for name in "abc"]
+
+        results = await provider.send_batch(messages)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert "MESSAGE_REJECTED" in results[1].error
+
+    async def test_template_syntax_is_not_sent_in_bulk(self, provider):
+        """Content with template markers must not be rendered by SES."""
+        messages = [make_message(f"user{i}@example.com", subject="{{name}}") for i in range(2)]
+
+        await provider.send_batch(messages)
+
+        assert provider._client.bulk_calls == []
+        assert len(provider._client.raw_calls) == 2